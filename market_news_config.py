@@ -12,10 +12,8 @@ HOURS_LIMIT = 24
 SENTIMENT_ANALYSIS_ENABLED = True
 
 # AI関連設定
-AI_PROCESS_PROMPT_TEMPLATE = """
-以下のニュース記事を分析して、以下の3つの情報を特定してください：
-
-### 地域判定の基準
+# 単独処理・バッチ処理で共有する地域/カテゴリの判定基準
+AI_CLASSIFICATION_CRITERIA = """### 地域判定の基準
 - **japan**: 日銀、日本企業、日本政府、円相場が主要テーマ
 - **usa**: FRB、米企業、米政府、ドル相場が主要テーマ  
 - **china**: 中国人民銀行、中国企業、中国政府、人民元が主要テーマ
@@ -29,23 +27,37 @@ AI_PROCESS_PROMPT_TEMPLATE = """
 - **政治**: 選挙、政権交代、政策発表等
 - **市場動向**: 株価、為替、商品価格等
 - **国際情勢**: 貿易、制裁、地政学リスク等
-- **その他**: 上記以外の内容
-
-以下の形式で出力してください：
+- **その他**: 上記以外の内容"""
 
-## 地域
+# 単独処理・バッチ処理で共有する出力形式
+AI_OUTPUT_SECTIONS_FORMAT = """## 地域
 [japan/usa/china/europe/その他]
 
 ## カテゴリ
 [金融政策/経済指標/企業業績/政治/市場動向/国際情勢/その他]
 
 ## 要約
-[180-220字の簡潔な要約（事実→影響→今後の見通しの順）]
+[180-220字の簡潔な要約（事実→影響→今後の見通しの順）]"""
 
----
+AI_PROCESS_PROMPT_TEMPLATE = (
+    "\n以下のニュース記事を分析して、以下の3つの情報を特定してください：\n\n"
+    + AI_CLASSIFICATION_CRITERIA
+    + "\n\n以下の形式で出力してください：\n\n"
+    + AI_OUTPUT_SECTIONS_FORMAT
+    + "\n\n---\n\n記事: {text}\n"
+)
 
-記事: {text}
-"""
+# 複数記事を1リクエストで処理するバッチ用プロンプト
+# {articles} には "=== 記事 N ===" 見出し付きの記事本文を連結して埋め込む
+AI_BATCH_PROCESS_PROMPT_TEMPLATE = (
+    "\n以下の{count}件のニュース記事それぞれについて、以下の3つの情報を特定してください：\n\n"
+    + AI_CLASSIFICATION_CRITERIA
+    + "\n\n記事ごとに、入力と同じ番号の見出しを付けて以下の形式で出力してください。\n"
+    "記事を省略したり、複数の記事をまとめたりしないでください：\n\n"
+    "=== 記事 N ===\n"
+    + AI_OUTPUT_SECTIONS_FORMAT
+    + "\n\n---\n\n{articles}\n"
+)
 
 # GoogleドキュメントのID (上書き更新用)
 GOOGLE_OVERWRITE_DOC_ID = None
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+articlesテーブルにminhash_signature列を追加するマイグレーションスクリプト
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, text, inspect
+from src.config.app_config import get_config
+
+
+def _has_column(conn, table_name: str, column_name: str) -> bool:
+    inspector = inspect(conn)
+    cols = inspector.get_columns(table_name)
+    return any(col.get("name") == column_name for col in cols)
+
+
+def migrate_database():
+    """データベースマイグレーション実行"""
+    config = get_config()
+    engine = create_engine(config.database.url)
+
+    print("=== articlesテーブルマイグレーション開始 ===")
+
+    with engine.connect() as conn:
+        # トランザクション開始
+        trans = conn.begin()
+        try:
+            # 近似重複判定用のMinHashシグネチャ列を追加
+            if not _has_column(conn, "articles", "minhash_signature"):
+                print("minhash_signature列を追加中...")
+                column_type = "BYTEA" if engine.dialect.name == "postgresql" else "BLOB"
+                conn.execute(text(f"ALTER TABLE articles ADD COLUMN minhash_signature {column_type}"))
+            else:
+                print("minhash_signature列は既に存在するためスキップ")
+
+            # コミット
+            trans.commit()
+            print("✅ マイグレーション完了")
+
+        except Exception as e:
+            # ロールバック
+            trans.rollback()
+            print(f"❌ マイグレーション失敗: {e}")
+            raise
+
+if __name__ == "__main__":
+    migrate_database()
@@ -24,11 +24,17 @@ except ImportError:
     WebDriverWait = None  # type: ignore
     expected_conditions = None  # type: ignore
     TimeoutException = Exception  # type: ignore
+import atexit
 import tempfile
+import threading
 from pathlib import Path
 import shutil
+from typing import Optional
 
 from src.config.app_config import get_config
+from src.tracing import trace_span
+from scrapers.http_fetcher import PooledHttpFetcher, RETRYABLE_STATUS_CODES
+from scrapers.html_parsing import ContainerRule, ContainerSelector, parse_html
 
 # --- 設定の読み込み ---
 config = get_config()
@@ -45,23 +51,106 @@ _ARTICLE_URL_RE = re.compile(
 )
 
 
-def scrape_bloomberg_article_body(article_url: str, timeout: int = 15) -> str:
-    """指定された Bloomberg 記事 URL から本文を抽出する (requests ベース)"""
-    headers = {
-        'User-Agent': (
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
-            '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
-        ),
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'ja,en-US;q=0.7,en;q=0.3',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Referer': 'https://www.bloomberg.co.jp/',
-    }
+_BODY_REQUEST_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ja,en-US;q=0.7,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Referer': 'https://www.bloomberg.co.jp/',
+}
+
+_default_fetcher: Optional[PooledHttpFetcher] = None
+_default_fetcher_lock = threading.Lock()
+
+
+def create_bloomberg_fetcher() -> PooledHttpFetcher:
+    """Bloomberg 本文取得用のフェッチャーを生成する"""
+    return PooledHttpFetcher(
+        headers=_BODY_REQUEST_HEADERS,
+        pool_size=config.bloomberg.num_parallel_requests,
+        per_host_limit=config.bloomberg.per_host_concurrency,
+        backoff_base=config.bloomberg.retry_backoff_base,
+        backoff_max=config.bloomberg.retry_backoff_max,
+    )
+
+
+def _get_default_fetcher() -> PooledHttpFetcher:
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = create_bloomberg_fetcher()
+            atexit.register(_close_default_fetcher)
+        return _default_fetcher
+
+
+def _close_default_fetcher() -> None:
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is not None:
+            _default_fetcher.close()
+            _default_fetcher = None
+
+
+# 本文コンテナの探索ルール（優先度順）
+BLOOMBERG_BODY_CONTAINER = ContainerSelector([
+    ContainerRule('div', re.compile(r'body-copy|article-body|content-well', re.I)),
+    ContainerRule('article'),
+    ContainerRule('main'),
+    ContainerRule('div', re.compile(r'story.*content|content.*story', re.I)),
+])
+
+
+def _extract_bloomberg_body(soup: BeautifulSoup) -> Optional[str]:
+    """
+    BeautifulSoup オブジェクトから Bloomberg 記事本文を抽出する。
+    本文コンテナが見つからない場合は None を返す。
+    """
+    body_container, _ = BLOOMBERG_BODY_CONTAINER.find(soup)
+
+    if not body_container:
+        return None
+
+    # 不要タグを除去
+    for unwanted in body_container.find_all(
+        ['script', 'style', 'aside', 'figure', 'figcaption', 'iframe', 'header', 'footer', 'nav']
+    ):
+        unwanted.decompose()
+
+    paragraphs = [
+        p.get_text(separator=' ', strip=True)
+        for p in body_container.find_all('p')
+        if p.get_text(strip=True)
+    ]
+
+    if not paragraphs:
+        full_text = body_container.get_text(separator='\n', strip=True)
+        paragraphs = [l.strip() for l in full_text.split('\n') if l.strip()]
+
+    return '\n'.join(paragraphs)
+
+
+def scrape_bloomberg_article_body(article_url: str, timeout: int = 15,
+                                  fetcher: Optional[PooledHttpFetcher] = None,
+                                  body_cache=None) -> str:
+    """
+    指定された Bloomberg 記事 URL から本文を抽出する (requests ベース)
+
+    fetcher を共有すると keep-alive 接続が再利用され、ホスト別の同時接続数も
+    制限される。省略時はモジュール共通のフェッチャーを使用する。
+    body_cache (ArticleBodyCache) にエントリがある場合は条件付きGETで再検証し、
+    304 Not Modified ならキャッシュの本文を返す。
+    """
+    fetcher = fetcher or _get_default_fetcher()
+    cache_entry = body_cache.get(article_url) if body_cache is not None else None
+    request_headers = body_cache.conditional_headers(cache_entry) if cache_entry else None
 
     max_retries = 2
     for attempt in range(max_retries + 1):
@@ -72,79 +161,70 @@ def scrape_bloomberg_article_body(article_url: str, timeout: int = 15) -> str:
                 f"(試行 {attempt + 1}/{max_retries + 1}, タイムアウト: {current_timeout}秒)"
             )
 
-            response = requests.get(article_url, headers=headers, timeout=current_timeout)
+            response = fetcher.get(article_url, timeout=current_timeout, headers=request_headers)
+            if response.status_code == 304 and cache_entry is not None:
+                print(f"  [Bloomberg本文取得] 未更新 (304) のためキャッシュを使用: {article_url}")
+                body_cache.record("revalidated")
+                return cache_entry.body
             response.raise_for_status()
-            response.encoding = response.apparent_encoding
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # 本文コンテナを複数パターンで探索
-            body_container = None
-            container_candidates = [
-                soup.find('div', class_=re.compile(r'body-copy|article-body|content-well', re.I)),
-                soup.find('article'),
-                soup.find('main'),
-                soup.find('div', class_=re.compile(r'story.*content|content.*story', re.I)),
-            ]
-            for candidate in container_candidates:
-                if candidate:
-                    body_container = candidate
-                    break
-
-            if not body_container:
+
+            # 本文コンテナだけを解析する（文字コードはバイト列からパーサーが判定する）
+            article_text = BLOOMBERG_BODY_CONTAINER.parse_and_extract(
+                response.content, _extract_bloomberg_body
+            )
+
+            if article_text is None:
                 print(f"  [Bloomberg本文取得] 本文コンテナが見つかりません: {article_url}")
                 if attempt < max_retries:
-                    time.sleep(2)
+                    fetcher.sleep_before_retry(attempt)
                     continue
                 return ""
 
-            # 不要タグを除去
-            for unwanted in body_container.find_all(
-                ['script', 'style', 'aside', 'figure', 'figcaption', 'iframe', 'header', 'footer', 'nav']
-            ):
-                unwanted.decompose()
-
-            paragraphs = [
-                p.get_text(separator=' ', strip=True)
-                for p in body_container.find_all('p')
-                if p.get_text(strip=True)
-            ]
-
-            if not paragraphs:
-                full_text = body_container.get_text(separator='\n', strip=True)
-                paragraphs = [l.strip() for l in full_text.split('\n') if l.strip()]
-
-            article_text = '\n'.join(paragraphs)
             if len(article_text.strip()) < 50:
                 print(f"  [Bloomberg本文取得] 本文が短すぎます (長さ: {len(article_text)}文字): {article_url}")
                 if attempt < max_retries:
-                    time.sleep(2)
+                    fetcher.sleep_before_retry(attempt)
                     continue
             else:
                 print(f"  [Bloomberg本文取得] 成功 (長さ: {len(article_text)}文字): {article_url}")
 
-            return re.sub(r'\s+', ' ', article_text).strip()
+            body_text = re.sub(r'\s+', ' ', article_text).strip()
+            if body_cache is not None and len(body_text) >= 50:
+                body_cache.record("refetched" if cache_entry is not None else "misses")
+                body_cache.put(
+                    article_url,
+                    body_text,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                )
+            return body_text
 
-        except (requests.exceptions.RequestException, requests.exceptions.Timeout) as e:
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            print(f"  [Bloomberg本文取得エラー] {article_url} (試行 {attempt + 1}): {e}")
+            # 404 などリトライしても結果が変わらないエラーは即時終了
+            if status not in RETRYABLE_STATUS_CODES:
+                break
+            if attempt < max_retries:
+                fetcher.sleep_before_retry(attempt)
+                continue
+        except requests.exceptions.RequestException as e:
             print(f"  [Bloomberg本文取得エラー] {article_url} (試行 {attempt + 1}): {e}")
             if attempt < max_retries:
-                time.sleep(2)
+                fetcher.sleep_before_retry(attempt)
                 continue
         except Exception as e:
             print(f"  [Bloomberg本文取得エラー] 解析中に予期せぬエラー: {e}")
             if attempt < max_retries:
-                time.sleep(2)
+                fetcher.sleep_before_retry(attempt)
                 continue
 
     print(f"  [Bloomberg本文取得失敗] 全試行失敗: {article_url}")
     return ""
 
 
-def scrape_bloomberg_top_page_articles(hours_limit: int, exclude_keywords: list) -> list:
-    """Bloomberg トップページから記事情報を収集する (Selenium ベース)"""
-
-    user_data_dir = tempfile.mkdtemp(prefix="chrome-bloomberg-", dir=str(Path.cwd()))
-
+def _start_bloomberg_driver(user_data_dir: str) -> "webdriver.Chrome":  # type: ignore[name-defined]
+    """一時プロファイルを使った Bloomberg 用の Chrome driver を起動する"""
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
@@ -172,15 +252,19 @@ def scrape_bloomberg_top_page_articles(hours_limit: int, exclude_keywords: list)
     })
     chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
 
-    driver = None
-    print("\n--- Bloomberg記事のスクレイピング開始 ---")
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_page_load_timeout(scraping_config.page_load_timeout)
+    return driver
 
-    articles_to_process = []
-    processed_urls = set()
 
+def _fetch_bloomberg_top_page_source(user_data_dir: str) -> str:
+    """
+    Selenium で Bloomberg トップページを取得し page_source を返す。
+    取得できなかった場合は空文字を返す。
+    """
+    driver = None
     try:
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.set_page_load_timeout(scraping_config.page_load_timeout)
+        driver = _start_bloomberg_driver(user_data_dir)
 
         print(f"  Bloomberg: トップページ ({_BLOOMBERG_BASE}) を取得中...")
 
@@ -194,7 +278,6 @@ def scrape_bloomberg_top_page_articles(hours_limit: int, exclude_keywords: list)
         #   2. さらに <a href> を含む要素が現れるまで短時間待機
         #   3. JS 描画を待つため追加スリープ
         # ─────────────────────────────────────────────────────────────────────
-        page_loaded = False
         for attempt in range(scraping_config.selenium_max_retries):
             try:
                 current_timeout = 30 if attempt == 0 else 50
@@ -206,8 +289,7 @@ def scrape_bloomberg_top_page_articles(hours_limit: int, exclude_keywords: list)
                 )
                 # JS 描画のための追加待機
                 time.sleep(3)
-                page_loaded = True
-                break
+                return driver.page_source
 
             except TimeoutException:
                 print(
@@ -217,12 +299,51 @@ def scrape_bloomberg_top_page_articles(hours_limit: int, exclude_keywords: list)
                 )
                 if attempt + 1 == scraping_config.selenium_max_retries:
                     print("    [!] リトライ上限に達したため、Bloombergのスクレイピングを中止します。")
-                    return []
+        return ""
+    finally:
+        if driver:
+            driver.quit()
 
-        if not page_loaded:
-            return []
 
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+def scrape_bloomberg_top_page_articles(hours_limit: int, exclude_keywords: list,
+                                       collection_cache=None, body_cache=None,
+                                       stored_article_lookup=None, on_article=None) -> list:
+    """
+    Bloomberg トップページから記事情報を収集する (Selenium ベース)
+
+    collection_cache (ScrapeCollectionCache) が渡された場合、前回の試行で取得した
+    トップページと本文を再利用し、新たに時間範囲へ入った記事の本文のみを取得する。
+    body_cache (ArticleBodyCache) が渡された場合、DB保存済みの記事はキャッシュの
+    本文を使用し、それ以外のキャッシュ済み記事は条件付きGETで再検証する。
+    stored_article_lookup(source, urls) -> {url: body} が渡された場合、本文取得の前に
+    候補を一括でDB照会し、保存済みの記事は保存済みの本文を使用する。
+    on_article(article) が渡された場合、本文が確定した記事から順に呼び出す
+    （全件の取得完了を待たずに後続処理へ渡すためのフック）。
+    """
+
+    user_data_dir = tempfile.mkdtemp(prefix="chrome-bloomberg-", dir=str(Path.cwd()))
+
+    print("\n--- Bloomberg記事のスクレイピング開始 ---")
+
+    articles_to_process = []
+    processed_urls = set()
+
+    try:
+        page_source = (
+            collection_cache.get_listing('Bloomberg') if collection_cache is not None else None
+        )
+        if page_source is None:
+            with trace_span("bloomberg.listing", category="scrape") as listing_span:
+                page_source = _fetch_bloomberg_top_page_source(user_data_dir)
+                listing_span.add(items=1, bytes=len(page_source or ""))
+            if not page_source:
+                return []
+            if collection_cache is not None:
+                collection_cache.store_listing('Bloomberg', page_source, page_fetches=1)
+        else:
+            print("  Bloomberg: キャッシュ済みのトップページを再利用します")
+
+        soup = parse_html(page_source)
 
         # ── 記事要素の抽出 ────────────────────────────────────────────────────
         # 優先度順にセレクターを試行:
@@ -271,8 +392,6 @@ def scrape_bloomberg_top_page_articles(hours_limit: int, exclude_keywords: list)
     except Exception as e:
         print(f"  Bloomberg スクレイピング処理全体でエラーが発生しました: {e}")
     finally:
-        if driver:
-            driver.quit()
         try:
             shutil.rmtree(user_data_dir, ignore_errors=True)
         except Exception:
@@ -281,27 +400,75 @@ def scrape_bloomberg_top_page_articles(hours_limit: int, exclude_keywords: list)
     if not articles_to_process:
         return []
 
-    print(
-        f"\n--- {len(articles_to_process)}件の記事本文を並列取得開始 "
-        f"(最大{config.bloomberg.num_parallel_requests}スレッド) ---"
+    pending_urls = [
+        article['url'] for article in articles_to_process
+        if collection_cache is None or article['url'] not in collection_cache
+    ]
+    stored_bodies = (
+        stored_article_lookup('Bloomberg', pending_urls)
+        if stored_article_lookup is not None and pending_urls else {}
     )
+    if collection_cache is not None:
+        # 次の試行では DB への再照会も不要にする
+        for url, body in stored_bodies.items():
+            collection_cache.store_body(url, body)
+
     final_articles_data = []
-    with ThreadPoolExecutor(max_workers=config.bloomberg.num_parallel_requests) as executor:
-        future_to_article = {
-            executor.submit(scrape_bloomberg_article_body, article['url']): article
-            for article in articles_to_process
-        }
-        for i, future in enumerate(as_completed(future_to_article)):
-            article = future_to_article[future]
-            try:
-                body = future.result()
-                article['body'] = body or "[本文取得失敗/空]"
-                final_articles_data.append(article)
-                print(f"  ({i + 1}/{len(articles_to_process)}) 完了: {article['title']}")
-            except Exception as exc:
-                print(f"  [!!] 記事取得中に例外発生 ({article['url']}): {exc}")
-                article['body'] = f"[本文取得エラー: {exc}]"
-                final_articles_data.append(article)
+    articles_to_fetch = []
+    for article in articles_to_process:
+        cached_body = stored_bodies.get(article['url'])
+        if cached_body is None and collection_cache is not None:
+            cached_body = collection_cache.get_body(article['url'])
+        if cached_body is None and body_cache is not None:
+            cached_body = body_cache.lookup_known(article['url'])
+        if cached_body is not None:
+            article['body'] = cached_body
+            final_articles_data.append(article)
+        else:
+            articles_to_fetch.append(article)
+
+    if final_articles_data:
+        print(f"  Bloomberg: キャッシュ済みの本文を再利用 ({len(final_articles_data)}件)")
+        if on_article is not None:
+            for article in final_articles_data:
+                on_article(article)
+
+    if not articles_to_fetch:
+        print(f"--- Bloomberg記事取得完了: {len(final_articles_data)} 件 ---")
+        return final_articles_data
+
+    print(
+        f"\n--- {len(articles_to_fetch)}件の記事本文を並列取得開始 "
+        f"(最大{config.bloomberg.num_parallel_requests}スレッド, "
+        f"同時接続上限{config.bloomberg.per_host_concurrency}) ---"
+    )
+    with trace_span("bloomberg.body_fetch", category="scrape") as fetch_span:
+        # 全記事で1つの Session を共有し、keep-alive 接続を再利用する
+        with create_bloomberg_fetcher() as fetcher, \
+                ThreadPoolExecutor(max_workers=config.bloomberg.num_parallel_requests) as executor:
+            future_to_article = {
+                executor.submit(
+                    scrape_bloomberg_article_body, article['url'],
+                    fetcher=fetcher, body_cache=body_cache,
+                ): article
+                for article in articles_to_fetch
+            }
+            for i, future in enumerate(as_completed(future_to_article)):
+                article = future_to_article[future]
+                try:
+                    body = future.result()
+                    article['body'] = body or "[本文取得失敗/空]"
+                    if body and collection_cache is not None:
+                        collection_cache.store_body(article['url'], body)
+                    final_articles_data.append(article)
+                    fetch_span.add(items=1, bytes=len(body or ""))
+                    print(f"  ({i + 1}/{len(articles_to_fetch)}) 完了: {article['title']}")
+                except Exception as exc:
+                    print(f"  [!!] 記事取得中に例外発生 ({article['url']}): {exc}")
+                    article['body'] = f"[本文取得エラー: {exc}]"
+                    final_articles_data.append(article)
+                if on_article is not None:
+                    on_article(article)
 
     print(f"--- Bloomberg記事取得完了: {len(final_articles_data)} 件 ---")
     return final_articles_data
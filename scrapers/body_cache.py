@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+記事本文の永続キャッシュ（条件付きGET対応）
+
+正規化URLのハッシュ（Article.url_hash と同一の値）をキーとして、抽出済みの
+本文と ETag / Last-Modified をディスク上の SQLite に保存する。
+
+- DB に本文付きで保存済みの記事 → ネットワークアクセスなしでキャッシュの本文を使用
+- キャッシュのみに存在する記事 → If-None-Match / If-Modified-Since で再検証
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.database.url_normalizer import URLNormalizer
+
+
+@dataclass
+class BodyCacheEntry:
+    """キャッシュエントリ"""
+
+    url_hash: str
+    normalized_url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: Optional[str] = None
+
+
+class ArticleBodyCache:
+    """SQLite バックエンドの記事本文キャッシュ"""
+
+    def __init__(self, path: str, retention_days: int = 30):
+        self.path = path
+        self.retention_days = retention_days
+        self.url_normalizer = URLNormalizer()
+        self._known_url_hashes: Set[str] = set()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS article_bodies (
+                url_hash TEXT PRIMARY KEY,
+                normalized_url TEXT NOT NULL,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        self.stats: Dict[str, int] = {
+            "known_hits": 0,
+            "revalidated": 0,
+            "refetched": 0,
+            "misses": 0,
+            "stored": 0,
+        }
+
+    def url_hash(self, url: str) -> str:
+        """正規化URLのSHA-256（Article.url_hash と同じ計算）"""
+        normalized_url = self.url_normalizer.normalize_url(url)
+        return hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[BodyCacheEntry]:
+        """URLに対応するキャッシュエントリを取得"""
+        key = self.url_hash(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url_hash, normalized_url, body, etag, last_modified, fetched_at "
+                "FROM article_bodies WHERE url_hash = ?",
+                (key,),
+            ).fetchone()
+        return BodyCacheEntry(*row) if row else None
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """抽出済み本文と検証子を保存（空の本文は保存しない）"""
+        if not body:
+            return
+        normalized_url = self.url_normalizer.normalize_url(url)
+        key = hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO article_bodies "
+                "(url_hash, normalized_url, body, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, normalized_url, body, etag, last_modified, datetime.utcnow().isoformat()),
+            )
+            self._conn.commit()
+            self.stats["stored"] += 1
+
+    def lookup_known(self, url: str) -> Optional[str]:
+        """
+        DB保存済みの記事であればキャッシュの本文を返す（ネットワーク不要）
+
+        Returns:
+            本文、または再取得・再検証が必要な場合はNone
+        """
+        key = self.url_hash(url)
+        if key not in self._known_url_hashes:
+            return None
+        entry = self.get(url)
+        if entry is None:
+            return None
+        with self._lock:
+            self.stats["known_hits"] += 1
+        return entry.body
+
+    def conditional_headers(self, entry: Optional[BodyCacheEntry]) -> Dict[str, str]:
+        """条件付きGET用のリクエストヘッダー"""
+        headers: Dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def record(self, outcome: str) -> None:
+        """取得結果（revalidated / refetched / misses）を統計に記録"""
+        with self._lock:
+            self.stats[outcome] = self.stats.get(outcome, 0) + 1
+
+    def url_hashes(self) -> List[str]:
+        """キャッシュ済みの全URLハッシュ"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT url_hash FROM article_bodies")]
+
+    def set_known_url_hashes(self, url_hashes: Iterable[str]) -> None:
+        """DBに本文付きで保存済みのURLハッシュを登録"""
+        self._known_url_hashes = set(url_hashes)
+
+    def prune(self) -> int:
+        """保持期間を過ぎたエントリを削除"""
+        cutoff = (datetime.utcnow() - timedelta(days=self.retention_days)).isoformat()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM article_bodies WHERE fetched_at < ?", (cutoff,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+動的時間範囲拡張の試行間で取得結果を共有するキャッシュ
+
+記事一覧は時間範囲に依存せず同じページを取得しているため、一度取得した
+一覧と本文を保持しておけば、時間範囲を広げた再試行では新たに範囲へ入った
+記事の本文だけを取得すればよい。
+"""
+
+import copy
+import threading
+from typing import Any, Dict, Optional
+
+
+class ScrapeCollectionCache:
+    """スクレイピング結果（記事一覧・本文）の試行間キャッシュ"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listings: Dict[str, Any] = {}
+        self._listing_fetch_counts: Dict[str, int] = {}
+        self._bodies: Dict[str, str] = {}
+
+        # キャッシュにより省略できたフェッチ数
+        self.listing_fetches_saved = 0
+        self.body_fetches_saved = 0
+
+    def get_listing(self, source: str) -> Optional[Any]:
+        """
+        キャッシュ済みの記事一覧を取得する
+
+        Args:
+            source: ソース名（'Reuters', 'Bloomberg'）
+
+        Returns:
+            保存時のペイロードのコピー。未取得の場合はNone
+        """
+        with self._lock:
+            if source not in self._listings:
+                return None
+            self.listing_fetches_saved += self._listing_fetch_counts.get(source, 0)
+            return copy.deepcopy(self._listings[source])
+
+    def store_listing(self, source: str, payload: Any, page_fetches: int = 1) -> None:
+        """
+        記事一覧を保存する
+
+        Args:
+            source: ソース名
+            payload: 時間範囲フィルタ適用前の一覧データ
+            page_fetches: 一覧取得に要したページ取得回数
+        """
+        with self._lock:
+            self._listings[source] = copy.deepcopy(payload)
+            self._listing_fetch_counts[source] = page_fetches
+
+    def get_body(self, url: str) -> Optional[str]:
+        """キャッシュ済みの本文を取得する（未取得の場合はNone）"""
+        with self._lock:
+            body = self._bodies.get(url)
+            if body is not None:
+                self.body_fetches_saved += 1
+            return body
+
+    def __contains__(self, url: str) -> bool:
+        """本文がキャッシュ済みかを確認する（統計には計上しない）"""
+        with self._lock:
+            return url in self._bodies
+
+    def store_body(self, url: str, body: str) -> None:
+        """取得に成功した本文を保存する"""
+        if not body:
+            return
+        with self._lock:
+            self._bodies[url] = body
+
+    @property
+    def fetches_saved(self) -> int:
+        """キャッシュにより省略できたフェッチの合計数"""
+        return self.listing_fetches_saved + self.body_fetches_saved
+
+    def get_stats(self) -> Dict[str, int]:
+        """キャッシュ統計を取得"""
+        with self._lock:
+            return {
+                "cached_listings": len(self._listings),
+                "cached_bodies": len(self._bodies),
+                "listing_fetches_saved": self.listing_fetches_saved,
+                "body_fetches_saved": self.body_fetches_saved,
+                "fetches_saved": self.listing_fetches_saved + self.body_fetches_saved,
+            }
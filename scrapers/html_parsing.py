@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+スクレイパー共通のHTML解析レイヤー
+
+- パーサー: lxml がインストールされていれば lxml、無ければ標準の html.parser を使う
+  （SCRAPING_HTML_PARSER で明示指定も可能）
+- 本文コンテナの探索ルールはサイトごとにモジュール読み込み時に1度だけ組み立て、
+  優先度順の複数ルールを文書の1回の走査で評価する
+- 記事ページは SoupStrainer で本文コンテナだけを木に組み立てて解析し、コンテナが
+  見つからない・本文が短い場合のみページ全体を解析し直す
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Pattern, Sequence, Tuple, TypeVar, Union
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+from src.config.app_config import get_config
+
+try:
+    import lxml  # noqa: F401
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+Markup = Union[str, bytes]
+T = TypeVar("T")
+
+
+def resolve_parser(preferred: str = "auto") -> str:
+    """
+    BeautifulSoup に渡すパーサー名を決定する
+
+    'auto' は lxml が使えれば lxml、使えなければ html.parser。
+    'lxml' を指定しても未インストールの場合は html.parser に戻す。
+    """
+    preferred = (preferred or "auto").strip().lower()
+    if preferred == "auto" or (preferred == "lxml" and not LXML_AVAILABLE):
+        return "lxml" if LXML_AVAILABLE else "html.parser"
+    return preferred
+
+
+def parse_html(markup: Markup, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """設定されたパーサーでHTMLを解析する（parse_only を指定すると一致した要素だけを木にする）"""
+    parser = resolve_parser(get_config().scraping.html_parser)
+    return BeautifulSoup(markup, parser, parse_only=parse_only)
+
+
+@dataclass(frozen=True)
+class ContainerRule:
+    """
+    本文コンテナの判定ルール
+
+    tag が None の場合は任意のタグ。class_pattern は BeautifulSoup の
+    class_=re.compile(...) と同様に、class 属性全体（空白区切り）を search する。
+    """
+
+    tag: Optional[str] = None
+    class_pattern: Optional[Pattern[str]] = None
+    attrs: Tuple[Tuple[str, str], ...] = field(default_factory=tuple)
+
+    def matches(self, element: Tag) -> bool:
+        if self.tag is not None and element.name != self.tag:
+            return False
+        for key, value in self.attrs:
+            if element.get(key) != value:
+                return False
+        if self.class_pattern is not None:
+            classes = element.get("class")
+            if not classes:
+                return False
+            joined = classes if isinstance(classes, str) else " ".join(classes)
+            return self.class_pattern.search(joined) is not None
+        return True
+
+    def strainer(self) -> SoupStrainer:
+        """このルールに一致する要素（とその子孫）だけを解析する SoupStrainer"""
+        attrs = dict(self.attrs)
+        if self.class_pattern is not None:
+            attrs["class"] = self.class_pattern
+        return SoupStrainer(self.tag, attrs=attrs)
+
+    def __str__(self) -> str:
+        parts = [self.tag or "*"]
+        parts += [f'[{key}="{value}"]' for key, value in self.attrs]
+        if self.class_pattern is not None:
+            parts.append(f"(class~/{self.class_pattern.pattern}/)")
+        return "".join(parts)
+
+
+class ContainerSelector:
+    """
+    優先度順の本文コンテナ探索ルール（サイトごとに1つ生成して使い回す）
+
+    find() は各ルールについて文書順で最初に一致した要素を求め、最も優先度の高い
+    ルールの要素を返す。ルールごとに find を繰り返す場合と結果は同じだが、
+    文書の走査は1回で済み、最優先ルールに一致した時点で打ち切る。
+    """
+
+    def __init__(self, rules: Sequence[ContainerRule]):
+        if not rules:
+            raise ValueError("ルールが空です")
+        self.rules = tuple(rules)
+        # 任意タグのルールが無ければ、対象タグ名で先に絞り込む
+        self._tag_names = (
+            None if any(rule.tag is None for rule in self.rules)
+            else frozenset(rule.tag for rule in self.rules)
+        )
+        # コンテナのみ解析は最優先ルール（現行のページ構造）で行う
+        self.strainer = self.rules[0].strainer()
+
+    def find(self, soup: Union[BeautifulSoup, Tag]) -> Tuple[Optional[Tag], Optional[ContainerRule]]:
+        """最も優先度の高いルールに一致したコンテナとそのルールを返す（無ければ (None, None)）"""
+        best_index, best = len(self.rules), None
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            if self._tag_names is not None and element.name not in self._tag_names:
+                continue
+            for index in range(best_index):
+                if self.rules[index].matches(element):
+                    best_index, best = index, element
+                    break
+            if best_index == 0:
+                break
+        return best, (self.rules[best_index] if best is not None else None)
+
+    def parse_and_extract(
+        self,
+        markup: Markup,
+        extract: Callable[[BeautifulSoup], Optional[T]],
+        min_length: int = 50,
+    ) -> Optional[T]:
+        """
+        本文コンテナだけを解析して extract を実行し、コンテナが無い・結果が
+        min_length 文字未満の場合はページ全体を解析して extract をやり直す
+
+        Args:
+            markup: ページのHTML
+            extract: 解析結果から本文を取り出す関数
+            min_length: コンテナのみ解析の結果を採用する最小文字数
+
+        Returns:
+            extract の戻り値
+        """
+        if get_config().scraping.container_only_parsing:
+            partial = parse_html(markup, parse_only=self.strainer)
+            if partial.find(True) is not None:
+                result = extract(partial)
+                if result and len(str(result).strip()) >= min_length:
+                    return result
+        return extract(parse_html(markup))
+
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+スクレイパー共通の HTTP フェッチャー
+
+1つの requests.Session を共有して keep-alive 接続を再利用し、ホストごとの
+同時接続数を制限する。リトライ間隔はジッター付き指数バックオフで決める。
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# リトライ対象とする HTTP ステータス
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class PooledHttpFetcher:
+    """接続プール付き Session とホスト別同時接続制限を持つフェッチャー"""
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: int = 10,
+        per_host_limit: int = 4,
+        backoff_base: float = 1.0,
+        backoff_max: float = 10.0,
+    ):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+        self.per_host_limit = max(1, per_host_limit)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+    def get(self, url: str, timeout: float, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        ホスト別の同時接続数制限のもとで GET を1回実行する
+
+        Raises:
+            requests.exceptions.RequestException: 通信エラー・HTTPエラー時
+        """
+        with self._host_semaphore(url):
+            return self.session.get(url, headers=headers, timeout=timeout)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """ジッター付き指数バックオフの待機秒数（full jitter）"""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def sleep_before_retry(self, attempt: int) -> None:
+        """リトライ前にバックオフ時間だけ待機する"""
+        time.sleep(self.backoff_delay(attempt))
+
+    def close(self) -> None:
+        """Session を閉じて接続を解放する"""
+        self.session.close()
+
+    def __enter__(self) -> "PooledHttpFetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
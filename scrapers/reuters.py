@@ -26,9 +26,14 @@ except ImportError:
     TimeoutException = Exception  # type: ignore
 import tempfile
 import os
+import queue
+import threading
+import shutil
 from pathlib import Path
 
 from src.config.app_config import get_config
+from src.tracing import trace_span
+from scrapers.html_parsing import ContainerRule, ContainerSelector, parse_html
 
 # --- 設定の読み込み ---
 config = get_config()
@@ -79,37 +84,29 @@ def _build_chrome_options(user_data_dir: str) -> Options:
     return opts
 
 
+# 本文コンテナの探索ルール（優先度順）
+# data-testid="ArticleBody"（現行の確実な構造）→ class パターン → article タグ → main タグ
+REUTERS_BODY_CONTAINER = ContainerSelector([
+    ContainerRule(attrs=(("data-testid", "ArticleBody"),)),
+    ContainerRule('div', re.compile(r'article-body-module__content__')),
+    ContainerRule('div', re.compile(r'article-body-module__container__')),
+    ContainerRule('div', re.compile(r'article-body__content__')),
+    ContainerRule('div', re.compile(r'article.*body|body.*content', re.I)),
+    ContainerRule('article'),
+    ContainerRule('div', re.compile(r'story.*body|content.*body', re.I)),
+    ContainerRule('main'),
+])
+
+
 def _extract_body_from_soup(soup: BeautifulSoup, article_url: str) -> str:
     """
     BeautifulSoup オブジェクトから記事本文を抽出する。
     Selenium・requests どちらの取得結果にも使える共通ロジック。
     """
     # --- コンテナ特定 ---
-    # 優先度順: data-testid="ArticleBody" → class パターン → article タグ → main タグ
-    body_container = None
-
-    # 1. data-testid="ArticleBody" (現行の確実な構造)
-    body_container = soup.find(attrs={"data-testid": "ArticleBody"})
-
-    if not body_container:
-        container_selectors = [
-            ('div', re.compile(r'article-body-module__content__')),
-            ('div', re.compile(r'article-body-module__container__')),
-            ('div', re.compile(r'article-body__content__')),
-            ('div', re.compile(r'article.*body|body.*content', re.I)),
-            ('article', None),
-            ('div', re.compile(r'story.*body|content.*body', re.I)),
-            ('main', None),
-        ]
-        for tag, class_pattern in container_selectors:
-            if class_pattern:
-                container = soup.find(tag, class_=class_pattern)
-            else:
-                container = soup.find(tag)
-            if container:
-                body_container = container
-                print(f"  [記事本文取得] 本文コンテナ発見: {tag}要素 ({class_pattern})")
-                break
+    body_container, rule = REUTERS_BODY_CONTAINER.find(soup)
+    if body_container is not None and rule is not REUTERS_BODY_CONTAINER.rules[0]:
+        print(f"  [記事本文取得] 本文コンテナ発見: {rule}")
 
     if not body_container:
         print(f"  [記事本文取得] 本文コンテナが見つかりません: {article_url}")
@@ -182,6 +179,16 @@ def _extract_body_from_soup(soup: BeautifulSoup, article_url: str) -> str:
     return re.sub(r'\s+', ' ', article_text).strip()
 
 
+def _extract_body_from_html(page_source: str, article_url: str) -> str:
+    """
+    ページのHTMLから記事本文を抽出する。
+    本文コンテナだけを解析し、見つからない・本文が短い場合はページ全体を解析し直す。
+    """
+    return REUTERS_BODY_CONTAINER.parse_and_extract(
+        page_source, lambda soup: _extract_body_from_soup(soup, article_url)
+    ) or ""
+
+
 def scrape_reuters_article_body_with_selenium(
     driver: "webdriver.Chrome",  # type: ignore[name-defined]
     article_url: str,
@@ -211,8 +218,7 @@ def scrape_reuters_article_body_with_selenium(
                 # タイムアウトしても page_source は取得を試みる
                 print(f"  [記事本文取得/Selenium] ArticleBody 待機タイムアウト: {article_url}")
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            body_text = _extract_body_from_soup(soup, article_url)
+            body_text = _extract_body_from_html(driver.page_source, article_url)
 
             if body_text:
                 print(f"  [記事本文取得/Selenium] 成功 (長さ: {len(body_text)}文字): {article_url}")
@@ -234,184 +240,429 @@ def scrape_reuters_article_body_with_selenium(
     return ""
 
 
-def scrape_reuters_articles(query: str, hours_limit: int, max_pages: int,
-                            items_per_page: int, target_categories: list,
-                            exclude_keywords: list) -> list:
-    """ロイターのサイト内検索を利用して記事情報を収集する"""
-
-    base_search_url = "https://jp.reuters.com/site-search/"
-
-    # Chrome プロファイルを一時ディレクトリに作成（他インスタンスとの衝突を防ぐ）
-    user_data_dir = tempfile.mkdtemp(prefix="chrome-reuters-", dir=str(Path.cwd()))
+def _start_reuters_driver(user_data_dir: str) -> "webdriver.Chrome":  # type: ignore[name-defined]
+    """一時プロファイルを使った Reuters 用の Chrome driver を起動する"""
     chrome_options = _build_chrome_options(user_data_dir)
     # 記事一覧ページと本文ページの両方を同一 driver で扱うため
     # remote-debugging-port は衝突回避のためポートを固定しない
     chrome_options.add_argument("--remote-debugging-port=0")
 
-    driver = None
-    print("\n--- ロイター記事のスクレイピング開始 ---")
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_page_load_timeout(scraping_config.page_load_timeout)
+    driver.implicitly_wait(scraping_config.implicit_wait)
+    return driver
 
-    articles_to_process = []
-    processed_urls = set()
 
+class _DriverSlot:
+    """プール内の driver と、そのプロファイルディレクトリ"""
+
+    def __init__(self, driver=None, user_data_dir=None, owns_dir=True):
+        self.driver = driver
+        self.user_data_dir = user_data_dir
+        self.owns_dir = owns_dir
+
+
+class ReutersDriverPool:
+    """
+    記事本文取得用のヘッドレス Chrome driver プール。
+
+    driver は初回利用時に起動し、以降は使い回す（ウォーム状態を維持）。
+    各 driver は専用のプロファイルディレクトリを持つ。応答しなくなった
+    driver は recycle() で破棄・再起動され、バッチ全体は継続する。
+    """
+
+    def __init__(self, size: int, seed_driver=None):
+        self.size = max(1, size)
+        self._slots: "queue.Queue[_DriverSlot]" = queue.Queue()
+        self._all_slots = []
+        for i in range(self.size):
+            # 一覧取得で使った driver があれば最初のスロットとして引き継ぐ
+            # （プロファイルディレクトリの削除は呼び出し側の責務）
+            if i == 0 and seed_driver is not None:
+                slot = _DriverSlot(seed_driver, None, owns_dir=False)
+            else:
+                slot = _DriverSlot()
+            self._all_slots.append(slot)
+            self._slots.put(slot)
+        self.recycled_count = 0
+
+    def acquire(self) -> _DriverSlot:
+        """空いているスロットを取得し、必要なら driver を起動する"""
+        slot = self._slots.get()
+        if slot.driver is None:
+            try:
+                self._start(slot)
+            except Exception:
+                self._slots.put(slot)
+                raise
+        return slot
+
+    def release(self, slot: _DriverSlot) -> None:
+        """スロットをプールに返却する"""
+        self._slots.put(slot)
+
+    def recycle(self, slot: _DriverSlot) -> None:
+        """故障した driver を破棄する（次回 acquire 時に新しく起動される）"""
+        self._stop(slot)
+        self.recycled_count += 1
+
+    def close(self) -> None:
+        """全ての driver を終了し、プロファイルディレクトリを削除する"""
+        for slot in self._all_slots:
+            self._stop(slot)
+
+    def _start(self, slot: _DriverSlot) -> None:
+        slot.user_data_dir = tempfile.mkdtemp(prefix="chrome-reuters-body-", dir=str(Path.cwd()))
+        slot.owns_dir = True
+        slot.driver = _start_reuters_driver(slot.user_data_dir)
+
+    @staticmethod
+    def _stop(slot: _DriverSlot) -> None:
+        if slot.driver is not None:
+            try:
+                slot.driver.quit()
+            except Exception:
+                pass
+        if slot.owns_dir and slot.user_data_dir:
+            shutil.rmtree(slot.user_data_dir, ignore_errors=True)
+        slot.driver = None
+        slot.user_data_dir = None
+        slot.owns_dir = True
+
+
+def _is_driver_alive(driver) -> bool:
+    """driver がまだ操作可能かを確認する"""
     try:
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.set_page_load_timeout(scraping_config.page_load_timeout)
-        driver.implicitly_wait(scraping_config.implicit_wait)
+        _ = driver.current_url
+        return True
+    except Exception:
+        return False
 
-        jst = pytz.timezone('Asia/Tokyo')
-        time_threshold_jst = datetime.now(jst) - timedelta(hours=hours_limit)
 
-        # ────────────────────────────────────────────
-        # Step 1: 記事一覧をスクレイピング
-        # ────────────────────────────────────────────
-        for page_num in range(max_pages):
-            offset = page_num * items_per_page
-            search_url = (
-                f"{base_search_url}"
-                f"?query={requests.utils.quote(query)}&offset={offset}"
+def _fetch_reuters_bodies_with_pool(articles: list, pool: ReutersDriverPool,
+                                    on_result=None) -> list:
+    """
+    driver プールで記事本文を並列取得する。
+
+    on_result(article, body) が渡された場合、各記事の取得完了時に取得スレッドから呼び出す。
+
+    Returns:
+        articles と同じ順序の本文リスト（取得失敗時は空文字、例外時は例外オブジェクト）
+    """
+    def fetch(article):
+        body = fetch_body(article)
+        if on_result is not None:
+            on_result(article, body)
+        return body
+
+    def fetch_body(article):
+        try:
+            slot = pool.acquire()
+        except Exception as exc:
+            return exc
+        try:
+            body = scrape_reuters_article_body_with_selenium(
+                slot.driver, article['url'],
+                selenium_timeout=scraping_config.selenium_timeout,
             )
-            print(f"  ロイター: ページ {page_num + 1}/{max_pages} を処理中 ({search_url})...")
+            if not body and not _is_driver_alive(slot.driver):
+                print(f"  [driverプール] 応答しない driver を再起動します: {article['url']}")
+                pool.recycle(slot)
+            return body
+        except Exception as exc:
+            pool.recycle(slot)
+            return exc
+        finally:
+            pool.release(slot)
+
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        # map は入力順で結果を返す
+        return list(executor.map(fetch, articles))
+
+
+def _scrape_reuters_listing(driver, query: str, max_pages: int, items_per_page: int,
+                            target_categories: list, exclude_keywords: list) -> tuple:
+    """
+    検索結果一覧から記事候補を収集する。
 
-            page_loaded = False
-            for attempt in range(scraping_config.selenium_max_retries):
-                try:
-                    current_timeout = 30 if attempt == 0 else 50
-                    wait_with_timeout = WebDriverWait(driver, current_timeout)
-                    driver.get(search_url)
-                    wait_with_timeout.until(
-                        EC.presence_of_element_located(
-                            (By.CSS_SELECTOR, 'li[data-testid="StoryCard"]')
-                        )
+    時間範囲フィルタは適用しない（呼び出し側で適用する）。一覧は時間範囲に
+    依存せず同じページを巡回するため、結果を試行間で再利用できる。
+
+    Returns:
+        (記事候補リスト, 取得したページ数)
+    """
+    base_search_url = "https://jp.reuters.com/site-search/"
+    jst = pytz.timezone('Asia/Tokyo')
+
+    candidates = []
+    processed_urls = set()
+    pages_fetched = 0
+
+    for page_num in range(max_pages):
+        offset = page_num * items_per_page
+        search_url = (
+            f"{base_search_url}"
+            f"?query={requests.utils.quote(query)}&offset={offset}"
+        )
+        print(f"  ロイター: ページ {page_num + 1}/{max_pages} を処理中 ({search_url})...")
+
+        page_loaded = False
+        for attempt in range(scraping_config.selenium_max_retries):
+            try:
+                current_timeout = 30 if attempt == 0 else 50
+                wait_with_timeout = WebDriverWait(driver, current_timeout)
+                driver.get(search_url)
+                wait_with_timeout.until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, 'li[data-testid="StoryCard"]')
                     )
-                    page_loaded = True
-                    break
-                except TimeoutException:
+                )
+                page_loaded = True
+                break
+            except TimeoutException:
+                print(
+                    f"    [!] ページ読み込みタイムアウト "
+                    f"({current_timeout}秒, {attempt + 1}/{scraping_config.selenium_max_retries})。"
+                    f"リトライします..."
+                )
+                if attempt + 1 == scraping_config.selenium_max_retries:
                     print(
-                        f"    [!] ページ読み込みタイムアウト "
-                        f"({current_timeout}秒, {attempt + 1}/{scraping_config.selenium_max_retries})。"
-                        f"リトライします..."
+                        f"    [!] リトライ上限に達したため、"
+                        f"このページ ({search_url}) をスキップします。"
                     )
-                    if attempt + 1 == scraping_config.selenium_max_retries:
-                        print(
-                            f"    [!] リトライ上限に達したため、"
-                            f"このページ ({search_url}) をスキップします。"
-                        )
 
-            if not page_loaded:
+        pages_fetched += 1
+        if not page_loaded:
+            continue
+
+        soup = parse_html(driver.page_source)
+        articles_on_page = soup.find_all('li', attrs={"data-testid": "StoryCard"})
+
+        print(f"    - ページで見つかった記事候補: {len(articles_on_page)}件")
+
+        if not articles_on_page:
+            if page_num == 0:
+                print("    [!] 最初のページで記事が見つかりませんでした。サイト構造が変更された可能性があります。")
+                fallback_articles = soup.find_all(
+                    'li', class_=lambda x: x and 'search-result' in x.lower()
+                )
+                print(f"    [デバッグ] フォールバック検索結果: {len(fallback_articles)}件")
+            else:
+                print(f"    - ページ{page_num + 1}で記事が見つからなかったため処理を終了します。")
+            break
+
+        articles_found_on_page = 0
+        for article_li in articles_on_page:
+            link_element = article_li.find('a', attrs={"data-testid": "TitleLink"})
+            if not link_element:
+                print("    [デバッグ] リンク要素が見つからない記事をスキップ")
                 continue
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            articles_on_page = soup.find_all('li', attrs={"data-testid": "StoryCard"})
+            article_url = link_element.get('href', '')
+            if not article_url.startswith('http'):
+                article_url = "https://jp.reuters.com" + article_url
 
-            print(f"    - ページで見つかった記事候補: {len(articles_on_page)}件")
+            if article_url in processed_urls:
+                print(f"    [デバッグ] 重複URL をスキップ: {article_url}")
+                continue
+            processed_urls.add(article_url)
 
-            if not articles_on_page:
-                if page_num == 0:
-                    print("    [!] 最初のページで記事が見つかりませんでした。サイト構造が変更された可能性があります。")
-                    fallback_articles = soup.find_all(
-                        'li', class_=lambda x: x and 'search-result' in x.lower()
-                    )
-                    print(f"    [デバッグ] フォールバック検索結果: {len(fallback_articles)}件")
-                else:
-                    print(f"    - ページ{page_num + 1}で記事が見つからなかったため処理を終了します。")
-                break
+            title = link_element.get_text(strip=True) or "タイトル不明"
+            print(f"    > 記事候補発見: {title}")
+            articles_found_on_page += 1
 
-            articles_found_on_page = 0
-            for article_li in articles_on_page:
-                link_element = article_li.find('a', attrs={"data-testid": "TitleLink"})
-                if not link_element:
-                    print("    [デバッグ] リンク要素が見つからない記事をスキップ")
-                    continue
+            time_element = article_li.find('time', attrs={"data-testid": "DateLineText"})
+            try:
+                dt_utc = datetime.fromisoformat(
+                    time_element.get('datetime').replace('Z', '+00:00')
+                )
+                article_time_jst = dt_utc.astimezone(jst)
+            except (ValueError, AttributeError):
+                print(f"    [デバッグ] 時刻解析失敗のためスキップ: {title}")
+                continue
 
-                article_url = link_element.get('href', '')
-                if not article_url.startswith('http'):
-                    article_url = "https://jp.reuters.com" + article_url
+            title_text = link_element.get_text(strip=True)
+            if any(kw.lower() in title_text.lower() for kw in exclude_keywords):
+                print(f"    [デバッグ] 除外キーワードでスキップ: {title_text}")
+                continue
 
-                if article_url in processed_urls:
-                    print(f"    [デバッグ] 重複URL をスキップ: {article_url}")
-                    continue
-                processed_urls.add(article_url)
+            kicker = article_li.find('span', attrs={"data-testid": "KickerLabel"})
+            category_text = (
+                kicker.get_text(strip=True).replace(" category", "")
+                if kicker else "不明"
+            )
 
-                title = link_element.get_text(strip=True) or "タイトル不明"
-                print(f"    > 記事候補発見: {title}")
-                articles_found_on_page += 1
+            if target_categories and category_text not in target_categories:
+                print(f"    [デバッグ] カテゴリ対象外でスキップ: {title_text} (カテゴリ: {category_text})")
+                continue
 
-                time_element = article_li.find('time', attrs={"data-testid": "DateLineText"})
-                try:
-                    dt_utc = datetime.fromisoformat(
-                        time_element.get('datetime').replace('Z', '+00:00')
-                    )
-                    article_time_jst = dt_utc.astimezone(jst)
-                except (ValueError, AttributeError):
-                    print(f"    [デバッグ] 時刻解析失敗のためスキップ: {title}")
-                    continue
-
-                if article_time_jst < time_threshold_jst:
-                    print(f"    [デバッグ] 時間制限外のためスキップ: {title} ({article_time_jst})")
-                    continue
-
-                title_text = link_element.get_text(strip=True)
-                if any(kw.lower() in title_text.lower() for kw in exclude_keywords):
-                    print(f"    [デバッグ] 除外キーワードでスキップ: {title_text}")
-                    continue
-
-                kicker = article_li.find('span', attrs={"data-testid": "KickerLabel"})
-                category_text = (
-                    kicker.get_text(strip=True).replace(" category", "")
-                    if kicker else "不明"
-                )
+            candidates.append({
+                'source': 'Reuters',
+                'title': title_text,
+                'url': article_url,
+                'published_jst': article_time_jst,
+                'category': category_text,
+            })
+
+        print(
+            f"    - ページ{page_num + 1}の処理完了: "
+            f"候補{articles_found_on_page}件中、条件に合致した記事数を追加"
+        )
 
-                if target_categories and category_text not in target_categories:
-                    print(f"    [デバッグ] カテゴリ対象外でスキップ: {title_text} (カテゴリ: {category_text})")
-                    continue
+        if len(articles_on_page) < items_per_page:
+            print("    [i] 記事がページあたりのアイテム数より少ないため、最終ページと判断し終了します。")
+            break
 
-                print(f"    > 記事発見: {title_text}")
-                articles_to_process.append({
-                    'source': 'Reuters',
-                    'title': title_text,
-                    'url': article_url,
-                    'published_jst': article_time_jst,
-                    'category': category_text,
-                })
+        time.sleep(1)
 
-            print(
-                f"    - ページ{page_num + 1}の処理完了: "
-                f"候補{articles_found_on_page}件中、条件に合致した記事数を追加"
-            )
+    return candidates, pages_fetched
 
-            if len(articles_on_page) < items_per_page:
-                print("    [i] 記事がページあたりのアイテム数より少ないため、最終ページと判断し終了します。")
-                break
 
-            time.sleep(1)
+def scrape_reuters_articles(query: str, hours_limit: int, max_pages: int,
+                            items_per_page: int, target_categories: list,
+                            exclude_keywords: list, collection_cache=None,
+                            body_cache=None, stored_article_lookup=None,
+                            on_article=None) -> list:
+    """
+    ロイターのサイト内検索を利用して記事情報を収集する
+
+    collection_cache (ScrapeCollectionCache) が渡された場合、前回の試行で取得した
+    記事一覧と本文を再利用し、新たに時間範囲へ入った記事の本文のみを取得する。
+    body_cache (ArticleBodyCache) が渡された場合、DB保存済みの記事はキャッシュの
+    本文を使用し、ブラウザでの本文取得を省略する。
+    stored_article_lookup(source, urls) -> {url: body} が渡された場合、本文取得の前に
+    候補を一括でDB照会し、保存済みの記事は保存済みの本文を使用する。
+    on_article(article) が渡された場合、本文が確定した記事から順に呼び出す
+    （全件の取得完了を待たずに後続処理へ渡すためのフック）。
+    """
+
+    # Chrome プロファイルを一時ディレクトリに作成（他インスタンスとの衝突を防ぐ）
+    user_data_dir = tempfile.mkdtemp(prefix="chrome-reuters-", dir=str(Path.cwd()))
+
+    driver = None
+    print("\n--- ロイター記事のスクレイピング開始 ---")
+
+    final_articles_data = []
+
+    try:
+        jst = pytz.timezone('Asia/Tokyo')
+        time_threshold_jst = datetime.now(jst) - timedelta(hours=hours_limit)
+
+        # ────────────────────────────────────────────
+        # Step 1: 記事一覧をスクレイピング（キャッシュがあれば再利用）
+        # ────────────────────────────────────────────
+        candidates = (
+            collection_cache.get_listing('Reuters') if collection_cache is not None else None
+        )
+        if candidates is None:
+            with trace_span("reuters.listing", category="scrape") as listing_span:
+                driver = _start_reuters_driver(user_data_dir)
+                candidates, pages_fetched = _scrape_reuters_listing(
+                    driver, query, max_pages, items_per_page, target_categories, exclude_keywords
+                )
+                listing_span.add(items=len(candidates))
+                listing_span.set(pages=pages_fetched)
+            if collection_cache is not None:
+                collection_cache.store_listing('Reuters', candidates, page_fetches=pages_fetched)
+        else:
+            print(f"  ロイター: キャッシュ済みの記事一覧を再利用します ({len(candidates)}件)")
+
+        articles_to_process = []
+        for candidate in candidates:
+            if candidate['published_jst'] < time_threshold_jst:
+                print(
+                    f"    [デバッグ] 時間制限外のためスキップ: "
+                    f"{candidate['title']} ({candidate['published_jst']})"
+                )
+                continue
+            print(f"    > 記事発見: {candidate['title']}")
+            articles_to_process.append(candidate)
 
         if not articles_to_process:
             print("--- ロイター: 処理対象の記事が見つかりませんでした ---")
             return []
 
         # ────────────────────────────────────────────
-        # Step 2: 同一 driver で記事本文を順次取得
-        #         （401 対策: requests を使わず Selenium 経由）
+        # Step 2: 本文取得対象の絞り込み（キャッシュ・DB保存済みを除外）
         # ────────────────────────────────────────────
-        print(
-            f"\n--- {len(articles_to_process)}件の記事本文を Selenium で順次取得開始 ---"
+        pending_urls = [
+            article['url'] for article in articles_to_process
+            if collection_cache is None or article['url'] not in collection_cache
+        ]
+        stored_bodies = (
+            stored_article_lookup('Reuters', pending_urls)
+            if stored_article_lookup is not None and pending_urls else {}
         )
+        if collection_cache is not None:
+            # 次の試行では DB への再照会も不要にする
+            for url, body in stored_bodies.items():
+                collection_cache.store_body(url, body)
+
+        articles_to_fetch = []
+        for article in articles_to_process:
+            cached_body = stored_bodies.get(article['url'])
+            if cached_body is None and collection_cache is not None:
+                cached_body = collection_cache.get_body(article['url'])
+            if cached_body is None and body_cache is not None:
+                cached_body = body_cache.lookup_known(article['url'])
+            if cached_body is not None:
+                article['body'] = cached_body
+            else:
+                articles_to_fetch.append(article)
 
-        final_articles_data = []
-        for i, article in enumerate(articles_to_process):
-            try:
-                body = scrape_reuters_article_body_with_selenium(
-                    driver, article['url'],
-                    selenium_timeout=scraping_config.selenium_timeout,
-                )
-                article['body'] = body if body else "[本文取得失敗/空]"
-                final_articles_data.append(article)
-                print(f"  ({i + 1}/{len(articles_to_process)}) 完了: {article['title']}")
-            except Exception as exc:
-                print(f"  [!!] 記事取得中に例外発生 ({article['url']}): {exc}")
-                article['body'] = f"[本文取得エラー: {exc}]"
-                final_articles_data.append(article)
+        reused_count = len(articles_to_process) - len(articles_to_fetch)
+        if reused_count:
+            print(f"  ロイター: キャッシュ済みの本文を再利用 ({reused_count}件)")
+            if on_article is not None:
+                for article in articles_to_process:
+                    if 'body' in article:
+                        on_article(article)
+
+        # ────────────────────────────────────────────
+        # Step 3: driver プールで記事本文を並列取得
+        #         （401 対策: requests を使わず Selenium 経由）
+        # ────────────────────────────────────────────
+        if articles_to_fetch:
+            pool_size = min(reuters_config.body_driver_pool_size, len(articles_to_fetch))
+            print(
+                f"\n--- {len(articles_to_fetch)}件の記事本文を Selenium で並列取得開始 "
+                f"(driver数: {pool_size}) ---"
+            )
+            # 一覧取得で起動済みの driver はプールへ引き継ぐ
+            pool = ReutersDriverPool(pool_size, seed_driver=driver)
+            driver = None
+            result_lock = threading.Lock()
+            completed = [0]
+
+            def apply_body(article, body):
+                # 取得スレッドから完了順に呼ばれるため、キャッシュ更新と出力は直列化する
+                with result_lock:
+                    completed[0] += 1
+                    if isinstance(body, Exception):
+                        print(f"  [!!] 記事取得中に例外発生 ({article['url']}): {body}")
+                        article['body'] = f"[本文取得エラー: {body}]"
+                    else:
+                        article['body'] = body if body else "[本文取得失敗/空]"
+                        if body and collection_cache is not None:
+                            collection_cache.store_body(article['url'], body)
+                        if body and body_cache is not None:
+                            # Selenium 経由では検証子を取得できないため本文のみ保存する
+                            body_cache.record("misses")
+                            body_cache.put(article['url'], body)
+                        fetch_span.add(items=1, bytes=len(body or ""))
+                        print(f"  ({completed[0]}/{len(articles_to_fetch)}) 完了: {article['title']}")
+                if on_article is not None:
+                    on_article(article)
+
+            with trace_span("reuters.body_fetch", category="scrape", drivers=pool_size) as fetch_span:
+                try:
+                    _fetch_reuters_bodies_with_pool(articles_to_fetch, pool, on_result=apply_body)
+                finally:
+                    pool.close()
+            if pool.recycled_count:
+                print(f"  [driverプール] 再起動した driver 数: {pool.recycled_count}")
+
+        final_articles_data = articles_to_process
 
     except Exception as e:
         print(f"  ロイタースクレイピングのブラウザ操作中に予期せぬエラーが発生しました: {e}")
@@ -420,7 +671,6 @@ def scrape_reuters_articles(query: str, hours_limit: int, max_pages: int,
             driver.quit()
         # 一時プロファイルディレクトリを削除
         try:
-            import shutil
             shutil.rmtree(user_data_dir, ignore_errors=True)
         except Exception:
             pass
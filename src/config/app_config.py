@@ -29,6 +29,21 @@ class ScrapingConfig:
     minimum_article_count: int = 100  # 最低記事数閾値
     max_hours_limit: int = 72  # 最大時間範囲（時間）
     weekend_hours_extension: int = 48  # 週末拡張時間（時間）
+    # 時間範囲拡張時に前回試行の一覧・本文を再利用する
+    incremental_collection: bool = os.getenv("SCRAPING_INCREMENTAL_COLLECTION", "true").lower() == "true"
+    # 本文取得前にDB保存済みの記事を一括照会し、本文取得を省略する
+    skip_stored_article_bodies: bool = os.getenv("SCRAPING_SKIP_STORED_ARTICLE_BODIES", "true").lower() == "true"
+    # 記事本文の永続キャッシュ（ETag / Last-Modified による条件付きGET）
+    body_cache_enabled: bool = os.getenv("SCRAPING_BODY_CACHE_ENABLED", "true").lower() == "true"
+    body_cache_path: str = os.getenv("SCRAPING_BODY_CACHE_PATH", "cache/article_bodies.db")
+    body_cache_retention_days: int = 30
+    # 収集・DB保存・AI要約を有界キューでつなぎ、記事単位で重ねて実行する
+    streaming_pipeline_enabled: bool = os.getenv("SCRAPING_STREAMING_PIPELINE_ENABLED", "false").lower() == "true"
+    streaming_queue_size: int = int(os.getenv("SCRAPING_STREAMING_QUEUE_SIZE", "64"))
+    # HTMLパーサー: 'auto'（lxml があれば使用）/ 'lxml' / 'html.parser'
+    html_parser: str = os.getenv("SCRAPING_HTML_PARSER", "auto")
+    # 記事ページは本文コンテナだけを解析する（見つからない場合はページ全体を解析）
+    container_only_parsing: bool = os.getenv("SCRAPING_CONTAINER_ONLY_PARSING", "true").lower() == "true"
 
 
 @dataclass
@@ -39,6 +54,7 @@ class ReutersConfig:
     max_pages: int = 5
     items_per_page: int = 20
     num_parallel_requests: int = 8  # 記事本文を並列取得する際のスレッド数
+    body_driver_pool_size: int = int(os.getenv("REUTERS_BODY_DRIVER_POOL_SIZE", "3"))  # 本文取得用 Chrome driver 数
     target_categories: List[str] = field(
         default_factory=lambda: [
             "ビジネスcategory",
@@ -81,6 +97,11 @@ class BloombergConfig:
     """ブルームバーグ設定"""
 
     num_parallel_requests: int = 6  # 記事本文を並列取得する際のスレッド数
+    # 同一ホストへの同時接続数の上限。本文は全て同一ホストから取得するため、
+    # num_parallel_requests より小さくすると実効並列数はこの値まで下がる
+    per_host_concurrency: int = 6
+    retry_backoff_base: float = 1.0  # リトライ待機の基準秒数（ジッター付き指数バックオフ）
+    retry_backoff_max: float = 10.0  # リトライ待機の上限秒数
     exclude_keywords: List[str] = field(
         default_factory=lambda: [
             "動画",
@@ -116,6 +137,24 @@ class AIConfig:
     max_output_tokens: int = 1024
     temperature: float = 0.2
 
+    # 複数記事を1リクエストにまとめるバッチ要約
+    batch_summarization_enabled: bool = os.getenv("AI_BATCH_SUMMARIZATION_ENABLED", "true").lower() == "true"
+    batch_max_articles: int = int(os.getenv("AI_BATCH_MAX_ARTICLES", "5"))  # 1リクエストあたりの最大記事数
+    batch_token_budget: int = int(os.getenv("AI_BATCH_TOKEN_BUDGET", "8000"))  # 1リクエストあたりの入力トークン上限
+
+    # LLMリクエストのレート制御（RPM/TPMトークンバケット + AIMD同時実行数）
+    requests_per_minute: int = int(os.getenv("AI_REQUESTS_PER_MINUTE", "60"))
+    tokens_per_minute: int = int(os.getenv("AI_TOKENS_PER_MINUTE", "1000000"))
+    initial_concurrency: int = int(os.getenv("AI_INITIAL_CONCURRENCY", "5"))
+    max_concurrency: int = int(os.getenv("AI_MAX_CONCURRENCY", "10"))
+    rate_limit_max_retries: int = int(os.getenv("AI_RATE_LIMIT_MAX_RETRIES", "3"))
+
+    # LLM応答キャッシュ（同一内容の再要約でAPIを呼ばない）
+    response_cache_enabled: bool = os.getenv("AI_RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    response_cache_path: str = os.getenv("AI_RESPONSE_CACHE_PATH", "cache/llm_responses.db")
+    response_cache_ttl_hours: int = int(os.getenv("AI_RESPONSE_CACHE_TTL_HOURS", "168"))
+    response_cache_max_entries: int = int(os.getenv("AI_RESPONSE_CACHE_MAX_ENTRIES", "5000"))
+
     process_prompt_template: str = """
 あなたは10年以上の経験を持つ金融市場専門のニュース編集者兼アナリストです。
 日本の金融・経済市場に精通し、複雑な市場情報を一般読者にもわかりやすく伝える専門家です。
@@ -218,6 +257,26 @@ class SupabaseConfig:
     max_chunks_per_document: int = 50
     similarity_threshold: float = 0.7
 
+    # 埋め込みキャッシュ（モデル名 + 正規化テキストのハッシュをキーとする）
+    embedding_cache_enabled: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    embedding_cache_dir: str = os.getenv("EMBEDDING_CACHE_DIR", "cache/embeddings")
+    embedding_cache_max_entries: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "20000"))
+
+    # ローカルベクターインデックス（search_chunks RPC の代替）
+    local_index_enabled: bool = os.getenv("RAG_LOCAL_INDEX_ENABLED", "false").lower() == "true"
+    local_index_dir: str = os.getenv("RAG_LOCAL_INDEX_DIR", "cache/vector_index")
+    local_index_type: str = os.getenv("RAG_LOCAL_INDEX_TYPE", "flat")  # flat / ivf
+    local_index_nlist: int = int(os.getenv("RAG_LOCAL_INDEX_NLIST", "64"))
+    local_index_nprobe: int = int(os.getenv("RAG_LOCAL_INDEX_NPROBE", "8"))
+
+    # RAG検索のクエリ埋め込み・検索結果キャッシュ
+    search_cache_size: int = int(os.getenv("RAG_SEARCH_CACHE_SIZE", "256"))
+    search_cache_ttl_seconds: int = int(os.getenv("RAG_SEARCH_CACHE_TTL_SECONDS", "600"))
+
+    # ローカルキーワード（BM25）インデックス
+    keyword_index_enabled: bool = os.getenv("RAG_KEYWORD_INDEX_ENABLED", "false").lower() == "true"
+    keyword_index_dir: str = os.getenv("RAG_KEYWORD_INDEX_DIR", "cache/keyword_index")
+
 
 @dataclass
 class FileSearchConfig:
@@ -239,6 +298,9 @@ class LoggingConfig:
     file_path: str = "logs/market_news.log"
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     backup_count: int = 5
+    # 実行トレース（処理段ごとの時間・リソース計測）のDB保存と Chrome トレース出力
+    trace_enabled: bool = os.getenv("RUN_TRACE_ENABLED", "true").lower() == "true"
+    trace_dir: str = os.getenv("RUN_TRACE_DIR", "logs/traces")
 
 
 @dataclass
@@ -289,6 +351,12 @@ class PodcastConfig:
     lufs_target: float = -16.0
     peak_target: float = -1.0
 
+    # TTS セグメント合成（キャッシュ・並列度・レート制限）
+    tts_cache_enabled: bool = True
+    tts_cache_dir: str = "cache/tts_segments"
+    tts_max_concurrency: int = 4
+    tts_requests_per_minute: int = 300
+
     # 配信設定
     episode_prefix: str = "第"
     episode_suffix: str = "回"
@@ -321,6 +389,16 @@ class PodcastConfig:
         self.max_file_size_mb = int(
             os.getenv("PODCAST_MAX_FILE_SIZE_MB", str(self.max_file_size_mb))
         )
+        self.tts_cache_enabled = (
+            os.getenv("PODCAST_TTS_CACHE_ENABLED", str(self.tts_cache_enabled)).lower() == "true"
+        )
+        self.tts_cache_dir = os.getenv("PODCAST_TTS_CACHE_DIR", self.tts_cache_dir)
+        self.tts_max_concurrency = int(
+            os.getenv("PODCAST_TTS_MAX_CONCURRENCY", str(self.tts_max_concurrency))
+        )
+        self.tts_requests_per_minute = int(
+            os.getenv("PODCAST_TTS_REQUESTS_PER_MINUTE", str(self.tts_requests_per_minute))
+        )
 
     def load_pronunciation_dict(self) -> Dict[str, str]:
         """発音辞書を読み込み"""
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+
+"""
+記事のストリーミング処理パイプライン
+
+スクレイパーが本文を取得した記事から順に「重複排除 → DB保存 → AI要約」へ流す。
+各段は有界キューでつなぎ、後段が詰まった場合は前段（最終的にはスクレイパー）が
+待機する。これにより一方のソースの本文取得中に、もう一方の記事のAI要約を進められる。
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.logging_config import log_with_context
+
+# キュー終端を示す番兵
+_STOP = object()
+
+
+class StreamingArticlePipeline:
+    """スクレイピング・DB保存・AI要約を重ねて実行する生産者/消費者パイプライン"""
+
+    def __init__(
+        self,
+        save_articles: Callable[[List[Dict[str, Any]]], List[int]],
+        analyze_article_ids: Optional[Callable[[List[int]], None]] = None,
+        *,
+        queue_size: int = 64,
+        save_batch_size: int = 20,
+        ai_batch_size: int = 10,
+        ai_workers: int = 2,
+        max_ai_articles: Optional[int] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            save_articles: 記事リストを保存し、新規記事のIDを返す関数
+            analyze_article_ids: 記事IDリストをAI要約する関数（Noneの場合は保存のみ）
+            queue_size: 各段のキューの上限（超えると前段が待機する）
+            save_batch_size: 1回の保存でまとめる最大記事数
+            ai_batch_size: 1回のAI要約でまとめる最大記事数
+            ai_workers: AI要約段のワーカー数
+            max_ai_articles: 今回の実行でAI要約する新規記事数の上限
+        """
+        self.save_articles = save_articles
+        self.analyze_article_ids = analyze_article_ids
+        self.save_batch_size = max(1, save_batch_size)
+        self.ai_batch_size = max(1, ai_batch_size)
+        self.ai_workers = max(1, ai_workers) if analyze_article_ids is not None else 0
+        self.max_ai_articles = max_ai_articles
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._save_queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+        self._ai_queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+        self._lock = threading.Lock()
+        self._seen_urls = set()
+        self._threads: List[threading.Thread] = []
+        self._started_at: Optional[float] = None
+        self._closed = False
+
+        self.articles: List[Dict[str, Any]] = []
+        self.new_article_ids: List[int] = []
+        self.stats: Dict[str, Any] = {
+            "submitted": 0,
+            "duplicates": 0,
+            "saved": 0,
+            "new_articles": 0,
+            "ai_queued": 0,
+            "ai_deferred": 0,
+            "ai_analyzed": 0,
+            "save_batches": 0,
+            "ai_batches": 0,
+            "save_errors": 0,
+            "ai_errors": 0,
+            "producer_wait_seconds": 0.0,
+            "first_ai_start_seconds": None,
+            "elapsed_seconds": 0.0,
+        }
+
+    def start(self) -> "StreamingArticlePipeline":
+        """保存段・AI要約段のワーカーを起動"""
+        self._started_at = time.monotonic()
+        self._threads.append(
+            threading.Thread(target=self._save_worker, name="article-pipeline-save", daemon=True)
+        )
+        for index in range(self.ai_workers):
+            self._threads.append(
+                threading.Thread(
+                    target=self._ai_worker, name=f"article-pipeline-ai-{index}", daemon=True
+                )
+            )
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def __enter__(self) -> "StreamingArticlePipeline":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def submit(self, article: Dict[str, Any]) -> bool:
+        """
+        本文取得済みの記事を投入（スクレイパーのスレッドから呼ばれる）
+
+        保存キューが満杯の場合は空きが出るまで待機する。
+
+        Returns:
+            bool: 投入した場合True（同一URLの記事が投入済みの場合False）
+        """
+        url = article.get("url")
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("パイプラインは終了済みです")
+            self.stats["submitted"] += 1
+            if url in self._seen_urls:
+                self.stats["duplicates"] += 1
+                return False
+            self._seen_urls.add(url)
+
+        wait_start = time.monotonic()
+        self._save_queue.put(article)
+        waited = time.monotonic() - wait_start
+        with self._lock:
+            self.stats["producer_wait_seconds"] += waited
+        return True
+
+    def close(self) -> Dict[str, Any]:
+        """投入を締め切り、キュー内の記事の処理完了を待って統計を返す"""
+        with self._lock:
+            if self._closed:
+                return self.stats
+            self._closed = True
+        if self._threads:
+            self._save_queue.put(_STOP)
+            for thread in self._threads:
+                thread.join()
+        if self._started_at is not None:
+            self.stats["elapsed_seconds"] = round(time.monotonic() - self._started_at, 3)
+        self.stats["producer_wait_seconds"] = round(self.stats["producer_wait_seconds"], 3)
+
+        if self.stats["ai_deferred"]:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                f"AI処理対象を{self.max_ai_articles}件に制限しました "
+                f"({self.stats['new_articles']}件中)",
+                operation="streaming_pipeline",
+                deferred=self.stats["ai_deferred"],
+            )
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "ストリーミング処理完了",
+            operation="streaming_pipeline",
+            **self.stats,
+        )
+        return self.stats
+
+    @staticmethod
+    def _drain(source: "queue.Queue[Any]", first: Any, limit: int) -> List[Any]:
+        """最初の要素に続けて、待たずに取り出せる要素を上限までまとめる（番兵は末尾に残す）"""
+        items = [first]
+        while first is not _STOP and len(items) < limit:
+            try:
+                item = source.get_nowait()
+            except queue.Empty:
+                break
+            items.append(item)
+            if item is _STOP:
+                break
+        return items
+
+    def _save_worker(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = self._drain(self._save_queue, self._save_queue.get(), self.save_batch_size)
+            if batch[-1] is _STOP:
+                batch.pop()
+                stopping = True
+            if batch:
+                self._save_batch(batch)
+
+        for _ in range(self.ai_workers):
+            self._ai_queue.put(_STOP)
+
+    def _save_batch(self, batch: List[Dict[str, Any]]) -> None:
+        # 保存の成否によらず、収集した記事は実行結果（HTML等）に残す
+        with self._lock:
+            self.articles.extend(batch)
+
+        try:
+            new_ids = self.save_articles(batch)
+            saved = len(batch)
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.ERROR,
+                f"ストリーミング保存エラー: {e}",
+                operation="streaming_pipeline",
+                count=len(batch),
+                exc_info=True,
+            )
+            new_ids, saved = self._save_one_by_one(batch) if len(batch) > 1 else ([], 0)
+            with self._lock:
+                self.stats["save_errors"] += len(batch) - saved
+            if not saved:
+                return
+
+        with self._lock:
+            self.new_article_ids.extend(new_ids)
+            self.stats["save_batches"] += 1
+            self.stats["saved"] += saved
+            self.stats["new_articles"] += len(new_ids)
+            if not self.ai_workers:
+                return
+            room = (
+                len(new_ids)
+                if self.max_ai_articles is None
+                else max(0, self.max_ai_articles - self.stats["ai_queued"])
+            )
+            queued_ids = new_ids[:room]
+            self.stats["ai_queued"] += len(queued_ids)
+            self.stats["ai_deferred"] += len(new_ids) - len(queued_ids)
+
+        for article_id in queued_ids:
+            self._ai_queue.put(article_id)
+
+    def _save_one_by_one(self, batch: List[Dict[str, Any]]) -> Tuple[List[int], int]:
+        """一括保存に失敗したバッチを1記事ずつ保存し直す（1件の不正な行で他の記事を失わない）"""
+        new_ids: List[int] = []
+        saved = 0
+        for article in batch:
+            try:
+                new_ids.extend(self.save_articles([article]))
+                saved += 1
+            except Exception as e:
+                log_with_context(
+                    self.logger,
+                    logging.ERROR,
+                    f"ストリーミング保存エラー（記事単位）: {e}",
+                    operation="streaming_pipeline",
+                    url=article.get("url"),
+                )
+        return new_ids, saved
+
+    def _ai_worker(self) -> None:
+        while True:
+            batch = self._drain(self._ai_queue, self._ai_queue.get(), self.ai_batch_size)
+            stopping = batch[-1] is _STOP
+            if stopping:
+                batch.pop()
+            if batch:
+                self._analyze_batch(batch)
+            if stopping:
+                return
+
+    def _analyze_batch(self, article_ids: List[int]) -> None:
+        with self._lock:
+            if self.stats["first_ai_start_seconds"] is None and self._started_at is not None:
+                self.stats["first_ai_start_seconds"] = round(
+                    time.monotonic() - self._started_at, 3
+                )
+        try:
+            self.analyze_article_ids(article_ids)
+        except Exception as e:
+            with self._lock:
+                self.stats["ai_errors"] += 1
+            log_with_context(
+                self.logger,
+                logging.ERROR,
+                f"ストリーミングAI処理エラー: {e}",
+                operation="streaming_pipeline",
+                article_ids=article_ids,
+                exc_info=True,
+            )
+            return
+
+        with self._lock:
+            self.stats["ai_batches"] += 1
+            self.stats["ai_analyzed"] += len(article_ids)
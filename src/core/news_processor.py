@@ -8,12 +8,14 @@ import time
 import logging
 import concurrent.futures
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import pytz
 
 from src.logging_config import get_logger, log_with_context
 from src.config.app_config import get_config, AppConfig
+from src.core.article_pipeline import StreamingArticlePipeline
+from src.tracing import RunTracer, activate_tracer, trace_span
 
 try:
     from src.database.database_manager import DatabaseManager
@@ -41,18 +43,28 @@ except ImportError:
 
 try:
     from scrapers import reuters, bloomberg
+    from scrapers.collection_cache import ScrapeCollectionCache
+    from scrapers.body_cache import ArticleBodyCache
     _SCRAPERS_AVAILABLE = True
 except ImportError:
     reuters = None  # type: ignore
     bloomberg = None  # type: ignore
+    ScrapeCollectionCache = None  # type: ignore
+    ArticleBodyCache = None  # type: ignore
     _SCRAPERS_AVAILABLE = False
 
 try:
-    from src.legacy.ai_summarizer import process_article_with_ai
+    from src.legacy.ai_summarizer import (
+        build_article_batches,
+        process_article_with_ai,
+        process_articles_batch_with_ai,
+    )
     from src.legacy.article_grouper import group_articles_for_pro_summary
     _LEGACY_AVAILABLE = True
 except ImportError:
+    build_article_batches = None  # type: ignore
     process_article_with_ai = None  # type: ignore
+    process_articles_batch_with_ai = None  # type: ignore
     group_articles_for_pro_summary = None  # type: ignore
     _LEGACY_AVAILABLE = False
 
@@ -80,11 +92,23 @@ except ImportError:
     _HTML_GENERATOR_AVAILABLE = False
 
 try:
-    from src.llm import BaseLLMClient, GeminiClient, OpenRouterClient
+    from src.llm import (
+        BaseLLMClient,
+        CachedLLMClient,
+        DispatchedLLMClient,
+        GeminiClient,
+        LLMDispatcher,
+        LLMResponseCache,
+        OpenRouterClient,
+    )
     _LLM_AVAILABLE = True
 except ImportError:
     BaseLLMClient = None  # type: ignore
+    CachedLLMClient = None  # type: ignore
+    DispatchedLLMClient = None  # type: ignore
     GeminiClient = None  # type: ignore
+    LLMDispatcher = None  # type: ignore
+    LLMResponseCache = None  # type: ignore
     OpenRouterClient = None  # type: ignore
     _LLM_AVAILABLE = False
 
@@ -154,6 +178,21 @@ class NewsProcessor:
         ) if ProSummaryConfig else None
         self.article_llm_client: Optional[BaseLLMClient] = None
         self.pro_llm_client: Optional[BaseLLMClient] = None
+        self._llm_response_cache = None
+        self._llm_dispatchers: Dict[str, Any] = {}
+
+        # 動的記事取得の試行間キャッシュ（収集中のみ有効）
+        self._collection_cache = None
+        self._body_cache = None
+        self._prefetch_skip_stats: Dict[str, Dict[str, int]] = {}
+        self._collecting = False
+        self.last_collection_stats: Dict[str, Any] = {}
+        # ストリーミングモードで収集中の記事を受け取るパイプライン
+        self._article_pipeline: Optional[StreamingArticlePipeline] = None
+        self.last_pipeline_stats: Dict[str, Any] = {}
+        # 実行トレース（run 実行中のみ有効）
+        self.tracer: Optional[RunTracer] = None
+        self.last_trace_path: Optional[str] = None
 
     @staticmethod
     def _get_positive_int_env(name: str, default: int) -> int:
@@ -276,6 +315,15 @@ class NewsProcessor:
                 default_timeout=timeout,
             )
 
+        # レート制御はプロバイダー単位で共有し、キャッシュヒット時は消費しない
+        dispatcher = self._get_llm_dispatcher(provider)
+        if dispatcher is not None:
+            client = DispatchedLLMClient(client, dispatcher)
+
+        response_cache = self._get_llm_response_cache()
+        if response_cache is not None:
+            client = CachedLLMClient(client, response_cache)
+
         self.logger.debug(
             "LLMクライアントを生成しました (purpose=%s, provider=%s, model=%s)",
             purpose,
@@ -284,6 +332,62 @@ class NewsProcessor:
         )
         return client
 
+    def _get_llm_dispatcher(self, provider: str):
+        """プロバイダー単位で共有するLLMディスパッチャーを取得"""
+        if LLMDispatcher is None:
+            return None
+        if provider not in self._llm_dispatchers:
+            ai_config = self.config.ai
+            self._llm_dispatchers[provider] = LLMDispatcher(
+                requests_per_minute=ai_config.requests_per_minute,
+                tokens_per_minute=ai_config.tokens_per_minute,
+                initial_concurrency=ai_config.initial_concurrency,
+                max_concurrency=ai_config.max_concurrency,
+                max_retries=ai_config.rate_limit_max_retries,
+            )
+        return self._llm_dispatchers[provider]
+
+    def _stream_ai_tasks(self, provider: str, fn, items):
+        """AIタスクを実行し、完了順に (item, result, error) を返す"""
+        dispatcher = self._llm_dispatchers.get(provider)
+        if dispatcher is not None:
+            yield from dispatcher.stream(fn, items)
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, self.config.ai.initial_concurrency)
+        ) as executor:
+            future_to_item = {executor.submit(fn, item): item for item in items}
+            for future in concurrent.futures.as_completed(future_to_item):
+                item = future_to_item[future]
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
+
+    def _get_llm_response_cache(self):
+        """LLM応答キャッシュを取得（無効時・初期化失敗時はNone）"""
+        ai_config = self.config.ai
+        if not ai_config.response_cache_enabled or LLMResponseCache is None:
+            return None
+        if self._llm_response_cache is None:
+            try:
+                self._llm_response_cache = LLMResponseCache(
+                    ai_config.response_cache_path,
+                    ttl_seconds=ai_config.response_cache_ttl_hours * 3600,
+                    max_entries=ai_config.response_cache_max_entries,
+                )
+                self._llm_response_cache.prune()
+            except Exception as e:
+                log_with_context(
+                    self.logger,
+                    logging.WARNING,
+                    f"LLM応答キャッシュを初期化できないため無効化: {e}",
+                    operation="llm_response_cache",
+                )
+                return None
+        return self._llm_response_cache
+
     def _ensure_article_client(self) -> BaseLLMClient:
         if self.article_llm_client is None:
             self.article_llm_client = self._create_llm_client(
@@ -359,6 +463,67 @@ class NewsProcessor:
         )
         self.logger.info(f"最低記事数閾値: {self.config.scraping.minimum_article_count}件")
 
+        # 増分収集: 時間範囲拡張時は前回試行の一覧・本文を再利用する
+        if self.config.scraping.incremental_collection and ScrapeCollectionCache:
+            self._collection_cache = ScrapeCollectionCache()
+        else:
+            self._collection_cache = None
+
+        self._body_cache = self._open_body_cache()
+        self._prefetch_skip_stats = {}
+        self._collecting = True
+
+        try:
+            return self._collect_with_widening_range(current_hours)
+        finally:
+            self._collecting = False
+            self._log_collection_cache_stats()
+            self._collection_cache = None
+            if self._body_cache is not None:
+                self._body_cache.close()
+                self._body_cache = None
+
+    def _prefetch_lookup_enabled(self) -> bool:
+        """本文取得前のDB照会フックを使用するか（記事収集中のみ有効）"""
+        return bool(
+            self.config.scraping.skip_stored_article_bodies
+            and self.db_manager
+            and self._collecting
+        )
+
+    def _open_body_cache(self):
+        """
+        記事本文の永続キャッシュを開き、DBに本文付きで保存済みの記事を登録する
+
+        Returns:
+            ArticleBodyCache、無効または利用不可の場合はNone
+        """
+        if not (self.config.scraping.body_cache_enabled and ArticleBodyCache):
+            return None
+
+        try:
+            body_cache = ArticleBodyCache(
+                self.config.scraping.body_cache_path,
+                retention_days=self.config.scraping.body_cache_retention_days,
+            )
+            body_cache.prune()
+            if self.db_manager:
+                body_cache.set_known_url_hashes(
+                    self.db_manager.get_url_hashes_with_body(body_cache.url_hashes())
+                )
+            return body_cache
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                f"本文キャッシュを開けないためキャッシュなしで収集します: {e}",
+                operation="collect_articles",
+            )
+            return None
+
+    def _collect_with_widening_range(self, current_hours: int) -> List[Dict[str, Any]]:
+        """最低記事数を満たすまで時間範囲を24時間ずつ拡張しながら記事を収集"""
+        articles: List[Dict[str, Any]] = []
         attempts = 0
         while current_hours <= self.config.scraping.max_hours_limit:
             attempts += 1
@@ -406,6 +571,81 @@ class NewsProcessor:
         self.logger.info(f"=== 動的記事取得完了 (ループ終了) ===")
         return articles
 
+    def _lookup_stored_articles(self, source: str, urls: List[str]) -> Dict[str, str]:
+        """
+        本文取得前のDB照会フック（スクレイパーから呼び出される）
+
+        候補URLを一括でDB照会し、本文付きで保存済みの記事の本文を返す。
+        スクレイパーはこれらの記事の本文取得を省略する。
+
+        Args:
+            source: ソース名
+            urls: 本文取得予定の記事URL
+
+        Returns:
+            URLをキーとする保存済み本文の辞書
+        """
+        try:
+            stored_bodies = self.db_manager.get_stored_bodies_by_urls(urls)
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                f"{source} 保存済み記事の照会に失敗（全件の本文を取得します）: {e}",
+                operation="collect_articles",
+                scraper=source,
+            )
+            return {}
+
+        stats = self._prefetch_skip_stats.setdefault(source, {"candidates": 0, "skipped": 0})
+        stats["candidates"] += len(urls)
+        stats["skipped"] += len(stored_bodies)
+        skip_ratio = len(stored_bodies) / len(urls) if urls else 0.0
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            f"{source} 保存済み記事の本文取得をスキップ: {len(stored_bodies)}/{len(urls)}件 "
+            f"(スキップ率 {skip_ratio:.0%})",
+            operation="collect_articles",
+            scraper=source,
+            candidates=len(urls),
+            skipped=len(stored_bodies),
+            skip_ratio=round(skip_ratio, 3),
+        )
+        return stored_bodies
+
+    def _log_collection_cache_stats(self) -> None:
+        """増分収集キャッシュで削減できたフェッチ数を記録"""
+        self.last_collection_stats = {}
+        for source, stats in self._prefetch_skip_stats.items():
+            candidates = stats["candidates"]
+            self.last_collection_stats[f"{source.lower()}_prefetch_skip_ratio"] = (
+                round(stats["skipped"] / candidates, 3) if candidates else 0.0
+            )
+        if self._body_cache is not None:
+            self.last_collection_stats.update(
+                {f"body_cache_{key}": value for key, value in self._body_cache.stats.items()}
+            )
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "本文キャッシュ統計",
+                operation="collect_articles",
+                **self._body_cache.stats,
+            )
+
+        if self._collection_cache is None:
+            return
+
+        self.last_collection_stats.update(self._collection_cache.get_stats())
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            f"増分収集キャッシュにより {self.last_collection_stats['fetches_saved']}件のフェッチを削減",
+            operation="collect_articles",
+            **self._collection_cache.get_stats(),
+        )
+
     def _collect_articles_with_hours(self, hours_limit: int) -> List[Dict[str, Any]]:
         """指定された時間範囲で記事を収集（並列処理対応）"""
         all_articles = []
@@ -420,6 +660,19 @@ class NewsProcessor:
             bloomberg_params = self.config.bloomberg.to_dict()
             bloomberg_params["hours_limit"] = hours_limit
 
+            if self._collection_cache is not None:
+                reuters_params["collection_cache"] = self._collection_cache
+                bloomberg_params["collection_cache"] = self._collection_cache
+            if self._body_cache is not None:
+                reuters_params["body_cache"] = self._body_cache
+                bloomberg_params["body_cache"] = self._body_cache
+            if self._prefetch_lookup_enabled():
+                reuters_params["stored_article_lookup"] = self._lookup_stored_articles
+                bloomberg_params["stored_article_lookup"] = self._lookup_stored_articles
+            if self._article_pipeline is not None:
+                reuters_params["on_article"] = self._article_pipeline.submit
+                bloomberg_params["on_article"] = self._article_pipeline.submit
+
             future_to_scraper = {
                 executor.submit(reuters.scrape_reuters_articles, **reuters_params): "Reuters",
                 executor.submit(
@@ -470,6 +723,50 @@ class NewsProcessor:
         # 新しい動的収集メソッドを使用
         return self.collect_articles_with_dynamic_range()
 
+    def collect_and_process_articles_streaming(self) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """
+        記事収集・DB保存・新規記事のAI処理を重ねて実行（ストリーミングモード）
+
+        スクレイパーが本文を確定した記事から順に保存し、新規記事はその場でAI処理へ渡す。
+        AI処理件数の上限は process_new_articles_with_ai と同じ AI_MAX_ARTICLES_PER_RUN。
+
+        Returns:
+            (収集した記事リスト, 新規保存された記事IDリスト)
+        """
+        analyze_fn = None
+        try:
+            client = self._ensure_article_client()
+
+            def analyze(article_ids: List[int]) -> None:
+                articles = self.db_manager.get_articles_by_ids(article_ids)
+                self._analyze_articles_with_ai(client, articles, operation="process_new_articles")
+
+            analyze_fn = analyze
+        except ValueError as exc:
+            log_with_context(
+                self.logger,
+                logging.ERROR,
+                f"AIクライアントの初期化に失敗（保存のみ実行します）: {exc}",
+                operation="process_new_articles",
+            )
+
+        pipeline = StreamingArticlePipeline(
+            self.save_articles_to_db,
+            analyze_fn,
+            queue_size=self.config.scraping.streaming_queue_size,
+            ai_workers=max(1, self.config.ai.initial_concurrency),
+            max_ai_articles=self._get_positive_int_env("AI_MAX_ARTICLES_PER_RUN", 25),
+            logger=self.logger,
+        )
+        self._article_pipeline = pipeline.start()
+        try:
+            scraped_articles = self.collect_articles()
+        finally:
+            self._article_pipeline = None
+            self.last_pipeline_stats = pipeline.close()
+
+        return scraped_articles, list(pipeline.new_article_ids)
+
     def save_articles_to_db(self, articles: List[Dict[str, Any]]) -> List[int]:
         """収集した記事をデータベースに保存（重複は自動で排除）"""
         log_with_context(
@@ -481,9 +778,22 @@ class NewsProcessor:
         )
         new_article_ids = []
 
-        for article_data in articles:
-            # データベースに保存し、新規かどうかを判定
-            article_id, is_new = self.db_manager.save_article(article_data)
+        with trace_span("db.save_articles", category="db") as span:
+            span.add(items=len(articles))
+            try:
+                # 一括アップサートで保存し、入力行ごとに新規かどうかを判定
+                results = self.db_manager.upsert_articles(articles)
+            except Exception as e:
+                log_with_context(
+                    self.logger,
+                    logging.WARNING,
+                    f"一括保存に失敗したため記事単位の保存にフォールバック: {e}",
+                    operation="save_articles_to_db",
+                )
+                span.set(fallback=True)
+                results = [self.db_manager.save_article(article_data) for article_data in articles]
+
+        for article_id, is_new in results:
             if article_id and is_new:
                 new_article_ids.append(article_id)
 
@@ -535,38 +845,129 @@ class NewsProcessor:
             )
             return
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_article = {
-                executor.submit(
-                    process_article_with_ai,
-                    client,
-                    article.body,
-                ): article
-                for article in articles_to_process
-                if article.body
-            }
+        self._analyze_articles_with_ai(client, articles_to_process, operation="process_new_articles")
 
-            for future in concurrent.futures.as_completed(future_to_article):
-                article = future_to_article[future]
-                try:
-                    ai_result = future.result()
-                    if ai_result:
+        log_with_context(self.logger, logging.INFO, "AI処理完了", operation="process_new_articles")
+
+    def _analyze_articles_with_ai(self, client: BaseLLMClient, articles: List[Article], operation: str):
+        """
+        記事をAIで分析して結果を保存
+
+        バッチ要約が有効な場合はトークン予算内で複数記事を1リクエストにまとめ、
+        解析できなかった記事のみ単独処理にフォールバックする。
+        """
+        # 同一内容の記事は代表1件のみ分析し、結果を共有する
+        duplicates_by_key: Dict[str, List[Article]] = {}
+        targets = []
+        for article in articles:
+            if not article.body:
+                continue
+            content_key = article.content_hash or article.body
+            if content_key in duplicates_by_key:
+                duplicates_by_key[content_key].append(article)
+                continue
+            duplicates_by_key[content_key] = []
+            targets.append(article)
+        if not targets:
+            return
+
+        ai_config = self.config.ai
+        if (
+            ai_config.batch_summarization_enabled
+            and ai_config.batch_max_articles > 1
+            and process_articles_batch_with_ai is not None
+        ):
+            batches = build_article_batches(
+                [article.body for article in targets],
+                token_budget=ai_config.batch_token_budget,
+                max_batch_size=ai_config.batch_max_articles,
+            )
+            groups = [[targets[index] for index in batch] for batch in batches]
+        else:
+            groups = [[article] for article in targets]
+
+        fallback_count = 0
+        # 完了したグループから順に保存する
+        tasks = self._stream_ai_tasks(
+            client.provider,
+            lambda group: self._summarize_article_group(client, group),
+            groups,
+        )
+        for group, outcome, error in tasks:
+            if error is not None:
+                log_with_context(
+                    self.logger,
+                    logging.ERROR,
+                    f"記事ID {[article.id for article in group]} のAI処理エラー",
+                    operation=operation,
+                    error=str(error),
+                )
+                continue
+
+            group_results, group_fallbacks = outcome
+            fallback_count += group_fallbacks
+            for representative, ai_result in zip(group, group_results):
+                if not ai_result:
+                    continue
+                content_key = representative.content_hash or representative.body
+                for article in [representative] + duplicates_by_key[content_key]:
+                    try:
                         self.db_manager.save_ai_analysis(article.id, ai_result)
                         log_with_context(
                             self.logger, logging.DEBUG, "AI分析結果を保存", article_id=article.id
                         )
-                except Exception as e:
-                    log_with_context(
-                        self.logger,
-                        logging.ERROR,
-                        f"記事ID {article.id} のAI処理エラー",
-                        operation="process_new_articles",
-                        article_id=article.id,
-                        error=str(e),
-                        exc_info=True,
-                    )
+                    except Exception as e:
+                        log_with_context(
+                            self.logger,
+                            logging.ERROR,
+                            f"記事ID {article.id} のAI処理エラー",
+                            operation=operation,
+                            article_id=article.id,
+                            error=str(e),
+                            exc_info=True,
+                        )
 
-        log_with_context(self.logger, logging.INFO, "AI処理完了", operation="process_new_articles")
+        batch_requests = sum(1 for group in groups if len(group) > 1)
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "AI要約リクエスト統計",
+            operation=operation,
+            articles=len(targets),
+            requests=len(groups),
+            batch_requests=batch_requests,
+            fallbacks=fallback_count,
+            duplicates=sum(len(dups) for dups in duplicates_by_key.values()),
+            response_cache=dict(self._llm_response_cache.stats) if self._llm_response_cache else None,
+            dispatcher=(
+                self._llm_dispatchers[client.provider].stats
+                if client.provider in self._llm_dispatchers
+                else None
+            ),
+        )
+
+    def _summarize_article_group(
+        self, client: BaseLLMClient, group: List[Article]
+    ) -> Tuple[List[Optional[Dict[str, Any]]], int]:
+        """
+        記事グループを要約する（2件以上はバッチ、失敗分は単独処理）
+
+        Returns:
+            (記事順の要約結果, 単独処理にフォールバックした件数)
+        """
+        with trace_span("llm.summarize", category="llm", provider=client.provider) as span:
+            span.add(items=len(group), bytes=sum(len(article.body.encode("utf-8")) for article in group))
+            if len(group) == 1:
+                return [process_article_with_ai(client, group[0].body)], 0
+
+            results = process_articles_batch_with_ai(client, [article.body for article in group])
+            fallbacks = 0
+            for index, article in enumerate(group):
+                if results[index] is None:
+                    results[index] = process_article_with_ai(client, article.body)
+                    fallbacks += 1
+            span.set(fallbacks=fallbacks)
+            return results, fallbacks
 
     def process_recent_articles_without_ai(self):
         """AI分析がない24時間以内の記事を処理"""
@@ -624,36 +1025,7 @@ class NewsProcessor:
             )
             return
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_article = {
-                executor.submit(
-                    process_article_with_ai,
-                    client,
-                    article.body,
-                ): article
-                for article in articles_to_process
-                if article.body
-            }
-
-            for future in concurrent.futures.as_completed(future_to_article):
-                article = future_to_article[future]
-                try:
-                    ai_result = future.result()
-                    if ai_result:
-                        self.db_manager.save_ai_analysis(article.id, ai_result)
-                        log_with_context(
-                            self.logger, logging.DEBUG, "AI分析結果を保存", article_id=article.id
-                        )
-                except Exception as e:
-                    log_with_context(
-                        self.logger,
-                        logging.ERROR,
-                        f"記事ID {article.id} のAI処理エラー",
-                        operation="process_recent_articles",
-                        article_id=article.id,
-                        error=str(e),
-                        exc_info=True,
-                    )
+        self._analyze_articles_with_ai(client, articles_to_process, operation="process_recent_articles")
 
         log_with_context(
             self.logger, logging.INFO, "未処理記事のAI処理完了", operation="process_recent_articles"
@@ -1279,6 +1651,64 @@ class NewsProcessor:
                 exc_info=True,
             )
 
+    def _finish_run_trace(self, session_id: int) -> None:
+        """
+        実行トレースをDBへ保存し、Chrome トレース形式で出力する
+
+        処理段ごとの集計はログに記録し、収集・AI処理の所要時間は
+        スクレイピングセッションの時間列にも反映する。
+        """
+        tracer = self.tracer
+        activate_tracer(None)
+        self.tracer = None
+        if tracer is None:
+            return
+
+        summary = tracer.summarize()
+        try:
+            self.db_manager.save_performance_spans(
+                session_id, [span.to_dict() for span in tracer.spans]
+            )
+            ai_stages = ("ai.process_new_articles", "ai.process_recent_articles", "pro_integration")
+            self.db_manager.update_scraping_session(
+                session_id,
+                scraping_duration_ms=int(summary.get("collect_articles", {}).get("wall_ms", 0)),
+                ai_processing_duration_ms=int(
+                    sum(summary[name]["wall_ms"] for name in ai_stages if name in summary)
+                ),
+            )
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                f"実行トレースのDB保存に失敗: {e}",
+                operation="performance_monitoring",
+            )
+
+        try:
+            path = os.path.join(
+                self.config.logging.trace_dir,
+                f"run_{session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            )
+            self.last_trace_path = tracer.export_chrome_trace(path)
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                f"Chrome トレースの出力に失敗: {e}",
+                operation="performance_monitoring",
+            )
+
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "処理段ごとの実行時間",
+            operation="performance_monitoring",
+            session_id=session_id,
+            trace_path=self.last_trace_path,
+            stages=summary,
+        )
+
     def _monitor_system_performance(self, start_time: float, operation: str):
         """
         システムパフォーマンスの監視
@@ -1608,6 +2038,7 @@ class NewsProcessor:
         )
 
         final_articles = []
+        normalized_urls = []
         processed_urls = set()
         ai_analysis_found = 0
         duplicates_skipped = 0
@@ -1637,109 +2068,81 @@ class NewsProcessor:
                 continue
 
             processed_urls.add(normalized_url)
+            normalized_urls.append(normalized_url)
+            final_articles.append(
+                {
+                    "title": scraped_article.get("title", ""),
+                    "url": url,  # 表示には元のURLを使用
+                    "source": scraped_article.get("source", ""),
+                    "published_jst": scraped_article.get("published_jst", ""),
+                    "content": scraped_article.get("body", ""),  # 本文を追加
+                    "summary": "要約はありません。",
+                    "sentiment_label": "N/A",
+                    "sentiment_score": 0.0,
+                    "category": "その他",
+                    "region": "その他",
+                }
+            )
+
+        # AI分析結果は正規化済みURLで一括取得する（記事ごとの問い合わせは行わない）
+        try:
+            analyses = self.db_manager.get_articles_by_urls_with_analysis(normalized_urls)
+        except Exception as e:
             log_with_context(
                 self.logger,
-                logging.DEBUG,
-                f"新規URLを処理: 元URL='{url}', 正規化URL='{normalized_url}'",
+                logging.ERROR,
+                f"AI分析結果の一括取得でエラー ({len(normalized_urls)}件) - {e}",
                 operation="prepare_html_data",
+                exc_info=True,
             )
+            analyses = {}
 
-            article_data = {
-                "title": scraped_article.get("title", ""),
-                "url": url,  # 表示には元のURLを使用
-                "source": scraped_article.get("source", ""),
-                "published_jst": scraped_article.get("published_jst", ""),
-                "content": scraped_article.get("body", ""),  # 本文を追加
-                "summary": "要約はありません。",
-                "sentiment_label": "N/A",
-                "sentiment_score": 0.0,
-                "category": "その他",
-                "region": "その他",
-            }
+        for article_data, normalized_url in zip(final_articles, normalized_urls):
+            url = article_data["url"]
+            analysis = analyses.get(normalized_url)
 
-            try:
-                # DBからは正規化済みURLで問い合わせるのが確実
+            if analysis is None:
                 log_with_context(
                     self.logger,
-                    logging.DEBUG,
-                    f"AI分析結果を検索中: 正規化URL='{normalized_url}'",
+                    logging.WARNING,
+                    f"記事がデータベースに見つかりません: 正規化URL='{normalized_url}'",
                     operation="prepare_html_data",
                 )
-                article_with_analysis = self.db_manager.get_article_by_url_with_analysis(
-                    normalized_url
+            elif analysis["analysis_id"] is None:
+                log_with_context(
+                    self.logger,
+                    logging.WARNING,
+                    f"記事は見つかったがAI分析結果がありません: URL='{url}'",
+                    operation="prepare_html_data",
                 )
-                
-                if article_with_analysis:
-                    log_with_context(
-                        self.logger,
-                        logging.DEBUG,
-                        f"記事が見つかりました: title='{article_with_analysis.title}', ai_analysis_count={len(article_with_analysis.ai_analysis) if article_with_analysis.ai_analysis else 0}",
-                        operation="prepare_html_data",
-                    )
-                    
-                    if article_with_analysis.ai_analysis:
-                        analysis = article_with_analysis.ai_analysis[0]
-                        log_with_context(
-                            self.logger,
-                            logging.DEBUG,
-                            f"AI分析結果が見つかりました: category='{analysis.category}', region='{analysis.region}', summary_length={len(analysis.summary) if analysis.summary else 0}",
-                            operation="prepare_html_data",
-                        )
-                        
-                        if analysis.summary:
-                            article_data.update(
-                                {
-                                    "summary": analysis.summary,
-                                    "sentiment_label": (
-                                        analysis.sentiment_label if analysis.sentiment_label else "N/A"
-                                    ),
-                                    "sentiment_score": (
-                                        analysis.sentiment_score
-                                        if analysis.sentiment_score is not None
-                                        else 0.0
-                                    ),
-                                    "category": analysis.category if analysis.category else "その他",
-                                    "region": analysis.region if analysis.region else "その他",
-                                }
-                            )
-                            ai_analysis_found += 1
-                            log_with_context(
-                                self.logger,
-                                logging.INFO,
-                                f"AI分析結果を記事データに設定完了: URL='{url}', category='{analysis.category}', region='{analysis.region}'",
-                                operation="prepare_html_data",
-                            )
-                        else:
-                            log_with_context(
-                                self.logger,
-                                logging.WARNING,
-                                f"AI分析は存在するが要約が空です: URL='{url}'",
-                                operation="prepare_html_data",
-                            )
-                    else:
-                        log_with_context(
-                            self.logger,
-                            logging.WARNING,
-                            f"記事は見つかったがAI分析結果がありません: URL='{url}'",
-                            operation="prepare_html_data",
-                        )
-                else:
-                    log_with_context(
-                        self.logger,
-                        logging.WARNING,
-                        f"記事がデータベースに見つかりません: 正規化URL='{normalized_url}'",
-                        operation="prepare_html_data",
-                    )
-            except Exception as e:
+            elif not analysis["summary"]:
                 log_with_context(
                     self.logger,
-                    logging.ERROR,
-                    f"AI分析結果の取得でエラー: URL='{url}', 正規化URL='{normalized_url}' - {e}",
+                    logging.WARNING,
+                    f"AI分析は存在するが要約が空です: URL='{url}'",
+                    operation="prepare_html_data",
+                )
+            else:
+                article_data.update(
+                    {
+                        "summary": analysis["summary"],
+                        "sentiment_label": analysis["sentiment_label"] or "N/A",
+                        "sentiment_score": (
+                            analysis["sentiment_score"]
+                            if analysis["sentiment_score"] is not None
+                            else 0.0
+                        ),
+                        "category": analysis["category"] or "その他",
+                        "region": analysis["region"] or "その他",
+                    }
+                )
+                ai_analysis_found += 1
+                log_with_context(
+                    self.logger,
+                    logging.DEBUG,
+                    f"AI分析結果を記事データに設定完了: URL='{url}', category='{analysis['category']}', region='{analysis['region']}'",
                     operation="prepare_html_data",
-                    exc_info=True,
                 )
-
-            final_articles.append(article_data)
 
         log_with_context(
             self.logger,
@@ -2480,6 +2883,9 @@ class NewsProcessor:
 
         # スクレイピングセッション開始
         session_id = self.db_manager.start_scraping_session()
+        if self.config.logging.trace_enabled:
+            self.tracer = RunTracer()
+            activate_tracer(self.tracer)
 
         try:
             if not self.validate_environment():
@@ -2488,8 +2894,14 @@ class NewsProcessor:
                 )
                 return
 
-            # 1. 記事収集
-            scraped_articles = self.collect_articles()
+            # 1. 記事収集（ストリーミングモードではDB保存・新規記事のAI処理も並行して行う）
+            streaming = self.config.scraping.streaming_pipeline_enabled
+            with trace_span("collect_articles", category="scrape", streaming=streaming) as span:
+                if streaming:
+                    scraped_articles, new_article_ids = self.collect_and_process_articles_streaming()
+                else:
+                    scraped_articles = self.collect_articles()
+                span.add(items=len(scraped_articles))
             log_with_context(
                 self.logger,
                 logging.INFO,
@@ -2508,7 +2920,8 @@ class NewsProcessor:
                 raise RuntimeError("記事のスクレイピングに失敗しました。ソースサイトの構造変更やネットワーク問題を確認してください。")
 
             # 2. DBに保存 (重複排除)
-            new_article_ids = self.save_articles_to_db(scraped_articles)
+            if not streaming:
+                new_article_ids = self.save_articles_to_db(scraped_articles)
             log_with_context(
                 self.logger,
                 logging.INFO,
@@ -2521,19 +2934,25 @@ class NewsProcessor:
             )
 
             # 3. 新規記事をAIで処理
-            self.process_new_articles_with_ai(new_article_ids)
+            if not streaming:
+                with trace_span("ai.process_new_articles", category="llm") as span:
+                    span.add(items=len(new_article_ids))
+                    self.process_new_articles_with_ai(new_article_ids)
 
             # 3.5. AI分析がない24時間以内の記事も処理する
-            self.process_recent_articles_without_ai()
+            with trace_span("ai.process_recent_articles", category="llm"):
+                self.process_recent_articles_without_ai()
 
             # 3.7. Pro統合要約処理（新規追加）
             integration_result = None
             pro_integration_start_time = time.time()
 
             try:
-                integration_result = self.process_pro_integration_summaries(
-                    session_id, scraped_articles
-                )
+                with trace_span("pro_integration", category="llm") as span:
+                    span.add(items=len(scraped_articles))
+                    integration_result = self.process_pro_integration_summaries(
+                        session_id, scraped_articles
+                    )
                 if integration_result:
                     log_with_context(
                         self.logger,
@@ -2565,9 +2984,11 @@ class NewsProcessor:
                 self._monitor_system_performance(pro_integration_start_time, "Pro統合要約処理")
 
             # 4. 今回実行分の記事データをAI分析結果と組み合わせて準備
-            current_session_articles = self.prepare_current_session_articles_for_html(
-                scraped_articles
-            )
+            with trace_span("html.prepare_articles", category="db") as span:
+                current_session_articles = self.prepare_current_session_articles_for_html(
+                    scraped_articles
+                )
+                span.add(items=len(current_session_articles))
             log_with_context(
                 self.logger,
                 logging.INFO,
@@ -2576,7 +2997,9 @@ class NewsProcessor:
             )
 
             # 5. 最終的なHTMLを生成（今回実行分のみ）
-            self.generate_final_html(current_session_articles, session_id)
+            with trace_span("html.generate", category="output") as span:
+                span.add(items=len(current_session_articles))
+                self.generate_final_html(current_session_articles, session_id)
 
             # 6. Googleドキュメント・スプレッドシート生成（時刻条件満たす場合のみ）
             # 環境変数でGoogle Services処理をON/OFF制御
@@ -2584,7 +3007,9 @@ class NewsProcessor:
             enable_google_services = os.getenv('ENABLE_GOOGLE_SERVICES', 'true').lower() == 'true'
             
             if enable_google_services:
-                self.generate_google_docs_and_sheets(session_id, current_session_articles)
+                with trace_span("google_docs", category="output") as span:
+                    span.add(items=len(current_session_articles))
+                    self.generate_google_docs_and_sheets(session_id, current_session_articles)
             else:
                 log_with_context(
                     self.logger,
@@ -2594,10 +3019,13 @@ class NewsProcessor:
                 )
 
             # 8. Supabaseにアーカイブ（新規追加）
-            self.archive_to_supabase(session_id, current_session_articles)
+            with trace_span("supabase.archive", category="output") as span:
+                span.add(items=len(current_session_articles))
+                self.archive_to_supabase(session_id, current_session_articles)
 
             # 7. 古いデータをクリーンアップ
-            self.db_manager.cleanup_old_data(days_to_keep=30)
+            with trace_span("db.cleanup", category="db"):
+                self.db_manager.cleanup_old_data(days_to_keep=30)
 
             self.db_manager.complete_scraping_session(session_id, status="completed_ok")
 
@@ -2610,6 +3038,9 @@ class NewsProcessor:
         finally:
             overall_elapsed_time = time.time() - overall_start_time
 
+            # 実行トレースの保存・出力
+            self._finish_run_trace(session_id)
+
             # セッション全体のサマリーをログに記録
             self._log_session_summary(
                 session_id,
@@ -3,10 +3,13 @@
 import hashlib
 import re
 from difflib import SequenceMatcher
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, Set
 import logging
 
+import numpy as np
+
 from src.logging_config import get_logger
+from .minhash import LSHIndex, MinHasher
 
 
 class ContentDeduplicator:
@@ -15,6 +18,7 @@ class ContentDeduplicator:
     def __init__(self, similarity_threshold: float = 0.85):
         self.similarity_threshold = similarity_threshold
         self.logger = get_logger("content_deduplicator")
+        self.minhasher = MinHasher()
 
         # 正規化で除去する一般的なパターン
         self.noise_patterns = [
@@ -96,6 +100,32 @@ class ContentDeduplicator:
         # SHA256ハッシュ生成
         return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
+    def generate_minhash_signature(self, content: str) -> Optional[np.ndarray]:
+        """
+        正規化済みコンテンツの MinHash 署名生成
+
+        Args:
+            content: 署名対象コンテンツ
+
+        Returns:
+            MinHash 署名。正規化後に空となる場合はNone
+        """
+        if not content:
+            return None
+        return self.minhasher.signature(self._normalize_content(content))
+
+    def generate_minhash_signature_bytes(self, content: str) -> Optional[bytes]:
+        """DB保存用の MinHash 署名（Article.minhash_signature）"""
+        signature = self.generate_minhash_signature(content)
+        return MinHasher.to_bytes(signature) if signature is not None else None
+
+    def _article_signatures(self, article: Dict[str, Any]):
+        """記事の (本文署名, タイトル署名)"""
+        body_signature = self.generate_minhash_signature(article.get("body", ""))
+        title = article.get("title", "")
+        title_signature = self.minhasher.signature(self._normalize_title(title)) if title else None
+        return body_signature, title_signature
+
     def _normalize_content(self, content: str) -> str:
         """
         コンテンツ正規化
@@ -297,6 +327,10 @@ class ContentDeduplicator:
         unique_articles = []
         seen_hashes = set()
 
+        # 本文・タイトルの LSH インデックスで比較候補を絞り込む
+        body_index = LSHIndex()
+        title_index = LSHIndex()
+
         for article in articles:
             # コンテンツハッシュによる高速チェック
             content = article.get("body", article.get("title", ""))
@@ -306,14 +340,20 @@ class ContentDeduplicator:
                 self.logger.debug(f"Duplicate detected by hash: {article.get('title', '')[:50]}")
                 continue
 
-            # 詳細重複チェック
+            # 候補のみ詳細重複チェック
+            body_signature, title_signature = self._article_signatures(article)
+            candidates = body_index.query(body_signature) | title_index.query(title_signature)
             is_duplicate = any(
-                self.is_duplicate_article(article, existing) for existing in unique_articles
+                self.is_duplicate_article(article, unique_articles[index])
+                for index in sorted(candidates)
             )
 
             if not is_duplicate:
+                index = len(unique_articles)
                 unique_articles.append(article)
                 seen_hashes.add(content_hash)
+                body_index.add(index, body_signature)
+                title_index.add(index, title_signature)
 
                 self.logger.debug(f"Unique article added: {article.get('title', '')[:50]}")
             else:
@@ -344,6 +384,16 @@ class ContentDeduplicator:
         if not articles:
             return []
 
+        # 全記事を LSH インデックスに登録し、候補ペアのみ比較する
+        body_index = LSHIndex()
+        title_index = LSHIndex()
+        signatures = []
+        for index, article in enumerate(articles):
+            body_signature, title_signature = self._article_signatures(article)
+            signatures.append((body_signature, title_signature))
+            body_index.add(index, body_signature)
+            title_index.add(index, title_signature)
+
         groups = []
         processed = set()
 
@@ -354,10 +404,13 @@ class ContentDeduplicator:
             current_group = [article1]
             processed.add(i)
 
-            for j, article2 in enumerate(articles[i + 1 :], i + 1):
-                if j in processed:
+            body_signature, title_signature = signatures[i]
+            candidates = body_index.query(body_signature) | title_index.query(title_signature)
+            for j in sorted(candidates):
+                if j <= i or j in processed:
                     continue
 
+                article2 = articles[j]
                 if self.is_duplicate_article(article1, article2):
                     current_group.append(article2)
                     processed.add(j)
@@ -1,18 +1,21 @@
 # -*- coding: utf-8 -*-
 
 import hashlib
+import json
 import logging
+import sqlite3
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Set, Tuple
 from contextlib import contextmanager
 from sqlalchemy import create_engine, func, desc
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError, DatabaseError
 
 from config.base import DatabaseConfig
-from .models import Base, Article, AIAnalysis, ScrapingSession, ProcessingStats
+from .models import Base, Article, AIAnalysis, ScrapingSession, ProcessingStats, PerformanceSpan
 from .url_normalizer import URLNormalizer
 from .content_deduplicator import ContentDeduplicator
+from .minhash import LSHIndex, MinHasher
 
 # log_with_context を安全にインポート
 try:
@@ -23,6 +26,11 @@ except ImportError:
         logger.log(level, f"{message} - Context: {context}")
 
 
+# スクレイパーが本文取得に失敗した際に保存する代替文言の接頭辞
+# （"[本文取得失敗/空]" / "[本文取得エラー: ...]"）
+BODY_PLACEHOLDER_PREFIX = "[本文取得"
+
+
 class DatabaseManager:
     """データベース管理クラス"""
 
@@ -100,6 +108,9 @@ class DatabaseManager:
                     category=article_data.get("category"),
                     published_at=article_data.get("published_jst"),
                     content_hash=content_hash,
+                    minhash_signature=self.content_deduplicator.generate_minhash_signature_bytes(
+                        article_data.get("body", "")
+                    ),
                 )
 
                 session.add(article)
@@ -132,100 +143,251 @@ class DatabaseManager:
         Returns:
             新規に保存された記事のIDリスト
         """
-        if not articles_data:
+        try:
+            results = self.upsert_articles(articles_data)
+        except SQLAlchemyError:
             return []
+        return [article_id for article_id, is_new in results if article_id and is_new]
+
+    def upsert_articles(
+        self, articles_data: List[Dict[str, Any]], chunk_size: int = 500
+    ) -> List[Tuple[Optional[int], bool]]:
+        """
+        複数の記事を一括でアップサート（既存URLは挿入せずIDのみ取得）
+
+        SQLite 3.35 以降と PostgreSQL では INSERT ... ON CONFLICT DO NOTHING RETURNING
+        により、チャンクごとに1文で挿入と新規IDの取得を行う。既存記事のIDは
+        IN 句のクエリでまとめて取得する。
+
+        Args:
+            articles_data: 記事データの辞書リスト
+            chunk_size: 1文あたりの行数
+
+        Returns:
+            入力行ごとの (記事ID, 新規作成フラグ)。URLがない行は (None, False)。
+            入力内で重複するURLは最初の行のみ新規扱い。
+
+        Raises:
+            SQLAlchemyError: 保存に失敗した場合
+        """
+        row_hashes: List[Optional[str]] = []
+        rows_by_hash: Dict[str, Dict[str, Any]] = {}
+        scraped_at = datetime.utcnow()
 
-        # URLの正規化とハッシュ化、入力データの準備
-        hashes_to_check = []
-        data_by_hash = {}
         for data in articles_data:
             if "url" not in data:
-                log_with_context(self.logger, logging.WARNING, "URLキーがないため記事をスキップ", operation="save_articles_bulk", data_title=data.get("title"))
+                log_with_context(
+                    self.logger,
+                    logging.WARNING,
+                    "URLキーがないため記事をスキップ",
+                    operation="upsert_articles",
+                    data_title=data.get("title"),
+                )
+                row_hashes.append(None)
                 continue
 
             normalized_url = self.url_normalizer.normalize_url(data["url"])
             url_hash = hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+            row_hashes.append(url_hash)
 
-            if url_hash not in data_by_hash: # 重複URLを排除
-                hashes_to_check.append(url_hash)
-                data["_url_hash"] = url_hash
-                data_by_hash[url_hash] = data
+            if url_hash not in rows_by_hash:
+                rows_by_hash[url_hash] = self._build_article_row(data, url_hash, scraped_at)
 
-        with self.get_session() as session:
-            try:
-                # 既存の記事を一度のクエリでチェック
-                existing_hashes = {
-                    res[0]
-                    for res in session.query(Article.url_hash)
-                    .filter(Article.url_hash.in_(hashes_to_check))
-                    .all()
-                }
+        ids_by_hash: Dict[str, int] = {}
+        new_hashes: Set[str] = set()
 
-                # 挿入対象の記事データを準備
-                articles_to_insert = []
-                hashes_to_insert = []
-                for url_hash, data in data_by_hash.items():
-                    if url_hash in existing_hashes:
-                        continue
-
-                    content_hash = None
-                    if data.get("body"):
-                        content_hash = self.content_deduplicator.generate_content_hash(
-                            data["body"]
+        if rows_by_hash:
+            rows = list(rows_by_hash.values())
+            try:
+                with self.get_session() as session:
+                    dialect_insert = self._insert_returning_construct()
+                    if dialect_insert is not None:
+                        for i in range(0, len(rows), chunk_size):
+                            stmt = (
+                                dialect_insert(Article)
+                                .values(rows[i : i + chunk_size])
+                                .on_conflict_do_nothing()
+                                .returning(Article.id, Article.url_hash)
+                            )
+                            for article_id, url_hash in session.execute(stmt):
+                                ids_by_hash[url_hash] = article_id
+                                new_hashes.add(url_hash)
+                    else:
+                        # RETURNING 非対応の環境: 既存チェック後に未登録分のみ挿入
+                        existing = self._get_ids_by_url_hashes(session, list(rows_by_hash), chunk_size)
+                        rows_to_insert = [row for row in rows if row["url_hash"] not in existing]
+                        if rows_to_insert:
+                            session.bulk_insert_mappings(Article, rows_to_insert)
+                        new_hashes = {row["url_hash"] for row in rows_to_insert}
+                        ids_by_hash.update(existing)
+
+                    missing_hashes = [h for h in rows_by_hash if h not in ids_by_hash]
+                    if missing_hashes:
+                        ids_by_hash.update(
+                            self._get_ids_by_url_hashes(session, missing_hashes, chunk_size)
                         )
+            except SQLAlchemyError as e:
+                log_with_context(
+                    self.logger,
+                    logging.ERROR,
+                    f"記事の一括アップサートでエラーが発生: {e}",
+                    operation="upsert_articles",
+                    exc_info=True,
+                )
+                raise
 
-                    articles_to_insert.append(
-                        {
-                            "url": data["url"],
-                            "url_hash": url_hash,
-                            "title": data["title"],
-                            "body": data.get("body", ""),
-                            "source": data["source"],
-                            "category": data.get("category"),
-                            "published_at": data.get("published_jst"),
-                            "content_hash": content_hash,
-                        }
-                    )
-                    hashes_to_insert.append(url_hash)
-
-                if not articles_to_insert:
-                    log_with_context(
-                        self.logger,
-                        logging.INFO,
-                        "一括保存: 新規記事はありませんでした。",
-                        operation="save_articles_bulk",
-                        total_articles=len(articles_data),
-                    )
-                    return []
+        results: List[Tuple[Optional[int], bool]] = []
+        reported_new: Set[str] = set()
+        for url_hash in row_hashes:
+            if url_hash is None:
+                results.append((None, False))
+                continue
+            is_new = url_hash in new_hashes and url_hash not in reported_new
+            if is_new:
+                reported_new.add(url_hash)
+            results.append((ids_by_hash.get(url_hash), is_new))
+
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "記事の一括アップサート完了",
+            operation="upsert_articles",
+            new_articles_count=len(new_hashes),
+            existing_articles_count=len(rows_by_hash) - len(new_hashes),
+            total_attempted=len(articles_data),
+        )
+        return results
+
+    def _build_article_row(
+        self, data: Dict[str, Any], url_hash: str, scraped_at: datetime
+    ) -> Dict[str, Any]:
+        """記事データ辞書から articles テーブルの行を作成"""
+        content_hash = None
+        if data.get("body"):
+            content_hash = self.content_deduplicator.generate_content_hash(data["body"])
+
+        return {
+            "url": data["url"],
+            "url_hash": url_hash,
+            "title": data["title"],
+            "body": data.get("body", ""),
+            "source": data["source"],
+            "category": data.get("category"),
+            "published_at": data.get("published_jst"),
+            "scraped_at": scraped_at,
+            "content_hash": content_hash,
+            "minhash_signature": self.content_deduplicator.generate_minhash_signature_bytes(
+                data.get("body", "")
+            ),
+        }
+
+    def _insert_returning_construct(self):
+        """
+        ON CONFLICT DO NOTHING RETURNING が使えるダイアレクトの insert を返す
 
-                # バルクインサートを実行
-                session.bulk_insert_mappings(Article, articles_to_insert)
+        Returns:
+            ダイアレクト固有の insert 関数。非対応の場合はNone
+        """
+        dialect_name = self.engine.dialect.name
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+            return pg_insert
+        if dialect_name == "sqlite" and sqlite3.sqlite_version_info >= (3, 35, 0):
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+            return sqlite_insert
+        return None
+
+    def _get_ids_by_url_hashes(
+        self, session: Session, url_hashes: List[str], chunk_size: int
+    ) -> Dict[str, int]:
+        """URLハッシュから記事IDを一括取得"""
+        ids_by_hash: Dict[str, int] = {}
+        for i in range(0, len(url_hashes), chunk_size):
+            chunk = url_hashes[i : i + chunk_size]
+            rows = session.query(Article.id, Article.url_hash).filter(Article.url_hash.in_(chunk)).all()
+            for article_id, url_hash in rows:
+                ids_by_hash[url_hash] = article_id
+        return ids_by_hash
+
+    @staticmethod
+    def _stored_body_conditions():
+        """本文付きで保存済みとみなす条件（スクレイパーが保存する取得失敗の代替文言は除く）"""
+        return (
+            Article.body.isnot(None),
+            Article.body != "",
+            ~Article.body.startswith(BODY_PLACEHOLDER_PREFIX),
+        )
 
-                # 挿入した記事のIDを取得
-                newly_inserted_articles = session.query(Article.id).filter(Article.url_hash.in_(hashes_to_insert)).all()
-                new_article_ids = [res[0] for res in newly_inserted_articles]
+    def get_url_hashes_with_body(self, url_hashes: List[str], chunk_size: int = 500) -> Set[str]:
+        """
+        指定したURLハッシュのうち、本文付きで保存済みの記事のハッシュを取得
 
-                log_with_context(
-                    self.logger,
-                    logging.INFO,
-                    "記事の一括保存完了",
-                    operation="save_articles_bulk",
-                    new_articles_count=len(new_article_ids),
-                    total_attempted=len(articles_data),
+        Args:
+            url_hashes: 確認対象のURLハッシュ
+            chunk_size: 1クエリあたりのIN句の要素数
+
+        Returns:
+            本文付きで保存済みのURLハッシュ集合
+        """
+        if not url_hashes:
+            return set()
+
+        found = set()
+        unique_hashes = list(dict.fromkeys(url_hashes))
+        with self.get_session() as session:
+            for i in range(0, len(unique_hashes), chunk_size):
+                chunk = unique_hashes[i : i + chunk_size]
+                rows = (
+                    session.query(Article.url_hash)
+                    .filter(
+                        Article.url_hash.in_(chunk),
+                        *self._stored_body_conditions(),
+                    )
+                    .all()
                 )
+                found.update(row[0] for row in rows)
+        return found
 
-                return new_article_ids
+    def get_stored_bodies_by_urls(self, urls: List[str], chunk_size: int = 500) -> Dict[str, str]:
+        """
+        URLリストのうち本文付きで保存済みの記事の本文を一括取得
+        （save_articles_bulk と同様に url_hash IN (...) で照会する）
 
-            except SQLAlchemyError as e:
-                session.rollback()
-                log_with_context(
-                    self.logger,
-                    logging.ERROR,
-                    f"記事の一括保存でエラーが発生: {e}",
-                    operation="save_articles_bulk",
-                    exc_info=True,
+        Args:
+            urls: 確認対象のURLリスト
+            chunk_size: 1クエリあたりのIN句の要素数
+
+        Returns:
+            入力URLをキーとし、保存済みの本文を値とする辞書
+        """
+        if not urls:
+            return {}
+
+        urls_by_hash: Dict[str, List[str]] = {}
+        for url in urls:
+            normalized_url = self.url_normalizer.normalize_url(url)
+            url_hash = hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+            urls_by_hash.setdefault(url_hash, []).append(url)
+
+        hashes = list(urls_by_hash.keys())
+        bodies: Dict[str, str] = {}
+        with self.get_session() as session:
+            for i in range(0, len(hashes), chunk_size):
+                chunk = hashes[i : i + chunk_size]
+                rows = (
+                    session.query(Article.url_hash, Article.body)
+                    .filter(
+                        Article.url_hash.in_(chunk),
+                        *self._stored_body_conditions(),
+                    )
+                    .all()
                 )
-                return []
+                for url_hash, body in rows:
+                    for url in urls_by_hash[url_hash]:
+                        bodies[url] = body
+        return bodies
 
     def get_articles_by_ids(self, article_ids: List[int]) -> List[Article]:
         """IDリストで記事を取得（AI分析結果を含む）"""
@@ -300,43 +462,61 @@ class DatabaseManager:
 
             return article
 
-    def get_articles_by_urls_with_analysis(self, urls: List[str]) -> Dict[str, Article]:
+    def get_articles_by_urls_with_analysis(
+        self, urls: List[str], chunk_size: int = 500
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        URLリストから複数の記事を検索し、AI分析結果も含めて一括で取得する。
-        N+1問題を回避するために単一クエリで実行する。
+        URLリストから複数の記事を検索し、AI分析結果も含めてプレーンな辞書で一括取得する。
+        N+1問題を回避するため、url_hash IN (...) と ai_analysis の外部結合を
+        チャンクごとに1クエリで行い、ORMオブジェクトは生成しない。
 
         Args:
-            urls: 検索対象のURLリスト
+            urls: 確認対象のURLリスト
+            chunk_size: 1クエリあたりのIN句の要素数
 
         Returns:
-            正規化URLをキーとし、Articleオブジェクトを値とする辞書
+            入力URLをキーとし、記事・分析の列を値とする辞書（DB未保存のURLは含まない）。
+            分析が無い記事は analysis_id 以下の値が None になる。
+            複数の分析がある場合は最初（ID最小）のものを使う
         """
         if not urls:
             return {}
 
-        # URLを正規化し、ハッシュを計算
-        url_map = {self.url_normalizer.normalize_url(u): u for u in urls}
-        url_hashes = [hashlib.sha256(norm_url.encode("utf-8")).hexdigest() for norm_url in url_map.keys()]
-
+        urls_by_hash: Dict[str, List[str]] = {}
+        for url in urls:
+            normalized_url = self.url_normalizer.normalize_url(url)
+            url_hash = hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+            urls_by_hash.setdefault(url_hash, []).append(url)
+
+        columns = (
+            Article.url_hash,
+            Article.id.label("article_id"),
+            Article.title,
+            AIAnalysis.id.label("analysis_id"),
+            AIAnalysis.summary,
+            AIAnalysis.sentiment_label,
+            AIAnalysis.sentiment_score,
+            AIAnalysis.category,
+            AIAnalysis.region,
+        )
+        hashes = list(urls_by_hash.keys())
+        results: Dict[str, Dict[str, Any]] = {}
         with self.get_session() as session:
-            from sqlalchemy.orm import joinedload
-
-            articles = (
-                session.query(Article)
-                .options(joinedload(Article.ai_analysis))
-                .filter(Article.url_hash.in_(url_hashes))
-                .all()
-            )
-
-            # 結果を正規化URLをキーとする辞書に変換
-            results_by_normalized_url = {}
-            for article in articles:
-                # DBから取得したURLも正規化して、辞書のキーとして一貫性を保つ
-                normalized_db_url = self.url_normalizer.normalize_url(article.url)
-                session.expunge(article) # セッションから切り離す
-                results_by_normalized_url[normalized_db_url] = article
-
-            return results_by_normalized_url
+            for i in range(0, len(hashes), chunk_size):
+                chunk = hashes[i : i + chunk_size]
+                rows = (
+                    session.query(*columns)
+                    .outerjoin(AIAnalysis, AIAnalysis.article_id == Article.id)
+                    .filter(Article.url_hash.in_(chunk))
+                    .order_by(Article.id, AIAnalysis.id)
+                    .all()
+                )
+                for row in rows:
+                    record = row._asdict()
+                    url_hash = record.pop("url_hash")
+                    for url in urls_by_hash[url_hash]:
+                        results.setdefault(url, record)
+        return results
 
     # @retry_with_backoff(max_retries=3, exceptions=(SQLAlchemyError,))  # 依存関係削除のためコメントアウト
     def save_ai_analysis(
@@ -502,6 +682,80 @@ class DatabaseManager:
 
             return result
 
+    def detect_near_duplicate_articles(
+        self, days: int = 30, chunk_size: int = 500
+    ) -> List[Tuple[Article, Article]]:
+        """
+        MinHash/LSH による近似重複記事検出
+
+        保存済みの MinHash 署名から LSH で候補ペアを求め、候補のみ本文類似度で
+        検証する。署名が未保存の記事は本文から計算して保存する。
+
+        Args:
+            days: 対象期間（日数、scraped_at 基準）
+            chunk_size: 本文取得時のIN句の要素数
+
+        Returns:
+            (古い記事, 新しい記事) のペアリスト
+        """
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        index = LSHIndex()
+
+        with self.get_session() as session:
+            rows = (
+                session.query(Article.id, Article.minhash_signature)
+                .filter(
+                    Article.scraped_at >= cutoff,
+                    Article.body.isnot(None),
+                    Article.body != "",
+                )
+                .all()
+            )
+
+            missing_ids = [article_id for article_id, signature in rows if signature is None]
+            backfilled: Dict[int, bytes] = {}
+            for i in range(0, len(missing_ids), chunk_size):
+                chunk = missing_ids[i : i + chunk_size]
+                for article in session.query(Article).filter(Article.id.in_(chunk)):
+                    signature = self.content_deduplicator.generate_minhash_signature_bytes(article.body)
+                    article.minhash_signature = signature
+                    if signature:
+                        backfilled[article.id] = signature
+            session.flush()
+
+            for article_id, signature in rows:
+                signature = signature or backfilled.get(article_id)
+                if signature:
+                    index.add(article_id, MinHasher.from_bytes(signature))
+
+            candidate_pairs = sorted(index.candidate_pairs())
+            candidate_ids = sorted({article_id for pair in candidate_pairs for article_id in pair})
+            articles_by_id: Dict[int, Article] = {}
+            for i in range(0, len(candidate_ids), chunk_size):
+                chunk = candidate_ids[i : i + chunk_size]
+                for article in session.query(Article).filter(Article.id.in_(chunk)):
+                    articles_by_id[article.id] = article
+
+            result = []
+            for id1, id2 in candidate_pairs:
+                article1, article2 = articles_by_id[id1], articles_by_id[id2]
+                if self.content_deduplicator.is_duplicate_content(article1.body, article2.body):
+                    result.append((article1, article2))
+
+            session.expunge_all()
+
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "近似重複記事検出完了",
+            operation="detect_near_duplicates",
+            articles=len(rows),
+            signatures_backfilled=len(backfilled),
+            candidate_pairs=len(candidate_pairs),
+            duplicate_pairs=len(result),
+        )
+        return result
+
     def start_scraping_session(self) -> int:
         """スクレイピングセッション開始"""
         with self.get_session() as session:
@@ -567,6 +821,83 @@ class DatabaseManager:
 
             return scraping_session
 
+    def save_performance_spans(self, session_id: int, spans: List[Dict[str, Any]]) -> int:
+        """
+        実行トレースのスパンを一括保存
+
+        Args:
+            session_id: スクレイピングセッションID
+            spans: TraceSpan.to_dict() 形式のスパン
+
+        Returns:
+            保存したスパン数
+        """
+        rows = [
+            {
+                "session_id": session_id,
+                "name": span["name"],
+                "category": span.get("category"),
+                "parent_name": span.get("parent"),
+                "thread_name": span.get("thread_name"),
+                "started_at": datetime.utcfromtimestamp(span["started_at"]),
+                "wall_ms": span.get("wall_ms"),
+                "cpu_ms": span.get("cpu_ms"),
+                "peak_rss_mb": span.get("peak_rss_mb"),
+                "items": span.get("items", 0),
+                "bytes": span.get("bytes", 0),
+                "status": span.get("status", "ok"),
+                "error": span.get("error"),
+                "attributes": (
+                    json.dumps(span["attributes"], ensure_ascii=False, default=str)
+                    if span.get("attributes") else None
+                ),
+            }
+            for span in spans
+        ]
+        if not rows:
+            return 0
+
+        with self.get_session() as session:
+            session.bulk_insert_mappings(PerformanceSpan, rows)
+
+        log_with_context(
+            self.logger,
+            logging.DEBUG,
+            "実行トレースを保存",
+            operation="save_performance_spans",
+            session_id=session_id,
+            count=len(rows),
+        )
+        return len(rows)
+
+    def get_performance_spans(self, session_id: int) -> List[Dict[str, Any]]:
+        """セッションのスパンを開始時刻順に取得"""
+        with self.get_session() as session:
+            spans = (
+                session.query(PerformanceSpan)
+                .filter(PerformanceSpan.session_id == session_id)
+                .order_by(PerformanceSpan.started_at, PerformanceSpan.id)
+                .all()
+            )
+            return [
+                {
+                    "name": span.name,
+                    "category": span.category,
+                    "parent": span.parent_name,
+                    "thread_name": span.thread_name,
+                    "started_at": span.started_at,
+                    "wall_ms": span.wall_ms,
+                    "cpu_ms": span.cpu_ms,
+                    "peak_rss_mb": span.peak_rss_mb,
+                    "items": span.items,
+                    "bytes": span.bytes,
+                    "status": span.status,
+                    "error": span.error,
+                    "attributes": json.loads(span.attributes) if span.attributes else {},
+                }
+                for span in spans
+            ]
+
     def get_statistics(self, days: int = 7) -> Dict[str, Any]:
         """
         統計情報取得
@@ -646,7 +977,13 @@ class DatabaseManager:
             # 古い記事を削除（CASCADE設定により関連データも削除される）
             deleted_count = session.query(Article).filter(Article.scraped_at < cutoff_date).delete()
 
-            # 古いセッション情報も削除
+            # 古いセッション情報も削除（実行トレースを先に削除する）
+            old_session_ids = session.query(ScrapingSession.id).filter(
+                ScrapingSession.started_at < cutoff_date
+            )
+            session.query(PerformanceSpan).filter(
+                PerformanceSpan.session_id.in_(old_session_ids.scalar_subquery())
+            ).delete(synchronize_session=False)
             session.query(ScrapingSession).filter(ScrapingSession.started_at < cutoff_date).delete()
 
             log_with_context(
@@ -0,0 +1,169 @@
+"""
+埋め込みキャッシュ
+
+モデル名と正規化済みテキストのハッシュをキーとして、float32 の埋め込み
+ベクトルをメモリマップ配列ファイルに保存する。スロット割り当てと LRU 管理は
+SQLite のインデックスファイルで行う。
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """メモリマップ配列 + SQLite インデックスによる埋め込みキャッシュ"""
+
+    def __init__(self, directory: str, model_name: str, dimension: int, max_entries: int = 20000):
+        self.model_name = model_name
+        self.dimension = dimension
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        base_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+        self.vectors_path = os.path.join(directory, f"{base_name}.f32")
+        self.index_path = os.path.join(directory, f"{base_name}.idx.db")
+
+        self._conn = sqlite3.connect(self.index_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                text_hash TEXT PRIMARY KEY,
+                slot INTEGER NOT NULL UNIQUE,
+                last_accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_last_accessed ON embeddings (last_accessed)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+        self._vectors = self._open_vectors()
+
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def _open_vectors(self) -> np.memmap:
+        """配列ファイルを開く（形状が変わった場合は作り直す）"""
+        shape = (self.max_entries, self.dimension)
+        expected_bytes = self.max_entries * self.dimension * 4
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'shape'").fetchone()
+        stored_shape = row[0] if row else None
+
+        if (
+            os.path.exists(self.vectors_path)
+            and os.path.getsize(self.vectors_path) == expected_bytes
+            and stored_shape == f"{self.max_entries}x{self.dimension}"
+        ):
+            return np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=shape)
+
+        # 形状が一致しない既存キャッシュは破棄する
+        self._conn.execute("DELETE FROM embeddings")
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('shape', ?)",
+            (f"{self.max_entries}x{self.dimension}",),
+        )
+        self._conn.commit()
+        return np.memmap(self.vectors_path, dtype=np.float32, mode="w+", shape=shape)
+
+    def text_hash(self, normalized_text: str) -> str:
+        """モデル名と正規化済みテキストのキャッシュキー"""
+        return hashlib.sha256(f"{self.model_name}\0{normalized_text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, normalized_texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        複数テキストの埋め込みを一括取得
+
+        Returns:
+            入力順のベクトル（コピー）。未キャッシュはNone
+        """
+        if not normalized_texts:
+            return []
+        hashes = [self.text_hash(text) for text in normalized_texts]
+        now = time.time()
+        with self._lock:
+            slots: Dict[str, int] = {}
+            unique_hashes = list(dict.fromkeys(hashes))
+            for i in range(0, len(unique_hashes), 500):
+                chunk = unique_hashes[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for text_hash, slot in self._conn.execute(
+                    f"SELECT text_hash, slot FROM embeddings WHERE text_hash IN ({placeholders})",
+                    chunk,
+                ):
+                    slots[text_hash] = slot
+            if slots:
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_accessed = ? WHERE text_hash = ?",
+                    [(now, text_hash) for text_hash in slots],
+                )
+                self._conn.commit()
+
+            results: List[Optional[np.ndarray]] = []
+            for text_hash in hashes:
+                slot = slots.get(text_hash)
+                if slot is None:
+                    self.stats["misses"] += 1
+                    results.append(None)
+                else:
+                    self.stats["hits"] += 1
+                    results.append(np.array(self._vectors[slot], dtype=np.float32))
+            return results
+
+    def put_many(self, normalized_texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """複数テキストの埋め込みを保存（上限を超える分は LRU で追い出す）"""
+        now = time.time()
+        with self._lock:
+            for text, vector in zip(normalized_texts, vectors):
+                if vector is None:
+                    continue
+                array = np.asarray(vector, dtype=np.float32)
+                if array.shape != (self.dimension,):
+                    continue
+
+                text_hash = self.text_hash(text)
+                row = self._conn.execute(
+                    "SELECT slot FROM embeddings WHERE text_hash = ?", (text_hash,)
+                ).fetchone()
+                if row is not None:
+                    slot = row[0]
+                else:
+                    slot = self._allocate_slot()
+                self._vectors[slot] = array
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO embeddings (text_hash, slot, last_accessed) VALUES (?, ?, ?)",
+                    (text_hash, slot, now),
+                )
+                self.stats["stores"] += 1
+            self._vectors.flush()
+            self._conn.commit()
+
+    def _allocate_slot(self) -> int:
+        """空きスロット、または最も古く参照されたエントリのスロットを返す"""
+        # スロットは追い出し時に即再利用されるため、上限までは連番で埋まる
+        next_slot = self._conn.execute("SELECT COALESCE(MAX(slot), -1) + 1 FROM embeddings").fetchone()[0]
+        if next_slot < self.max_entries:
+            return next_slot
+
+        text_hash, slot = self._conn.execute(
+            "SELECT text_hash, slot FROM embeddings ORDER BY last_accessed ASC LIMIT 1"
+        ).fetchone()
+        self._conn.execute("DELETE FROM embeddings WHERE text_hash = ?", (text_hash,))
+        self.stats["evictions"] += 1
+        return slot
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._vectors.flush()
+            self._conn.close()
@@ -8,11 +8,46 @@ import logging
 from typing import List, Optional, Dict, Any
 import numpy as np
 from src.config.app_config import SupabaseConfig, get_config
+from src.database.embedding_cache import EmbeddingCache
 
 # heavy importは遅延させるためここでは読み込まない
 SentenceTransformer = None
 
 
+def as_embedding_matrix(embeddings: Any) -> np.ndarray:
+    """埋め込みを float32 の2次元配列に変換（float32 配列はコピーしない）"""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return matrix
+
+
+def embedding_norms(matrix: np.ndarray) -> np.ndarray:
+    """行ごとのL2ノルム（ゼロベクトルは1として扱い、類似度0になるようにする）"""
+    norms = np.sqrt(np.einsum('ij,ij->i', matrix, matrix))
+    norms[norms == 0] = 1.0
+    return norms
+
+
+def normalize_embeddings(embeddings: Any) -> np.ndarray:
+    """行ベクトルをL2正規化した float32 配列を返す"""
+    matrix = as_embedding_matrix(embeddings)
+    return (matrix / embedding_norms(matrix)[:, None]).astype(np.float32, copy=False)
+
+
+def top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """スコア上位k件のインデックスを降順で返す（argpartition で全件ソートを避ける）"""
+    count = len(scores)
+    k = min(top_k, count)
+    if k <= 0:
+        return np.array([], dtype=np.int64)
+    if k < count:
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(count)
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
 class EmbeddingGenerator:
     """埋め込み生成クラス"""
 
@@ -20,6 +55,8 @@ class EmbeddingGenerator:
         self.config = config or get_config().supabase
         self.logger = logging.getLogger("embedding_generator")
         self._model: Optional[SentenceTransformer] = None
+        self._cache: Optional[EmbeddingCache] = None
+        self._cache_disabled = not getattr(self.config, 'embedding_cache_enabled', False)
 
         if not self.config.enabled:
             self.logger.info("Supabase機能が無効のため、埋め込み生成器を初期化しません")
@@ -48,6 +85,52 @@ class EmbeddingGenerator:
 
         return self._model
 
+    @property
+    def cache(self) -> Optional[EmbeddingCache]:
+        """埋め込みキャッシュを遅延初期化（無効時・初期化失敗時はNone）"""
+        if self._cache_disabled:
+            return None
+
+        if self._cache is None:
+            try:
+                self._cache = EmbeddingCache(
+                    self.config.embedding_cache_dir,
+                    self.config.embedding_model,
+                    self.config.embedding_dimension,
+                    max_entries=self.config.embedding_cache_max_entries,
+                )
+            except Exception as e:
+                self.logger.warning(f"埋め込みキャッシュを利用できません: {e}")
+                self._cache_disabled = True
+                return None
+
+        return self._cache
+
+    def _encode_with_cache(self, normalized_texts: List[str]) -> List[np.ndarray]:
+        """キャッシュ済みの埋め込みを再利用し、未キャッシュ分のみモデルで生成"""
+        cache = self.cache
+        cached = cache.get_many(normalized_texts) if cache is not None else [None] * len(normalized_texts)
+
+        # 未キャッシュのテキスト（重複は1回だけ生成）
+        miss_texts = list(dict.fromkeys(
+            text for text, vector in zip(normalized_texts, cached) if vector is None
+        ))
+        if miss_texts:
+            encoded = self.model.encode(miss_texts, convert_to_numpy=True)
+            encoded_by_text = dict(zip(miss_texts, encoded))
+            if cache is not None:
+                cache.put_many(miss_texts, encoded)
+            cached = [
+                vector if vector is not None else encoded_by_text[text]
+                for text, vector in zip(normalized_texts, cached)
+            ]
+
+        if cache is not None and len(normalized_texts) > 1:
+            self.logger.info(
+                f"埋め込みキャッシュ: {len(normalized_texts) - len(miss_texts)}/{len(normalized_texts)}件ヒット"
+            )
+        return cached
+
     def is_available(self) -> bool:
         """埋め込み生成器が利用可能かチェック"""
         return self.config.enabled and self.model is not None
@@ -65,8 +148,8 @@ class EmbeddingGenerator:
             # テキストを正規化
             normalized_text = self._normalize_text(text)
             
-            # 埋め込み生成
-            embedding = self.model.encode(normalized_text, convert_to_numpy=True)
+            # 埋め込み生成（キャッシュ優先）
+            embedding = self._encode_with_cache([normalized_text])[0]
             
             # 次元数チェック
             if len(embedding) != self.config.embedding_dimension:
@@ -96,8 +179,8 @@ class EmbeddingGenerator:
                 self.logger.warning("有効なテキストがありません")
                 return [None] * len(texts)
 
-            # 埋め込み一括生成
-            embeddings = self.model.encode(normalized_texts, convert_to_numpy=True)
+            # 埋め込み一括生成（キャッシュ済みのテキストはモデルに送らない）
+            embeddings = self._encode_with_cache(normalized_texts)
             
             # リスト形式に変換
             result = []
@@ -123,24 +206,67 @@ class EmbeddingGenerator:
     def calculate_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
         """コサイン類似度計算"""
         try:
-            vec1 = np.array(embedding1)
-            vec2 = np.array(embedding2)
-            
-            # コサイン類似度計算
-            dot_product = np.dot(vec1, vec2)
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-                
-            similarity = dot_product / (norm1 * norm2)
-            return float(similarity)
+            return float(self.cosine_similarities(embedding1, embedding2)[0])
 
         except Exception as e:
             self.logger.error(f"類似度計算失敗: {e}")
             return 0.0
 
+    def cosine_similarities(self, query_embedding: Any, corpus_embeddings: Any, normalized: bool = False) -> np.ndarray:
+        """
+        クエリと複数の埋め込みのコサイン類似度を一括計算
+
+        Args:
+            query_embedding: クエリ埋め込み（1次元）
+            corpus_embeddings: 比較対象の埋め込み行列（n × 次元）
+            normalized: 入力がL2正規化済みの場合True（ノルム計算を省略）
+
+        Returns:
+            長さnの類似度配列
+        """
+        query = as_embedding_matrix(query_embedding)[0]
+        corpus = as_embedding_matrix(corpus_embeddings)
+        scores = corpus @ query
+        if not normalized:
+            query_norm = float(np.linalg.norm(query))
+            if query_norm == 0:
+                return np.zeros(len(corpus), dtype=np.float32)
+            scores = scores / (embedding_norms(corpus) * query_norm)
+        return scores
+
+    def similarity_matrix(
+        self, embeddings_a: Any, embeddings_b: Optional[Any] = None, normalized: bool = False
+    ) -> np.ndarray:
+        """
+        ペアワイズのコサイン類似度行列を計算
+
+        Args:
+            embeddings_a: 埋め込み行列（m × 次元）
+            embeddings_b: 埋め込み行列（n × 次元）。省略時は embeddings_a 同士
+            normalized: 入力がL2正規化済みの場合True
+
+        Returns:
+            m × n の類似度行列
+        """
+        matrix_a = as_embedding_matrix(embeddings_a)
+        matrix_b = matrix_a if embeddings_b is None else as_embedding_matrix(embeddings_b)
+        scores = matrix_a @ matrix_b.T
+        if not normalized:
+            norms_a = embedding_norms(matrix_a)
+            norms_b = norms_a if embeddings_b is None else embedding_norms(matrix_b)
+            scores = scores / np.outer(norms_a, norms_b)
+        return scores
+
+    def top_k_similar(
+        self, query_embedding: Any, corpus_embeddings: Any, top_k: int = 5, normalized: bool = False
+    ) -> List[Dict[str, Any]]:
+        """類似度上位k件を {'index', 'similarity'} の降順リストで返す"""
+        scores = self.cosine_similarities(query_embedding, corpus_embeddings, normalized=normalized)
+        return [
+            {'index': int(i), 'similarity': float(scores[i])}
+            for i in top_k_indices(scores, top_k)
+        ]
+
     def find_most_similar(
         self, 
         query_embedding: List[float], 
@@ -148,24 +274,11 @@ class EmbeddingGenerator:
         top_k: int = 5
     ) -> List[Dict[str, Any]]:
         """最も類似した埋め込みを検索"""
-        if not candidate_embeddings:
+        if candidate_embeddings is None or len(candidate_embeddings) == 0:
             return []
 
         try:
-            similarities = []
-            
-            for i, candidate in enumerate(candidate_embeddings):
-                similarity = self.calculate_similarity(query_embedding, candidate)
-                similarities.append({
-                    'index': i,
-                    'similarity': similarity
-                })
-            
-            # 類似度順にソート
-            similarities.sort(key=lambda x: x['similarity'], reverse=True)
-            
-            # 上位top_k件を返す
-            return similarities[:top_k]
+            return self.top_k_similar(query_embedding, candidate_embeddings, top_k)
 
         except Exception as e:
             self.logger.error(f"類似検索失敗: {e}")
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+"""
+MinHash 署名と LSH バンドインデックスによる近似重複検出
+
+正規化済み本文の文字シングルから MinHash 署名を作り、署名をバンドに分割した
+LSH インデックスで候補ペアを絞り込む。候補ペアのみを呼び出し側で厳密に
+検証することで、全ペア比較（O(n²)）を避ける。
+"""
+
+import hashlib
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# 2^31 - 1（メルセンヌ素数）。a * x + b が uint64 に収まる範囲でハッシュ族を作る
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+
+class MinHasher:
+    """文字シングルの MinHash 署名を生成する"""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+
+    def shingles(self, text: str) -> Set[str]:
+        """文字 n-gram の集合（短いテキストは全体を1シングルとする）"""
+        if not text:
+            return set()
+        if len(text) <= self.shingle_size:
+            return {text}
+        return {text[i : i + self.shingle_size] for i in range(len(text) - self.shingle_size + 1)}
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        正規化済みテキストの MinHash 署名を生成
+
+        Returns:
+            uint32 配列（長さ num_perm）。テキストが空の場合はNone
+        """
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+
+        hashes = np.fromiter(
+            (
+                int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+                for s in shingles
+            ),
+            dtype=np.uint64,
+            count=len(shingles),
+        ) % _MERSENNE_PRIME
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def to_bytes(signature: np.ndarray) -> bytes:
+        """DB保存用にシリアライズ"""
+        return signature.astype("<u4").tobytes()
+
+    @staticmethod
+    def from_bytes(data: bytes) -> np.ndarray:
+        """DBから読み込んだ署名を復元"""
+        return np.frombuffer(data, dtype="<u4").astype(np.uint32)
+
+    @staticmethod
+    def estimate_jaccard(sig1: np.ndarray, sig2: np.ndarray) -> float:
+        """2つの署名から Jaccard 類似度を推定"""
+        if sig1 is None or sig2 is None or len(sig1) != len(sig2):
+            return 0.0
+        return float(np.mean(sig1 == sig2))
+
+
+class LSHIndex:
+    """MinHash 署名のバンド分割による LSH インデックス"""
+
+    def __init__(self, num_bands: int = 32, rows_per_band: int = 4):
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [defaultdict(list) for _ in range(num_bands)]
+        self._keys: Set[Hashable] = set()
+
+    def _band_keys(self, signature: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        expected = self.num_bands * self.rows_per_band
+        if len(signature) < expected:
+            raise ValueError(f"署名長 {len(signature)} がバンド設定 {expected} より短い")
+        for band in range(self.num_bands):
+            start = band * self.rows_per_band
+            yield band, signature[start : start + self.rows_per_band].tobytes()
+
+    def add(self, key: Hashable, signature: Optional[np.ndarray]) -> None:
+        """署名をインデックスに登録"""
+        if signature is None:
+            return
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band][band_key].append(key)
+        self._keys.add(key)
+
+    def query(self, signature: Optional[np.ndarray]) -> Set[Hashable]:
+        """いずれかのバンドが一致する登録済みキー（候補）を取得"""
+        candidates: Set[Hashable] = set()
+        if signature is None:
+            return candidates
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                candidates.update(bucket)
+        return candidates
+
+    def candidate_pairs(self) -> Set[Tuple[Hashable, Hashable]]:
+        """同一バケットに入ったキーの組（ソート済みタプル）"""
+        pairs: Set[Tuple[Hashable, Hashable]] = set()
+        for buckets in self._buckets:
+            for keys in buckets.values():
+                if len(keys) < 2:
+                    continue
+                for i, key1 in enumerate(keys):
+                    for key2 in keys[i + 1 :]:
+                        if key1 != key2:
+                            pairs.add((key1, key2) if key1 < key2 else (key2, key1))
+        return pairs
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -10,6 +10,7 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Index,
+    LargeBinary,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -34,6 +35,7 @@ class Article(Base):
     published_at = Column(DateTime, index=True)
     scraped_at = Column(DateTime, default=datetime.utcnow, index=True)
     content_hash = Column(String(64), index=True)
+    minhash_signature = Column(LargeBinary)  # 近似重複検出用 MinHash 署名
 
     # リレーション
     ai_analysis = relationship("AIAnalysis", back_populates="article", cascade="all, delete-orphan")
@@ -109,6 +111,37 @@ class ScrapingSession(Base):
         return f"<ScrapingSession(id={self.id}, status='{self.status}', articles_found={self.articles_found})>"
 
 
+class PerformanceSpan(Base):
+    """実行トレースのスパン（処理段ごとの時間・リソース計測）モデル"""
+
+    __tablename__ = "performance_spans"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    session_id = Column(Integer, ForeignKey("scraping_sessions.id"), nullable=False, index=True)
+    name = Column(String(200), nullable=False, index=True)  # 例: 'reuters.body_fetch', 'llm.summarize'
+    category = Column(String(50), index=True)  # scrape / db / llm / output など
+    parent_name = Column(String(200))
+    thread_name = Column(String(100))
+    started_at = Column(DateTime, index=True)
+    wall_ms = Column(Float)
+    cpu_ms = Column(Float)  # プロセス全体のCPU時間
+    peak_rss_mb = Column(Float)
+    items = Column(Integer, default=0)
+    bytes = Column(Integer, default=0)
+    status = Column(String(20), default="ok")  # 'ok', 'error'
+    error = Column(Text)
+    attributes = Column(Text)  # JSON形式の任意属性
+
+    # リレーション
+    session = relationship("ScrapingSession", backref="performance_spans")
+
+    # インデックス
+    __table_args__ = (Index("idx_span_session_name", "session_id", "name"),)
+
+    def __repr__(self) -> str:
+        return f"<PerformanceSpan(session_id={self.session_id}, name='{self.name}', wall_ms={self.wall_ms})>"
+
+
 class ProcessingStats(Base):
     """処理統計モデル"""
 
@@ -25,6 +25,8 @@ class SupabaseClient:
         self.config = config or get_config().supabase
         self.logger = logging.getLogger("supabase_client")
         self._client: Optional[Client] = None
+        # チャンクを書き換えるたびに増える版番号（検索キャッシュの無効化に使用）
+        self.chunks_version = 0
         # RESTフォールバック用
         self._rest_base_url = self.config.url.rstrip('/') + "/rest/v1" if self.config.url else None
         self._rest_headers = self._build_rest_headers()
@@ -121,12 +123,33 @@ class SupabaseClient:
             self.logger.error(f"REST insert失敗 ({table}): {e}")
             return []
 
-    def _rest_delete_by(self, table: str, column: str, value: str) -> bool:
+    def _rest_upsert_many(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not self._rest_base_url or not self._rest_headers:
+            return []
+        if not rows:
+            return []
+        try:
+            resp = requests.post(
+                f"{self._rest_base_url}/{table}",
+                headers={**self._rest_headers, "Prefer": "resolution=merge-duplicates,return=representation"},
+                json=rows,
+                timeout=30,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            return data if isinstance(data, list) else []
+        except Exception as e:
+            self.logger.error(f"REST upsert失敗 ({table}): {e}")
+            return []
+
+    def _rest_delete_by(self, table: str, column: str, value: str, operator: str = 'eq') -> bool:
         if not self._rest_base_url or not self._rest_headers:
             return False
+        if operator == 'in':
+            value = f"({value})"
         try:
             resp = requests.delete(
-                f"{self._rest_base_url}/{table}?{column}=eq.{value}",
+                f"{self._rest_base_url}/{table}?{column}={operator}.{value}",
                 headers=self._rest_headers,
                 timeout=15,
             )
@@ -207,11 +230,17 @@ class SupabaseClient:
         return None
 
     # Chunk操作
+    def _mark_chunks_changed(self) -> None:
+        """チャンクの書き込みを記録（検索結果キャッシュを無効化させる）"""
+        self.chunks_version += 1
+
     def create_chunks(self, chunks_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """チャンク一括作成"""
         if not self.is_available():
             return []
 
+        self._mark_chunks_changed()
+
         if not SUPABASE_AVAILABLE or self.client is None:
             inserted = self._rest_insert_many('chunks', chunks_data)
             if inserted:
@@ -233,6 +262,8 @@ class SupabaseClient:
         if not self.is_available():
             return False
 
+        self._mark_chunks_changed()
+
         if not SUPABASE_AVAILABLE or self.client is None:
             return self._rest_delete_by('chunks', 'document_id', document_id)
 
@@ -244,6 +275,94 @@ class SupabaseClient:
             self.logger.error(f"チャンク削除失敗: {e}")
         return False
 
+    def get_chunks_by_document_id(
+        self,
+        document_id: str,
+        columns: str = 'id,chunk_index,content,metadata,embedding',
+    ) -> Optional[List[Dict[str, Any]]]:
+        """ドキュメントIDでチャンクを取得（失敗時はNone）"""
+        if not self.is_available():
+            return None
+
+        if not SUPABASE_AVAILABLE or self.client is None:
+            if not self._rest_base_url or not self._rest_headers:
+                return None
+            try:
+                resp = requests.get(
+                    f"{self._rest_base_url}/chunks",
+                    headers=self._rest_headers,
+                    params={'select': columns, 'document_id': f'eq.{document_id}'},
+                    timeout=30,
+                )
+                resp.raise_for_status()
+                data = resp.json()
+                return data if isinstance(data, list) else None
+            except Exception as e:
+                self.logger.error(f"REST チャンク取得失敗: {e}")
+                return None
+
+        try:
+            result = self.client.table('chunks').select(columns).eq('document_id', document_id).execute()
+            return result.data or []
+        except Exception as e:
+            self.logger.error(f"チャンク取得失敗: {e}")
+        return None
+
+    def get_chunk_by_id(
+        self,
+        chunk_id: Any,
+        columns: str = 'id,content,embedding',
+    ) -> Optional[Dict[str, Any]]:
+        """チャンクIDでチャンクを取得（見つからない・失敗時はNone）"""
+        if not self.is_available():
+            return None
+
+        if not SUPABASE_AVAILABLE or self.client is None:
+            if not self._rest_base_url or not self._rest_headers:
+                return None
+            try:
+                resp = requests.get(
+                    f"{self._rest_base_url}/chunks",
+                    headers=self._rest_headers,
+                    params={'select': columns, 'id': f'eq.{chunk_id}'},
+                    timeout=15,
+                )
+                resp.raise_for_status()
+                data = resp.json()
+                return data[0] if isinstance(data, list) and data else None
+            except Exception as e:
+                self.logger.error(f"REST チャンク取得失敗: {e}")
+                return None
+
+        try:
+            result = self.client.table('chunks').select(columns).eq('id', chunk_id).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            self.logger.error(f"チャンク取得失敗: {e}")
+        return None
+
+    def delete_chunks_by_ids(self, chunk_ids: List[Any]) -> bool:
+        """チャンクIDを指定して削除"""
+        if not self.is_available():
+            return False
+
+        if not chunk_ids:
+            return True
+
+        self._mark_chunks_changed()
+
+        if not SUPABASE_AVAILABLE or self.client is None:
+            id_list = ','.join(str(chunk_id) for chunk_id in chunk_ids)
+            return self._rest_delete_by('chunks', 'id', id_list, operator='in')
+
+        try:
+            self.client.table('chunks').delete().in_('id', chunk_ids).execute()
+            self.logger.info(f"チャンク削除成功: {len(chunk_ids)}件")
+            return True
+        except Exception as e:
+            self.logger.error(f"チャンク削除失敗: {e}")
+        return False
+
     def upsert_chunks(self, chunks_data: List[Dict[str, Any]]) -> int:
         """チャンクのUpsert（バッチ処理）"""
         if not self.is_available():
@@ -252,6 +371,8 @@ class SupabaseClient:
         if not chunks_data:
             return 0
 
+        self._mark_chunks_changed()
+
         try:
             # チャンクデータをSupabaseの形式に変換
             formatted_chunks = []
@@ -265,12 +386,18 @@ class SupabaseClient:
                 }
 
                 # オプションのフィールドを追加
-                for field in ['category', 'region', 'source', 'url']:
+                for field in ['id', 'category', 'region', 'source', 'url']:
                     if field in chunk:
                         formatted_chunk[field] = chunk[field]
 
                 formatted_chunks.append(formatted_chunk)
 
+            # RESTフォールバック
+            if not SUPABASE_AVAILABLE or self.client is None:
+                upserted = self._rest_upsert_many('chunks', formatted_chunks)
+                self.logger.info(f"チャンクUpsert成功(REST): {len(upserted)}/{len(chunks_data)}個")
+                return len(upserted)
+
             # バッチUpsert
             result = self.client.table('chunks').upsert(formatted_chunks).execute()
 
@@ -311,6 +438,52 @@ class SupabaseClient:
             self.logger.error(f"ベクター検索失敗: {e}")
         return []
 
+    def fetch_chunks_for_index(
+        self,
+        columns: str = '*,documents(doc_date,url)',
+        page_size: int = 1000,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """ローカルインデックス構築用に全チャンクをページ単位で取得（失敗時はNone）"""
+        if not self.is_available():
+            return None
+
+        rows: List[Dict[str, Any]] = []
+        offset = 0
+        while True:
+            if not SUPABASE_AVAILABLE or self.client is None:
+                if not self._rest_base_url or not self._rest_headers:
+                    return None
+                try:
+                    resp = requests.get(
+                        f"{self._rest_base_url}/chunks",
+                        headers=self._rest_headers,
+                        params={'select': columns, 'order': 'id', 'offset': offset, 'limit': page_size},
+                        timeout=60,
+                    )
+                    resp.raise_for_status()
+                    page = resp.json()
+                except Exception as e:
+                    self.logger.error(f"REST インデックス用チャンク取得失敗: {e}")
+                    return None
+            else:
+                try:
+                    result = self.client.table('chunks').select(columns).order('id')\
+                        .range(offset, offset + page_size - 1).execute()
+                    page = result.data or []
+                except Exception as e:
+                    self.logger.error(f"インデックス用チャンク取得失敗: {e}")
+                    return None
+
+            if not isinstance(page, list):
+                return None
+            rows.extend(page)
+            if len(page) < page_size:
+                break
+            offset += page_size
+
+        self.logger.info(f"インデックス用チャンク取得成功: {len(rows)}件")
+        return rows
+
     # Storage操作
     def upload_file(self, bucket_name: str, file_path: str, file_data: bytes) -> Optional[str]:
         """ファイルアップロード"""
@@ -381,6 +554,8 @@ class SupabaseClient:
         """古いデータのクリーンアップ"""
         if not self.is_available():
             return {'deleted_documents': 0, 'deleted_chunks': 0}
+
+        self._mark_chunks_changed()
             
         try:
             from datetime import datetime, timedelta
@@ -2,13 +2,23 @@
 
 import os
 import json
+import hashlib
 import re
-from typing import Optional, Dict, Any, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import logging
 
 # プロジェクトモジュール
 import market_news_config as config
-from src.llm import BaseLLMClient, GeminiClient
+from src.llm import BaseLLMClient, CachedLLMClient, GeminiClient, LLMResult, estimate_tokens
+
+# 応答キャッシュのキーに含めるプロンプトテンプレートのバージョン
+# バッチ処理の結果も同じキーで保存するため、両テンプレートを合わせてハッシュする
+# （どちらかを変更すると自動的に別キーになる）
+ARTICLE_PROMPT_VERSION = hashlib.sha256(
+    "\n".join(
+        [config.AI_PROCESS_PROMPT_TEMPLATE, config.AI_BATCH_PROCESS_PROMPT_TEMPLATE]
+    ).encode("utf-8")
+).hexdigest()[:16]
 
 def process_article_with_ai(
     client_or_api_key: Union[str, BaseLLMClient],
@@ -52,52 +62,17 @@ def process_article_with_ai(
             prompt,
             max_output_tokens=1024,
             temperature=0.2,
+            cache_content=text,
+            prompt_version=ARTICLE_PROMPT_VERSION,
+            validate=_is_cacheable_article_response,
         )
 
         # レスポンスから構造化マークダウンを解析
         response_text = result.text.strip()
         logging.info(f"AI要約レスポンス: {response_text[:200]}...")
-        
-        # 構造化マークダウンからセクションを抽出
-        region = None
-        category = None
-        summary = None
-        
-        # ## 地域 セクションを抽出
-        region_match = re.search(r"##\s*地域\s*\n?\s*([^\n#]+)", response_text, re.IGNORECASE)
-        if region_match:
-            region = region_match.group(1).strip()
-            # 角括弧を除去 [usa] -> usa
-            region = re.sub(r'[\[\]]', '', region)
-        
-        # ## カテゴリ セクションを抽出
-        category_match = re.search(r"##\s*カテゴリ\s*\n?\s*([^\n#]+)", response_text, re.IGNORECASE)
-        if category_match:
-            category = category_match.group(1).strip()
-            category = re.sub(r'[\[\]]', '', category)
-        
-        # ## 要約 セクションを抽出
-        summary_match = re.search(r"##\s*要約\s*\n?\s*(.*?)(?=\n##|$)", response_text, re.IGNORECASE | re.DOTALL)
-        if summary_match:
-            summary = summary_match.group(1).strip()
-            # 角括弧を除去
-            summary = re.sub(r'^\[|\]$', '', summary)
-        
-        # フォールバック: 古いJSON形式も試行
-        if not (region and category and summary):
-            logging.warning("構造化マークダウン解析失敗、JSON形式でフォールバック試行")
-            try:
-                # 従来のJSON解析も試行
-                json_match = re.search(r"```(?:json)?\s*({.*?})\s*```", response_text, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                    result = json.loads(json_str)
-                    region = region or result.get("region")
-                    category = category or result.get("category")
-                    summary = summary or result.get("summary")
-            except (json.JSONDecodeError, Exception) as e:
-                logging.warning(f"JSON フォールバック解析も失敗: {e}")
-        
+
+        region, category, summary = _parse_article_response(response_text)
+
         # 結果の検証
         if not summary:
             logging.warning(f"AI要約: 要約テキストが取得できませんでした。レスポンス: {response_text[:100]}")
@@ -110,12 +85,7 @@ def process_article_with_ai(
         # デバッグログ出力
         logging.info(f"解析結果: region='{region}', category='{category}', summary_length={len(summary)}")
 
-        return {
-            "summary": summary,
-            "region": region if region else "その他",
-            "category": category if category else "その他",
-            "keywords": []  # 互換性のため空配列を維持
-        }
+        return _build_result(region, category, summary)
         
     except json.JSONDecodeError as e:
         logging.warning(f"AI要約: JSONパース失敗。{str(e)[:50]}")
@@ -124,6 +94,235 @@ def process_article_with_ai(
         logging.error(f"AI要約処理エラー: {str(e)[:50]}")
         return None
 
+# バッチ応答の記事見出し（"=== 記事 3 ===" など）
+_BATCH_HEADER_PATTERN = re.compile(r"^\s*=+\s*記事\s*(\d+)\s*=+\s*$", re.MULTILINE)
+
+# 1記事あたりの出力トークン見積もり（要約220字 + 見出し）
+_OUTPUT_TOKENS_PER_ARTICLE = 400
+
+
+def _parse_markdown_sections(response_text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    構造化マークダウンから 地域/カテゴリ/要約 セクションを抽出する
+
+    Returns:
+        (region, category, summary)。見つからないセクションはNone
+    """
+    region = None
+    category = None
+    summary = None
+
+    # ## 地域 セクションを抽出
+    region_match = re.search(r"##\s*地域\s*\n?\s*([^\n#]+)", response_text, re.IGNORECASE)
+    if region_match:
+        region = region_match.group(1).strip()
+        # 角括弧を除去 [usa] -> usa
+        region = re.sub(r'[\[\]]', '', region)
+
+    # ## カテゴリ セクションを抽出
+    category_match = re.search(r"##\s*カテゴリ\s*\n?\s*([^\n#]+)", response_text, re.IGNORECASE)
+    if category_match:
+        category = category_match.group(1).strip()
+        category = re.sub(r'[\[\]]', '', category)
+
+    # ## 要約 セクションを抽出
+    summary_match = re.search(r"##\s*要約\s*\n?\s*(.*?)(?=\n##|$)", response_text, re.IGNORECASE | re.DOTALL)
+    if summary_match:
+        summary = summary_match.group(1).strip()
+        # 区切り線と角括弧を除去
+        summary = re.sub(r'\n-{3,}\s*$', '', summary).strip()
+        summary = re.sub(r'^\[|\]$', '', summary)
+
+    return region, category, summary
+
+
+def _parse_article_response(response_text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    単独処理の応答から 地域/カテゴリ/要約 を抽出する（旧JSON形式にもフォールバック）
+
+    Returns:
+        (region, category, summary)。見つからないセクションはNone
+    """
+    region, category, summary = _parse_markdown_sections(response_text)
+    if region and category and summary:
+        return region, category, summary
+
+    logging.warning("構造化マークダウン解析失敗、JSON形式でフォールバック試行")
+    try:
+        json_match = re.search(r"```(?:json)?\s*({.*?})\s*```", response_text, re.DOTALL)
+        if json_match:
+            data = json.loads(json_match.group(1))
+            region = region or data.get("region")
+            category = category or data.get("category")
+            summary = summary or data.get("summary")
+    except (json.JSONDecodeError, Exception) as e:
+        logging.warning(f"JSON フォールバック解析も失敗: {e}")
+    return region, category, summary
+
+
+def _is_cacheable_article_response(result: LLMResult) -> bool:
+    """出力上限で途切れておらず、3セクションが揃った応答だけをキャッシュ対象とする"""
+    finish_reason = (result.metadata or {}).get("finish_reason")
+    if getattr(finish_reason, "name", str(finish_reason)).endswith("MAX_TOKENS"):
+        return False
+    region, category, summary = _parse_markdown_sections(result.text.strip())
+    return bool(region and category and summary)
+
+
+def _build_result(region: Optional[str], category: Optional[str], summary: str) -> Dict[str, Any]:
+    return {
+        "summary": summary,
+        "region": region if region else "その他",
+        "category": category if category else "その他",
+        "keywords": []  # 互換性のため空配列を維持
+    }
+
+
+def _format_markdown_sections(result: Dict[str, Any]) -> str:
+    """要約結果を単独処理の応答と同じ構造化マークダウンに戻す"""
+    return (
+        f"## 地域\n{result['region']}\n\n"
+        f"## カテゴリ\n{result['category']}\n\n"
+        f"## 要約\n{result['summary']}"
+    )
+
+
+def build_article_batches(
+    texts: Sequence[str],
+    token_budget: int,
+    max_batch_size: int,
+) -> List[List[int]]:
+    """
+    記事本文をトークン予算内に収まるバッチに分割する
+
+    Args:
+        texts: 記事本文のリスト
+        token_budget: 1バッチあたりの入力トークン上限（プロンプト本体を含む）
+        max_batch_size: 1バッチあたりの最大記事数
+
+    Returns:
+        入力インデックスのリストのリスト。予算を超える記事は単独のバッチになる
+    """
+    prompt_tokens = estimate_tokens(config.AI_BATCH_PROCESS_PROMPT_TEMPLATE)
+    max_batch_size = max(1, max_batch_size)
+
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = prompt_tokens
+    for index, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if current and (
+            len(current) >= max_batch_size or current_tokens + tokens > token_budget
+        ):
+            batches.append(current)
+            current = []
+            current_tokens = prompt_tokens
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_response(response_text: str, count: int) -> List[Optional[Dict[str, Any]]]:
+    """
+    バッチ応答を記事ごとの結果に分解する
+
+    Args:
+        response_text: LLMの応答テキスト
+        count: バッチ内の記事数
+
+    Returns:
+        記事順の結果リスト。見出しや 地域/カテゴリ/要約 が揃わない記事はNone
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * count
+    headers = list(_BATCH_HEADER_PATTERN.finditer(response_text))
+    for position, header in enumerate(headers):
+        number = int(header.group(1))
+        if not 1 <= number <= count or results[number - 1] is not None:
+            continue
+        end = headers[position + 1].start() if position + 1 < len(headers) else len(response_text)
+        region, category, summary = _parse_markdown_sections(response_text[header.end():end])
+        if region and category and summary:
+            results[number - 1] = _build_result(region, category, summary)
+    return results
+
+
+def process_articles_batch_with_ai(
+    client: BaseLLMClient,
+    texts: Sequence[str],
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    複数の記事を1回のリクエストでまとめて要約する
+
+    解析できなかった記事の結果はNoneとなるため、呼び出し側で
+    process_article_with_ai による単独処理にフォールバックすること。
+
+    Args:
+        client: LLMクライアント
+        texts: 記事本文のリスト
+
+    Returns:
+        入力順の要約結果リスト（失敗した記事はNone）
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+    # 短すぎる記事は単独処理と同様に対象外
+    targets = [i for i, text in enumerate(texts) if text and len(text.strip()) >= 50]
+
+    # 応答キャッシュは単独処理と同じキー（記事本文単位）で参照・保存する
+    cache_keys: Dict[int, str] = {}
+    if isinstance(client, CachedLLMClient):
+        for index in list(targets):
+            key = client.cache_key(cache_content=texts[index], prompt_version=ARTICLE_PROMPT_VERSION)
+            cached = client.get_cached(key)
+            if cached is not None:
+                region, category, summary = _parse_markdown_sections(cached.text)
+                if summary:
+                    results[index] = _build_result(region, category, summary)
+                    targets.remove(index)
+                    continue
+            cache_keys[index] = key
+
+    if not targets:
+        return results
+
+    articles_block = "\n\n".join(
+        f"=== 記事 {number} ===\n{texts[index].strip()}"
+        for number, index in enumerate(targets, start=1)
+    )
+    prompt = config.AI_BATCH_PROCESS_PROMPT_TEMPLATE.format(
+        count=len(targets), articles=articles_block
+    )
+
+    # バッチ応答そのものはキャッシュしない（解析できた記事のみ下で記事単位に保存する）
+    request_client = client.client if isinstance(client, CachedLLMClient) else client
+    try:
+        result = request_client.generate(
+            prompt,
+            max_output_tokens=_OUTPUT_TOKENS_PER_ARTICLE * len(targets),
+            temperature=0.2,
+        )
+    except Exception as e:
+        logging.warning(f"AIバッチ要約エラー（{len(targets)}件）: {str(e)[:50]}")
+        return results
+
+    parsed = parse_batch_response(result.text.strip(), len(targets))
+    for index, article_result in zip(targets, parsed):
+        results[index] = article_result
+        if article_result is not None and index in cache_keys:
+            client.store(
+                cache_keys[index],
+                LLMResult(
+                    text=_format_markdown_sections(article_result),
+                    metadata={"model": client.model_name, "batched": True},
+                ),
+            )
+
+    failed = sum(1 for r in parsed if r is None)
+    logging.info(f"AIバッチ要約: {len(targets) - failed}/{len(targets)}件を解析")
+    return results
+
+
 if __name__ == '__main__':
     # .envファイルから環境変数を読み込む
     from dotenv import load_dotenv
@@ -1,13 +1,20 @@
 """Shared LLM client implementations."""
 
 from .base_client import BaseLLMClient, LLMResult
+from .dispatcher import DispatchedLLMClient, LLMDispatcher, estimate_tokens
 from .gemini_client import GeminiClient
 from .openrouter_client import OpenRouterClient, OpenRouterError
+from .response_cache import CachedLLMClient, LLMResponseCache
 
 __all__ = [
     "BaseLLMClient",
+    "CachedLLMClient",
+    "DispatchedLLMClient",
     "GeminiClient",
+    "LLMDispatcher",
+    "LLMResponseCache",
     "LLMResult",
     "OpenRouterClient",
     "OpenRouterError",
+    "estimate_tokens",
 ]
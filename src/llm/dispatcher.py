@@ -0,0 +1,280 @@
+"""Rate-limited dispatcher shared by the LLM clients."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from .base_client import BaseLLMClient, LLMResult
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Substrings that identify rate-limit failures in provider error messages.
+# GeminiClient re-raises SDK errors as RuntimeError, so the type is not available.
+# Only these are retried; a hard quota or a plain timeout does not clear after a backoff.
+_RATE_LIMIT_MARKERS = (
+    "429",
+    "resource_exhausted",
+    "resource exhausted",
+    "resourceexhausted",
+    "too many requests",
+    "toomanyrequests",
+)
+
+# Substrings that identify request timeouts. These reduce concurrency but are not retried.
+_TIMEOUT_MARKERS = (
+    "deadline exceeded",
+    "timed out",
+    "timeout",
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate tokens: one per non-ASCII character, one per four ASCII characters."""
+    if not text:
+        return 0
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Return True for 429 / RESOURCE_EXHAUSTED / TooManyRequests errors, which are retried."""
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    message = f"{type(exc).__name__} {exc}".lower()
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+
+def is_timeout_error(exc: BaseException) -> bool:
+    """Return True for request timeouts, which reduce concurrency without a retry."""
+    if isinstance(exc, TimeoutError):
+        return True
+    message = str(exc).lower()
+    return any(marker in message for marker in _TIMEOUT_MARKERS)
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """Return True for errors that should reduce concurrency."""
+    return is_rate_limit_error(exc) or is_timeout_error(exc)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate_per_minute``."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None) -> None:
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Block until ``amount`` tokens are available and return the seconds waited."""
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self.rate_per_second
+            time.sleep(delay)
+            waited += delay
+
+
+class AIMDConcurrencyLimiter:
+    """Concurrency limit with additive increase and multiplicative decrease."""
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 16) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, *, succeeded: bool, throttled: bool = False) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(float(self.minimum), self.limit / 2)
+            elif succeeded:
+                # +1 per "window" of successful calls at the current limit
+                self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            self._condition.notify_all()
+
+
+class LLMDispatcher:
+    """Shared RPM/TPM token buckets plus AIMD concurrency for LLM calls.
+
+    ``call`` wraps a single request: it waits for request and token budget,
+    holds a concurrency slot, and retries rate-limited calls with jittered
+    backoff after halving the concurrency limit. Timeouts also halve the
+    limit but are raised without a retry. ``stream`` runs many tasks
+    and yields results in completion order.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float = 60,
+        tokens_per_minute: float = 1_000_000,
+        initial_concurrency: int = 5,
+        max_concurrency: int = 10,
+        min_concurrency: int = 1,
+        max_retries: int = 3,
+        backoff_base: float = 2.0,
+        backoff_max: float = 60.0,
+    ) -> None:
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.concurrency = AIMDConcurrencyLimiter(
+            initial_concurrency, minimum=min_concurrency, maximum=max_concurrency
+        )
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.logger = logging.getLogger(__name__)
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, float] = {
+            "calls": 0,
+            "succeeded": 0,
+            "throttled": 0,
+            "timeouts": 0,
+            "retries": 0,
+            "failed": 0,
+            "rate_wait_seconds": 0.0,
+        }
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        stats["rate_wait_seconds"] = round(stats["rate_wait_seconds"], 3)
+        stats["concurrency_limit"] = round(self.concurrency.limit, 2)
+        return stats
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def call(self, fn: Callable[[], R], *, estimated_tokens: int = 0) -> R:
+        """Run ``fn`` under the rate limits, retrying rate-limited failures."""
+        for attempt in range(self.max_retries + 1):
+            waited = 0.0
+            if self.request_bucket is not None:
+                waited += self.request_bucket.acquire(1)
+            if self.token_bucket is not None and estimated_tokens:
+                waited += self.token_bucket.acquire(estimated_tokens)
+            if waited:
+                self._count("rate_wait_seconds", waited)
+
+            self.concurrency.acquire()
+            self._count("calls")
+            try:
+                result = fn()
+            except Exception as exc:
+                rate_limited = is_rate_limit_error(exc)
+                timed_out = not rate_limited and is_timeout_error(exc)
+                self.concurrency.release(succeeded=False, throttled=rate_limited or timed_out)
+                if timed_out:
+                    self._count("timeouts")
+                if not rate_limited:
+                    self._count("failed")
+                    raise
+                self._count("throttled")
+                if attempt >= self.max_retries:
+                    self._count("failed")
+                    raise
+                delay = self.backoff_delay(attempt)
+                self.logger.warning(
+                    "LLMリクエストがレート制限されました。%.1f秒後に再試行 (%d/%d, 同時実行上限=%.1f): %s",
+                    delay,
+                    attempt + 1,
+                    self.max_retries,
+                    self.concurrency.limit,
+                    str(exc)[:100],
+                )
+                self._count("retries")
+                time.sleep(delay)
+                continue
+
+            self.concurrency.release(succeeded=True)
+            self._count("succeeded")
+            return result
+
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def stream(
+        self, fn: Callable[[T], R], items: Iterable[T]
+    ) -> Iterator[Tuple[T, Optional[R], Optional[BaseException]]]:
+        """Run ``fn`` for each item and yield ``(item, result, error)`` as each finishes.
+
+        Worker threads are sized to the maximum concurrency; the AIMD limiter
+        inside ``call`` decides how many requests are actually in flight.
+        """
+        items = list(items)
+        if not items:
+            return
+        workers = min(len(items), self.concurrency.maximum)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_item = {executor.submit(fn, item): item for item in items}
+            for future in concurrent.futures.as_completed(future_to_item):
+                item = future_to_item[future]
+                try:
+                    yield item, future.result(), None
+                except Exception as exc:
+                    yield item, None, exc
+
+
+class DispatchedLLMClient(BaseLLMClient):
+    """Route ``generate`` calls of a client through a shared ``LLMDispatcher``."""
+
+    def __init__(self, client: BaseLLMClient, dispatcher: LLMDispatcher) -> None:
+        super().__init__(provider=client.provider, model_name=client.model_name)
+        self.client = client
+        self.dispatcher = dispatcher
+
+    def generate(
+        self,
+        prompt: str,
+        *,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.2,
+        max_output_tokens: Optional[int] = None,
+        timeout: Optional[int] = None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        estimated = estimate_tokens(prompt) + estimate_tokens(system_prompt or "")
+        estimated += max_output_tokens or 1024
+        return self.dispatcher.call(
+            lambda: self.client.generate(
+                prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_output_tokens=max_output_tokens,
+                timeout=timeout,
+                **kwargs,
+            ),
+            estimated_tokens=estimated,
+        )
@@ -0,0 +1,208 @@
+"""Persistent response cache for LLM clients."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src.database.content_deduplicator import ContentDeduplicator
+
+from .base_client import BaseLLMClient, LLMResult
+
+
+class LLMResponseCache:
+    """SQLite backed response cache with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        ttl_seconds: int = 7 * 24 * 3600,
+        max_entries: int = 5000,
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                text TEXT NOT NULL,
+                metadata TEXT,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_accessed "
+            "ON llm_responses (last_accessed)"
+        )
+        self._conn.commit()
+
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def get(self, cache_key: str) -> Optional[LLMResult]:
+        """Return the cached result, or ``None`` when missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, metadata, created_at FROM llm_responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None or now - row[2] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+                    self._conn.commit()
+                    self.stats["evictions"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_responses SET last_accessed = ? WHERE cache_key = ?",
+                (now, cache_key),
+            )
+            self._conn.commit()
+            self.stats["hits"] += 1
+
+        metadata = json.loads(row[1]) if row[1] else {}
+        metadata["cache_hit"] = True
+        return LLMResult(text=row[0], metadata=metadata)
+
+    def put(self, cache_key: str, provider: str, model: str, result: LLMResult) -> None:
+        """Store a result and evict the least recently used entries over the limit."""
+        if not result.text:
+            return
+        now = time.time()
+        metadata = json.dumps(result.metadata or {}, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(cache_key, provider, model, text, metadata, created_at, last_accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (cache_key, provider, model, result.text, metadata, now, now),
+            )
+            overflow = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_responses WHERE cache_key IN ("
+                    "SELECT cache_key FROM llm_responses ORDER BY last_accessed ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self.stats["evictions"] += overflow
+            self._conn.commit()
+            self.stats["stores"] += 1
+
+    def prune(self) -> int:
+        """Delete entries older than the TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (cutoff,))
+            self._conn.commit()
+            self.stats["evictions"] += cursor.rowcount
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedLLMClient(BaseLLMClient):
+    """Wrap an LLM client so identical requests are answered from the cache.
+
+    Cache keys combine provider, model, prompt template version and a content
+    hash. Callers that summarise article bodies pass ``cache_content`` (the
+    article body) and ``prompt_version``; the body is hashed with
+    ``ContentDeduplicator.generate_content_hash`` so republished wires share an
+    entry. Without ``cache_content`` the full prompt is hashed verbatim.
+
+    Callers that can only tell a usable reply after parsing it pass
+    ``validate``, a callable taking the ``LLMResult``. Replies it rejects are
+    returned but not stored, and cached entries it rejects are refetched.
+    """
+
+    def __init__(self, client: BaseLLMClient, cache: LLMResponseCache) -> None:
+        super().__init__(provider=client.provider, model_name=client.model_name)
+        self.client = client
+        self.cache = cache
+        self.logger = logging.getLogger(__name__)
+        self._content_deduplicator = ContentDeduplicator()
+
+    def cache_key(
+        self,
+        prompt: str = "",
+        *,
+        cache_content: Optional[str] = None,
+        prompt_version: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Build the cache key for a request."""
+        if cache_content:
+            content_hash = self._content_deduplicator.generate_content_hash(cache_content)
+        else:
+            content_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        system_hash = (
+            hashlib.sha256(system_prompt.encode("utf-8")).hexdigest() if system_prompt else ""
+        )
+        raw_key = "|".join(
+            [self.provider, self.model_name, prompt_version or "", system_hash, content_hash]
+        )
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def get_cached(self, cache_key: str) -> Optional[LLMResult]:
+        return self.cache.get(cache_key)
+
+    def store(self, cache_key: str, result: LLMResult) -> None:
+        self.cache.put(cache_key, self.provider, self.model_name, result)
+
+    def generate(
+        self,
+        prompt: str,
+        *,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.2,
+        max_output_tokens: Optional[int] = None,
+        timeout: Optional[int] = None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        cache_content = kwargs.pop("cache_content", None)
+        prompt_version = kwargs.pop("prompt_version", None)
+        validate: Optional[Callable[[LLMResult], bool]] = kwargs.pop("validate", None)
+        key = self.cache_key(
+            prompt,
+            cache_content=cache_content,
+            prompt_version=prompt_version,
+            system_prompt=system_prompt,
+        )
+
+        cached = self.get_cached(key)
+        if cached is not None:
+            if validate is None or validate(cached):
+                return cached
+            self.logger.debug("キャッシュ済みLLM応答が検証に失敗したため再取得します")
+
+        result = self.client.generate(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            timeout=timeout,
+            **kwargs,
+        )
+        if validate is None or validate(result):
+            self.store(key, result)
+        return result
@@ -0,0 +1,225 @@
+"""
+音声アセット解析キャッシュ
+
+イントロ・アウトロ・BGMなど毎回同じ音声アセットについて、ファイル内容のハッシュを
+キーにデコード・リサンプリング済みWAVとラウドネス情報を保存し、エピソードごとの
+再デコード・再測定を省きます。
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+try:
+    from pydub import AudioSegment
+    PYDUB_AVAILABLE = True
+except ImportError:
+    AudioSegment = None  # type: ignore
+    PYDUB_AVAILABLE = False
+
+try:
+    import numpy as np
+    import pyloudnorm as pyln
+    PYLOUDNORM_AVAILABLE = True
+except ImportError:
+    PYLOUDNORM_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "cache/audio_assets"
+
+# 解析内容を変更した場合に古いキャッシュを無効化するためのバージョン
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class PreparedAsset:
+    """解析・変換済みの音声アセット情報"""
+
+    source_path: str
+    digest: str
+    wav_path: str
+    sample_rate: int
+    channels: int
+    duration_seconds: float
+    peak_dbfs: Optional[float] = None
+    rms_dbfs: Optional[float] = None
+    lufs: Optional[float] = None
+
+
+class AssetAnalysisCache:
+    """ファイルハッシュをキーにした音声アセットの解析キャッシュ"""
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR):
+        """
+        Args:
+            cache_dir: キャッシュディレクトリのパス
+        """
+        self.cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+        # (パス, サイズ, 更新時刻) -> ハッシュ（同一プロセス内での再ハッシュを省く）
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        # (ハッシュ, サンプルレート, チャンネル数) -> 読み込み済み音声
+        self._audio: Dict[Tuple[str, int, int], "AudioSegment"] = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+    def file_digest(self, path: Union[str, Path]) -> str:
+        """ファイル内容の SHA-256 ハッシュを取得"""
+        stat = os.stat(path)
+        memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+        digest = self._digests.get(memo_key)
+        if digest is None:
+            sha256 = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    sha256.update(block)
+            digest = sha256.hexdigest()
+            self._digests[memo_key] = digest
+        return digest
+
+    def _entry_paths(self, digest: str, sample_rate: int, channels: int) -> Tuple[Path, Path]:
+        stem = f"{digest}_{sample_rate}hz_{channels}ch"
+        return self.cache_dir / f"{stem}.wav", self.cache_dir / f"{stem}.json"
+
+    def prepare(self, path: Union[str, Path], sample_rate: int, channels: int) -> PreparedAsset:
+        """
+        アセットを指定形式のWAVに変換し、解析情報を取得（キャッシュ済みなら再利用）
+
+        Args:
+            path: 元の音声アセットファイル
+            sample_rate: 出力サンプルレート
+            channels: 出力チャンネル数
+
+        Returns:
+            解析・変換済みアセット情報
+        """
+        digest = self.file_digest(path)
+        wav_path, meta_path = self._entry_paths(digest, sample_rate, channels)
+
+        if wav_path.exists() and meta_path.exists():
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                if meta.pop("version", None) == CACHE_FORMAT_VERSION:
+                    meta.update(source_path=str(path), wav_path=str(wav_path))
+                    with self._lock:
+                        self.stats["hits"] += 1
+                    return PreparedAsset(**meta)
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Invalid asset analysis cache entry {meta_path}: {e}")
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return self._analyze(path, digest, wav_path, meta_path, sample_rate, channels)
+
+    def _analyze(
+        self,
+        path: Union[str, Path],
+        digest: str,
+        wav_path: Path,
+        meta_path: Path,
+        sample_rate: int,
+        channels: int,
+    ) -> PreparedAsset:
+        if not PYDUB_AVAILABLE:
+            raise RuntimeError("pydub is required to analyze audio assets")
+
+        logger.info(f"Analyzing audio asset: {path}")
+        audio = AudioSegment.from_file(str(path))
+        audio = audio.set_frame_rate(sample_rate).set_channels(channels)
+
+        prepared = PreparedAsset(
+            source_path=str(path),
+            digest=digest,
+            wav_path=str(wav_path),
+            sample_rate=sample_rate,
+            channels=channels,
+            duration_seconds=len(audio) / 1000.0,
+            peak_dbfs=round(audio.max_dBFS, 2) if audio.rms else None,
+            rms_dbfs=round(audio.dBFS, 2) if audio.rms else None,
+            lufs=self._measure_lufs(audio),
+        )
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(wav_path, lambda f: audio.export(f, format="wav"))
+        meta = asdict(prepared)
+        for key in ("source_path", "wav_path"):
+            meta.pop(key)
+        meta["version"] = CACHE_FORMAT_VERSION
+        self._write_atomic(
+            meta_path, lambda f: f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        )
+
+        with self._lock:
+            self._audio[(digest, sample_rate, channels)] = audio
+        return prepared
+
+    def _write_atomic(self, path: Path, write) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def _measure_lufs(audio: "AudioSegment") -> Optional[float]:
+        """統合ラウドネス（LUFS）を測定（pyloudnorm が無い・測定不能な場合はNone）"""
+        if not PYLOUDNORM_AVAILABLE:
+            return None
+        try:
+            samples = np.array(audio.get_array_of_samples(), dtype=np.float64)
+            samples = samples.reshape(-1, audio.channels) / float(1 << (8 * audio.sample_width - 1))
+            loudness = pyln.Meter(audio.frame_rate).integrated_loudness(samples)
+            return round(float(loudness), 2) if np.isfinite(loudness) else None
+        except Exception as e:
+            logger.warning(f"LUFS measurement failed: {e}")
+            return None
+
+    def load_audio(self, path: Union[str, Path], sample_rate: int, channels: int) -> "AudioSegment":
+        """
+        変換済みアセットを AudioSegment として取得（同一プロセス内ではメモリ上で再利用）
+
+        Args:
+            path: 元の音声アセットファイル
+            sample_rate: 出力サンプルレート
+            channels: 出力チャンネル数
+
+        Returns:
+            指定形式に変換済みの音声
+        """
+        prepared = self.prepare(path, sample_rate, channels)
+        key = (prepared.digest, sample_rate, channels)
+        with self._lock:
+            audio = self._audio.get(key)
+        if audio is None:
+            audio = AudioSegment.from_wav(prepared.wav_path)
+            with self._lock:
+                self._audio[key] = audio
+        return audio
+
+
+# 共有インスタンス（キャッシュディレクトリごと）
+_caches: Dict[str, AssetAnalysisCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_asset_analysis_cache(cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR) -> AssetAnalysisCache:
+    """キャッシュディレクトリごとの解析キャッシュを取得（シングルトン）"""
+    key = str(cache_dir)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = AssetAnalysisCache(cache_dir)
+            _caches[key] = cache
+        return cache
@@ -9,11 +9,14 @@ import logging
 import tempfile
 import subprocess
 import shutil
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 import json
 
+from ..assets.asset_analysis_cache import DEFAULT_CACHE_DIR, get_asset_analysis_cache
 from ..assets.asset_manager import AssetManager
 
 
@@ -40,21 +43,34 @@ class AudioProcessor:
         "enable_music": True,  # BGM・ミュージック合成を有効化
         "bgm_volume": 0.15,  # BGM音量レベル（メイン音声を邪魔しない）
         "fade_duration": 0.5,  # フェードイン/アウト時間（秒）
+        # 処理モード: single_pass（測定1回 + 1つのフィルタグラフで正規化・合成・エンコード）
+        #            staged（正規化・合成・最終エンコードを個別のFFmpeg実行で行う従来方式）
+        "pipeline_mode": "single_pass",
     }
 
-    def __init__(self, assets_dir: str, ffmpeg_path: Optional[str] = None):
+    PIPELINE_MODES = ("single_pass", "staged")
+
+    def __init__(
+        self,
+        assets_dir: str,
+        ffmpeg_path: Optional[str] = None,
+        asset_cache_dir: Optional[str] = None,
+    ):
         """
         初期化
 
         Args:
             assets_dir: 音声アセットディレクトリ
             ffmpeg_path: FFmpegバイナリパス（オプション）
+            asset_cache_dir: アセット解析キャッシュのディレクトリ（省略時は cache/audio_assets）
         """
         self.assets_dir = Path(assets_dir)
         self.logger = logging.getLogger(__name__)
 
         # アセットマネージャーの初期化
         self.asset_manager = AssetManager(str(self.assets_dir))
+        # イントロ・アウトロ・BGMは出力形式のWAVに変換済みのものを再利用する
+        self.asset_cache = get_asset_analysis_cache(asset_cache_dir or DEFAULT_CACHE_DIR)
 
         # FFmpegパスの検出
         self.ffmpeg_path = ffmpeg_path or shutil.which("ffmpeg")
@@ -65,6 +81,9 @@ class AudioProcessor:
         self.temp_dir = Path(tempfile.gettempdir()) / "podcast_audio"
         self.temp_dir.mkdir(exist_ok=True)
 
+        # 直近の処理の段階別所要時間（秒）
+        self.timing_report: Dict[str, Any] = {"mode": None, "stages": {}}
+
         self.logger.info(f"AudioProcessor初期化完了 - アセット: {assets_dir}")
 
     def process_audio(
@@ -113,8 +132,9 @@ class AudioProcessor:
             output_path = output_dir / f"{episode_id}.mp3"
 
             # BGM付き高品質音声処理パイプライン
+            self.timing_report = {"mode": None, "stages": {}}
             if self.ffmpeg_path:
-                processed_path = self._process_with_ffmpeg_and_music(
+                processed_path = self._process_with_ffmpeg(
                     temp_input, output_path, process_settings, metadata
                 )
             else:
@@ -127,6 +147,7 @@ class AudioProcessor:
             # 一時ファイルの清掃
             self._cleanup_temp_files(temp_input)
 
+            self._log_timing_report()
             self.logger.info(f"音声処理完了 - 出力: {processed_path}")
             return str(processed_path)
 
@@ -135,6 +156,219 @@ class AudioProcessor:
             # エラー時は基本処理にフォールバック
             return self._create_fallback_file(audio_data, episode_id, metadata)
 
+    def _process_with_ffmpeg(
+        self,
+        input_path: Path,
+        output_path: Path,
+        settings: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """
+        設定された処理モードでFFmpeg処理を実行
+
+        single_pass が失敗した場合は staged（従来方式）で再処理する。
+        """
+        mode = settings.get("pipeline_mode", "single_pass")
+        if mode not in self.PIPELINE_MODES:
+            self.logger.warning(f"未対応の処理モードのため staged で処理します: {mode}")
+            mode = "staged"
+
+        if mode == "single_pass":
+            self.timing_report["mode"] = "single_pass"
+            try:
+                return self._process_single_pass(input_path, output_path, settings, metadata)
+            except subprocess.CalledProcessError as e:
+                stderr = e.stderr.decode("utf-8", errors="replace") if isinstance(e.stderr, bytes) else e.stderr
+                self.logger.warning(f"シングルパス処理に失敗したため段階処理で再実行します: {stderr}")
+
+        self.timing_report = {"mode": "staged", "stages": {}}
+        return self._process_with_ffmpeg_and_music(input_path, output_path, settings, metadata)
+
+    def _process_single_pass(
+        self,
+        input_path: Path,
+        output_path: Path,
+        settings: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """
+        ラウドネス測定1回 + 単一フィルタグラフによる処理
+
+        loudnorm・BGM/イントロ/アウトロ合成・最終MP3エンコードを1回のFFmpeg実行で行い、
+        中間ファイル（非可逆の再エンコード）を作らない。
+
+        Args:
+            input_path: 入力ファイルパス
+            output_path: 出力ファイルパス
+            settings: 処理設定
+            metadata: メタデータ
+
+        Returns:
+            Path: 処理済みファイルパス
+        """
+        with self._timed_stage("measure"):
+            loudness_info = self._measure_loudness(input_path)
+
+        intro_path, outro_path, bgm_path = self._resolve_music_assets(settings)
+        cmd = self._build_single_pass_command(
+            input_path, output_path, settings, loudness_info, intro_path, outro_path, bgm_path, metadata
+        )
+
+        self.logger.info("シングルパス処理（正規化・合成・エンコード）実行中...")
+        with self._timed_stage("render"):
+            subprocess.run(cmd, check=True, capture_output=True)
+
+        return output_path
+
+    def _resolve_music_assets(
+        self, settings: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """合成に使うイントロ・アウトロ・BGMのパス（存在しないもの・無効設定はNone）"""
+        if not settings.get("enable_music", True):
+            return None, None, None
+
+        assets = self.asset_manager.get_all_assets()
+
+        def existing(asset_type: str) -> Optional[str]:
+            path = assets.get(asset_type)
+            return path if path and Path(path).exists() else None
+
+        intro_path = existing("intro_jingle")
+        outro_path = existing("outro_jingle")
+        bgm_path = existing("background_music")
+        if not (intro_path or outro_path or bgm_path):
+            self.logger.warning("ミュージックアセットが見つかりません")
+        with self._timed_stage("assets"):
+            return tuple(
+                self._prepared_asset_path(path, settings) for path in (intro_path, outro_path, bgm_path)
+            )
+
+    def _prepared_asset_path(self, path: Optional[str], settings: Dict[str, Any]) -> Optional[str]:
+        """
+        アセットを出力形式に変換済みのWAVパスに置き換え（解析キャッシュを利用）
+
+        キャッシュを利用できない場合は元のパスをそのまま返す。
+        """
+        if not path:
+            return path
+        try:
+            prepared = self.asset_cache.prepare(
+                path, settings.get("sample_rate", 44100), settings.get("channels", 1)
+            )
+            return prepared.wav_path
+        except Exception as e:
+            self.logger.warning(f"アセット解析キャッシュを利用できません: {path} ({e})")
+            return path
+
+    def _build_single_pass_command(
+        self,
+        voice_path: Path,
+        output_path: Path,
+        settings: Dict[str, Any],
+        loudness_info: Optional[Dict[str, str]],
+        intro_path: Optional[str] = None,
+        outro_path: Optional[str] = None,
+        bgm_path: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[str]:
+        """
+        シングルパス処理のFFmpegコマンドを構築
+
+        Returns:
+            List[str]: FFmpegコマンド
+        """
+        sample_rate = settings.get("sample_rate", 44100)
+        channels = settings.get("channels", 1)
+        channel_layout = "mono" if channels == 1 else "stereo"
+        # concat/amix の入力形式を揃える（loudnorm は内部で192kHzにリサンプリングするため必須）
+        conform = f"aresample={sample_rate},aformat=sample_fmts=fltp:channel_layouts={channel_layout}"
+
+        input_files = [str(voice_path)]
+        bgm_idx = intro_idx = outro_idx = None
+        if bgm_path:
+            bgm_idx = len(input_files)
+            input_files.append(bgm_path)
+        if intro_path:
+            intro_idx = len(input_files)
+            input_files.append(intro_path)
+        if outro_path:
+            outro_idx = len(input_files)
+            input_files.append(outro_path)
+
+        filter_parts = [f"[0:a]{self._loudnorm_filter(settings, loudness_info)},{conform}[voice]"]
+        voice_label = "[voice]"
+
+        if bgm_idx is not None:
+            bgm_volume = settings.get("bgm_volume", 0.15)
+            filter_parts.append(
+                f"[{bgm_idx}:a]volume={bgm_volume},aloop=loop=-1:size=2e+09,{conform}[bgm_loop]"
+            )
+            filter_parts.append("[voice][bgm_loop]amix=inputs=2:duration=first[voice_bgm]")
+            voice_label = "[voice_bgm]"
+
+        concat_labels = []
+        if intro_idx is not None:
+            filter_parts.append(f"[{intro_idx}:a]{conform}[intro]")
+            concat_labels.append("[intro]")
+        concat_labels.append(voice_label)
+        if outro_idx is not None:
+            filter_parts.append(f"[{outro_idx}:a]{conform}[outro]")
+            concat_labels.append("[outro]")
+
+        if len(concat_labels) > 1:
+            filter_parts.append(
+                f"{''.join(concat_labels)}concat=n={len(concat_labels)}:v=0:a=1[final_mixed]"
+            )
+            final_output = "[final_mixed]"
+        else:
+            final_output = voice_label
+
+        cmd = [self.ffmpeg_path]
+        for input_file in input_files:
+            cmd.extend(["-i", input_file])
+        cmd.extend([
+            "-filter_complex", ";".join(filter_parts),
+            "-map", final_output,
+        ])
+        cmd.extend(self._encode_options(settings))
+        cmd.extend(self._metadata_options(metadata))
+        cmd.extend(["-y", str(output_path)])
+        return cmd
+
+    @contextmanager
+    def _timed_stage(self, stage: str) -> Iterator[None]:
+        """処理段階の所要時間を timing_report に記録"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            stages = self.timing_report.setdefault("stages", {})
+            stages[stage] = round(stages.get(stage, 0.0) + elapsed, 3)
+
+    def _log_timing_report(self) -> None:
+        report = self.get_timing_report()
+        if not report["stages"]:
+            return
+        breakdown = ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in report["stages"].items())
+        self.logger.info(
+            f"音声処理タイミング（{report['mode']}）: {breakdown}, 合計={report['total_seconds']:.2f}s"
+        )
+
+    def get_timing_report(self) -> Dict[str, Any]:
+        """
+        直近の音声処理の段階別所要時間を取得
+
+        Returns:
+            Dict[str, Any]: {"mode": 処理モード, "stages": {段階: 秒}, "total_seconds": 合計秒}
+        """
+        stages = dict(self.timing_report.get("stages") or {})
+        return {
+            "mode": self.timing_report.get("mode"),
+            "stages": stages,
+            "total_seconds": round(sum(stages.values()), 3),
+        }
+
     def _process_with_ffmpeg_and_music(
         self,
         input_path: Path,
@@ -163,7 +397,11 @@ class AudioProcessor:
             self._normalize_loudness(input_path, temp_normalized, settings)
 
             # ステップ2: BGMとミュージック合成（設定で有効な場合のみ）
-            if settings.get("enable_music", True) and self._add_music_layers(temp_normalized, temp_with_music, settings):
+            music_added = False
+            if settings.get("enable_music", True):
+                with self._timed_stage("mix"):
+                    music_added = self._add_music_layers(temp_normalized, temp_with_music, settings)
+            if music_added:
                 # BGM合成成功時は音楽付きファイルを使用
                 final_input = temp_with_music
                 self.logger.info("BGM付き音声処理完了")
@@ -176,7 +414,8 @@ class AudioProcessor:
                     self.logger.info("BGM合成は無効設定のため、音楽なしで処理します。")
 
             # ステップ3: 最終エンコーディング + メタデータ埋め込み
-            self._encode_final_output(final_input, output_path, settings, metadata)
+            with self._timed_stage("encode"):
+                self._encode_final_output(final_input, output_path, settings, metadata)
 
             return output_path
 
@@ -200,11 +439,38 @@ class AudioProcessor:
             output_path: 出力ファイル
             settings: 処理設定
         """
-        lufs_target = settings["lufs_target"]
-        peak_target = settings["peak_target"]
-
         # 2パス処理: 測定 -> 適用
-        # パス1: ラウドネス測定
+        with self._timed_stage("measure"):
+            loudness_info = self._measure_loudness(input_path)
+
+        cmd_normalize = [
+            self.ffmpeg_path,
+            "-i",
+            str(input_path),
+            "-af",
+            self._loudnorm_filter(settings, loudness_info),
+            "-ar",
+            str(settings["sample_rate"]),
+            "-ac",
+            str(settings["channels"]),
+            "-y",
+            str(output_path),
+        ]
+
+        self.logger.info("ラウドネス正規化実行中...")
+        with self._timed_stage("normalize"):
+            subprocess.run(cmd_normalize, check=True, capture_output=True)
+
+    def _measure_loudness(self, input_path: Path) -> Optional[Dict[str, str]]:
+        """
+        ラウドネス測定（loudnorm の1パス目）
+
+        Args:
+            input_path: 入力ファイル
+
+        Returns:
+            Dict[str, str]: 測定値（測定失敗時はNone）
+        """
         cmd_measure = [
             self.ffmpeg_path,
             "-i",
@@ -220,46 +486,37 @@ class AudioProcessor:
         result = subprocess.run(cmd_measure, capture_output=True, text=True, check=False)
 
         # JSON出力から測定値を抽出
-        loudness_info = self._extract_loudness_info(result.stderr)
+        return self._extract_loudness_info(result.stderr)
 
-        # パス2: 正規化適用
-        if loudness_info:
-            measured_i = loudness_info.get("input_i", str(lufs_target))
-            measured_lra = loudness_info.get("input_lra", "7.0")
-            measured_tp = loudness_info.get("input_tp", str(peak_target))
-            measured_thresh = loudness_info.get("input_thresh", "-26.0")
+    def _loudnorm_filter(
+        self, settings: Dict[str, Any], loudness_info: Optional[Dict[str, str]]
+    ) -> str:
+        """
+        loudnorm フィルタ文字列を構築（測定値がある場合は線形2パス、無い場合は1パス）
 
-            cmd_normalize = [
-                self.ffmpeg_path,
-                "-i",
-                str(input_path),
-                "-af",
-                f"loudnorm=I={lufs_target}:TP={peak_target}:LRA=7.0:measured_I={measured_i}:measured_LRA={measured_lra}:measured_TP={measured_tp}:measured_thresh={measured_thresh}:linear=true:print_format=summary",
-                "-ar",
-                str(settings["sample_rate"]),
-                "-ac",
-                str(settings["channels"]),
-                "-y",
-                str(output_path),
-            ]
-        else:
-            # 測定失敗時は1パス正規化
-            cmd_normalize = [
-                self.ffmpeg_path,
-                "-i",
-                str(input_path),
-                "-af",
-                f"loudnorm=I={lufs_target}:TP={peak_target}",
-                "-ar",
-                str(settings["sample_rate"]),
-                "-ac",
-                str(settings["channels"]),
-                "-y",
-                str(output_path),
-            ]
+        Args:
+            settings: 処理設定
+            loudness_info: 測定値
 
-        self.logger.info("ラウドネス正規化実行中...")
-        subprocess.run(cmd_normalize, check=True, capture_output=True)
+        Returns:
+            str: loudnorm フィルタ
+        """
+        lufs_target = settings["lufs_target"]
+        peak_target = settings["peak_target"]
+
+        if not loudness_info:
+            # 測定失敗時は1パス正規化
+            return f"loudnorm=I={lufs_target}:TP={peak_target}"
+
+        measured_i = loudness_info.get("input_i", str(lufs_target))
+        measured_lra = loudness_info.get("input_lra", "7.0")
+        measured_tp = loudness_info.get("input_tp", str(peak_target))
+        measured_thresh = loudness_info.get("input_thresh", "-26.0")
+        return (
+            f"loudnorm=I={lufs_target}:TP={peak_target}:LRA=7.0:measured_I={measured_i}"
+            f":measured_LRA={measured_lra}:measured_TP={measured_tp}"
+            f":measured_thresh={measured_thresh}:linear=true:print_format=summary"
+        )
 
     def _encode_final_output(
         self,
@@ -277,10 +534,19 @@ class AudioProcessor:
             settings: 処理設定
             metadata: メタデータ
         """
-        cmd = [
-            self.ffmpeg_path,
-            "-i",
-            str(input_path),
+        cmd = [self.ffmpeg_path, "-i", str(input_path)]
+        cmd.extend(self._encode_options(settings))
+        cmd.extend(self._metadata_options(metadata))
+
+        cmd.extend(["-y", str(output_path)])
+
+        self.logger.info("最終エンコーディング実行中...")
+        subprocess.run(cmd, check=True, capture_output=True)
+
+    @staticmethod
+    def _encode_options(settings: Dict[str, Any]) -> List[str]:
+        """最終MP3エンコードのFFmpegオプション"""
+        return [
             "-c:a",
             "libmp3lame",
             "-b:a",
@@ -293,25 +559,14 @@ class AudioProcessor:
             "2",  # 高品質設定
         ]
 
-        # メタデータを追加
-        if metadata:
-            if "title" in metadata:
-                cmd.extend(["-metadata", f"title={metadata['title']}"])
-            if "artist" in metadata:
-                cmd.extend(["-metadata", f"artist={metadata['artist']}"])
-            if "album" in metadata:
-                cmd.extend(["-metadata", f"album={metadata['album']}"])
-            if "date" in metadata:
-                cmd.extend(["-metadata", f"date={metadata['date']}"])
-            if "genre" in metadata:
-                cmd.extend(["-metadata", f"genre={metadata['genre']}"])
-            if "comment" in metadata:
-                cmd.extend(["-metadata", f"comment={metadata['comment']}"])
-
-        cmd.extend(["-y", str(output_path)])
-
-        self.logger.info("最終エンコーディング実行中...")
-        subprocess.run(cmd, check=True, capture_output=True)
+    @staticmethod
+    def _metadata_options(metadata: Optional[Dict[str, Any]]) -> List[str]:
+        """メタデータ埋め込みのFFmpegオプション"""
+        options = []
+        for key in ("title", "artist", "album", "date", "genre", "comment"):
+            if metadata and key in metadata:
+                options.extend(["-metadata", f"{key}={metadata[key]}"])
+        return options
 
     def _add_music_layers(
         self, input_path: Path, output_path: Path, settings: Dict[str, Any]
@@ -330,9 +585,9 @@ class AudioProcessor:
         try:
             # アセットファイルパスを取得
             assets = self.asset_manager.get_all_assets()
-            intro_path = assets.get("intro_jingle")
-            outro_path = assets.get("outro_jingle")
-            bgm_path = assets.get("background_music")
+            intro_path = self._prepared_asset_path(assets.get("intro_jingle"), settings)
+            outro_path = self._prepared_asset_path(assets.get("outro_jingle"), settings)
+            bgm_path = self._prepared_asset_path(assets.get("background_music"), settings)
 
             self.logger.info("BGMとミュージック合成を開始")
 
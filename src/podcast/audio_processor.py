@@ -36,6 +36,8 @@ try:
 except ImportError:
     PYLOUDNORM_AVAILABLE = False
 
+from .assets.asset_analysis_cache import DEFAULT_CACHE_DIR, get_asset_analysis_cache
+
 
 @dataclass
 class AudioAssets:
@@ -76,12 +78,13 @@ class AudioProcessor:
     音量正規化、BGM・ジングル合成、ファイル最適化を行います。
     """
 
-    def __init__(self, assets_path: str):
+    def __init__(self, assets_path: str, asset_cache_dir: Optional[str] = None):
         """
         初期化
 
         Args:
             assets_path: 音声アセットディレクトリのパス
+            asset_cache_dir: アセット解析キャッシュのディレクトリ（省略時は cache/audio_assets）
 
         Raises:
             AudioProcessingError: 必要なライブラリが不足している場合
@@ -94,6 +97,8 @@ class AudioProcessor:
 
         # 音声アセットを読み込み
         self.assets = self._load_assets()
+        # アセットのデコード・リサンプリング結果はファイルハッシュ単位で再利用する
+        self.asset_cache = get_asset_analysis_cache(asset_cache_dir or DEFAULT_CACHE_DIR)
 
         # 音声処理設定
         self.target_lufs = -16.0  # 音量正規化目標
@@ -338,6 +343,27 @@ class AudioProcessor:
         self.logger.debug(f"簡易正規化完了: {current_rms_db:.2f} -> {target_rms_db} dB RMS")
         return normalized
 
+    def _load_asset_audio(self, path: Path) -> "AudioSegment":
+        """
+        音声アセットを出力形式（サンプルレート・チャンネル数）で読み込み
+
+        解析キャッシュを利用できない場合は元ファイルをデコードして変換する。
+
+        Args:
+            path: アセットファイルのパス
+
+        Returns:
+            出力形式に変換済みの音声データ
+        """
+        try:
+            return self.asset_cache.load_audio(path, self.output_sample_rate, self.output_channels)
+        except Exception as e:
+            self.logger.warning(f"アセット解析キャッシュを利用できません: {path} ({e})")
+
+        audio = self.AudioSegment.from_file(str(path))
+        audio = audio.set_frame_rate(self.output_sample_rate)
+        return audio.set_channels(self.output_channels)
+
     def _add_intro_outro(self, audio_data: "AudioSegment") -> "AudioSegment":
         """
         オープニング・エンディング追加
@@ -354,9 +380,7 @@ class AudioProcessor:
         intro_path = Path(self.assets.intro_jingle)
         if intro_path.exists():
             try:
-                intro = self.AudioSegment.from_file(str(intro_path))
-                intro = intro.set_frame_rate(self.output_sample_rate)
-                intro = intro.set_channels(self.output_channels)
+                intro = self._load_asset_audio(intro_path)
                 intro = intro + self.jingle_volume_db  # 音量調整
 
                 # フェードイン・アウト効果
@@ -391,9 +415,7 @@ class AudioProcessor:
         outro_path = Path(self.assets.outro_jingle)
         if outro_path.exists():
             try:
-                outro = self.AudioSegment.from_file(str(outro_path))
-                outro = outro.set_frame_rate(self.output_sample_rate)
-                outro = outro.set_channels(self.output_channels)
+                outro = self._load_asset_audio(outro_path)
                 outro = outro + self.jingle_volume_db  # 音量調整
 
                 # フェードイン・アウト効果
@@ -439,10 +461,8 @@ class AudioProcessor:
             return audio_data
 
         try:
-            # BGMを読み込み
-            bgm = self.AudioSegment.from_file(str(bgm_path))
-            bgm = bgm.set_frame_rate(self.output_sample_rate)
-            bgm = bgm.set_channels(self.output_channels)
+            # BGMを読み込み（出力形式に変換済みのキャッシュを利用）
+            bgm = self._load_asset_audio(bgm_path)
 
             # BGMの音量を調整（メイン音声より低く）
             bgm = bgm + self.bgm_volume_db
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+"""
+ストリーミング音声結合
+各セグメントを1回だけPCMにデコードし、FFmpegエンコーダの標準入力へ順次書き込む。
+書き込みと同時に再生時間・ピーク・RMSを集計するため、結合後の再デコードは不要。
+"""
+import io
+import logging
+import math
+import subprocess
+import tempfile
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from pydub import AudioSegment
+
+# サンプル幅（バイト）ごとの numpy 型（pydub の raw_data は符号付きリトルエンディアン）
+_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+
+class StreamingAudioConcatenator:
+    """PCMフレームをFFmpegへストリーミングしてMP3を1回だけエンコードする結合器"""
+
+    def __init__(
+        self,
+        bitrate: str = "128k",
+        parameters: Sequence[str] = ("-q:a", "2"),
+        output_format: str = "mp3",
+        converter: Optional[str] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            bitrate: 出力ビットレート
+            parameters: FFmpegへの追加エンコードパラメータ
+            output_format: 出力フォーマット
+            converter: FFmpegバイナリパス（省略時は pydub の設定値）
+        """
+        self.bitrate = bitrate
+        self.parameters = list(parameters)
+        self.output_format = output_format
+        self.converter = converter or AudioSegment.converter
+        self.logger = logging.getLogger(__name__)
+
+        self.frame_rate: Optional[int] = None
+        self.channels: Optional[int] = None
+        self.sample_width: Optional[int] = None
+        self.frame_count = 0
+        self.segment_count = 0
+        self._peak = 0
+        self._sum_squares = 0.0
+        self._sample_count = 0
+
+        self._process: Optional[subprocess.Popen] = None
+        self._output = None
+        self._stderr = None
+
+    def append_bytes(self, audio_data: bytes, format: str = "mp3") -> AudioSegment:
+        """エンコード済み音声をデコードして追加（デコードした AudioSegment を返す）"""
+        segment = AudioSegment.from_file(io.BytesIO(audio_data), format=format)
+        self.append(segment)
+        return segment
+
+    def append(self, segment: AudioSegment) -> None:
+        """デコード済みセグメントを追加（最初のセグメントの形式に揃える）"""
+        if self.frame_rate is None:
+            if segment.sample_width not in _SAMPLE_DTYPES:
+                segment = segment.set_sample_width(4)
+            self.frame_rate = segment.frame_rate
+            self.channels = segment.channels
+            self.sample_width = segment.sample_width
+        else:
+            if segment.frame_rate != self.frame_rate:
+                segment = segment.set_frame_rate(self.frame_rate)
+            if segment.channels != self.channels:
+                segment = segment.set_channels(self.channels)
+            if segment.sample_width != self.sample_width:
+                segment = segment.set_sample_width(self.sample_width)
+
+        pcm = segment.raw_data
+        self._update_levels(pcm)
+        self.frame_count += len(pcm) // (self.sample_width * self.channels)
+        self.segment_count += 1
+        self._write(pcm)
+
+    def _update_levels(self, pcm: bytes) -> None:
+        samples = np.frombuffer(pcm, dtype=_SAMPLE_DTYPES[self.sample_width])
+        if samples.size == 0:
+            return
+        samples = samples.astype(np.float64)
+        self._peak = max(self._peak, int(np.abs(samples).max()))
+        self._sum_squares += float(np.dot(samples, samples))
+        self._sample_count += samples.size
+
+    def _start_encoder(self) -> None:
+        command = [
+            self.converter,
+            "-hide_banner",
+            "-loglevel", "error",
+            "-f", f"s{8 * self.sample_width}le",
+            "-ar", str(self.frame_rate),
+            "-ac", str(self.channels),
+            "-i", "pipe:0",
+            "-b:a", self.bitrate,
+            *self.parameters,
+            "-f", self.output_format,
+            "pipe:1",
+        ]
+        # 出力・エラー出力は一時ファイルに逃がし、パイプの詰まりによるデッドロックを避ける
+        self._output = tempfile.TemporaryFile()
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=self._output, stderr=self._stderr
+        )
+
+    def _write(self, pcm: bytes) -> None:
+        if not pcm:
+            return
+        if self._process is None:
+            self._start_encoder()
+        try:
+            self._process.stdin.write(pcm)
+        except BrokenPipeError:
+            # エンコーダが途中終了した場合はエラー出力を添えて失敗させる
+            raise self._encoder_error(self._process.wait()) from None
+
+    def _encoder_error(self, return_code: int) -> RuntimeError:
+        self._stderr.seek(0)
+        message = self._stderr.read().decode("utf-8", errors="replace").strip()
+        return RuntimeError(f"FFmpegエンコード失敗 (code={return_code}): {message}")
+
+    def finish(self) -> bytes:
+        """エンコードを完了して音声データを返す"""
+        if self._process is None:
+            raise RuntimeError("結合する音声セグメントがありません")
+        try:
+            try:
+                self._process.stdin.close()
+            except BrokenPipeError:
+                pass
+            return_code = self._process.wait()
+            if return_code != 0:
+                raise self._encoder_error(return_code)
+            self._output.seek(0)
+            return self._output.read()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """エンコーダプロセスと一時ファイルを解放"""
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        for handle in (self._output, self._stderr):
+            if handle is not None:
+                handle.close()
+        self._output = None
+        self._stderr = None
+
+    @property
+    def duration_seconds(self) -> float:
+        """追加済み音声の再生時間（秒）"""
+        return self.frame_count / self.frame_rate if self.frame_rate else 0.0
+
+    def analysis(self) -> Dict[str, Any]:
+        """結合時に集計した音声情報（validate_audio_quality にそのまま渡せる形式、無音のレベルはNone）"""
+        max_amplitude = float(1 << (8 * self.sample_width - 1)) if self.sample_width else 1.0
+        rms = math.sqrt(self._sum_squares / self._sample_count) if self._sample_count else 0.0
+        return {
+            "duration_seconds": self.duration_seconds,
+            "frame_rate": self.frame_rate,
+            "channels": self.channels,
+            "sample_width": self.sample_width,
+            "segments": self.segment_count,
+            "peak_dbfs": round(20 * math.log10(self._peak / max_amplitude), 2) if self._peak else None,
+            "rms_dbfs": round(20 * math.log10(rms / max_amplitude), 2) if rms else None,
+        }
+
+
+def analyze_audio_segment(segment: AudioSegment) -> Dict[str, Any]:
+    """デコード済みセグメント1つ分の音声情報を StreamingAudioConcatenator.analysis と同じ形式で返す"""
+    return {
+        "duration_seconds": len(segment) / 1000.0,
+        "frame_rate": segment.frame_rate,
+        "channels": segment.channels,
+        "sample_width": segment.sample_width,
+        "segments": 1,
+        "peak_dbfs": round(segment.max_dBFS, 2) if segment.rms else None,
+        "rms_dbfs": round(segment.dBFS, 2) if segment.rms else None,
+    }
@@ -15,6 +15,15 @@ import os
 
 from google.cloud import texttospeech
 
+from .audio_concat import StreamingAudioConcatenator, analyze_audio_segment
+from .segment_cache import TTSSegmentCache
+
+# LLM 用のレート制限ディスパッチャ（RPM バケット + AIMD 同時実行数）を TTS でも共用する
+try:
+    from src.llm.dispatcher import LLMDispatcher
+except ImportError:
+    LLMDispatcher = None
+
 try:
     from pydub import AudioSegment
     PYDUB_AVAILABLE = True
@@ -39,6 +48,9 @@ class GeminiTTSEngine:
         "sample_rate_hertz": 44100,  # 高品質サンプリングレート
     }
 
+    # キャッシュキーに含める合成エンジン識別子（音声名は voice_config 側に含まれる）
+    TTS_MODEL_ID = "google-cloud-tts:ja-JP:mp3"
+
     # 発音修正辞書
     PRONUNCIATION_FIXES = {
         # 金融用語
@@ -83,7 +95,12 @@ class GeminiTTSEngine:
     }
 
     def __init__(
-        self, credentials_json: Optional[str] = None, voice_config: Optional[Dict[str, Any]] = None
+        self,
+        credentials_json: Optional[str] = None,
+        voice_config: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
     ):
         """
         初期化
@@ -91,6 +108,9 @@ class GeminiTTSEngine:
         Args:
             credentials_json: Google Cloud認証情報JSON（文字列またはファイルパス）
             voice_config: 音声設定（オプション）
+            cache_dir: セグメント音声キャッシュのディレクトリ（省略時は設定値、空文字で無効）
+            max_concurrency: セグメント合成の最大同時実行数（省略時は設定値）
+            requests_per_minute: 合成リクエストの毎分上限（省略時は設定値）
             
         Raises:
             ValueError: Google Cloud TTSライブラリが利用できない場合
@@ -98,6 +118,17 @@ class GeminiTTSEngine:
         self.voice_config = voice_config or self.DEFAULT_VOICE_CONFIG.copy()
         self.logger = logging.getLogger(__name__)
 
+        podcast_config = self._load_podcast_config()
+        if cache_dir is None and getattr(podcast_config, "tts_cache_enabled", False):
+            cache_dir = podcast_config.tts_cache_dir
+        self.segment_cache = TTSSegmentCache(cache_dir) if cache_dir else None
+        # 直近の結合時に集計した音声情報（品質検証で再デコードを省くために使う）
+        self.last_audio_analysis: Optional[Dict[str, Any]] = None
+        self.max_concurrency = max_concurrency or getattr(podcast_config, "tts_max_concurrency", 4)
+        self.requests_per_minute = requests_per_minute or getattr(
+            podcast_config, "tts_requests_per_minute", 300
+        )
+
         # Google Cloud TTS クライアントを初期化
         try:
             if credentials_json:
@@ -152,23 +183,17 @@ class GeminiTTSEngine:
             # セグメント分割（長い台本を適切な長さに分割）
             segments = self._split_into_segments(processed_script)
 
-            # 各セグメントを合成
-            audio_segments = []
-            for i, segment in enumerate(segments, 1):
-                self.logger.info(f"セグメント {i}/{len(segments)} を合成中...")
-                audio_data = self._synthesize_segment(segment)
-                audio_segments.append(audio_data)
-
-                # API制限を考慮した適切な間隔
-                if i < len(segments):
-                    time.sleep(0.5)
+            # 各セグメントを合成（キャッシュ済みは再利用、残りは並列合成して順序通りに並べる）
+            audio_segments = self._synthesize_segments(segments)
 
             # 音声セグメントを結合
             combined_audio = self._combine_audio_segments(audio_segments)
 
             # 品質検証（前処理後の文字数で推定時間を算出し精度向上）
             expected_duration = len(processed_script) / 330.0 * 60  # 330文字/分で推定（実測値ベース）
-            quality_result = self.validate_audio_quality(combined_audio, expected_duration)
+            quality_result = self.validate_audio_quality(
+                combined_audio, expected_duration, analysis=self.last_audio_analysis
+            )
             
             if not quality_result["valid"]:
                 self.logger.warning(f"音声品質に問題があります: {quality_result['issues']}")
@@ -202,6 +227,94 @@ class GeminiTTSEngine:
             self.logger.error("📊 影響: 音声ファイルは生成されません")
             raise RuntimeError(f"音声合成エラー: {e}")
 
+    @staticmethod
+    def _load_podcast_config() -> Any:
+        """ポッドキャスト設定を取得（読み込めない場合はNone）"""
+        try:
+            from src.config.app_config import get_config
+
+            return get_config().podcast
+        except Exception:
+            return None
+
+    def _segment_cache_key(self, segment: str) -> str:
+        """セグメントのキャッシュキー（本文・音声設定・モデルのハッシュ）"""
+        return TTSSegmentCache.make_key(segment, self.voice_config, self.TTS_MODEL_ID)
+
+    def _synthesize_segments(self, segments: list) -> list:
+        """
+        セグメント群を合成
+
+        キャッシュ済みのセグメントは再合成せず、未キャッシュ分のみレート制限付きで
+        並列に合成する。合成に成功したセグメントはその都度キャッシュするため、
+        途中で失敗しても再実行時は未完了のセグメントだけが合成対象になる。
+
+        Args:
+            segments: 発音前処理済みのセグメントリスト
+
+        Returns:
+            list: セグメント順の音声データ
+
+        Raises:
+            RuntimeError: いずれかのセグメントの合成に失敗した場合
+        """
+        audio_segments = [None] * len(segments)
+        pending = []
+        for index, segment in enumerate(segments):
+            key = self._segment_cache_key(segment)
+            cached = self.segment_cache.get(key) if self.segment_cache else None
+            if cached:
+                audio_segments[index] = cached
+            else:
+                pending.append((index, segment, key))
+
+        if self.segment_cache:
+            self.logger.info(
+                f"TTSキャッシュ: {len(segments) - len(pending)}/{len(segments)}セグメント再利用"
+            )
+        if not pending:
+            return audio_segments
+
+        def synthesize(item):
+            index, segment, key = item
+            self.logger.info(f"セグメント {index + 1}/{len(segments)} を合成中...")
+            audio_data = self._synthesize_segment(segment)
+            if self.segment_cache:
+                self.segment_cache.put(key, audio_data)
+            return audio_data
+
+        if LLMDispatcher is None or self.max_concurrency <= 1:
+            # ディスパッチャが使えない場合は従来通り逐次合成
+            for position, item in enumerate(pending):
+                audio_segments[item[0]] = synthesize(item)
+                # API制限を考慮した適切な間隔
+                if position < len(pending) - 1:
+                    time.sleep(0.5)
+            return audio_segments
+
+        dispatcher = LLMDispatcher(
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=0,
+            initial_concurrency=self.max_concurrency,
+            max_concurrency=self.max_concurrency,
+        )
+        failed_segments = []
+        for item, audio_data, error in dispatcher.stream(
+            lambda item: dispatcher.call(lambda: synthesize(item)), pending
+        ):
+            if error is not None:
+                failed_segments.append((item[0] + 1, error))
+            else:
+                audio_segments[item[0]] = audio_data
+
+        if failed_segments:
+            index, error = min(failed_segments, key=lambda failure: failure[0])
+            raise RuntimeError(
+                f"{len(failed_segments)}セグメントの合成に失敗しました"
+                f"（最初の失敗: セグメント{index}: {error}）"
+            )
+        return audio_segments
+
     def _preprocess_pronunciation(self, script: str) -> str:
         """
         発音を改善するための前処理
@@ -530,7 +643,10 @@ class GeminiTTSEngine:
 
     def _combine_audio_segments(self, segments: list) -> bytes:
         """
-        PyDubを使用したプロフェッショナルな音声セグメント結合
+        音声セグメントをストリーミング結合
+
+        各セグメントを1回だけデコードしてFFmpegエンコーダへPCMを流し込み、
+        再生時間・レベルは同じパスで集計して self.last_audio_analysis に保持する。
 
         Args:
             segments: 音声セグメントのリスト（bytes）
@@ -538,90 +654,68 @@ class GeminiTTSEngine:
         Returns:
             bytes: 結合された音声データ
         """
+        self.last_audio_analysis = None
+
         if not segments:
             self.logger.error("結合する音声セグメントがありません")
             return b""
 
         if len(segments) == 1:
             self.logger.info("単一セグメントのため結合処理をスキップ")
+            try:
+                segment_audio = AudioSegment.from_file(io.BytesIO(segments[0]), format="mp3")
+                self.last_audio_analysis = analyze_audio_segment(segment_audio)
+            except Exception as e:
+                self.logger.warning(f"単一セグメントの解析に失敗: {e}")
             return segments[0]
 
+        self.logger.info(f"{len(segments)} セグメントをストリーミング結合開始")
+        concatenator = StreamingAudioConcatenator(bitrate="128k", parameters=["-q:a", "2"])
         try:
-            # PyDubを使用した高品質結合
-            self.logger.info(f"PyDubを使用して {len(segments)} セグメントを結合開始")
-            
-            combined_audio = None
-            total_duration = 0
-            
             for i, segment_bytes in enumerate(segments):
                 if not segment_bytes:
                     self.logger.warning(f"セグメント {i+1} が空のため、スキップします")
                     continue
-                    
+
                 try:
-                    # BytesIOを使用してメモリ上でMP3を読み込み
-                    segment_audio = AudioSegment.from_file(
-                        io.BytesIO(segment_bytes), format="mp3"
-                    )
-                    
-                    # セグメント情報をログ出力
-                    duration_seconds = len(segment_audio) / 1000.0
-                    total_duration += duration_seconds
-                    self.logger.info(
-                        f"セグメント {i+1}: {duration_seconds:.2f}秒, "
-                        f"{len(segment_bytes)}バイト, "
-                        f"サンプルレート: {segment_audio.frame_rate}Hz"
-                    )
-                    
-                    # 結合処理
-                    if combined_audio is None:
-                        combined_audio = segment_audio
-                    else:
-                        combined_audio += segment_audio
-                        
+                    # デコードとエンコーダへの書き込みを1回で行う（結合済みバッファは持たない）
+                    segment_audio = concatenator.append_bytes(segment_bytes, format="mp3")
                 except Exception as e:
                     self.logger.error(f"セグメント {i+1} の処理エラー: {e}")
                     # エラーのあるセグメントをスキップして続行
                     continue
-            
-            if combined_audio is None:
+
+                self.logger.info(
+                    f"セグメント {i+1}: {len(segment_audio) / 1000.0:.2f}秒, "
+                    f"{len(segment_bytes)}バイト, "
+                    f"サンプルレート: {segment_audio.frame_rate}Hz"
+                )
+                del segment_audio
+
+            if concatenator.segment_count == 0:
                 self.logger.error("すべてのセグメントが無効でした")
                 self.logger.error("🚨 CRITICAL: 音声セグメントの結合に完全に失敗")
                 self.logger.error("📊 結果: 空の音声データが返されます（音声ファイル生成失敗）")
                 raise RuntimeError("音声セグメント結合失敗: すべてのセグメントが無効")
-            
-            # 結合結果をMP3バイトデータとして出力
-            output_buffer = io.BytesIO()
-            combined_audio.export(
-                output_buffer, 
-                format="mp3",
-                bitrate="128k",  # 高品質設定
-                parameters=["-q:a", "2"]  # 高品質エンコーディング
-            )
-            
-            combined_bytes = output_buffer.getvalue()
-            final_duration = len(combined_audio) / 1000.0
-            
+
+            combined_bytes = concatenator.finish()
+            self.last_audio_analysis = concatenator.analysis()
+
             self.logger.info(
                 f"音声結合完了: {len(segments)}セグメント -> {len(combined_bytes)}バイト, "
-                f"総再生時間: {final_duration:.2f}秒 (予想: {total_duration:.2f}秒)"
+                f"総再生時間: {concatenator.duration_seconds:.2f}秒, "
+                f"ピーク: {self.last_audio_analysis['peak_dbfs']}dBFS, "
+                f"RMS: {self.last_audio_analysis['rms_dbfs']}dBFS"
             )
-            
-            # 品質チェック
-            duration_diff = abs(final_duration - total_duration)
-            if duration_diff > 1.0:  # 1秒以上の差がある場合は警告
-                self.logger.warning(
-                    f"結合後の時間長に差異があります: {duration_diff:.2f}秒の差"
-                )
-            
             return combined_bytes
-            
+
         except Exception as e:
-            self.logger.error(f"PyDub音声結合エラー: {e}")
+            self.logger.error(f"音声結合エラー: {e}")
             # エラーの根本原因を明確化し、例外を再発生
-            self.logger.error("音声セグメントの結合に失敗しました。PyDubのインストール状態や音声データの整合性を確認してください")
+            self.logger.error("音声セグメントの結合に失敗しました。FFmpegのインストール状態や音声データの整合性を確認してください")
             raise e
-    
+        finally:
+            concatenator.close()
 
     def _save_audio_file(self, audio_data: bytes, output_path: Union[str, Path]) -> None:
         """
@@ -692,13 +786,19 @@ class GeminiTTSEngine:
         """
         return self.voice_config.copy()
     
-    def validate_audio_quality(self, audio_data: bytes, expected_duration: float = None) -> Dict[str, Any]:
+    def validate_audio_quality(
+        self,
+        audio_data: bytes,
+        expected_duration: float = None,
+        analysis: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """
         音声データの品質検証
         
         Args:
             audio_data: 音声データ
             expected_duration: 期待される再生時間（秒）
+            analysis: 結合時に集計済みの音声情報（指定時は再デコードしない）
             
         Returns:
             Dict[str, Any]: 品質検証結果
@@ -725,10 +825,14 @@ class GeminiTTSEngine:
             
             duration_seconds = 0.0
             
-            # PyDubでの詳細分析
+            # 結合時の集計値を優先し、無い場合のみPyDubでデコードして分析
             try:
-                audio_segment = AudioSegment.from_file(io.BytesIO(audio_data), format="mp3")
-                duration_seconds = len(audio_segment) / 1000.0
+                analysis_source = "stream" if analysis is not None else "decode"
+                if analysis is None:
+                    analysis = analyze_audio_segment(
+                        AudioSegment.from_file(io.BytesIO(audio_data), format="mp3")
+                    )
+                duration_seconds = analysis["duration_seconds"]
                 
                 # 再生時間チェック
                 if duration_seconds < 1.0:
@@ -744,12 +848,16 @@ class GeminiTTSEngine:
                         )
                 
                 # サンプルレートチェック
-                if hasattr(audio_segment, 'frame_rate'):
-                    if audio_segment.frame_rate < 22050:
-                        issues.append(f"サンプルレートが低いです: {audio_segment.frame_rate}Hz")
+                if analysis.get("frame_rate") and analysis["frame_rate"] < 22050:
+                    issues.append(f"サンプルレートが低いです: {analysis['frame_rate']}Hz")
+
+                # 無音チェック
+                if analysis.get("rms_dbfs") is None:
+                    issues.append("音声が無音です")
                 
             except Exception as analysis_error:
                 issues.append(f"音声分析エラー: {analysis_error}")
+                analysis = None
             
             return {
                 "valid": len(issues) == 0,
@@ -757,7 +865,10 @@ class GeminiTTSEngine:
                 "size_bytes": size_bytes,
                 "duration_seconds": duration_seconds,
                 "expected_duration": expected_duration,
-                "analyzed_with_pydub": 'analysis_error' not in locals()
+                "peak_dbfs": analysis.get("peak_dbfs") if analysis else None,
+                "rms_dbfs": analysis.get("rms_dbfs") if analysis else None,
+                "analysis_source": analysis_source,
+                "analyzed_with_pydub": analysis is not None
             }
             
         except Exception as e:
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+TTS セグメント音声キャッシュ
+セグメント本文・音声設定・モデルから求めたハッシュをキーに、合成済み音声を保存する
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+class TTSSegmentCache:
+    """コンテンツアドレス方式のセグメント音声キャッシュ（1セグメント1ファイル）"""
+
+    def __init__(self, cache_dir: Union[str, Path], extension: str = "mp3"):
+        """
+        初期化
+
+        Args:
+            cache_dir: キャッシュディレクトリ
+            extension: 保存する音声ファイルの拡張子
+        """
+        self.cache_dir = Path(cache_dir)
+        self.extension = extension
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    @staticmethod
+    def make_key(text: str, voice_config: Dict[str, Any], model: str) -> str:
+        """
+        キャッシュキーを生成
+
+        Args:
+            text: 合成するセグメント本文（発音前処理後）
+            voice_config: 音声設定
+            model: 音声合成モデル（エンジン）識別子
+
+        Returns:
+            str: SHA-256 ハッシュ
+        """
+        payload = json.dumps(
+            {"model": model, "voice": voice_config, "text": text},
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.{self.extension}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """キャッシュ済み音声を取得（未キャッシュの場合はNone）"""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            data = None
+        except OSError as e:
+            self.logger.warning(f"TTSキャッシュ読み込み失敗: {path} ({e})")
+            data = None
+
+        with self._lock:
+            self.stats["hits" if data else "misses"] += 1
+        return data or None
+
+    def put(self, key: str, audio_data: bytes) -> None:
+        """合成済み音声を保存（一時ファイル経由で置き換えるため途中状態は残らない）"""
+        if not audio_data:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio_data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"TTSキャッシュ保存失敗: {path} ({e})")
+            return
+
+        with self._lock:
+            self.stats["stores"] += 1
@@ -4,8 +4,10 @@
 日次サマリーと記事データをSupabaseにアーカイブし、長期保存・検索を可能にします。
 """
 
+import hashlib
 import logging
 import json
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date
 from dataclasses import asdict
@@ -14,6 +16,7 @@ from src.config.app_config import SupabaseConfig, get_config
 from src.database.supabase_client import get_supabase_client
 from src.database.embedding_generator import get_embedding_generator
 from src.rag.chunk_processor import ChunkProcessor, TextChunk
+from src.rag.keyword_index import BM25Index, get_keyword_index
 
 
 class ArchiveManager:
@@ -25,6 +28,38 @@ class ArchiveManager:
         self.supabase_client = get_supabase_client()
         self.embedding_generator = get_embedding_generator()
         self.chunk_processor = ChunkProcessor(config)
+        self.last_archive_stats: Dict[str, int] = {}
+
+    @property
+    def keyword_index(self) -> Optional[BM25Index]:
+        """ローカルキーワードインデックス（無効の場合はNone）"""
+        if not getattr(self.config, 'keyword_index_enabled', False):
+            return None
+        return get_keyword_index(self.config.keyword_index_dir)
+
+    def _update_keyword_index(
+        self,
+        document_id: str,
+        rows: List[Dict[str, Any]],
+        doc_date: Optional[date] = None,
+        removed_ids: Optional[List[Any]] = None,
+        replace_document: bool = False,
+    ) -> None:
+        """保存したチャンクをキーワードインデックスに差分反映"""
+        index = self.keyword_index
+        if index is None:
+            return
+
+        try:
+            if replace_document:
+                index.remove_document(document_id)
+            if removed_ids:
+                index.remove_chunks(removed_ids)
+            doc_date_str = doc_date.isoformat() if doc_date else None
+            index.add_chunks([dict(row, doc_date=row.get('doc_date') or doc_date_str) for row in rows])
+            index.save(self.config.keyword_index_dir)
+        except Exception as e:
+            self.logger.warning(f"キーワードインデックス更新失敗: {e}")
 
     def archive_daily_summary(
         self,
@@ -109,11 +144,13 @@ class ArchiveManager:
                 chunk_records.append(chunk_record)
 
             # 5. チャンクを一括保存
+            saved_chunks = []
             if chunk_records:
                 saved_chunks = self.supabase_client.create_chunks(chunk_records)
                 self.logger.info(f"日次サマリーアーカイブ完了: {len(saved_chunks)}チャンク保存")
             else:
                 self.logger.warning("保存可能なチャンクがありませんでした")
+            self._update_keyword_index(document_id, saved_chunks, doc_date, replace_document=True)
 
             # 6. Storageにも保存（JSON形式）
             self._save_to_storage(summary_data, doc_date, 'daily_summary')
@@ -191,6 +228,9 @@ class ArchiveManager:
                 return document_id
 
             # 4. チャンクデータを保存
+            document_meta = {
+                field: document_data[field] for field in ('region', 'category', 'source', 'url')
+            }
             chunk_records = []
             for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
                 if embedding is None:
@@ -217,6 +257,11 @@ class ArchiveManager:
             if chunk_records:
                 saved_count = self.supabase_client.upsert_chunks(chunk_records)
                 self.logger.info(f"チャンク保存完了: {saved_count}/{len(chunk_records)}件")
+                if saved_count:
+                    self._update_keyword_index(
+                        document_id, [dict(record, **document_meta) for record in chunk_records],
+                        doc_date, replace_document=True,
+                    )
 
             return document_id
 
@@ -270,10 +315,17 @@ class ArchiveManager:
                 'full_corpus'
             )
 
+            existing_chunks: List[Dict[str, Any]] = []
             if existing_doc:
                 self.logger.info(f"既存の記事コーパスを更新: {doc_date}")
                 document_data['id'] = existing_doc['id']
-                self.supabase_client.delete_chunks_by_document_id(existing_doc['id'])
+                # 既存チャンクと差分を取り、変更分のみ埋め込みを再生成する
+                fetched = self.supabase_client.get_chunks_by_document_id(existing_doc['id'])
+                if fetched is None:
+                    self.logger.warning("既存チャンクを取得できないため全チャンクを再作成します")
+                    self.supabase_client.delete_chunks_by_document_id(existing_doc['id'])
+                else:
+                    existing_chunks = fetched
             else:
                 self.logger.info(f"新しい記事コーパスを作成: {doc_date}")
 
@@ -288,6 +340,10 @@ class ArchiveManager:
             chunks = self.chunk_processor.create_chunks_from_articles(articles)
             if not chunks:
                 self.logger.warning("記事からチャンクが作成されませんでした")
+                if existing_chunks:
+                    self.last_archive_stats = self._sync_corpus_chunks(
+                        document_id, [], existing_chunks, doc_date
+                    )
                 return document_id
 
             # チャンク数制限
@@ -296,41 +352,21 @@ class ArchiveManager:
                 self.logger.info(f"チャンク数を制限: {len(chunks)} → {max_chunks}")
                 chunks = chunks[:max_chunks]
 
-            # 3. 埋め込み生成（バッチ処理）
-            chunk_texts = [chunk.content for chunk in chunks]
-            embeddings = self.embedding_generator.generate_embeddings_batch(chunk_texts)
-
-            # 4. チャンクデータを準備
-            chunk_records = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                if embedding is None or not self.embedding_generator.validate_embedding(embedding):
-                    continue
-
-                chunk_record = {
-                    'document_id': document_id,
-                    'content': chunk.content,
-                    'chunk_index': chunk.chunk_no,
-                    'embedding': embedding.tolist(),
-                    'metadata': {
-                        'region': chunk.region,
-                        'category': chunk.category,
-                        'source': chunk.source,
-                        'url': chunk.url,
-                    }
-                }
-                chunk_records.append(chunk_record)
+            # 3-5. 既存チャンクとの差分を保存（新規・変更分のみ埋め込み生成）
+            sync_stats = self._sync_corpus_chunks(document_id, chunks, existing_chunks, doc_date)
+            self.last_archive_stats = sync_stats
+            self.logger.info(
+                f"記事アーカイブ完了: {len(articles)}記事 → {sync_stats['total_chunks']}チャンク "
+                f"(新規埋め込み{sync_stats['embedded']}件, 埋め込み再利用{sync_stats['reused']}件, "
+                f"削除{sync_stats['deleted']}件)"
+            )
 
-            # 5. チャンクを一括保存
-            if chunk_records:
-                saved_chunks = self.supabase_client.create_chunks(chunk_records)
-                self.logger.info(f"記事アーカイブ完了: {len(articles)}記事 → {len(saved_chunks)}チャンク保存")
-            
             # 6. Storageにも保存
             corpus_data = {
                 'articles': articles,
                 'metadata': {
                     'total_articles': len(articles),
-                    'total_chunks': len(chunk_records),
+                    'total_chunks': sync_stats['total_chunks'],
                     'archived_at': datetime.now().isoformat()
                 }
             }
@@ -342,6 +378,105 @@ class ArchiveManager:
             self.logger.error(f"記事アーカイブ失敗: {e}")
             return None
 
+    @staticmethod
+    def _stored_chunk_hash(row: Dict[str, Any]) -> str:
+        """保存済みチャンクの本文ハッシュ（旧データはcontentから計算）"""
+        metadata = row.get('metadata') or {}
+        stored_hash = metadata.get('content_hash') if isinstance(metadata, dict) else None
+        return stored_hash or hashlib.sha256((row.get('content') or '').encode('utf-8')).hexdigest()
+
+    def _sync_corpus_chunks(
+        self,
+        document_id: str,
+        chunks: List[TextChunk],
+        existing_chunks: List[Dict[str, Any]],
+        doc_date: Optional[date] = None,
+    ) -> Dict[str, int]:
+        """
+        コーパスのチャンクを既存チャンクと差分同期する
+
+        本文ハッシュが一致する既存チャンクは埋め込みを再利用し、新規・変更された
+        チャンクのみ埋め込みを生成する。新しいチャンク集合にないものは削除する。
+
+        Returns:
+            同期統計（embedded, reused, updated, deleted, total_chunks）
+        """
+        existing_by_hash: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in existing_chunks:
+            existing_by_hash[self._stored_chunk_hash(row)].append(row)
+
+        reused = 0
+        updated_records = []
+        chunks_to_embed = []
+        for chunk in chunks:
+            metadata = {
+                'region': chunk.region,
+                'category': chunk.category,
+                'source': chunk.source,
+                'url': chunk.url,
+                'content_hash': chunk.content_hash,
+            }
+            matches = existing_by_hash.get(chunk.content_hash)
+            if matches:
+                row = matches.pop(0)
+                reused += 1
+                if row.get('chunk_index') != chunk.chunk_no or (row.get('metadata') or {}) != metadata:
+                    updated_records.append({
+                        'id': row['id'],
+                        'document_id': document_id,
+                        'content': chunk.content,
+                        'chunk_index': chunk.chunk_no,
+                        'embedding': row.get('embedding'),
+                        'metadata': metadata,
+                    })
+                continue
+            chunks_to_embed.append((chunk, metadata))
+
+        stale_ids = [row['id'] for rows in existing_by_hash.values() for row in rows]
+        if stale_ids:
+            self.supabase_client.delete_chunks_by_ids(stale_ids)
+
+        new_records = []
+        if chunks_to_embed:
+            embeddings = self.embedding_generator.generate_embeddings_batch(
+                [chunk.content for chunk, _ in chunks_to_embed]
+            )
+            for (chunk, metadata), embedding in zip(chunks_to_embed, embeddings):
+                if embedding is None or not self.embedding_generator.validate_embedding(embedding):
+                    continue
+                new_records.append({
+                    'document_id': document_id,
+                    'content': chunk.content,
+                    'chunk_index': chunk.chunk_no,
+                    'embedding': embedding.tolist() if hasattr(embedding, 'tolist') else list(embedding),
+                    'metadata': metadata,
+                })
+
+        saved_chunks = self.supabase_client.create_chunks(new_records) if new_records else []
+        updated_count = self.supabase_client.upsert_chunks(updated_records) if updated_records else 0
+        if updated_count < len(updated_records):
+            self.logger.warning(
+                f"再利用チャンクの位置・メタデータ更新に失敗: {len(updated_records) - updated_count}件"
+            )
+
+        # 既存チャンクが無い（初回・全削除後）場合はドキュメント単位で置き換える
+        # （更新に失敗した行は保存済みの内容と異なるため索引に渡さない）
+        self._update_keyword_index(
+            document_id,
+            list(saved_chunks) + (updated_records if updated_count == len(updated_records) else []),
+            doc_date,
+            removed_ids=stale_ids,
+            replace_document=not existing_chunks,
+        )
+
+        return {
+            'embedded': len(new_records),
+            'reused': reused,
+            'updated': updated_count,
+            'deleted': len(stale_ids),
+            'total_chunks': reused + len(saved_chunks),
+        }
+
     def get_archive_stats(self, days_back: int = 30) -> Dict[str, Any]:
         """アーカイブ統計情報取得"""
         if not self.supabase_client.is_available():
@@ -664,6 +799,14 @@ class ArchiveManager:
             if chunk_data_list:
                 success_count = self.supabase_client.upsert_chunks(chunk_data_list)
                 self.logger.info(f"記事チャンク保存成功: {success_count}/{len(chunk_data_list)}個")
+                if success_count:
+                    document_meta = {
+                        field: document_data[field] for field in ('region', 'category', 'source', 'url')
+                    }
+                    self._update_keyword_index(
+                        document_id, [dict(record, **document_meta) for record in chunk_data_list],
+                        doc_date, replace_document=True,
+                    )
 
             return document_id
 
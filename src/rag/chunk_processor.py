@@ -4,6 +4,7 @@
 テキストを適切なサイズのチャンクに分割し、RAGシステム用のデータを準備します。
 """
 
+import hashlib
 import logging
 import re
 from typing import List, Dict, Any, Optional, Tuple
@@ -24,6 +25,11 @@ class TextChunk:
     source: Optional[str] = None
     url: Optional[str] = None
 
+    @property
+    def content_hash(self) -> str:
+        """差分アーカイブ用のチャンク本文ハッシュ"""
+        return hashlib.sha256(self.content.encode('utf-8')).hexdigest()
+
 
 class ChunkProcessor:
     """チャンク処理クラス"""
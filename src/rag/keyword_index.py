@@ -0,0 +1,255 @@
+"""
+ローカルキーワードインデックス
+
+チャンク本文の転置インデックスによる BM25 検索と、ベクター検索結果との
+Reciprocal Rank Fusion（RRF）を提供します。日本語は形態素解析器に依存せず
+文字バイグラムで、英数字（ティッカー・指標名など）は単語単位でトークン化します。
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from src.rag.vector_index import chunk_record_from_row
+
+# 英数字の語（"USD/JPY" → usd, jpy、"S&P500" → s, p500、"7203.T" → 7203.t）と日本語の連続部分
+_TOKEN_PATTERN = re.compile(
+    r"[a-z0-9]+(?:[.\-][a-z0-9]+)*"
+    r"|[\u3005\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+"
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    検索用トークン列に分割
+
+    NFKC 正規化・小文字化した上で、英数字は語単位、日本語は文字バイグラム
+    （1文字の場合はユニグラム）にする。
+    """
+    if not text:
+        return []
+    normalized = unicodedata.normalize('NFKC', text).lower()
+    tokens: List[str] = []
+    for match in _TOKEN_PATTERN.finditer(normalized):
+        segment = match.group()
+        if segment[0].isascii():
+            tokens.append(segment)
+        elif len(segment) == 1:
+            tokens.append(segment)
+        else:
+            tokens.extend(segment[i : i + 2] for i in range(len(segment) - 1))
+    return tokens
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Sequence[Sequence[Any]],
+    key: Callable[[Any], Hashable],
+    k: int = 60,
+) -> List[Tuple[Any, float]]:
+    """
+    複数のランキングを RRF で統合
+
+    Args:
+        ranked_lists: 順位順の結果リスト群（同じ項目は key で同一視）
+        key: 項目の同一性キーを返す関数
+        k: RRF の平滑化定数
+
+    Returns:
+        (項目, RRFスコア) のスコア降順リスト。項目は最初に現れたリストのものを使う
+    """
+    scores: Dict[Hashable, float] = defaultdict(float)
+    items: Dict[Hashable, Any] = {}
+    for ranked in ranked_lists:
+        for rank, item in enumerate(ranked, start=1):
+            item_key = key(item)
+            scores[item_key] += 1.0 / (k + rank)
+            items.setdefault(item_key, item)
+    return sorted(((items[item_key], score) for item_key, score in scores.items()), key=lambda x: -x[1])
+
+
+class BM25Index:
+    """チャンク本文の転置インデックスと BM25 スコアリング"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.logger = logging.getLogger("rag_keyword_index")
+        self._lock = threading.RLock()
+
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._term_counts: Dict[str, Counter] = {}
+        self._lengths: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._keys_by_document: Dict[Any, set] = defaultdict(set)
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @staticmethod
+    def chunk_key(row: Dict[str, Any]) -> str:
+        """チャンクの識別キー（IDが無い行はドキュメントIDとチャンク番号）"""
+        chunk_id = row.get('id', row.get('chunk_id'))
+        if chunk_id is not None:
+            return str(chunk_id)
+        return f"{row.get('document_id')}:{row.get('chunk_index')}"
+
+    def add_chunks(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """チャンクを追加（同じキーの既存エントリは置き換える）"""
+        added = 0
+        with self._lock:
+            for row in rows:
+                self._add_record(self.chunk_key(row), chunk_record_from_row(row))
+                added += 1
+        return added
+
+    def _add_record(self, key: str, record: Dict[str, Any]) -> None:
+        self._remove_key(key)
+        counts = Counter(tokenize(record['content']))
+        self._records[key] = record
+        self._term_counts[key] = counts
+        self._lengths[key] = sum(counts.values())
+        self._keys_by_document[record['document_id']].add(key)
+        for term, count in counts.items():
+            self._postings[term][key] = count
+        self._total_length += self._lengths[key]
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        with self._lock:
+            self._records.clear()
+            self._term_counts.clear()
+            self._lengths.clear()
+            self._postings.clear()
+            self._keys_by_document.clear()
+            self._total_length = 0
+
+    def remove_chunks(self, chunk_ids: Iterable[Any]) -> None:
+        """チャンクIDを指定して削除"""
+        with self._lock:
+            for chunk_id in chunk_ids:
+                self._remove_key(str(chunk_id))
+
+    def remove_document(self, document_id: Any) -> None:
+        """ドキュメントの全チャンクを削除"""
+        with self._lock:
+            for key in list(self._keys_by_document.get(document_id, ())):
+                self._remove_key(key)
+
+    def _remove_key(self, key: str) -> None:
+        record = self._records.pop(key, None)
+        if record is None:
+            return
+        counts = self._term_counts.pop(key)
+        for term in counts:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._lengths.pop(key)
+        document_keys = self._keys_by_document.get(record['document_id'])
+        if document_keys is not None:
+            document_keys.discard(key)
+            if not document_keys:
+                del self._keys_by_document[record['document_id']]
+
+    def _matches_filters(
+        self,
+        record: Dict[str, Any],
+        region_filter: Optional[str],
+        category_filter: Optional[str],
+        date_since: Optional[str],
+    ) -> bool:
+        if region_filter is not None and record.get('region') != region_filter:
+            return False
+        if category_filter is not None and record.get('category') != category_filter:
+            return False
+        if date_since and (record.get('doc_date') or '') < date_since[:10]:
+            return False
+        return True
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 8,
+        region_filter: Optional[str] = None,
+        category_filter: Optional[str] = None,
+        date_since: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        BM25 スコア上位のチャンクを検索
+
+        Returns:
+            検索結果レコード（chunk_id, content, region, ... と bm25_score）のスコア降順リスト
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            count = len(self._records)
+            if not terms or count == 0 or top_k <= 0:
+                return []
+            average_length = self._total_length / count if self._total_length else 1.0
+
+            scores: Dict[str, float] = defaultdict(float)
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, term_frequency in postings.items():
+                    length_ratio = self._lengths[key] / average_length
+                    denominator = term_frequency + self.k1 * (1 - self.b + self.b * length_ratio)
+                    scores[key] += idf * term_frequency * (self.k1 + 1) / denominator
+
+            candidates = (
+                (score, key) for key, score in scores.items()
+                if self._matches_filters(self._records[key], region_filter, category_filter, date_since)
+            )
+            top = heapq.nlargest(top_k, candidates)
+            return [dict(self._records[key], bm25_score=score) for score, key in top]
+
+    def save(self, directory: str) -> None:
+        """インデックスを保存（転置リストは読み込み時に本文から再構築する）"""
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            rows = [dict(record, chunk_key=key) for key, record in self._records.items()]
+        tmp_path = os.path.join(directory, 'chunks.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'k1': self.k1, 'b': self.b, 'chunks': rows}, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, os.path.join(directory, 'chunks.json'))
+
+    @classmethod
+    def load(cls, directory: str) -> 'BM25Index':
+        """保存済みインデックスを読み込む（存在しない場合は空のインデックス）"""
+        path = os.path.join(directory, 'chunks.json')
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        index = cls(k1=data.get('k1', 1.5), b=data.get('b', 0.75))
+        for row in data.get('chunks', []):
+            key = row.pop('chunk_key')
+            index._add_record(key, row)
+        return index
+
+
+# 共有インスタンス（ArchiveManager の更新と RAGSearchEngine の検索で共用）
+_keyword_indexes: Dict[str, BM25Index] = {}
+_keyword_indexes_lock = threading.Lock()
+
+
+def get_keyword_index(directory: str) -> BM25Index:
+    """保存先ディレクトリごとのキーワードインデックスを取得（シングルトン）"""
+    with _keyword_indexes_lock:
+        index = _keyword_indexes.get(directory)
+        if index is None:
+            index = BM25Index.load(directory)
+            _keyword_indexes[directory] = index
+        return index
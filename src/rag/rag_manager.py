@@ -129,6 +129,10 @@ class RAGManager:
                 integrity = self.archive_manager.verify_archive_integrity(document_id)
                 result['integrity'] = integrity
 
+                # ローカルインデックスを最新のアーカイブに合わせる
+                if self.config.supabase.local_index_enabled:
+                    result['local_index_size'] = self.search_engine.rebuild_local_index()
+
             return result
 
         except Exception as e:
@@ -304,8 +308,7 @@ class RAGManager:
             return None
 
         try:
-            embedding1 = self.embedding_generator.generate_embedding(content1)
-            embedding2 = self.embedding_generator.generate_embedding(content2)
+            embedding1, embedding2 = self.embedding_generator.generate_embeddings_batch([content1, content2])
 
             if not embedding1 or not embedding2:
                 return None
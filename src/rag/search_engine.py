@@ -5,14 +5,21 @@ RAG検索エンジン
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from src.config.app_config import SupabaseConfig, get_config
 from src.database.supabase_client import get_supabase_client
 from src.database.embedding_generator import get_embedding_generator
 from src.rag.chunk_processor import TextChunk
+from src.rag.keyword_index import BM25Index, get_keyword_index, reciprocal_rank_fusion
+from src.rag.vector_index import LocalVectorIndex, parse_embedding
 
 
 @dataclass
@@ -37,6 +44,119 @@ class RAGSearchEngine:
         self.logger = logging.getLogger("rag_search_engine")
         self.supabase_client = get_supabase_client()
         self.embedding_generator = get_embedding_generator()
+        self._local_index: Optional[LocalVectorIndex] = None
+        self._local_index_loaded = False
+
+        # クエリ埋め込みと検索結果のLRUキャッシュ（値は (保存時刻, 値)）
+        self._cache_lock = threading.Lock()
+        self._query_embedding_cache: 'OrderedDict[str, Any]' = OrderedDict()
+        self._result_cache: 'OrderedDict[Any, Any]' = OrderedDict()
+        self.cache_stats = {'embedding_hits': 0, 'result_hits': 0}
+
+    @property
+    def local_index(self) -> Optional[LocalVectorIndex]:
+        """ディスクに保存済みのローカルインデックス（無効・未構築の場合はNone）"""
+        if not getattr(self.config, 'local_index_enabled', False):
+            return None
+
+        if not self._local_index_loaded:
+            self._local_index_loaded = True
+            try:
+                self._local_index = LocalVectorIndex.load(self.config.local_index_dir)
+                if self._local_index is not None:
+                    self.logger.info(f"ローカルインデックス読み込み: {len(self._local_index)}件")
+            except Exception as e:
+                self.logger.error(f"ローカルインデックス読み込み失敗: {e}")
+                self._local_index = None
+
+        if self._local_index is None or len(self._local_index) == 0:
+            return None
+        return self._local_index
+
+    def rebuild_local_index(self) -> int:
+        """Supabaseのアーカイブ済みチャンクからローカルインデックスを再構築して保存"""
+        rows = self.supabase_client.fetch_chunks_for_index()
+        if rows is None:
+            self.logger.warning("チャンクを取得できないため、ローカルインデックスを再構築しません")
+            return 0
+
+        index = LocalVectorIndex.from_chunk_rows(
+            rows,
+            self.config.embedding_dimension,
+            index_type=self.config.local_index_type,
+            nlist=self.config.local_index_nlist,
+            nprobe=self.config.local_index_nprobe,
+        )
+        index.save(self.config.local_index_dir)
+        self._local_index = index
+        self._local_index_loaded = True
+        return len(index)
+
+    @property
+    def keyword_index(self) -> Optional[BM25Index]:
+        """ローカルキーワードインデックス（無効・空の場合はNone）"""
+        if not getattr(self.config, 'keyword_index_enabled', False):
+            return None
+        index = get_keyword_index(self.config.keyword_index_dir)
+        return index if len(index) else None
+
+    def rebuild_keyword_index(self) -> int:
+        """Supabaseのアーカイブ済みチャンクからキーワードインデックスを再構築して保存"""
+        rows = self.supabase_client.fetch_chunks_for_index()
+        if rows is None:
+            self.logger.warning("チャンクを取得できないため、キーワードインデックスを再構築しません")
+            return 0
+
+        index = get_keyword_index(self.config.keyword_index_dir)
+        index.clear()
+        index.add_chunks(rows)
+        index.save(self.config.keyword_index_dir)
+        return len(index)
+
+    def _index_version(self, local_index: Optional[LocalVectorIndex]) -> str:
+        """検索対象データの版（ローカルインデックスの構築ID、またはSupabaseのチャンク書き込み回数）"""
+        if local_index is not None:
+            return f"local:{local_index.version}"
+        return f"remote:{getattr(self.supabase_client, 'chunks_version', 0)}"
+
+    def _cache_get(self, cache: 'OrderedDict[Any, Any]', key: Any, ttl: Optional[float] = None) -> Any:
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if ttl is not None and time.monotonic() - stored_at > ttl:
+                del cache[key]
+                return None
+            cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache: 'OrderedDict[Any, Any]', key: Any, value: Any, max_size: int) -> None:
+        if max_size <= 0:
+            return
+        with self._cache_lock:
+            cache[key] = (time.monotonic(), value)
+            cache.move_to_end(key)
+            while len(cache) > max_size:
+                cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """クエリ埋め込みと検索結果のキャッシュを破棄"""
+        with self._cache_lock:
+            self._query_embedding_cache.clear()
+            self._result_cache.clear()
+
+    def get_query_embedding(self, query: str) -> Optional[List[float]]:
+        """クエリの埋め込みを取得（同一クエリは再計算しない）"""
+        cached = self._cache_get(self._query_embedding_cache, query)
+        if cached is not None:
+            self.cache_stats['embedding_hits'] += 1
+            return cached
+
+        embedding = self.embedding_generator.generate_embedding(query)
+        if embedding:
+            self._cache_put(self._query_embedding_cache, query, embedding, self.config.search_cache_size)
+        return embedding
 
     def search(
         self,
@@ -47,9 +167,10 @@ class RAGSearchEngine:
         date_since: Optional[datetime] = None,
         similarity_threshold: Optional[float] = None
     ) -> List[SearchResult]:
-        """類似検索実行"""
-        
-        if not self.supabase_client.is_available():
+        """類似検索実行（ローカルインデックスがあればSupabaseを使わずに検索）"""
+        local_index = self.local_index
+
+        if local_index is None and not self.supabase_client.is_available():
             self.logger.warning("Supabaseが利用できません")
             return []
 
@@ -58,68 +179,166 @@ class RAGSearchEngine:
             return []
 
         try:
+            cache_key = self._result_cache_key(
+                ('query', query), top_k, region_filter, category_filter, date_since, similarity_threshold, local_index
+            )
+            cached = self._cache_get(self._result_cache, cache_key, self.config.search_cache_ttl_seconds)
+            if cached is not None:
+                self.cache_stats['result_hits'] += 1
+                return list(cached)
+
             # クエリの埋め込み生成
-            query_embedding = self.embedding_generator.generate_embedding(query)
+            query_embedding = self.get_query_embedding(query)
             if not query_embedding:
                 self.logger.error("クエリの埋め込み生成に失敗しました")
                 return []
 
-            # 日付フィルターの準備
-            date_since_str = None
-            if date_since:
-                date_since_str = date_since.strftime('%Y-%m-%d')
-
-            # Supabaseで類似検索実行
-            search_results = self.supabase_client.search_chunks(
-                query_embedding=query_embedding,
-                match_count=top_k,
-                region_filter=region_filter,
-                category_filter=category_filter,
-                date_since=date_since_str
+            results = self._search_with_embedding(
+                query_embedding, top_k, region_filter, category_filter, date_since, similarity_threshold, local_index
             )
-
-            # 類似度フィルタリング
-            threshold = similarity_threshold or self.config.similarity_threshold
-            filtered_results = [
-                result for result in search_results 
-                if result.get('similarity', 0) >= threshold
-            ]
-
-            # SearchResultオブジェクトに変換
-            results = []
-            for result in filtered_results:
-                search_result = SearchResult(
-                    chunk_id=result.get('chunk_id'),
-                    document_id=result.get('document_id'),
-                    content=result.get('content', ''),
-                    similarity=result.get('similarity', 0.0),
-                    region=result.get('region'),
-                    category=result.get('category'),
-                    source=result.get('source'),
-                    url=result.get('url'),
-                    doc_date=None  # 必要に応じてdocument情報から取得
-                )
-                results.append(search_result)
-
-            self.logger.info(f"検索完了: {len(results)}件（閾値: {threshold}）")
+            self._cache_put(self._result_cache, cache_key, tuple(results), self.config.search_cache_size)
             return results
 
         except Exception as e:
             self.logger.error(f"検索失敗: {e}")
             return []
 
+    def _result_cache_key(
+        self,
+        target: Any,
+        top_k: int,
+        region_filter: Optional[str],
+        category_filter: Optional[str],
+        date_since: Optional[datetime],
+        similarity_threshold: Optional[float],
+        local_index: Optional[LocalVectorIndex],
+    ) -> Any:
+        date_since_str = date_since.strftime('%Y-%m-%d') if date_since else None
+        threshold = similarity_threshold or self.config.similarity_threshold
+        return (
+            target, top_k, region_filter, category_filter, date_since_str, threshold,
+            self._index_version(local_index),
+        )
+
+    def _search_with_embedding(
+        self,
+        query_embedding: Any,
+        top_k: int,
+        region_filter: Optional[str],
+        category_filter: Optional[str],
+        date_since: Optional[datetime],
+        similarity_threshold: Optional[float],
+        local_index: Optional[LocalVectorIndex],
+    ) -> List[SearchResult]:
+        """埋め込みベクトルで類似検索を実行"""
+        # 日付フィルターの準備
+        date_since_str = None
+        if date_since:
+            date_since_str = date_since.strftime('%Y-%m-%d')
+
+        search_kwargs = dict(
+            query_embedding=query_embedding,
+            match_count=top_k,
+            region_filter=region_filter,
+            category_filter=category_filter,
+            date_since=date_since_str
+        )
+        if local_index is not None:
+            search_results = local_index.search(**search_kwargs)
+        else:
+            # Supabaseで類似検索実行
+            if isinstance(query_embedding, np.ndarray):
+                search_kwargs['query_embedding'] = query_embedding.tolist()
+            search_results = self.supabase_client.search_chunks(**search_kwargs)
+
+        # 類似度フィルタリング
+        threshold = similarity_threshold or self.config.similarity_threshold
+        filtered_results = [
+            result for result in search_results 
+            if result.get('similarity', 0) >= threshold
+        ]
+
+        # SearchResultオブジェクトに変換
+        results = [self._to_search_result(result) for result in filtered_results]
+
+        self.logger.info(f"検索完了: {len(results)}件（閾値: {threshold}）")
+        return results
+
+    @staticmethod
+    def _to_search_result(result: Dict[str, Any]) -> SearchResult:
+        return SearchResult(
+            chunk_id=result.get('chunk_id'),
+            document_id=result.get('document_id'),
+            content=result.get('content', ''),
+            similarity=result.get('similarity', 0.0),
+            region=result.get('region'),
+            category=result.get('category'),
+            source=result.get('source'),
+            url=result.get('url'),
+            doc_date=result.get('doc_date')
+        )
+
     def search_by_keywords(
         self,
         keywords: List[str],
+        hybrid: bool = True,
         **kwargs
     ) -> List[SearchResult]:
-        """キーワードリストによる検索"""
+        """
+        キーワードリストによる検索
+
+        キーワードインデックスがあれば BM25 で完全一致（ティッカー・指標名など）を拾い、
+        hybrid=True の場合はベクター検索結果と RRF で統合する。hybrid=False では
+        埋め込みを生成しない。
+        """
         if not keywords:
             return []
 
         # キーワードを結合してクエリ作成
         query = " ".join(keywords)
-        return self.search(query, **kwargs)
+        keyword_index = self.keyword_index
+        if keyword_index is None:
+            return self.search(query, **kwargs)
+
+        top_k = kwargs.get('top_k', 8)
+        date_since = kwargs.get('date_since')
+        keyword_hits = keyword_index.search(
+            query,
+            top_k=top_k * 2,
+            region_filter=kwargs.get('region_filter'),
+            category_filter=kwargs.get('category_filter'),
+            date_since=date_since.strftime('%Y-%m-%d') if date_since else None,
+        )
+        keyword_results = [self._to_search_result(hit) for hit in keyword_hits]
+        if not hybrid:
+            return keyword_results[:top_k]
+
+        vector_results = self.search(query, **dict(kwargs, top_k=top_k * 2))
+        # 同じチャンクはIDの有無に関わらず本文で同一視する（ベクター側の結果を優先して残す）
+        fused = reciprocal_rank_fusion([vector_results, keyword_results], key=lambda r: r.content)
+        return [result for result, _ in fused[:top_k]]
+
+    def get_chunk_embedding(self, chunk_id: int) -> Optional[Any]:
+        """保存済みのチャンク埋め込みを取得（再生成はしない）"""
+        local_index = self.local_index
+        if local_index is not None:
+            vector = local_index.get_vector(chunk_id)
+            if vector is not None:
+                return vector
+
+        if not self.supabase_client.is_available():
+            return None
+
+        row = self.supabase_client.get_chunk_by_id(chunk_id, columns='id,content,embedding')
+        if not row:
+            self.logger.warning(f"チャンクが見つかりません: {chunk_id}")
+            return None
+
+        embedding = parse_embedding(row.get('embedding'))
+        if embedding is None and row.get('content'):
+            # 埋め込みが保存されていない古いチャンクのみ内容から再生成する
+            embedding = self.get_query_embedding(row['content'])
+        return embedding
 
     def search_similar_to_chunk(
         self,
@@ -130,27 +349,33 @@ class RAGSearchEngine:
     ) -> List[SearchResult]:
         """既存チャンクに類似したチャンクを検索"""
         try:
-            # 指定されたチャンクの埋め込みを取得
-            # 注意: この実装では簡略化のため、チャンクの内容から埋め込みを再生成
-            # 本来はSupabaseからembeddingを直接取得すべき
-            
-            # チャンク内容を取得（簡略実装）
-            if not self.supabase_client.is_available():
-                return []
-
-            # チャンクの内容を取得してクエリとして使用
-            chunk_result = self.supabase_client.client.table('chunks').select('content').eq('id', chunk_id).execute()
-            if not chunk_result.data:
-                self.logger.warning(f"チャンクが見つかりません: {chunk_id}")
-                return []
-
-            chunk_content = chunk_result.data[0].get('content', '')
-            if not chunk_content:
-                return []
+            local_index = self.local_index
+            match_count = top_k + (1 if exclude_self else 0)
+            cache_key = self._result_cache_key(
+                ('chunk', chunk_id), match_count,
+                kwargs.get('region_filter'), kwargs.get('category_filter'),
+                kwargs.get('date_since'), kwargs.get('similarity_threshold'), local_index,
+            )
+            results = self._cache_get(self._result_cache, cache_key, self.config.search_cache_ttl_seconds)
+            if results is not None:
+                self.cache_stats['result_hits'] += 1
+                results = list(results)
+            else:
+                embedding = self.get_chunk_embedding(chunk_id)
+                if embedding is None:
+                    return []
+
+                results = self._search_with_embedding(
+                    embedding,
+                    match_count,
+                    kwargs.get('region_filter'),
+                    kwargs.get('category_filter'),
+                    kwargs.get('date_since'),
+                    kwargs.get('similarity_threshold'),
+                    local_index,
+                )
+                self._cache_put(self._result_cache, cache_key, tuple(results), self.config.search_cache_size)
 
-            # 類似検索実行
-            results = self.search(chunk_content, top_k=top_k + (1 if exclude_self else 0), **kwargs)
-            
             # 自分自身を除外
             if exclude_self:
                 results = [r for r in results if r.chunk_id != chunk_id][:top_k]
@@ -0,0 +1,280 @@
+"""
+ローカルベクターインデックス
+
+アーカイブ済みチャンクの埋め込みを正規化済み float32 行列として保持し、
+Supabase の search_chunks RPC と同じ形式の結果をプロセス内で返します。
+大規模アーカイブ向けに IVF（粗量子化 + 転置リスト）モードも提供します。
+"""
+
+import json
+import logging
+import os
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from src.database.embedding_generator import normalize_embeddings, top_k_indices
+
+# 検索結果として返すメタデータ項目（search_chunks RPC の戻り値と揃える）
+RECORD_FIELDS = ('chunk_id', 'document_id', 'content', 'region', 'category', 'source', 'url', 'doc_date')
+
+INDEX_TYPES = ('flat', 'ivf')
+
+
+def parse_embedding(value: Any) -> Optional[List[float]]:
+    """PostgREST が文字列で返す pgvector 値をリストに変換"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return None
+    try:
+        return [float(v) for v in value]
+    except (TypeError, ValueError):
+        return None
+
+
+def chunk_record_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    chunks 行（documents を埋め込み済みでもよい）を検索結果用レコードに変換
+
+    region/category/source/url は列を優先し、無ければ metadata を参照する。
+    """
+    metadata = row.get('metadata') if isinstance(row.get('metadata'), dict) else {}
+    document = row.get('documents') if isinstance(row.get('documents'), dict) else {}
+    return {
+        'chunk_id': row.get('id', row.get('chunk_id')),
+        'document_id': row.get('document_id'),
+        'content': row.get('content', ''),
+        'region': row.get('region') or metadata.get('region'),
+        'category': row.get('category') or metadata.get('category'),
+        'source': row.get('source') or metadata.get('source'),
+        'url': row.get('url') or metadata.get('url') or document.get('url'),
+        'doc_date': str(document.get('doc_date') or row.get('doc_date') or '')[:10] or None,
+    }
+
+
+class LocalVectorIndex:
+    """正規化済み埋め込み行列によるチャンク検索インデックス"""
+
+    def __init__(
+        self,
+        dimension: int,
+        index_type: str = 'flat',
+        nlist: int = 64,
+        nprobe: int = 8,
+    ):
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"未対応のインデックス種別です: {index_type}")
+        self.dimension = dimension
+        self.index_type = index_type
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.logger = logging.getLogger("rag_vector_index")
+
+        self.records: List[Dict[str, Any]] = []
+        self.vectors = np.zeros((0, dimension), dtype=np.float32)
+        # 構築ごとに変わる識別子（検索結果キャッシュのキーに使用）
+        self.version = ''
+
+        # IVF 用（build 時に作成）
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments: Optional[np.ndarray] = None
+
+        # フィルタ用の列（build 時に作成）
+        self._regions = np.array([], dtype=object)
+        self._categories = np.array([], dtype=object)
+        self._doc_dates = np.array([], dtype=object)
+        self._row_by_chunk_id: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @classmethod
+    def from_chunk_rows(cls, rows: Iterable[Dict[str, Any]], dimension: int, **kwargs) -> 'LocalVectorIndex':
+        """
+        Supabase の chunks 行（documents を埋め込み済み）からインデックスを構築
+
+        埋め込みが欠けている・次元が合わない行はスキップする。
+        """
+        index = cls(dimension, **kwargs)
+        records = []
+        vectors = []
+        for row in rows:
+            embedding = parse_embedding(row.get('embedding'))
+            if embedding is None or len(embedding) != dimension:
+                continue
+            records.append(chunk_record_from_row(row))
+            vectors.append(embedding)
+        index.build(records, vectors)
+        return index
+
+    def build(self, records: Sequence[Dict[str, Any]], embeddings: Sequence[Sequence[float]]) -> None:
+        """レコードと埋め込みからインデックスを（再）構築"""
+        if len(records) != len(embeddings):
+            raise ValueError("レコード数と埋め込み数が一致しません")
+
+        self.records = [{field: record.get(field) for field in RECORD_FIELDS} for record in records]
+        matrix = np.asarray(embeddings, dtype=np.float32).reshape(len(self.records), self.dimension)
+        self.vectors = normalize_embeddings(matrix)
+        self.version = uuid.uuid4().hex
+        self._build_filter_columns()
+
+        self.centroids = None
+        self.assignments = None
+        if self.index_type == 'ivf' and len(self.records) > 0:
+            self._train_ivf()
+
+        self.logger.info(f"ローカルベクターインデックス構築: {len(self.records)}件（{self.index_type}）")
+
+    def _build_filter_columns(self) -> None:
+        self._regions = np.array([r.get('region') for r in self.records], dtype=object)
+        self._categories = np.array([r.get('category') for r in self.records], dtype=object)
+        self._doc_dates = np.array([r.get('doc_date') or '' for r in self.records], dtype=object)
+        self._row_by_chunk_id = {r.get('chunk_id'): i for i, r in enumerate(self.records)}
+
+    def get_vector(self, chunk_id: Any) -> Optional[np.ndarray]:
+        """チャンクIDの正規化済み埋め込みを取得（未登録の場合はNone）"""
+        row = self._row_by_chunk_id.get(chunk_id)
+        return None if row is None else self.vectors[row]
+
+    def _train_ivf(self, iterations: int = 10, seed: int = 0) -> None:
+        """球面 k-means で粗量子化セントロイドを学習し、各ベクトルを割り当てる"""
+        count = len(self.vectors)
+        nlist = max(1, min(self.nlist, count))
+        rng = np.random.RandomState(seed)
+        centroids = self.vectors[rng.choice(count, nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignments = np.argmax(self.vectors @ centroids.T, axis=1)
+            for cluster in range(nlist):
+                members = self.vectors[assignments == cluster]
+                if len(members):
+                    centroids[cluster] = members.sum(axis=0)
+            centroids = normalize_embeddings(centroids)
+
+        self.centroids = centroids
+        self.assignments = np.argmax(self.vectors @ centroids.T, axis=1)
+
+    def _filter_mask(
+        self,
+        region_filter: Optional[str],
+        category_filter: Optional[str],
+        date_since: Optional[str],
+    ) -> Optional[np.ndarray]:
+        """メタデータの事前フィルタ（条件なしの場合はNone）"""
+        mask = None
+        if region_filter is not None:
+            mask = self._regions == region_filter
+        if category_filter is not None:
+            category_mask = self._categories == category_filter
+            mask = category_mask if mask is None else mask & category_mask
+        if date_since:
+            # ISO形式（YYYY-MM-DD）の文字列は辞書順で日付順になる
+            date_mask = self._doc_dates >= date_since[:10]
+            mask = date_mask if mask is None else mask & date_mask
+        return mask
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        match_count: int = 8,
+        region_filter: Optional[str] = None,
+        category_filter: Optional[str] = None,
+        date_since: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        コサイン類似度の上位チャンクを検索
+
+        Returns:
+            search_chunks RPC と同じキー（chunk_id, document_id, content, similarity, ...）の辞書リスト
+        """
+        if not self.records or match_count <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        if query.shape[0] != self.dimension:
+            raise ValueError(f"クエリ次元数が一致しません: {query.shape[0]} != {self.dimension}")
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        query = query / norm
+
+        mask = self._filter_mask(region_filter, category_filter, date_since)
+        candidates = np.arange(len(self.records)) if mask is None else np.flatnonzero(mask)
+
+        if self.index_type == 'ivf' and self.centroids is not None:
+            probe = np.argsort(-(self.centroids @ query))[: self.nprobe]
+            probed = candidates[np.isin(self.assignments[candidates], probe)]
+            # 近傍リストだけでは件数が足りない場合はフィルタ済み全件で検索する
+            if len(probed) >= match_count:
+                candidates = probed
+
+        if len(candidates) == 0:
+            return []
+
+        # 絞り込みがない場合は行列をコピーせずに1回の行列ベクトル積で計算する
+        matrix = self.vectors if len(candidates) == len(self.records) else self.vectors[candidates]
+        scores = matrix @ query
+        top = top_k_indices(scores, match_count)
+
+        results = []
+        for position in top:
+            result = dict(self.records[candidates[position]])
+            result['similarity'] = float(scores[position])
+            results.append(result)
+        return results
+
+    def save(self, directory: str) -> None:
+        """インデックスをディレクトリに保存"""
+        os.makedirs(directory, exist_ok=True)
+        arrays = {'vectors': self.vectors}
+        if self.centroids is not None:
+            arrays['centroids'] = self.centroids
+            arrays['assignments'] = self.assignments
+        np.savez(os.path.join(directory, 'vectors.npz'), **arrays)
+
+        meta = {
+            'dimension': self.dimension,
+            'index_type': self.index_type,
+            'nlist': self.nlist,
+            'nprobe': self.nprobe,
+            'version': self.version,
+            'records': self.records,
+        }
+        tmp_path = os.path.join(directory, 'records.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, os.path.join(directory, 'records.json'))
+
+    @classmethod
+    def load(cls, directory: str) -> Optional['LocalVectorIndex']:
+        """保存済みインデックスを読み込む（存在しない場合はNone）"""
+        records_path = os.path.join(directory, 'records.json')
+        vectors_path = os.path.join(directory, 'vectors.npz')
+        if not (os.path.exists(records_path) and os.path.exists(vectors_path)):
+            return None
+
+        with open(records_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        index = cls(
+            meta['dimension'],
+            index_type=meta.get('index_type', 'flat'),
+            nlist=meta.get('nlist', 64),
+            nprobe=meta.get('nprobe', 8),
+        )
+        with np.load(vectors_path) as arrays:
+            vectors = arrays['vectors'].astype(np.float32, copy=False)
+            if len(vectors) != len(meta['records']):
+                raise ValueError("保存済みインデックスのレコード数とベクトル数が一致しません")
+            index.records = meta['records']
+            index.version = meta.get('version') or uuid.uuid4().hex
+            index.vectors = vectors
+            if 'centroids' in arrays:
+                index.centroids = arrays['centroids']
+                index.assignments = arrays['assignments']
+        index._build_filter_columns()
+        return index
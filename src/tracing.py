@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+"""
+実行トレース（スパン計測）
+
+NewsProcessor.run の各処理段（一覧取得・本文取得・DB保存・LLM呼び出し・HTML生成など）を
+スパンとして記録し、実時間・CPU時間・ピークRSS・件数・バイト数を集計する。
+記録したスパンはDBへ保存し、Chrome トレース形式（chrome://tracing / Perfetto）で出力できる。
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+    _RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    resource = None  # type: ignore
+    _RESOURCE_AVAILABLE = False
+
+
+def peak_rss_mb() -> Optional[float]:
+    """プロセス開始以降のピークRSS（MB、取得できない環境ではNone）"""
+    if not _RESOURCE_AVAILABLE:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux は KB、macOS はバイト単位
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(max_rss / divisor, 1)
+
+
+@dataclass
+class TraceSpan:
+    """1つの処理区間の計測結果"""
+
+    name: str
+    category: str = "pipeline"
+    started_at: float = 0.0  # エポック秒
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0  # プロセス全体のCPU時間（並行するスパンでは重複して計上される）
+    peak_rss_mb: Optional[float] = None
+    items: int = 0
+    bytes: int = 0
+    thread_id: int = 0
+    thread_name: str = ""
+    parent: Optional[str] = None
+    status: str = "ok"
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def add(self, items: int = 0, bytes: int = 0) -> None:
+        """処理件数・バイト数を加算"""
+        self.items += items
+        self.bytes += bytes
+
+    def set(self, **attributes: Any) -> None:
+        """任意の属性を記録"""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class RunTracer:
+    """1回の実行分のスパンを収集するトレーサー（スレッドセーフ）"""
+
+    def __init__(self, name: str = "news_pipeline"):
+        self.name = name
+        self.started_at = time.time()
+        self._spans: List[TraceSpan] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def spans(self) -> List[TraceSpan]:
+        """完了したスパン（開始時刻順）"""
+        with self._lock:
+            return sorted(self._spans, key=lambda span: span.started_at)
+
+    def _stack(self) -> List[TraceSpan]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, category: str = "pipeline", **attributes: Any) -> Iterator[TraceSpan]:
+        """
+        処理区間を計測するコンテキストマネージャー
+
+        Args:
+            name: スパン名（例: "reuters.body_fetch"）
+            category: 分類（scrape / db / llm / output など）
+            **attributes: 任意の属性
+
+        Yields:
+            TraceSpan: 件数・バイト数・属性を追記できるスパン
+        """
+        stack = self._stack()
+        current = threading.current_thread()
+        span = TraceSpan(
+            name=name,
+            category=category,
+            started_at=time.time(),
+            thread_id=current.ident or 0,
+            thread_name=current.name,
+            parent=stack[-1].name if stack else None,
+            attributes=dict(attributes),
+        )
+        stack.append(span)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.wall_ms = round((time.perf_counter() - wall_start) * 1000, 3)
+            span.cpu_ms = round((time.process_time() - cpu_start) * 1000, 3)
+            span.peak_rss_mb = peak_rss_mb()
+            stack.pop()
+            with self._lock:
+                self._spans.append(span)
+
+    def summarize(self) -> Dict[str, Dict[str, Any]]:
+        """スパン名ごとの集計（回数・合計/最大実時間・合計CPU時間・件数・バイト数）"""
+        summary: Dict[str, Dict[str, Any]] = {}
+        for span in self.spans:
+            entry = summary.setdefault(
+                span.name,
+                {"count": 0, "wall_ms": 0.0, "max_wall_ms": 0.0, "cpu_ms": 0.0,
+                 "items": 0, "bytes": 0, "errors": 0},
+            )
+            entry["count"] += 1
+            entry["wall_ms"] = round(entry["wall_ms"] + span.wall_ms, 3)
+            entry["max_wall_ms"] = max(entry["max_wall_ms"], span.wall_ms)
+            entry["cpu_ms"] = round(entry["cpu_ms"] + span.cpu_ms, 3)
+            entry["items"] += span.items
+            entry["bytes"] += span.bytes
+            entry["errors"] += span.status != "ok"
+        return summary
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome トレースイベント形式（完了イベント "X"）に変換"""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": self.name}}
+        ]
+        thread_names: Dict[int, str] = {}
+        for span in self.spans:
+            thread_names.setdefault(span.thread_id, span.thread_name)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round((span.started_at - self.started_at) * 1_000_000),
+                    "dur": round(span.wall_ms * 1000),
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {
+                        "cpu_ms": span.cpu_ms,
+                        "peak_rss_mb": span.peak_rss_mb,
+                        "items": span.items,
+                        "bytes": span.bytes,
+                        "status": span.status,
+                        **({"error": span.error} if span.error else {}),
+                        **span.attributes,
+                    },
+                }
+            )
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> str:
+        """Chrome トレース形式のJSONを書き出してパスを返す"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=str)
+        return path
+
+
+# 実行中のトレーサー（スクレイパーなど NewsProcessor 外のモジュールから参照する）
+_active_tracer: Optional[RunTracer] = None
+_active_lock = threading.Lock()
+
+
+def activate_tracer(tracer: Optional[RunTracer]) -> None:
+    """trace_span の記録先トレーサーを設定（Noneで解除）"""
+    global _active_tracer
+    with _active_lock:
+        _active_tracer = tracer
+
+
+def get_active_tracer() -> Optional[RunTracer]:
+    """記録先トレーサーを取得（未設定の場合はNone）"""
+    return _active_tracer
+
+
+@contextmanager
+def trace_span(name: str, category: str = "pipeline", **attributes: Any) -> Iterator[TraceSpan]:
+    """
+    実行中のトレーサーにスパンを記録（トレーサー未設定時は記録せずに実行）
+
+    トレーサーの有無にかかわらず TraceSpan を返すため、呼び出し側は add / set を
+    そのまま呼び出せる。
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        yield TraceSpan(name=name, category=category, attributes=dict(attributes))
+        return
+    with tracer.span(name, category, **attributes) as span:
+        yield span
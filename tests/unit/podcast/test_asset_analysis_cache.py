@@ -0,0 +1,72 @@
+"""音声アセット解析キャッシュのテスト"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from src.podcast.assets import asset_analysis_cache
+from src.podcast.assets.asset_analysis_cache import AssetAnalysisCache
+
+
+def _write_tone(path, seconds=1.0, frame_rate=22050, amplitude=6000):
+    t = np.arange(int(seconds * frame_rate)) / frame_rate
+    samples = (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+    AudioSegment(samples.tobytes(), frame_rate=frame_rate, sample_width=2, channels=1).export(
+        str(path), format="wav"
+    )
+
+
+@pytest.fixture
+def asset(tmp_path):
+    path = tmp_path / "intro_jingle.wav"
+    _write_tone(path)
+    return path
+
+
+class TestAssetAnalysisCache:
+    """AssetAnalysisCache のテスト"""
+
+    def test_prepare_resamples_and_records_analysis(self, tmp_path, asset):
+        cache = AssetAnalysisCache(tmp_path / "cache")
+
+        prepared = cache.prepare(asset, 44100, 2)
+
+        assert prepared.duration_seconds == pytest.approx(1.0, abs=0.01)
+        assert prepared.peak_dbfs == pytest.approx(20 * np.log10(6000 / 32768), abs=0.1)
+        converted = AudioSegment.from_wav(prepared.wav_path)
+        assert (converted.frame_rate, converted.channels) == (44100, 2)
+
+    def test_second_run_reuses_cached_entry_without_decoding(self, tmp_path, asset):
+        first = AssetAnalysisCache(tmp_path / "cache").prepare(asset, 44100, 1)
+
+        cache = AssetAnalysisCache(tmp_path / "cache")
+        with patch.object(asset_analysis_cache.AudioSegment, "from_file") as from_file:
+            second = cache.prepare(asset, 44100, 1)
+
+        from_file.assert_not_called()
+        assert second == first
+        assert cache.stats == {"hits": 1, "misses": 0}
+
+    def test_changed_file_content_or_format_is_a_miss(self, tmp_path, asset):
+        cache = AssetAnalysisCache(tmp_path / "cache")
+        first = cache.prepare(asset, 44100, 1)
+
+        other_rate = cache.prepare(asset, 48000, 1)
+        _write_tone(asset, seconds=2.0)
+        changed = cache.prepare(asset, 44100, 1)
+
+        assert other_rate.wav_path != first.wav_path
+        assert changed.digest != first.digest
+        assert changed.duration_seconds == pytest.approx(2.0, abs=0.01)
+        assert cache.stats["misses"] == 3
+
+    def test_load_audio_is_reused_in_memory(self, tmp_path, asset):
+        cache = AssetAnalysisCache(tmp_path / "cache")
+
+        first = cache.load_audio(asset, 44100, 1)
+        second = cache.load_audio(asset, 44100, 1)
+
+        assert first is second
+        assert first.frame_rate == 44100
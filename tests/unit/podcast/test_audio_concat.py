@@ -0,0 +1,93 @@
+"""ストリーミング音声結合のテスト"""
+
+import stat
+import sys
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from src.podcast.tts.audio_concat import StreamingAudioConcatenator, analyze_audio_segment
+
+
+def _tone(seconds, frame_rate=24000, channels=1, amplitude=8000, frequency=440):
+    t = np.arange(int(seconds * frame_rate)) / frame_rate
+    samples = (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+    if channels == 2:
+        samples = np.repeat(samples, 2)
+    return AudioSegment(samples.tobytes(), frame_rate=frame_rate, sample_width=2, channels=channels)
+
+
+@pytest.fixture
+def passthrough_converter(tmp_path):
+    """引数を無視して標準入力のPCMをそのまま出力するエンコーダ代替"""
+    script = tmp_path / "passthrough"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import shutil, sys\n"
+        "shutil.copyfileobj(sys.stdin.buffer, sys.stdout.buffer)\n"
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+class TestStreamingAudioConcatenator:
+    """StreamingAudioConcatenator のテスト"""
+
+    def test_streams_pcm_in_order(self, passthrough_converter):
+        first, second = _tone(0.5), _tone(0.25, frequency=220)
+        concatenator = StreamingAudioConcatenator(converter=passthrough_converter)
+
+        concatenator.append(first)
+        concatenator.append(second)
+        output = concatenator.finish()
+
+        assert output == first.raw_data + second.raw_data
+        assert concatenator.duration_seconds == pytest.approx(0.75)
+
+    def test_levels_match_pydub_on_combined_audio(self, passthrough_converter):
+        segments = [_tone(0.3, amplitude=4000), _tone(0.2, amplitude=12000)]
+        concatenator = StreamingAudioConcatenator(converter=passthrough_converter)
+        for segment in segments:
+            concatenator.append(segment)
+        concatenator.finish()
+
+        combined = segments[0] + segments[1]
+        analysis = concatenator.analysis()
+        assert analysis["segments"] == 2
+        assert analysis["peak_dbfs"] == pytest.approx(combined.max_dBFS, abs=0.01)
+        assert analysis["rms_dbfs"] == pytest.approx(combined.dBFS, abs=0.01)
+        assert analysis == analyze_audio_segment(combined) | {"segments": 2}
+
+    def test_later_segments_are_converted_to_first_format(self, passthrough_converter):
+        concatenator = StreamingAudioConcatenator(converter=passthrough_converter)
+
+        concatenator.append(_tone(0.5, frame_rate=24000))
+        concatenator.append(_tone(0.5, frame_rate=48000, channels=2))
+        output = concatenator.finish()
+
+        assert (concatenator.frame_rate, concatenator.channels) == (24000, 1)
+        assert len(output) == 24000 * 2
+        assert concatenator.duration_seconds == pytest.approx(1.0)
+
+    def test_silence_has_no_level(self, passthrough_converter):
+        concatenator = StreamingAudioConcatenator(converter=passthrough_converter)
+        concatenator.append(AudioSegment.silent(duration=500, frame_rate=24000))
+        concatenator.finish()
+
+        assert concatenator.analysis()["rms_dbfs"] is None
+
+    def test_finish_without_segments_raises(self):
+        with pytest.raises(RuntimeError):
+            StreamingAudioConcatenator().finish()
+
+    def test_encoder_failure_is_reported(self, tmp_path):
+        script = tmp_path / "failing"
+        script.write_text(f"#!{sys.executable}\nimport sys\nsys.stderr.write('bad input')\nsys.exit(1)\n")
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        concatenator = StreamingAudioConcatenator(converter=str(script))
+
+        with pytest.raises(RuntimeError, match="bad input"):
+            # 大きな書き込みはパイプ切断、小さな書き込みは終了コードで検出される
+            concatenator.append(_tone(10))
+            concatenator.finish()
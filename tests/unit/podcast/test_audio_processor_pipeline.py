@@ -0,0 +1,146 @@
+"""AudioProcessor のFFmpeg処理モードのテスト"""
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.podcast.assets.asset_analysis_cache import PreparedAsset
+from src.podcast.audio import audio_processor as audio_processor_module
+from src.podcast.audio.audio_processor import AudioProcessor
+
+LOUDNESS_JSON = {
+    "input_i": "-23.5",
+    "input_tp": "-4.2",
+    "input_lra": "5.1",
+    "input_thresh": "-33.9",
+}
+
+
+class FakeFFmpeg:
+    """subprocess.run の代替（測定はJSONを返し、それ以外は出力ファイルを作成）"""
+
+    def __init__(self, fail_on_filter_complex=False):
+        self.commands = []
+        self.fail_on_filter_complex = fail_on_filter_complex
+
+    def __call__(self, cmd, check=False, **kwargs):
+        self.commands.append(cmd)
+        if "null" in cmd:
+            stderr = "[Parsed_loudnorm_0]\n" + json.dumps(LOUDNESS_JSON, indent=1)
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr=stderr)
+        if self.fail_on_filter_complex and "-filter_complex" in cmd and "loudnorm" in cmd[cmd.index("-filter_complex") + 1]:
+            raise subprocess.CalledProcessError(1, cmd, stderr=b"filter error")
+        Path(cmd[-1]).write_bytes(b"mp3")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    def filter_graphs(self):
+        return [cmd[cmd.index("-filter_complex") + 1] for cmd in self.commands if "-filter_complex" in cmd]
+
+
+def _prepare(path, sample_rate, channels):
+    wav_path = Path(f"{path}.{sample_rate}.wav")
+    wav_path.write_bytes(b"wav")
+    return PreparedAsset(
+        source_path=path,
+        digest="0" * 64,
+        wav_path=str(wav_path),
+        sample_rate=sample_rate,
+        channels=channels,
+        duration_seconds=5.0,
+    )
+
+
+@pytest.fixture
+def processor(tmp_path):
+    processor = AudioProcessor(
+        str(tmp_path / "assets"), ffmpeg_path="ffmpeg", asset_cache_dir=str(tmp_path / "asset_cache")
+    )
+    processor.temp_dir = tmp_path
+    with patch.object(processor.asset_cache, "prepare", side_effect=_prepare):
+        yield processor
+
+
+@pytest.fixture
+def music_assets(tmp_path, processor):
+    assets = {}
+    for asset_type in ("intro_jingle", "outro_jingle", "background_music"):
+        path = tmp_path / f"{asset_type}.mp3"
+        path.write_bytes(b"asset")
+        assets[asset_type] = str(path)
+    with patch.object(processor.asset_manager, "get_all_assets", return_value=assets):
+        yield assets
+
+
+def _settings(**overrides):
+    settings = AudioProcessor.DEFAULT_SETTINGS.copy()
+    settings.update(overrides)
+    return settings
+
+
+class TestSinglePassPipeline:
+    """single_pass モードのテスト"""
+
+    def test_measures_once_and_renders_in_one_filtergraph(self, tmp_path, processor, music_assets):
+        ffmpeg = FakeFFmpeg()
+        voice = tmp_path / "voice.mp3"
+        voice.write_bytes(b"voice")
+
+        with patch.object(audio_processor_module.subprocess, "run", ffmpeg):
+            output = processor._process_with_ffmpeg(
+                voice, tmp_path / "out.mp3", _settings(), {"title": "マーケットニュース"}
+            )
+
+        assert output == tmp_path / "out.mp3"
+        assert len(ffmpeg.commands) == 2
+        render = ffmpeg.commands[1]
+        graph = ffmpeg.filter_graphs()[0]
+        assert "measured_I=-23.5" in graph and "linear=true" in graph
+        assert "amix=inputs=2:duration=first" in graph
+        assert "[intro][voice_bgm][outro]concat=n=3" in graph
+        # アセットは変換済みWAV（解析キャッシュ）を入力にする
+        assert f"{music_assets['background_music']}.44100.wav" in render
+        assert render[render.index("-map") + 1] == "[final_mixed]"
+        assert "libmp3lame" in render and "title=マーケットニュース" in render
+        assert set(processor.get_timing_report()["stages"]) == {"measure", "assets", "render"}
+        assert processor.get_timing_report()["mode"] == "single_pass"
+
+    def test_without_music_only_normalizes_and_encodes(self, tmp_path, processor):
+        ffmpeg = FakeFFmpeg()
+
+        with patch.object(audio_processor_module.subprocess, "run", ffmpeg):
+            processor._process_with_ffmpeg(
+                tmp_path / "voice.mp3", tmp_path / "out.mp3", _settings(enable_music=False)
+            )
+
+        graph = ffmpeg.filter_graphs()[0]
+        assert "amix" not in graph and "concat" not in graph
+        assert ffmpeg.commands[1][ffmpeg.commands[1].index("-map") + 1] == "[voice]"
+
+    def test_falls_back_to_staged_pipeline_on_failure(self, tmp_path, processor, music_assets):
+        ffmpeg = FakeFFmpeg(fail_on_filter_complex=True)
+
+        with patch.object(audio_processor_module.subprocess, "run", ffmpeg):
+            output = processor._process_with_ffmpeg(tmp_path / "voice.mp3", tmp_path / "out.mp3", _settings())
+
+        assert output.exists()
+        assert processor.get_timing_report()["mode"] == "staged"
+
+
+class TestStagedPipeline:
+    """staged モード（従来方式）のテスト"""
+
+    def test_reports_each_stage(self, tmp_path, processor, music_assets):
+        ffmpeg = FakeFFmpeg()
+
+        with patch.object(audio_processor_module.subprocess, "run", ffmpeg):
+            processor._process_with_ffmpeg(
+                tmp_path / "voice.mp3", tmp_path / "out.mp3", _settings(pipeline_mode="staged")
+            )
+
+        report = processor.get_timing_report()
+        assert report["mode"] == "staged"
+        assert set(report["stages"]) == {"measure", "normalize", "mix", "encode"}
+        assert len(ffmpeg.commands) == 4
@@ -0,0 +1,126 @@
+"""TTSセグメント合成（並列化・キャッシュ）のテスト"""
+
+import random
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("google.cloud.texttospeech")
+
+from src.podcast.tts import gemini_tts_engine
+from src.podcast.tts.gemini_tts_engine import GeminiTTSEngine
+from src.podcast.tts.segment_cache import TTSSegmentCache
+
+
+class FakeSynthesizer:
+    """セグメント本文をそのまま音声データとして返す合成関数"""
+
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.fail_on = set(fail_on or [])
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, segment):
+        with self._lock:
+            self.calls.append(segment)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(random.uniform(0, 0.01))
+            if segment in self.fail_on:
+                raise RuntimeError("quota exceeded")
+            return f"audio:{segment}".encode("utf-8")
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+class TestTTSSegmentSynthesis:
+    """GeminiTTSEngine._synthesize_segments のテスト"""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        with patch.object(gemini_tts_engine.time, "sleep"):
+            yield
+
+    def _engine(self, cache_dir, synthesizer, **kwargs):
+        with patch.object(gemini_tts_engine.texttospeech, "TextToSpeechClient"):
+            engine = GeminiTTSEngine(cache_dir=str(cache_dir), **kwargs)
+        engine._synthesize_segment = synthesizer
+        return engine
+
+    def test_results_are_reassembled_in_order(self, tmp_path):
+        segments = [f"セグメント{i}" for i in range(12)]
+        synthesizer = FakeSynthesizer()
+        engine = self._engine(tmp_path, synthesizer, max_concurrency=4, requests_per_minute=6000)
+
+        audio = engine._synthesize_segments(segments)
+
+        assert audio == [f"audio:{segment}".encode("utf-8") for segment in segments]
+        assert sorted(synthesizer.calls) == sorted(segments)
+        assert synthesizer.max_in_flight <= 4
+
+    def test_rerun_only_synthesizes_changed_segments(self, tmp_path):
+        segments = ["冒頭の挨拶", "日銀の話題", "為替の話題", "締めの挨拶"]
+        self._engine(tmp_path, FakeSynthesizer())._synthesize_segments(segments)
+
+        edited = list(segments)
+        edited[2] = "為替の話題（修正版）"
+        synthesizer = FakeSynthesizer()
+        audio = self._engine(tmp_path, synthesizer)._synthesize_segments(edited)
+
+        assert synthesizer.calls == ["為替の話題（修正版）"]
+        assert audio[2] == "audio:為替の話題（修正版）".encode("utf-8")
+        assert audio[0] == "audio:冒頭の挨拶".encode("utf-8")
+
+    def test_voice_config_is_part_of_cache_key(self, tmp_path):
+        self._engine(tmp_path, FakeSynthesizer())._synthesize_segments(["本文"])
+
+        synthesizer = FakeSynthesizer()
+        engine = self._engine(tmp_path, synthesizer)
+        engine.update_voice_config({"speaking_rate": 1.2})
+        engine._synthesize_segments(["本文"])
+
+        assert synthesizer.calls == ["本文"]
+
+    def test_failed_segments_are_retried_on_next_run(self, tmp_path):
+        segments = ["一", "二", "三"]
+        with pytest.raises(RuntimeError):
+            self._engine(tmp_path, FakeSynthesizer(fail_on={"二"}))._synthesize_segments(segments)
+
+        synthesizer = FakeSynthesizer()
+        audio = self._engine(tmp_path, synthesizer)._synthesize_segments(segments)
+
+        assert synthesizer.calls == ["二"]
+        assert len(audio) == 3
+
+    def test_quality_check_reuses_concat_analysis(self, tmp_path):
+        engine = self._engine(tmp_path, FakeSynthesizer())
+        analysis = {"duration_seconds": 60.0, "frame_rate": 24000, "peak_dbfs": -1.0, "rms_dbfs": -20.0}
+
+        with patch.object(gemini_tts_engine.AudioSegment, "from_file") as from_file:
+            result = engine.validate_audio_quality(b"ID3" + b"\0" * 2000, 60.0, analysis=analysis)
+
+        from_file.assert_not_called()
+        assert result["valid"]
+        assert result["analysis_source"] == "stream"
+        assert result["rms_dbfs"] == -20.0
+
+
+class TestTTSSegmentCache:
+    """TTSSegmentCache のテスト"""
+
+    def test_round_trip_and_stats(self, tmp_path):
+        cache = TTSSegmentCache(tmp_path)
+        key = TTSSegmentCache.make_key("本文", {"voice_name": "ja-JP-Neural2-D"}, "model")
+
+        assert cache.get(key) is None
+        cache.put(key, b"mp3")
+
+        assert cache.get(key) == b"mp3"
+        assert cache.stats == {"hits": 1, "misses": 1, "stores": 1}
+        assert key != TTSSegmentCache.make_key("本文", {"voice_name": "ja-JP-Neural2-B"}, "model")
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+"""
+記事コーパスの差分アーカイブのユニットテスト
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.config.app_config import SupabaseConfig
+from src.database.supabase_client import SupabaseClient
+from src.rag.archive_manager import ArchiveManager
+
+
+def _article(i: int, body: str = None):
+    return {
+        "title": f"記事{i}",
+        "summary": f"要約{i}",
+        "body": body or f"記事{i}の本文です。" * 5,
+        "source": "Reuters",
+        "url": f"https://example.com/{i}",
+        "category": "市場動向",
+        "region": "japan",
+    }
+
+
+class TestIncrementalCorpusArchive(unittest.TestCase):
+    """ArchiveManager.archive_articles の差分同期のテスト"""
+
+    def setUp(self):
+        config = SupabaseConfig(enabled=True, chunk_size=600, chunk_overlap=100, max_chunks_per_document=50)
+        self.supabase = MagicMock()
+        self.supabase.is_available.return_value = True
+        self.supabase.upsert_document.return_value = {"id": "doc-1"}
+        self.supabase.create_chunks.side_effect = lambda rows: rows
+        self.supabase.upsert_chunks.side_effect = lambda rows: len(rows)
+        self.embedder = MagicMock()
+        self.embedder.generate_embeddings_batch.side_effect = lambda texts: [
+            np.ones(384, dtype=np.float32) for _ in texts
+        ]
+        self.embedder.validate_embedding.return_value = True
+
+        with patch("src.rag.archive_manager.get_supabase_client", return_value=self.supabase), \
+                patch("src.rag.archive_manager.get_embedding_generator", return_value=self.embedder):
+            self.manager = ArchiveManager(config)
+        self.manager._save_to_storage = MagicMock()
+
+    def _stored_rows(self, records):
+        return [dict(record, id=f"chunk-{i}") for i, record in enumerate(records)]
+
+    def test_first_archive_embeds_all_chunks(self):
+        self.supabase.get_document_by_date.return_value = None
+
+        self.manager.archive_articles([_article(1), _article(2)])
+
+        stats = self.manager.last_archive_stats
+        self.assertEqual(stats["embedded"], 2)
+        self.assertEqual(stats["reused"], 0)
+        self.supabase.delete_chunks_by_document_id.assert_not_called()
+        stored = self.supabase.create_chunks.call_args[0][0]
+        self.assertTrue(all("content_hash" in row["metadata"] for row in stored))
+
+    def test_rerun_embeds_only_new_and_changed_chunks(self):
+        """再実行では新規・変更チャンクのみ埋め込み、消えたチャンクのみ削除する"""
+        self.supabase.get_document_by_date.return_value = None
+        self.manager.archive_articles([_article(1), _article(2), _article(3)])
+        stored_rows = self._stored_rows(self.supabase.create_chunks.call_args[0][0])
+
+        self.supabase.reset_mock()
+        self.embedder.generate_embeddings_batch.reset_mock()
+        self.supabase.get_document_by_date.return_value = {"id": "doc-1"}
+        self.supabase.get_chunks_by_document_id.return_value = stored_rows
+
+        # 記事1は変更なし、記事2は本文変更、記事3は削除、記事4は新規
+        self.manager.archive_articles([_article(1), _article(2, body="更新された本文。" * 5), _article(4)])
+
+        stats = self.manager.last_archive_stats
+        self.assertEqual(stats["reused"], 1)
+        self.assertEqual(stats["embedded"], 2)
+        self.assertEqual(stats["deleted"], 2)
+        embedded_texts = self.embedder.generate_embeddings_batch.call_args[0][0]
+        self.assertEqual(len(embedded_texts), 2)
+        self.assertTrue(all("記事1" not in text for text in embedded_texts))
+        self.supabase.delete_chunks_by_document_id.assert_not_called()
+        self.assertEqual(
+            sorted(self.supabase.delete_chunks_by_ids.call_args[0][0]), ["chunk-1", "chunk-2"]
+        )
+
+    def _archive_with_shifted_rows(self):
+        """保存済みチャンクの位置がずれた状態で同じ記事を再アーカイブする"""
+        self.supabase.get_document_by_date.return_value = None
+        self.manager.archive_articles([_article(1), _article(2)])
+        stored_rows = [
+            dict(row, chunk_index=row["chunk_index"] + 10)
+            for row in self._stored_rows(self.supabase.create_chunks.call_args[0][0])
+        ]
+
+        self.supabase.reset_mock()
+        self.supabase.get_document_by_date.return_value = {"id": "doc-1"}
+        self.supabase.get_chunks_by_document_id.return_value = stored_rows
+        self.manager._update_keyword_index = MagicMock()
+        self.manager.archive_articles([_article(1), _article(2)])
+
+    def test_reused_chunks_with_shifted_index_are_upserted(self):
+        """位置が変わった再利用チャンクはUpsertされ、保存件数が統計に反映される"""
+        self._archive_with_shifted_rows()
+
+        stats = self.manager.last_archive_stats
+        self.assertEqual(stats["embedded"], 0)
+        self.assertEqual(stats["updated"], 2)
+        self.assertEqual(len(self.manager._update_keyword_index.call_args[0][1]), 2)
+
+    def test_failed_upsert_is_not_reported_or_indexed(self):
+        """Upsertに失敗した行は更新件数に含めず、キーワードインデックスにも渡さない"""
+        self.supabase.upsert_chunks.side_effect = lambda rows: 0
+
+        self._archive_with_shifted_rows()
+
+        self.assertEqual(self.manager.last_archive_stats["updated"], 0)
+        self.assertEqual(self.manager._update_keyword_index.call_args[0][1], [])
+
+    def test_falls_back_to_full_rebuild_when_chunks_unavailable(self):
+        self.supabase.get_document_by_date.return_value = {"id": "doc-1"}
+        self.supabase.get_chunks_by_document_id.return_value = None
+
+        self.manager.archive_articles([_article(1), _article(2)])
+
+        self.supabase.delete_chunks_by_document_id.assert_called_once_with("doc-1")
+        self.assertEqual(self.manager.last_archive_stats["embedded"], 2)
+
+
+
+class TestSupabaseChunkUpsertRest(unittest.TestCase):
+    """SupabaseClient.upsert_chunks のRESTフォールバックのテスト"""
+
+    def test_upsert_chunks_merges_duplicates_over_rest(self):
+        client = SupabaseClient(
+            SupabaseConfig(enabled=True, url="https://example.supabase.co", anon_key="", service_role_key="key")
+        )
+        rows = [
+            {"id": "chunk-1", "document_id": "doc-1", "content": "本文", "embedding": [0.1], "chunk_index": 1}
+        ]
+        response = MagicMock()
+        response.json.return_value = rows
+
+        with patch("src.database.supabase_client.requests.post", return_value=response) as post:
+            count = client.upsert_chunks(rows)
+
+        self.assertEqual(count, 1)
+        self.assertIn("resolution=merge-duplicates", post.call_args.kwargs["headers"]["Prefer"])
+        self.assertEqual(post.call_args.kwargs["json"][0]["id"], "chunk-1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+記事の一括アップサートのユニットテスト
+"""
+
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import event
+
+from src.database.models import Article
+
+
+def test_upsert_returns_new_and_existing_ids_per_row(test_db, sample_articles):
+    """入力行ごとに既存IDと新規IDが返される"""
+    existing_id, _ = test_db.save_article(sample_articles[0])
+
+    results = test_db.upsert_articles(sample_articles)
+
+    assert len(results) == len(sample_articles)
+    assert results[0] == (existing_id, False)
+    assert all(is_new for _, is_new in results[1:])
+    assert len({article_id for article_id, _ in results}) == len(sample_articles)
+
+    with test_db.get_session() as session:
+        assert session.query(Article).count() == len(sample_articles)
+
+
+def test_upsert_is_idempotent(test_db, sample_articles):
+    """2回目のアップサートでは同じIDが既存として返される"""
+    first = test_db.upsert_articles(sample_articles)
+    second = test_db.upsert_articles(sample_articles)
+
+    assert [article_id for article_id, _ in second] == [article_id for article_id, _ in first]
+    assert not any(is_new for _, is_new in second)
+
+
+def test_upsert_handles_duplicates_and_missing_url(test_db, sample_articles):
+    """入力内の重複URLは最初の行のみ新規、URLなしの行は (None, False)"""
+    duplicate = dict(sample_articles[0], url=sample_articles[0]["url"] + "?utm_source=feed")
+    articles = [sample_articles[0], duplicate, {"title": "URLなし"}]
+
+    results = test_db.upsert_articles(articles)
+
+    assert results[0][1] is True
+    assert results[1] == (results[0][0], False)
+    assert results[2] == (None, False)
+
+
+def test_upsert_uses_single_insert_per_chunk(test_db, sample_articles):
+    """RETURNING対応環境ではチャンクごとに1回のINSERTで保存される"""
+    if test_db._insert_returning_construct() is None:
+        return
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_db.engine, "before_cursor_execute", record)
+    try:
+        test_db.upsert_articles(sample_articles, chunk_size=2)
+    finally:
+        event.remove(test_db.engine, "before_cursor_execute", record)
+
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 2
+    assert all("RETURNING" in s.upper() for s in inserts)
+
+
+def test_upsert_fallback_without_returning(test_db, sample_articles):
+    """RETURNING非対応の環境でも行ごとの結果が返される"""
+    existing_id, _ = test_db.save_article(sample_articles[0])
+
+    with patch.object(test_db, "_insert_returning_construct", return_value=None):
+        results = test_db.upsert_articles(sample_articles)
+
+    assert results[0] == (existing_id, False)
+    assert all(article_id and is_new for article_id, is_new in results[1:])
+    assert test_db.save_articles_bulk(sample_articles) == []
+
+
+def test_news_processor_saves_through_upsert(sample_articles):
+    """NewsProcessor.save_articles_to_db が一括アップサートを使用する"""
+    from src.core.news_processor import NewsProcessor
+
+    processor = NewsProcessor.__new__(NewsProcessor)
+    processor.logger = MagicMock()
+    processor.db_manager = MagicMock()
+    processor.db_manager.upsert_articles.return_value = [(1, True), (2, False), (3, True)]
+
+    new_ids = processor.save_articles_to_db(sample_articles)
+
+    assert new_ids == [1, 3]
+    processor.db_manager.upsert_articles.assert_called_once_with(sample_articles)
+    processor.db_manager.save_article.assert_not_called()
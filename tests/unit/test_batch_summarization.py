@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""
+複数記事のバッチ要約のユニットテスト
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config.app_config import AIConfig
+
+
+def _section(region: str, category: str, summary: str) -> str:
+    return f"## 地域\n{region}\n\n## カテゴリ\n{category}\n\n## 要約\n{summary}\n"
+
+
+class TestBatchSummarizer(unittest.TestCase):
+    """ai_summarizer のバッチ処理のテスト"""
+
+    def setUp(self):
+        pytest.importorskip("google.generativeai")
+        from src.legacy import ai_summarizer
+
+        self.summarizer = ai_summarizer
+
+    def test_batches_respect_size_and_token_budget(self):
+        """バッチが最大件数とトークン予算で分割される"""
+        prompt_tokens = self.summarizer.estimate_tokens(
+            self.summarizer.config.AI_BATCH_PROCESS_PROMPT_TEMPLATE
+        )
+        texts = ["あ" * 100] * 5 + ["い" * 1000]
+
+        batches = self.summarizer.build_article_batches(
+            texts, token_budget=prompt_tokens + 300, max_batch_size=2
+        )
+
+        self.assertEqual(batches, [[0, 1], [2, 3], [4], [5]])
+
+    def test_parse_batch_response_by_article_number(self):
+        """見出し番号に従って記事ごとの結果に分解され、欠けた記事はNoneになる"""
+        response = (
+            "=== 記事 2 ===\n" + _section("japan", "金融政策", "日銀が金利を据え置いた。") + "\n---\n"
+            "=== 記事 1 ===\n" + _section("[usa]", "市場動向", "米国株が上昇した。")
+        )
+
+        results = self.summarizer.parse_batch_response(response, 3)
+
+        self.assertEqual(results[0]["region"], "usa")
+        self.assertEqual(results[0]["summary"], "米国株が上昇した。")
+        self.assertEqual(results[1]["category"], "金融政策")
+        self.assertEqual(results[1]["summary"], "日銀が金利を据え置いた。")
+        self.assertIsNone(results[2])
+
+    def test_batch_sends_one_request(self):
+        """複数記事が1回のリクエストで送信される"""
+        texts = ["米連邦準備制度理事会は政策金利を据え置くことを決定した。" * 3] * 2
+        client = MagicMock()
+        client.generate.return_value = SimpleNamespace(
+            text="=== 記事 1 ===\n" + _section("usa", "金融政策", "据え置き。")
+            + "=== 記事 2 ===\n" + _section("usa", "金融政策", "据え置き2。")
+        )
+
+        results = self.summarizer.process_articles_batch_with_ai(client, texts)
+
+        client.generate.assert_called_once()
+        self.assertIn("=== 記事 2 ===", client.generate.call_args[0][0])
+        self.assertEqual([r["summary"] for r in results], ["据え置き。", "据え置き2。"])
+
+
+class TestNewsProcessorBatchAnalysis(unittest.TestCase):
+    """NewsProcessor のバッチ要約とフォールバックのテスト"""
+
+    def _processor(self, ai_config: AIConfig):
+        from src.core.news_processor import NewsProcessor
+
+        processor = NewsProcessor.__new__(NewsProcessor)
+        processor.logger = MagicMock()
+        processor.db_manager = MagicMock()
+        processor.config = SimpleNamespace(ai=ai_config)
+        processor._llm_response_cache = None
+        processor._llm_dispatchers = {}
+        return processor
+
+    def _articles(self, count: int):
+        return [
+            SimpleNamespace(id=i + 1, body=f"本文{i}" * 30, content_hash=f"hash{i}")
+            for i in range(count)
+        ]
+
+    def test_unparsed_articles_fall_back_to_single_path(self):
+        """バッチで解析できなかった記事のみ単独処理される"""
+        processor = self._processor(AIConfig(batch_max_articles=3))
+        articles = self._articles(3)
+        batch = MagicMock(return_value=[{"summary": "a"}, None, {"summary": "c"}])
+        single = MagicMock(return_value={"summary": "b"})
+
+        with patch("src.core.news_processor.build_article_batches", return_value=[[0, 1, 2]]), \
+                patch("src.core.news_processor.process_articles_batch_with_ai", batch), \
+                patch("src.core.news_processor.process_article_with_ai", single):
+            processor._analyze_articles_with_ai(MagicMock(), articles, operation="test")
+
+        batch.assert_called_once()
+        single.assert_called_once()
+        self.assertEqual(single.call_args[0][1], articles[1].body)
+        saved = {call.args[0]: call.args[1]["summary"] for call in processor.db_manager.save_ai_analysis.call_args_list}
+        self.assertEqual(saved, {1: "a", 2: "b", 3: "c"})
+
+    def test_batch_disabled_uses_single_path(self):
+        """バッチ要約が無効な場合は記事ごとに処理される"""
+        processor = self._processor(AIConfig(batch_summarization_enabled=False))
+        articles = self._articles(2)
+        batch = MagicMock()
+        single = MagicMock(return_value={"summary": "s"})
+
+        with patch("src.core.news_processor.process_articles_batch_with_ai", batch), \
+                patch("src.core.news_processor.process_article_with_ai", single):
+            processor._analyze_articles_with_ai(MagicMock(), articles, operation="test")
+
+        batch.assert_not_called()
+        self.assertEqual(single.call_count, 2)
+        self.assertEqual(processor.db_manager.save_ai_analysis.call_count, 2)
+
+    def test_duplicate_content_is_analyzed_once(self):
+        """同一内容の記事は1回だけ分析され、結果が全件に保存される"""
+        processor = self._processor(AIConfig(batch_summarization_enabled=False))
+        articles = self._articles(2)
+        articles.append(SimpleNamespace(id=3, body=articles[0].body, content_hash="hash0"))
+        single = MagicMock(return_value={"summary": "s"})
+
+        with patch("src.core.news_processor.process_article_with_ai", single):
+            processor._analyze_articles_with_ai(MagicMock(), articles, operation="test")
+
+        self.assertEqual(single.call_count, 2)
+        saved_ids = sorted(call.args[0] for call in processor.db_manager.save_ai_analysis.call_args_list)
+        self.assertEqual(saved_ids, [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
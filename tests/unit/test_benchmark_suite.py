@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""
+オフラインベンチマーク（tools/performance/benchmarks）のユニットテスト
+"""
+
+import time
+
+import pytest
+import requests
+
+from tools.performance.benchmarks import (
+    BenchmarkHistory,
+    BenchmarkResult,
+    BenchmarkRunner,
+    generate_corpus,
+)
+from tools.performance.benchmarks.__main__ import main
+from tools.performance.benchmarks.fixtures import LocalFixtureServer
+from tools.performance.benchmarks.harness import BenchmarkContext, BenchmarkSkipped, BenchmarkStage
+from tools.performance.benchmarks.stages import get_stages
+
+
+def test_corpus_is_deterministic_and_contains_near_duplicates():
+    first = generate_corpus(200, seed=7)
+    second = generate_corpus(200, seed=7)
+    assert first == second
+    assert generate_corpus(200, seed=8) != first
+    assert len({article["url"] for article in first}) == 200
+    # 近似重複は既存記事の本文を先頭に含む
+    bodies = [article["body"] for article in first]
+    assert any(
+        other != body and other.startswith(body) for body in bodies for other in bodies
+    )
+
+
+def test_fixture_server_serves_recorded_pages_for_bloomberg_extraction():
+    from scrapers.bloomberg import create_bloomberg_fetcher, scrape_bloomberg_article_body
+
+    with LocalFixtureServer() as server:
+        assert requests.get(server.url_for("missing_fixture"), timeout=5).status_code == 404
+        fetcher = create_bloomberg_fetcher()
+        try:
+            body = scrape_bloomberg_article_body(
+                server.url_for("bloomberg_article", "000001"), fetcher=fetcher
+            )
+        finally:
+            fetcher.close()
+        assert server.request_count == 2
+    assert len(body) > 500
+
+
+def _stage(name, durations):
+    """呼び出しごとに durations の値（ミリ秒）だけ待機する処理段"""
+    calls = iter(durations)
+
+    def run(_state):
+        time.sleep(next(calls) / 1000)
+        return 10
+
+    return BenchmarkStage(name, lambda context, size: None, run)
+
+
+def test_history_baseline_and_regression_detection(tmp_path):
+    history = BenchmarkHistory(str(tmp_path / "history.db"))
+    assert history.baseline("stage", 10) is None
+
+    history.record([BenchmarkResult(stage="stage", size=10, items=10, wall_ms=10.0)])
+    history.record([BenchmarkResult(stage="stage", size=10, items=10, wall_ms=12.0)])
+    history.record([BenchmarkResult(stage="stage", size=10, status="skipped", wall_ms=0.0)])
+    assert history.baseline("stage", 10) == pytest.approx(11.0)
+
+    runner = BenchmarkRunner([], history=history, threshold=0.2, min_delta_ms=5.0)
+    slow = runner.check_regression(BenchmarkResult(stage="stage", size=10, wall_ms=30.0))
+    assert slow.regression and slow.baseline_ms == pytest.approx(11.0)
+    # 増加率はしきい値を超えるが、増加時間がノイズ下限未満なら劣化としない
+    noisy = runner.check_regression(BenchmarkResult(stage="stage", size=10, wall_ms=14.0))
+    assert not noisy.regression
+    other_size = runner.check_regression(BenchmarkResult(stage="stage", size=100, wall_ms=30.0))
+    assert other_size.baseline_ms is None and not other_size.regression
+
+
+def test_runner_records_median_skips_and_errors(tmp_path):
+    def skipped_setup(context, size):
+        raise BenchmarkSkipped("依存ライブラリなし")
+
+    def failing_run(state):
+        raise RuntimeError("boom")
+
+    history = BenchmarkHistory(str(tmp_path / "history.db"))
+    runner = BenchmarkRunner(
+        [
+            _stage("sleep", [5, 1, 30, 1]),
+            BenchmarkStage("skipped", skipped_setup, lambda state: 0),
+            BenchmarkStage("error", lambda context, size: None, failing_run),
+        ],
+        sizes=[10],
+        repeats=3,
+        history=history,
+    )
+    results = {r.stage: r for r in runner.run()}
+
+    sleep = results["sleep"]
+    assert sleep.status == "ok" and sleep.repeats == 3 and sleep.items == 10
+    assert 4 <= sleep.wall_ms < 30 and sleep.wall_ms_min < sleep.wall_ms
+    assert sleep.peak_memory_mb is not None
+    assert results["skipped"].status == "skipped"
+    assert results["error"].status == "error" and "boom" in results["error"].note
+    assert history.baseline("sleep", 10) == pytest.approx(sleep.wall_ms)
+    assert history.baseline("error", 10) is None
+
+
+def test_pipeline_stages_run_on_small_corpus():
+    runner = BenchmarkRunner(
+        get_stages(["reuters_extract_body", "content_dedup", "db_save_bulk", "html_generate",
+                    "rag_chunking", "embedding"]),
+        sizes=[5],
+        repeats=1,
+        context=BenchmarkContext(seed=1),
+        measure_memory=False,
+    )
+    results = runner.run(record=False)
+    assert [r.status for r in results] == ["ok"] * len(results), [r.note for r in results]
+    assert all(r.items > 0 for r in results)
+
+
+def test_unknown_stage_is_rejected():
+    with pytest.raises(ValueError):
+        get_stages(["no_such_stage"])
+
+
+def test_cli_exits_nonzero_on_regression(tmp_path, capsys):
+    history_path = str(tmp_path / "history.db")
+    BenchmarkHistory(history_path).record(
+        [BenchmarkResult(stage="reuters_extract_body", size=5, items=5, wall_ms=0.001)]
+    )
+    args = ["--sizes", "5", "--stages", "reuters_extract_body", "--repeats", "1", "--no-memory",
+            "--history", history_path, "--threshold", "0.2"]
+    # 基準値が極端に小さいため、5ページの解析時間（ノイズ下限 5ms 超）で劣化と判定される
+    assert main(args) == 1
+    output = capsys.readouterr()
+    assert "reuters_extract_body" in output.out
+    assert "性能劣化を検出しました: reuters_extract_body@5" in output.err
+    assert main(args + ["--threshold", "1000000", "--json"]) == 0
+
+
+def test_fake_llm_client_round_trips_batch_summaries():
+    pytest.importorskip("google.generativeai")
+    from src.legacy.ai_summarizer import process_articles_batch_with_ai
+    from tools.performance.benchmarks.fake_llm import FakeLLMClient
+
+    client = FakeLLMClient(latency_ms=0)
+    texts = [article["body"] for article in generate_corpus(3, seed=3)]
+    results = process_articles_batch_with_ai(client, texts)
+    assert client.call_count == 1
+    assert all(result and result["summary"] for result in results)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+"""
+記事本文の永続キャッシュ（条件付きGET）のユニットテスト
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+
+from scrapers.body_cache import ArticleBodyCache
+
+
+class TestArticleBodyCache(unittest.TestCase):
+    """ArticleBodyCacheのテスト"""
+
+    def setUp(self):
+        import tempfile
+        import os
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = ArticleBodyCache(os.path.join(self.tmpdir.name, "bodies.db"))
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_entries_keyed_by_normalized_url(self):
+        """トラッキングパラメータ違いのURLは同一エントリとして扱われる"""
+        self.cache.put("https://example.com/news/a?utm_source=x", "本文", etag='"v1"')
+
+        entry = self.cache.get("https://example.com/news/a")
+
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry.body, "本文")
+        self.assertEqual(self.cache.conditional_headers(entry), {"If-None-Match": '"v1"'})
+
+    def test_lookup_known_requires_db_registration(self):
+        """DB保存済みとして登録された記事のみネットワーク不要で返す"""
+        url = "https://example.com/news/b"
+        self.cache.put(url, "保存済み本文", last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+
+        self.assertIsNone(self.cache.lookup_known(url))
+
+        self.cache.set_known_url_hashes([self.cache.url_hash(url)])
+
+        self.assertEqual(self.cache.lookup_known(url), "保存済み本文")
+        self.assertEqual(self.cache.stats["known_hits"], 1)
+
+    def test_bloomberg_revalidates_with_conditional_get(self):
+        """キャッシュ済みの記事は条件付きGETで再検証され、304ならキャッシュを使う"""
+        from scrapers.bloomberg import scrape_bloomberg_article_body
+
+        url = "https://www.bloomberg.co.jp/news/articles/abc"
+        self.cache.put(url, "キャッシュ済み本文", etag='"etag-1"')
+        fetcher = MagicMock()
+        fetcher.get.return_value = MagicMock(status_code=304)
+
+        body = scrape_bloomberg_article_body(url, fetcher=fetcher, body_cache=self.cache)
+
+        self.assertEqual(body, "キャッシュ済み本文")
+        self.assertEqual(
+            fetcher.get.call_args.kwargs["headers"], {"If-None-Match": '"etag-1"'}
+        )
+        self.assertEqual(self.cache.stats["revalidated"], 1)
+
+    def test_bloomberg_stores_validators_on_fresh_fetch(self):
+        """新規取得した本文は検証子とともに保存される"""
+        from scrapers.bloomberg import scrape_bloomberg_article_body
+
+        url = "https://www.bloomberg.co.jp/news/articles/def"
+        paragraph = "欧州中央銀行は政策金利を据え置き、インフレ見通しを上方修正した。" * 2
+        response = MagicMock(status_code=200)
+        response.content = f"<article><p>{paragraph}</p></article>".encode("utf-8")
+        response.apparent_encoding = "utf-8"
+        response.headers = {"ETag": '"etag-2"', "Last-Modified": "Thu, 02 Jan 2025 00:00:00 GMT"}
+        fetcher = MagicMock()
+        fetcher.get.return_value = response
+
+        scrape_bloomberg_article_body(url, fetcher=fetcher, body_cache=self.cache)
+
+        entry = self.cache.get(url)
+        self.assertEqual(entry.body, paragraph)
+        self.assertEqual(entry.etag, '"etag-2"')
+        self.assertEqual(entry.last_modified, "Thu, 02 Jan 2025 00:00:00 GMT")
+
+
+def test_get_url_hashes_with_body(test_db, sample_articles):
+    """本文付きで保存済みの記事のハッシュのみが返される"""
+    sample_articles[2]["body"] = ""
+    sample_articles.append(
+        {**sample_articles[0], "url": "https://example.com/failed", "body": "[本文取得失敗/空]"}
+    )
+    for article in sample_articles:
+        test_db.save_article(article)
+
+    cache_helper = ArticleBodyCache(":memory:")
+    hashes = [cache_helper.url_hash(a["url"]) for a in sample_articles]
+    hashes.append(cache_helper.url_hash("https://example.com/unknown"))
+
+    found = test_db.get_url_hashes_with_body(hashes, chunk_size=2)
+
+    assert found == set(hashes[:2])
+
+
+def test_get_stored_bodies_by_urls(test_db, sample_articles):
+    """保存済み記事の本文が入力URLをキーとして返される"""
+    for article in sample_articles[:2]:
+        test_db.save_article(article)
+
+    urls = [
+        sample_articles[0]["url"] + "?utm_source=feed",
+        sample_articles[1]["url"],
+        sample_articles[2]["url"],
+    ]
+    bodies = test_db.get_stored_bodies_by_urls(urls)
+
+    assert bodies == {
+        urls[0]: sample_articles[0]["body"],
+        urls[1]: sample_articles[1]["body"],
+    }
+
+
+def test_get_stored_bodies_by_urls_skips_placeholder_bodies(test_db, sample_articles):
+    """本文取得失敗の代替文言が保存された記事は保存済みとして扱わない"""
+    sample_articles[0]["body"] = "[本文取得失敗/空]"
+    sample_articles[1]["body"] = "[本文取得エラー: timeout]"
+    for article in sample_articles:
+        test_db.save_article(article)
+
+    urls = [article["url"] for article in sample_articles]
+    bodies = test_db.get_stored_bodies_by_urls(urls)
+
+    assert bodies == {urls[2]: sample_articles[2]["body"]}
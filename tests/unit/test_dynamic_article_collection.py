@@ -25,7 +25,8 @@ class TestDynamicArticleCollection(unittest.TestCase):
             hours_limit=24,
             minimum_article_count=100,
             max_hours_limit=72,
-            weekend_hours_extension=48
+            weekend_hours_extension=48,
+            body_cache_enabled=False
         )
     
     def test_get_dynamic_hours_limit_monday(self):
@@ -180,6 +181,43 @@ class TestDynamicArticleCollection(unittest.TestCase):
             exc_info=True
         )
     
+    @patch('scrapers.reuters.scrape_reuters_articles')
+    @patch('scrapers.bloomberg.scrape_bloomberg_top_page_articles')
+    def test_collect_articles_with_hours_passes_collection_cache(self, mock_bloomberg, mock_reuters):
+        """増分収集キャッシュが各スクレイパーに渡されるかのテスト"""
+        from scrapers.collection_cache import ScrapeCollectionCache
+
+        mock_reuters.return_value = []
+        mock_bloomberg.return_value = []
+        cache = ScrapeCollectionCache()
+        self.processor._collection_cache = cache
+
+        self.processor._collect_articles_with_hours(48)
+
+        self.assertIs(mock_reuters.call_args.kwargs['collection_cache'], cache)
+        self.assertIs(mock_bloomberg.call_args.kwargs['collection_cache'], cache)
+
+    @patch('src.core.news_processor.NewsProcessor._collect_articles_with_hours')
+    def test_collect_articles_with_dynamic_range_shares_cache_between_attempts(self, mock_collect):
+        """時間範囲拡張の各試行で同一キャッシュが共有され、統計が記録されるかのテスト"""
+        seen_caches = []
+
+        def collect(hours):
+            seen_caches.append(self.processor._collection_cache)
+            return [{'title': f'Article {i}'} for i in range(10)]
+
+        mock_collect.side_effect = collect
+        self.processor.config.scraping.incremental_collection = True
+
+        with patch.object(self.processor, 'get_dynamic_hours_limit', return_value=24):
+            self.processor.collect_articles_with_dynamic_range()
+
+        self.assertEqual(len(seen_caches), 3)
+        self.assertIsNotNone(seen_caches[0])
+        self.assertTrue(all(cache is seen_caches[0] for cache in seen_caches))
+        self.assertIsNone(self.processor._collection_cache)
+        self.assertIn('fetches_saved', self.processor.last_collection_stats)
+
     def test_integration_collect_articles(self):
         """collect_articlesメソッドの統合テスト"""
         with patch.object(self.processor, 'collect_articles_with_dynamic_range') as mock_dynamic:
@@ -191,6 +229,149 @@ class TestDynamicArticleCollection(unittest.TestCase):
             mock_dynamic.assert_called_once()
 
 
+class TestIncrementalReutersCollection(unittest.TestCase):
+    """Reuters増分収集のテスト"""
+
+    def setUp(self):
+        jst = pytz.timezone('Asia/Tokyo')
+        now = datetime.now(jst)
+        self.candidates = [
+            {'source': 'Reuters', 'title': 'Recent', 'url': 'https://jp.reuters.com/a',
+             'published_jst': now - timedelta(hours=2), 'category': 'ビジネス'},
+            {'source': 'Reuters', 'title': 'Older', 'url': 'https://jp.reuters.com/b',
+             'published_jst': now - timedelta(hours=30), 'category': 'ビジネス'},
+        ]
+
+    @patch('scrapers.reuters.scrape_reuters_article_body_with_selenium')
+    @patch('scrapers.reuters._scrape_reuters_listing')
+    @patch('scrapers.reuters._start_reuters_driver')
+    def test_widening_reuses_listing_and_bodies(self, mock_start, mock_listing, mock_body):
+        """拡張時は一覧を再取得せず、新たに範囲に入った記事の本文のみ取得する"""
+        from scrapers import reuters
+        from scrapers.collection_cache import ScrapeCollectionCache
+
+        mock_start.return_value = MagicMock()
+        mock_listing.return_value = (self.candidates, 3)
+        mock_body.side_effect = lambda driver, url, selenium_timeout: f"body of {url}"
+        cache = ScrapeCollectionCache()
+        params = dict(query='q', max_pages=3, items_per_page=20,
+                      target_categories=[], exclude_keywords=[], collection_cache=cache)
+
+        first = reuters.scrape_reuters_articles(hours_limit=24, **params)
+        second = reuters.scrape_reuters_articles(hours_limit=48, **params)
+
+        self.assertEqual([a['title'] for a in first], ['Recent'])
+        self.assertEqual([a['title'] for a in second], ['Recent', 'Older'])
+        self.assertEqual(mock_listing.call_count, 1)
+        self.assertEqual(mock_body.call_count, 2)
+        self.assertEqual(second[0]['body'], 'body of https://jp.reuters.com/a')
+        self.assertEqual(cache.listing_fetches_saved, 3)
+        self.assertEqual(cache.body_fetches_saved, 1)
+        self.assertEqual(cache.fetches_saved, 4)
+
+
+    @patch('scrapers.reuters.scrape_reuters_article_body_with_selenium')
+    @patch('scrapers.reuters._scrape_reuters_listing')
+    @patch('scrapers.reuters._start_reuters_driver')
+    def test_stored_articles_skip_body_fetch(self, mock_start, mock_listing, mock_body):
+        """DB保存済みの記事は本文取得前の一括照会で除外される"""
+        from scrapers import reuters
+
+        mock_start.return_value = MagicMock()
+        mock_listing.return_value = (self.candidates, 1)
+        mock_body.return_value = "fetched body"
+        lookup = Mock(return_value={'https://jp.reuters.com/b': 'stored body'})
+
+        result = reuters.scrape_reuters_articles(
+            query='q', hours_limit=48, max_pages=1, items_per_page=20,
+            target_categories=[], exclude_keywords=[], stored_article_lookup=lookup,
+        )
+
+        lookup.assert_called_once_with(
+            'Reuters', ['https://jp.reuters.com/a', 'https://jp.reuters.com/b']
+        )
+        self.assertEqual(mock_body.call_count, 1)
+        self.assertEqual([a['body'] for a in result], ['fetched body', 'stored body'])
+
+
+class TestStoredArticleLookupHook(unittest.TestCase):
+    """本文取得前のDB照会フックのテスト"""
+
+    def test_skip_ratio_recorded_per_source(self):
+        """ソースごとのスキップ率が集計される"""
+        processor = NewsProcessor()
+        processor.logger = Mock()
+        processor.db_manager = Mock()
+        processor.db_manager.get_stored_bodies_by_urls.side_effect = [
+            {'u1': 'b1', 'u2': 'b2'},
+            {},
+        ]
+
+        processor._lookup_stored_articles('Reuters', ['u1', 'u2', 'u3', 'u4'])
+        processor._lookup_stored_articles('Bloomberg', ['u5'])
+        processor._log_collection_cache_stats()
+
+        self.assertEqual(processor.last_collection_stats['reuters_prefetch_skip_ratio'], 0.5)
+        self.assertEqual(processor.last_collection_stats['bloomberg_prefetch_skip_ratio'], 0.0)
+
+
+class TestReutersDriverPool(unittest.TestCase):
+    """Reuters本文取得用driverプールのテスト"""
+
+    @patch('scrapers.reuters.scrape_reuters_article_body_with_selenium')
+    @patch('scrapers.reuters._start_reuters_driver')
+    def test_bodies_returned_in_input_order_and_failed_driver_recycled(self, mock_start, mock_body):
+        """結果は入力順で返り、故障したdriverは再起動される"""
+        import time as time_module
+        from scrapers import reuters
+
+        mock_start.side_effect = lambda user_data_dir: MagicMock()
+        urls = [f"https://jp.reuters.com/{i}" for i in range(6)]
+
+        def fetch(driver, url, selenium_timeout):
+            if url.endswith('/2'):
+                raise RuntimeError("driver crashed")
+            # 先頭ほど遅くし、完了順と入力順を入れ替える
+            time_module.sleep(0.01 * (6 - int(url.rsplit('/', 1)[1])))
+            return f"body {url}"
+
+        mock_body.side_effect = fetch
+        pool = reuters.ReutersDriverPool(3)
+        try:
+            results = reuters._fetch_reuters_bodies_with_pool([{'url': u} for u in urls], pool)
+        finally:
+            pool.close()
+
+        self.assertEqual(results[0], "body https://jp.reuters.com/0")
+        self.assertEqual(results[5], "body https://jp.reuters.com/5")
+        self.assertIsInstance(results[2], RuntimeError)
+        self.assertEqual(pool.recycled_count, 1)
+        self.assertLessEqual(mock_start.call_count, 4)
+
+    @patch('scrapers.reuters.scrape_reuters_article_body_with_selenium')
+    @patch('scrapers.reuters._start_reuters_driver')
+    def test_on_result_called_per_completed_article(self, mock_start, mock_body):
+        """on_result は各記事の取得完了時に本文とともに呼ばれる"""
+        from scrapers import reuters
+
+        mock_start.side_effect = lambda user_data_dir: MagicMock()
+        mock_body.side_effect = lambda driver, url, selenium_timeout: f"body {url}"
+        articles = [{'url': f"https://jp.reuters.com/{i}"} for i in range(4)]
+        completed = []
+
+        pool = reuters.ReutersDriverPool(2)
+        try:
+            reuters._fetch_reuters_bodies_with_pool(
+                articles, pool, on_result=lambda article, body: completed.append((article['url'], body))
+            )
+        finally:
+            pool.close()
+
+        self.assertEqual(
+            sorted(completed), [(a['url'], f"body {a['url']}") for a in articles]
+        )
+
+
 class TestScrapingConfigExtension(unittest.TestCase):
     """ScrapingConfig拡張のテスト"""
     
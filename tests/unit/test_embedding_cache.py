@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+埋め込みキャッシュのユニットテスト
+"""
+
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.config.app_config import SupabaseConfig
+from src.database.embedding_cache import EmbeddingCache
+from src.database.embedding_generator import EmbeddingGenerator
+
+DIMENSION = 8
+
+
+class FakeModel:
+    """encode 呼び出しを記録する埋め込みモデル"""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, convert_to_numpy=True):
+        self.calls.append(list(texts))
+        return np.array([[float(len(text))] * DIMENSION for text in texts], dtype=np.float32)
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    """EmbeddingCache のテスト"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_get_many_returns_stored_vectors_in_input_order(self):
+        cache = EmbeddingCache(self.tmpdir.name, "model-a", DIMENSION, max_entries=10)
+        cache.put_many(["a", "bb"], [np.ones(DIMENSION), np.full(DIMENSION, 2.0)])
+
+        results = cache.get_many(["bb", "missing", "a"])
+
+        np.testing.assert_array_equal(results[0], np.full(DIMENSION, 2.0, dtype=np.float32))
+        self.assertIsNone(results[1])
+        np.testing.assert_array_equal(results[2], np.ones(DIMENSION, dtype=np.float32))
+        self.assertEqual(cache.stats["hits"], 2)
+        self.assertEqual(cache.stats["misses"], 1)
+
+    def test_entries_persist_across_instances(self):
+        cache = EmbeddingCache(self.tmpdir.name, "model-a", DIMENSION, max_entries=10)
+        cache.put_many(["text"], [np.arange(DIMENSION)])
+        cache.close()
+
+        reopened = EmbeddingCache(self.tmpdir.name, "model-a", DIMENSION, max_entries=10)
+        np.testing.assert_array_equal(
+            reopened.get_many(["text"])[0], np.arange(DIMENSION, dtype=np.float32)
+        )
+
+    def test_model_name_is_part_of_key(self):
+        cache_a = EmbeddingCache(self.tmpdir.name, "model-a", DIMENSION, max_entries=10)
+        cache_a.put_many(["text"], [np.ones(DIMENSION)])
+        cache_b = EmbeddingCache(self.tmpdir.name, "model-b", DIMENSION, max_entries=10)
+
+        self.assertIsNone(cache_b.get_many(["text"])[0])
+        self.assertNotEqual(cache_a.text_hash("text"), cache_b.text_hash("text"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = EmbeddingCache(self.tmpdir.name, "model-a", DIMENSION, max_entries=2)
+        cache.put_many(["old"], [np.ones(DIMENSION)])
+        cache.put_many(["recent"], [np.full(DIMENSION, 2.0)])
+        cache.get_many(["old"])  # old を最近参照済みにする
+        cache.put_many(["new"], [np.full(DIMENSION, 3.0)])
+
+        old, recent, new = cache.get_many(["old", "recent", "new"])
+        self.assertIsNotNone(old)
+        self.assertIsNone(recent)
+        np.testing.assert_array_equal(new, np.full(DIMENSION, 3.0, dtype=np.float32))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats["evictions"], 1)
+
+
+class TestEmbeddingGeneratorCache(unittest.TestCase):
+    """EmbeddingGenerator のキャッシュ連携テスト"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _generator(self, model):
+        config = SupabaseConfig(
+            enabled=True,
+            embedding_model="fake-model",
+            embedding_dimension=DIMENSION,
+            embedding_cache_enabled=True,
+            embedding_cache_dir=self.tmpdir.name,
+            embedding_cache_max_entries=100,
+        )
+        generator = EmbeddingGenerator(config)
+        generator._model = model
+        return generator
+
+    def test_batch_encodes_only_cache_misses(self):
+        model = FakeModel()
+        generator = self._generator(model)
+        generator.generate_embeddings_batch(["alpha", "beta"])
+
+        results = generator.generate_embeddings_batch(["alpha", "", "gamma", "beta", "gamma"])
+
+        self.assertEqual(model.calls, [["alpha", "beta"], ["gamma"]])
+        self.assertEqual(results[0], [5.0] * DIMENSION)
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2], [5.0] * DIMENSION)
+        self.assertEqual(results[3], [4.0] * DIMENSION)
+        self.assertEqual(results[4], [5.0] * DIMENSION)
+
+    def test_single_embedding_reuses_cache_from_previous_run(self):
+        first_model = FakeModel()
+        self._generator(first_model).generate_embedding("  market   news ")
+
+        second_model = FakeModel()
+        embedding = self._generator(second_model).generate_embedding("market news")
+
+        self.assertEqual(embedding, [11.0] * DIMENSION)
+        self.assertEqual(first_model.calls, [["market news"]])
+        self.assertEqual(second_model.calls, [])
+
+    def test_disabled_cache_always_calls_model(self):
+        model = FakeModel()
+        generator = self._generator(model)
+        generator.config.embedding_cache_enabled = False
+        generator._cache_disabled = True
+
+        generator.generate_embedding("text")
+        generator.generate_embedding("text")
+
+        self.assertEqual(len(model.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
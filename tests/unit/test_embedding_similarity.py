@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+EmbeddingGenerator の行列形式の類似度APIのユニットテスト
+"""
+
+import unittest
+
+import numpy as np
+
+from src.config.app_config import SupabaseConfig
+from src.database.embedding_generator import (
+    EmbeddingGenerator,
+    as_embedding_matrix,
+    normalize_embeddings,
+    top_k_indices,
+)
+
+
+def _cosine(a, b):
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+class TestEmbeddingSimilarity(unittest.TestCase):
+    """類似度計算のテスト"""
+
+    def setUp(self):
+        self.generator = EmbeddingGenerator(SupabaseConfig(enabled=False))
+        rng = np.random.RandomState(0)
+        self.query = rng.normal(size=8)
+        self.corpus = rng.normal(size=(50, 8))
+
+    def test_cosine_similarities_match_pairwise_calculation(self):
+        scores = self.generator.cosine_similarities(self.query.tolist(), self.corpus.tolist())
+
+        expected = [_cosine(self.query, row) for row in self.corpus]
+        np.testing.assert_allclose(scores, expected, rtol=1e-5)
+        self.assertAlmostEqual(
+            self.generator.calculate_similarity(self.query.tolist(), self.corpus[3].tolist()), expected[3], places=5
+        )
+
+    def test_normalized_inputs_skip_norms_and_copies(self):
+        corpus = normalize_embeddings(self.corpus)
+        query = normalize_embeddings(self.query)[0]
+
+        self.assertIs(as_embedding_matrix(corpus), corpus)
+        np.testing.assert_allclose(
+            self.generator.cosine_similarities(query, corpus, normalized=True),
+            self.generator.cosine_similarities(self.query, self.corpus),
+            rtol=1e-5,
+        )
+
+    def test_similarity_matrix(self):
+        matrix = self.generator.similarity_matrix(self.corpus[:5], self.corpus[5:8])
+
+        self.assertEqual(matrix.shape, (5, 3))
+        self.assertAlmostEqual(matrix[1, 2], _cosine(self.corpus[1], self.corpus[7]), places=5)
+        self_matrix = self.generator.similarity_matrix(self.corpus[:4])
+        np.testing.assert_allclose(np.diag(self_matrix), np.ones(4), rtol=1e-5)
+
+    def test_zero_vectors_have_zero_similarity(self):
+        corpus = np.vstack([np.zeros(8), self.corpus[0]])
+
+        scores = self.generator.cosine_similarities(self.query, corpus)
+
+        self.assertEqual(scores[0], 0.0)
+        self.assertEqual(self.generator.calculate_similarity([0.0] * 8, self.query.tolist()), 0.0)
+
+    def test_find_most_similar_returns_sorted_top_k(self):
+        results = self.generator.find_most_similar(self.query.tolist(), self.corpus.tolist(), top_k=5)
+
+        expected = sorted(
+            range(len(self.corpus)), key=lambda i: _cosine(self.query, self.corpus[i]), reverse=True
+        )[:5]
+        self.assertEqual([r["index"] for r in results], expected)
+        self.assertEqual(self.generator.find_most_similar(self.query.tolist(), []), [])
+
+    def test_top_k_indices_handles_k_larger_than_scores(self):
+        scores = np.array([0.1, 0.9, 0.5])
+
+        self.assertEqual(top_k_indices(scores, 10).tolist(), [1, 2, 0])
+        self.assertEqual(top_k_indices(scores, 0).tolist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
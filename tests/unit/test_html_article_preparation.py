@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+HTML用記事データ準備（記事とAI分析の一括取得）のユニットテスト
+"""
+
+import logging
+from unittest.mock import MagicMock
+
+from sqlalchemy import event
+
+from src.core.news_processor import NewsProcessor
+
+
+def _save_with_analysis(test_db, sample_articles):
+    results = test_db.upsert_articles(sample_articles)
+    test_db.save_ai_analysis(
+        results[0][0],
+        {"summary": "株価上昇の要約", "sentiment_label": "Positive", "sentiment_score": 0.8,
+         "category": "株式", "region": "japan"},
+    )
+    test_db.save_ai_analysis(results[1][0], {"summary": "", "category": "金融政策"})
+    return results
+
+
+def _count_selects(test_db, func):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_db.engine, "before_cursor_execute", record)
+    try:
+        result = func()
+    finally:
+        event.remove(test_db.engine, "before_cursor_execute", record)
+    return result, [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+def test_get_articles_by_urls_with_analysis_returns_plain_rows_in_one_query(test_db, sample_articles):
+    """記事と分析を1回のSELECTで取得し、入力URLをキーとした辞書で返す"""
+    _save_with_analysis(test_db, sample_articles)
+    urls = [a["url"] for a in sample_articles] + ["https://example.com/missing"]
+    tracked_url = sample_articles[0]["url"] + "?utm_source=feed"
+
+    analyses, selects = _count_selects(test_db, lambda: test_db.get_articles_by_urls_with_analysis(urls + [tracked_url]))
+
+    assert len(selects) == 1
+    assert set(analyses) == {a["url"] for a in sample_articles} | {tracked_url}
+    first = analyses[sample_articles[0]["url"]]
+    assert isinstance(first, dict)
+    assert first["summary"] == "株価上昇の要約"
+    assert first["region"] == "japan"
+    assert analyses[tracked_url] == first
+    assert analyses[sample_articles[2]["url"]]["analysis_id"] is None
+
+
+def test_get_articles_by_urls_with_analysis_chunks_large_inputs(test_db, sample_articles):
+    """IN句はチャンク単位で発行される"""
+    _save_with_analysis(test_db, sample_articles)
+    urls = [a["url"] for a in sample_articles]
+
+    analyses, selects = _count_selects(test_db, lambda: test_db.get_articles_by_urls_with_analysis(urls, chunk_size=2))
+
+    assert len(selects) == 2
+    assert len(analyses) == len(urls)
+
+
+def test_prepare_current_session_articles_uses_bulk_lookup(test_db, sample_articles):
+    """HTML用データ準備は記事数によらず一括取得のみを行う"""
+    _save_with_analysis(test_db, sample_articles)
+    processor = NewsProcessor.__new__(NewsProcessor)
+    processor.logger = logging.getLogger("test_html_article_preparation")
+    processor.db_manager = test_db
+    test_db.get_article_by_url_with_analysis = MagicMock()
+    scraped = sample_articles + [dict(sample_articles[0], url=sample_articles[0]["url"] + "?utm_source=x")]
+
+    articles, selects = _count_selects(
+        test_db, lambda: processor.prepare_current_session_articles_for_html(scraped)
+    )
+
+    test_db.get_article_by_url_with_analysis.assert_not_called()
+    assert len(selects) == 1
+    assert [a["url"] for a in articles] == [a["url"] for a in sample_articles]
+    assert articles[0]["summary"] == "株価上昇の要約"
+    assert articles[0]["sentiment_label"] == "Positive"
+    assert articles[0]["content"] == sample_articles[0]["body"]
+    # 要約が空・分析なしの記事は既定値のまま
+    assert articles[1]["summary"] == "要約はありません。"
+    assert articles[2]["category"] == "その他"
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""
+スクレイパー共通HTML解析レイヤーのユニットテスト
+"""
+
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scrapers import html_parsing
+from scrapers.html_parsing import ContainerRule, ContainerSelector, parse_html, resolve_parser
+from src.config.app_config import get_config
+
+PARAGRAPH = "日銀は金融政策決定会合で政策金利の据え置きを決定した。"
+
+
+@pytest.fixture
+def scraping_config(monkeypatch):
+    config = get_config().scraping
+    monkeypatch.setattr(config, "html_parser", "auto")
+    monkeypatch.setattr(config, "container_only_parsing", True)
+    return config
+
+
+def test_resolve_parser_prefers_lxml_and_falls_back(monkeypatch):
+    monkeypatch.setattr(html_parsing, "LXML_AVAILABLE", True)
+    assert resolve_parser("auto") == "lxml"
+    assert resolve_parser("html.parser") == "html.parser"
+    monkeypatch.setattr(html_parsing, "LXML_AVAILABLE", False)
+    assert resolve_parser("auto") == "html.parser"
+    assert resolve_parser("lxml") == "html.parser"
+
+
+def test_container_selector_matches_sequential_priority_search():
+    selector = ContainerSelector([
+        ContainerRule(attrs=(("data-testid", "ArticleBody"),)),
+        ContainerRule("div", re.compile(r"article.*body", re.I)),
+        ContainerRule("main"),
+    ])
+    html = (
+        "<main id='m'><div class='Article-Body' id='low'></div></main>"
+        "<div class='x article-body' id='late'></div>"
+        "<section data-testid='ArticleBody' id='top'></section>"
+    )
+    soup = BeautifulSoup(html, "html.parser")
+    container, rule = selector.find(soup)
+    assert container["id"] == "top" and rule is selector.rules[0]
+
+    soup.find(id="top").decompose()
+    container, rule = selector.find(soup)
+    # 文書順では main が先だが、優先度の高い div ルールの最初の一致を返す
+    assert container["id"] == "low" and rule is selector.rules[1]
+    assert selector.find(BeautifulSoup("<p>本文</p>", "html.parser")) == (None, None)
+
+
+def test_parse_and_extract_uses_container_only_parse(scraping_config):
+    selector = ContainerSelector([ContainerRule("div", re.compile("body-copy"))])
+    html = (
+        "<html><head><title>t</title></head><body><nav><p>メニュー</p></nav>"
+        f"<div class='body-copy'><p>{PARAGRAPH * 3}</p></div><footer>f</footer></body></html>"
+    )
+    seen = []
+
+    def extract(soup):
+        seen.append(soup)
+        return selector.find(soup)[0].get_text()
+
+    assert selector.parse_and_extract(html, extract) == PARAGRAPH * 3
+    assert len(seen) == 1
+    assert seen[0].find("nav") is None and seen[0].find("title") is None
+
+
+def test_parse_and_extract_falls_back_to_full_parse(scraping_config):
+    from scrapers.reuters import _extract_body_from_html
+
+    # 最優先コンテナが無い → ページ全体を解析して article タグから抽出
+    html = f"<html><body><article><p>{PARAGRAPH * 2}</p></article></body></html>"
+    assert _extract_body_from_html(html, "https://jp.reuters.com/a") == PARAGRAPH * 2
+
+    # コンテナはあるが本文が短い → ページ全体から meta description にフォールバック
+    description = PARAGRAPH * 3
+    html = (
+        f"<html><head><meta name='description' content='{description}'></head><body>"
+        "<div data-testid='ArticleBody'><p>短い</p></div></body></html>"
+    )
+    assert _extract_body_from_html(html, "https://jp.reuters.com/b") == description
+
+
+def test_container_only_parsing_can_be_disabled(scraping_config):
+    scraping_config.container_only_parsing = False
+    selector = ContainerSelector([ContainerRule("div", re.compile("body-copy"))])
+    html = f"<nav>n</nav><div class='body-copy'><p>{PARAGRAPH * 3}</p></div>"
+    soups = []
+    selector.parse_and_extract(html, lambda soup: soups.append(soup) or "x" * 100)
+    assert len(soups) == 1 and soups[0].find("nav") is not None
+
+
+@pytest.mark.parametrize("parser", ["lxml", "html.parser"])
+def test_fixture_extraction_matches_between_parsers(scraping_config, parser):
+    if parser == "lxml":
+        pytest.importorskip("lxml")
+    from scrapers.bloomberg import BLOOMBERG_BODY_CONTAINER, _extract_bloomberg_body
+    from scrapers.reuters import _extract_body_from_html, _extract_body_from_soup
+    from tools.performance.benchmarks.fixtures import load_fixture
+
+    scraping_config.html_parser = parser
+    reuters_html = load_fixture("reuters_article")
+    expected = _extract_body_from_soup(BeautifulSoup(reuters_html, "html.parser"), "u")
+    assert _extract_body_from_html(reuters_html, "u") == expected
+
+    bloomberg_html = load_fixture("bloomberg_article").encode("utf-8")
+    expected = _extract_bloomberg_body(BeautifulSoup(bloomberg_html, "html.parser"))
+    assert BLOOMBERG_BODY_CONTAINER.parse_and_extract(bloomberg_html, _extract_bloomberg_body) == expected
+    assert len(expected) > 500
+    assert parse_html("<p>x</p>").p.get_text() == "x"
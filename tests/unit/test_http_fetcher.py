@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""
+スクレイパー共通HTTPフェッチャーのユニットテスト
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from scrapers.http_fetcher import PooledHttpFetcher
+
+
+class TestPooledHttpFetcher(unittest.TestCase):
+    """PooledHttpFetcherのテスト"""
+
+    def test_backoff_delay_is_bounded(self):
+        """バックオフ時間が指数上限とbackoff_maxの範囲に収まる"""
+        fetcher = PooledHttpFetcher(backoff_base=1.0, backoff_max=5.0)
+        for attempt in range(6):
+            ceiling = min(5.0, 2 ** attempt)
+            for _ in range(20):
+                delay = fetcher.backoff_delay(attempt)
+                self.assertGreaterEqual(delay, 0)
+                self.assertLessEqual(delay, ceiling)
+
+    def test_per_host_concurrency_limit(self):
+        """同一ホストへの同時リクエスト数が制限される"""
+        fetcher = PooledHttpFetcher(per_host_limit=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_get(url, headers=None, timeout=None):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return MagicMock()
+
+        with patch.object(fetcher.session, 'get', side_effect=fake_get) as mock_get:
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                list(executor.map(
+                    lambda i: fetcher.get(f"https://example.com/{i}", timeout=1), range(6)
+                ))
+
+        self.assertEqual(mock_get.call_count, 6)
+        self.assertLessEqual(peak, 2)
+
+
+class TestBloombergBodyFetch(unittest.TestCase):
+    """Bloomberg本文取得のテスト"""
+
+    def _response(self, html: str, status: int = 200):
+        response = MagicMock()
+        response.content = html.encode('utf-8')
+        response.apparent_encoding = 'utf-8'
+        if status >= 400:
+            error_response = MagicMock(status_code=status)
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                response=error_response
+            )
+        return response
+
+    def test_body_fetched_through_shared_fetcher(self):
+        """本文取得が渡されたフェッチャー経由で行われる"""
+        from scrapers.bloomberg import scrape_bloomberg_article_body
+
+        paragraph = "日銀は金融政策決定会合で政策金利の据え置きを決定した。" * 3
+        fetcher = MagicMock()
+        fetcher.get.return_value = self._response(f"<article><p>{paragraph}</p></article>")
+
+        body = scrape_bloomberg_article_body("https://www.bloomberg.co.jp/news/a", fetcher=fetcher)
+
+        self.assertEqual(body, paragraph)
+        fetcher.get.assert_called_once()
+        fetcher.sleep_before_retry.assert_not_called()
+
+    def test_non_retryable_http_error_is_not_retried(self):
+        """404などリトライ対象外のHTTPエラーでは再試行しない"""
+        from scrapers.bloomberg import scrape_bloomberg_article_body
+
+        fetcher = MagicMock()
+        fetcher.get.return_value = self._response("", status=404)
+
+        body = scrape_bloomberg_article_body("https://www.bloomberg.co.jp/news/b", fetcher=fetcher)
+
+        self.assertEqual(body, "")
+        self.assertEqual(fetcher.get.call_count, 1)
+
+    def test_retryable_http_error_uses_backoff(self):
+        """503はバックオフ後に再試行される"""
+        from scrapers.bloomberg import scrape_bloomberg_article_body
+
+        paragraph = "米国株式市場はハイテク株を中心に上昇し、主要指数が最高値を更新した。" * 2
+        fetcher = MagicMock()
+        fetcher.get.side_effect = [
+            self._response("", status=503),
+            self._response(f"<article><p>{paragraph}</p></article>"),
+        ]
+
+        body = scrape_bloomberg_article_body("https://www.bloomberg.co.jp/news/c", fetcher=fetcher)
+
+        self.assertEqual(body, paragraph)
+        fetcher.sleep_before_retry.assert_called_once_with(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+BM25 キーワードインデックスとハイブリッド検索のユニットテスト
+"""
+
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from src.config.app_config import SupabaseConfig
+from src.rag.archive_manager import ArchiveManager
+from src.rag.keyword_index import BM25Index, get_keyword_index, reciprocal_rank_fusion, tokenize
+from src.rag.search_engine import RAGSearchEngine, SearchResult
+
+CHUNKS = [
+    {"id": 1, "document_id": "doc-1", "content": "日銀が追加利上げを決定。USD/JPYは下落した。", "region": "japan"},
+    {"id": 2, "document_id": "doc-1", "content": "トヨタ自動車(7203)の決算は増益だった。", "region": "japan"},
+    {"id": 3, "document_id": "doc-2", "content": "米CPIが市場予想を上回り、FRBの利下げ観測が後退。", "region": "usa"},
+    {"id": 4, "document_id": "doc-2", "content": "NVDAの株価が最高値を更新した。", "region": "usa"},
+]
+
+
+class TestTokenize(unittest.TestCase):
+    """トークン化のテスト"""
+
+    def test_japanese_bigrams_and_ascii_words(self):
+        tokens = tokenize("日銀がＣＰＩを発表")
+
+        self.assertIn("日銀", tokens)
+        self.assertIn("cpi", tokens)
+        self.assertNotIn("ＣＰＩ", tokens)
+
+
+class TestBM25Index(unittest.TestCase):
+    """BM25Index のテスト"""
+
+    def setUp(self):
+        self.index = BM25Index()
+        self.index.add_chunks(CHUNKS)
+
+    def test_exact_ticker_and_indicator_matches_rank_first(self):
+        self.assertEqual(self.index.search("NVDA")[0]["chunk_id"], 4)
+        self.assertEqual(self.index.search("7203")[0]["chunk_id"], 2)
+        self.assertEqual(self.index.search("cpi 利下げ")[0]["chunk_id"], 3)
+        self.assertEqual(self.index.search("存在しない語"), [])
+
+    def test_filters(self):
+        results = self.index.search("利上げ 利下げ", region_filter="usa")
+
+        self.assertEqual([r["chunk_id"] for r in results], [3])
+
+    def test_incremental_updates(self):
+        self.index.remove_chunks([4])
+        self.assertEqual(self.index.search("NVDA"), [])
+
+        self.index.add_chunks([{"id": 2, "document_id": "doc-1", "content": "ソニーの決算"}])
+        self.assertEqual(self.index.search("7203"), [])
+        self.assertEqual(self.index.search("ソニー")[0]["chunk_id"], 2)
+
+        self.index.remove_document("doc-2")
+        self.assertEqual(len(self.index), 2)
+
+    def test_save_and_load(self):
+        self.index.add_chunks([{"document_id": "doc-3", "chunk_index": 0, "content": "ECBが利下げ"}])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.index.save(tmpdir)
+            loaded = BM25Index.load(tmpdir)
+
+        self.assertEqual(len(loaded), len(self.index))
+        self.assertEqual(loaded.search("ECB"), self.index.search("ECB"))
+        loaded.remove_document("doc-3")
+        self.assertEqual(loaded.search("ECB"), [])
+
+
+class TestReciprocalRankFusion(unittest.TestCase):
+    """RRF のテスト"""
+
+    def test_items_ranked_high_in_both_lists_win(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d", "c"]], key=lambda x: x)
+
+        self.assertEqual([item for item, _ in fused], ["b", "c", "a", "d"])
+        self.assertEqual(len(fused), 4)
+
+
+class TestHybridSearch(unittest.TestCase):
+    """RAGSearchEngine.search_by_keywords と ArchiveManager の差分反映のテスト"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.config = SupabaseConfig(enabled=True, keyword_index_enabled=True, keyword_index_dir=self.tmpdir.name)
+        get_keyword_index(self.tmpdir.name).add_chunks(CHUNKS)
+
+        self.supabase = MagicMock()
+        self.supabase.is_available.return_value = True
+        self.supabase.chunks_version = 0
+        self.embedder = MagicMock()
+        self.embedder.is_available.return_value = True
+        self.embedder.generate_embedding.return_value = [0.1, 0.2]
+        with patch("src.rag.search_engine.get_supabase_client", return_value=self.supabase), \
+                patch("src.rag.search_engine.get_embedding_generator", return_value=self.embedder):
+            self.engine = RAGSearchEngine(self.config)
+
+    def test_keyword_only_search_skips_embedding(self):
+        results = self.engine.search_by_keywords(["NVDA"], hybrid=False, top_k=1)
+
+        self.assertEqual([r.chunk_id for r in results], [4])
+        self.embedder.generate_embedding.assert_not_called()
+
+    def test_hybrid_search_fuses_vector_and_keyword_results(self):
+        self.supabase.search_chunks.return_value = [
+            {"chunk_id": 3, "document_id": "doc-2", "content": CHUNKS[2]["content"], "similarity": 0.9},
+            {"chunk_id": 1, "document_id": "doc-1", "content": CHUNKS[0]["content"], "similarity": 0.8},
+        ]
+
+        results = self.engine.search_by_keywords(["CPI"], top_k=2)
+
+        self.assertEqual(results[0].chunk_id, 3)
+        self.assertAlmostEqual(results[0].similarity, 0.9)
+        self.assertIsInstance(results[1], SearchResult)
+
+    def test_archive_manager_updates_index_incrementally(self):
+        supabase = MagicMock()
+        supabase.is_available.return_value = True
+        supabase.upsert_document.return_value = {"id": "doc-9"}
+        supabase.get_document_by_date.return_value = None
+        supabase.create_chunks.side_effect = lambda rows: [dict(row, id=100 + i) for i, row in enumerate(rows)]
+        embedder = MagicMock()
+        embedder.generate_embeddings_batch.side_effect = lambda texts: [[0.0] * 384 for _ in texts]
+        embedder.validate_embedding.return_value = True
+        with patch("src.rag.archive_manager.get_supabase_client", return_value=supabase), \
+                patch("src.rag.archive_manager.get_embedding_generator", return_value=embedder):
+            manager = ArchiveManager(self.config)
+        manager._save_to_storage = MagicMock()
+
+        articles = [
+            {"title": f"記事{i}", "summary": "要約", "body": f"SOFRの金利{i}" * 10, "source": "Reuters",
+             "url": f"https://example.com/{i}", "category": "金融", "region": "usa"}
+            for i in range(2)
+        ]
+        manager.archive_articles(articles, date(2026, 10, 16))
+
+        hits = get_keyword_index(self.tmpdir.name).search("SOFR")
+        self.assertTrue(hits)
+        self.assertTrue(all(hit["document_id"] == "doc-9" for hit in hits))
+        self.assertEqual(hits[0]["doc_date"], "2026-10-16")
+        self.assertEqual(len(BM25Index.load(self.tmpdir.name)), len(CHUNKS) + len(hits))
+
+
+if __name__ == "__main__":
+    unittest.main()
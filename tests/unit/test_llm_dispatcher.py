@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+"""
+LLMディスパッチャー（レート制御・AIMD同時実行数）のユニットテスト
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from src.llm import DispatchedLLMClient, LLMDispatcher, LLMResult, OpenRouterError  # noqa: E402
+from src.llm.dispatcher import (  # noqa: E402
+    AIMDConcurrencyLimiter,
+    TokenBucket,
+    is_rate_limit_error,
+    is_throttle_error,
+)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """TokenBucketのテスト"""
+
+    def test_waits_when_bucket_is_empty(self):
+        """容量を使い切ると補充されるまで待機する"""
+        bucket = TokenBucket(rate_per_minute=600, capacity=2)  # 10トークン/秒
+
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+        started = time.monotonic()
+        waited = bucket.acquire()
+
+        self.assertGreater(waited, 0)
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+
+
+class TestAIMDConcurrencyLimiter(unittest.TestCase):
+    """AIMDConcurrencyLimiterのテスト"""
+
+    def test_additive_increase_and_multiplicative_decrease(self):
+        limiter = AIMDConcurrencyLimiter(initial=4, minimum=1, maximum=5)
+
+        for _ in range(4):
+            limiter.acquire()
+            limiter.release(succeeded=True)
+        self.assertAlmostEqual(limiter.limit, 5.0, places=0)
+
+        limiter.acquire()
+        limiter.release(succeeded=False, throttled=True)
+        self.assertLess(limiter.limit, 3.0)
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(succeeded=False, throttled=True)
+        self.assertEqual(limiter.limit, 1.0)
+
+
+class TestLLMDispatcher(unittest.TestCase):
+    """LLMDispatcherのテスト"""
+
+    def _dispatcher(self, **kwargs):
+        params = dict(requests_per_minute=0, tokens_per_minute=0, initial_concurrency=2, max_concurrency=4)
+        params.update(kwargs)
+        return LLMDispatcher(**params)
+
+    def test_throttled_call_is_retried_and_reduces_concurrency(self):
+        """429はバックオフ後に再試行され、同時実行上限が下がる"""
+        dispatcher = self._dispatcher(initial_concurrency=4)
+        fn = MagicMock(side_effect=[OpenRouterError("rate limited", status_code=429), "ok"])
+
+        with patch("src.llm.dispatcher.time.sleep") as sleep:
+            self.assertEqual(dispatcher.call(fn), "ok")
+
+        self.assertEqual(fn.call_count, 2)
+        sleep.assert_called_once()
+        self.assertEqual(dispatcher.stats["throttled"], 1)
+        self.assertLess(dispatcher.concurrency.limit, 4)
+
+    def test_non_throttle_errors_are_raised_immediately(self):
+        """レート制限以外のエラーは再試行しない"""
+        dispatcher = self._dispatcher()
+        fn = MagicMock(side_effect=ValueError("bad request"))
+
+        with self.assertRaises(ValueError):
+            dispatcher.call(fn)
+        self.assertEqual(fn.call_count, 1)
+
+    def test_gives_up_after_max_retries(self):
+        dispatcher = self._dispatcher(max_retries=2)
+        fn = MagicMock(side_effect=RuntimeError("429 RESOURCE_EXHAUSTED"))
+
+        with patch("src.llm.dispatcher.time.sleep"), self.assertRaises(RuntimeError):
+            dispatcher.call(fn)
+        self.assertEqual(fn.call_count, 3)
+        self.assertEqual(dispatcher.stats["failed"], 1)
+
+    def test_timeout_reduces_concurrency_without_retry(self):
+        """タイムアウトは同時実行上限を下げるが再試行しない"""
+        dispatcher = self._dispatcher(initial_concurrency=4)
+        fn = MagicMock(side_effect=TimeoutError("timed out"))
+
+        with patch("src.llm.dispatcher.time.sleep") as sleep, self.assertRaises(TimeoutError):
+            dispatcher.call(fn)
+
+        self.assertEqual(fn.call_count, 1)
+        sleep.assert_not_called()
+        self.assertEqual(dispatcher.stats["timeouts"], 1)
+        self.assertLess(dispatcher.concurrency.limit, 4)
+
+    def test_concurrency_is_bounded_by_limit(self):
+        """同時に実行される呼び出し数がAIMD上限を超えない"""
+        dispatcher = self._dispatcher(initial_concurrency=2, max_concurrency=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work(i):
+            def call():
+                nonlocal active, peak
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+                return i
+
+            return dispatcher.call(call)
+
+        results = list(dispatcher.stream(work, range(6)))
+
+        self.assertEqual(sorted(r for _, r, _ in results), list(range(6)))
+        self.assertLessEqual(peak, 2)
+
+    def test_stream_yields_in_completion_order(self):
+        """結果は完了した順に返される"""
+        dispatcher = self._dispatcher(max_concurrency=3)
+
+        def work(delay):
+            time.sleep(delay)
+            return delay
+
+        order = [item for item, _, _ in dispatcher.stream(work, [0.1, 0.0, 0.05])]
+
+        self.assertEqual(order, [0.0, 0.05, 0.1])
+
+    def test_dispatched_client_consumes_token_budget(self):
+        """DispatchedLLMClientはプロンプトと出力の見積もりトークンを消費する"""
+        dispatcher = self._dispatcher(tokens_per_minute=100_000)
+        inner = MagicMock(provider="test", model_name="m")
+        inner.generate.return_value = LLMResult(text="ok")
+        client = DispatchedLLMClient(inner, dispatcher)
+
+        before = dispatcher.token_bucket._tokens
+        client.generate("あ" * 100, max_output_tokens=200)
+
+        self.assertAlmostEqual(before - dispatcher.token_bucket._tokens, 300, delta=5)
+        inner.generate.assert_called_once()
+
+    def test_throttle_error_detection(self):
+        self.assertTrue(is_throttle_error(RuntimeError("429 Resource has been exhausted (e.g. check quota).")))
+        self.assertTrue(is_throttle_error(TimeoutError()))
+        self.assertFalse(is_throttle_error(RuntimeError("invalid api key")))
+        self.assertFalse(is_rate_limit_error(TimeoutError("timed out")))
+        self.assertFalse(is_rate_limit_error(RuntimeError("daily quota exceeded")))
+
+
+if __name__ == '__main__':
+    unittest.main()
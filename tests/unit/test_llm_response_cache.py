@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+"""
+LLM応答キャッシュのユニットテスト
+"""
+
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from src.llm import BaseLLMClient, CachedLLMClient, LLMResponseCache, LLMResult  # noqa: E402
+
+
+class _CountingClient(BaseLLMClient):
+    def __init__(self, model_name: str = "test-model"):
+        super().__init__(provider="test", model_name=model_name)
+        self.calls = 0
+
+    def generate(self, prompt, **kwargs):
+        self.calls += 1
+        return LLMResult(text=f"response {self.calls}", metadata={"model": self.model_name})
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """LLMResponseCache / CachedLLMClient のテスト"""
+
+    def setUp(self):
+        self.cache = LLMResponseCache(":memory:", ttl_seconds=3600, max_entries=2)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_repeated_prompt_is_served_from_cache(self):
+        """同一プロンプトの2回目はAPIを呼ばない"""
+        inner = _CountingClient()
+        client = CachedLLMClient(inner, self.cache)
+
+        first = client.generate("prompt")
+        second = client.generate("prompt")
+
+        self.assertEqual(inner.calls, 1)
+        self.assertEqual(second.text, first.text)
+        self.assertTrue(second.metadata["cache_hit"])
+        self.assertEqual(self.cache.stats["hits"], 1)
+        self.assertEqual(self.cache.stats["misses"], 1)
+
+    def test_content_hash_shares_republished_articles(self):
+        """正規化後に同一の本文はプロンプトが異なっても同じエントリを使う"""
+        inner = _CountingClient()
+        client = CachedLLMClient(inner, self.cache)
+        body = "日銀は政策金利を据え置いた。市場では円安が進んだ。"
+
+        client.generate("p1", cache_content=body, prompt_version="v1")
+        client.generate("p2", cache_content=f"\n  {body}  \n", prompt_version="v1")
+        client.generate("p1", cache_content=body, prompt_version="v2")
+
+        self.assertEqual(inner.calls, 2)
+
+    def test_key_includes_provider_and_model(self):
+        """モデルが異なれば別エントリになる"""
+        CachedLLMClient(_CountingClient("model-a"), self.cache).generate("prompt")
+        other = _CountingClient("model-b")
+        CachedLLMClient(other, self.cache).generate("prompt")
+
+        self.assertEqual(other.calls, 1)
+
+    def test_expired_entries_are_refetched(self):
+        """TTLを過ぎたエントリは再取得される"""
+        inner = _CountingClient()
+        client = CachedLLMClient(inner, self.cache)
+        client.generate("prompt")
+
+        with patch("src.llm.response_cache.time.time", return_value=time.time() + 7200):
+            client.generate("prompt")
+
+        self.assertEqual(inner.calls, 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """上限を超えると最も古く参照されたエントリが削除される"""
+        inner = _CountingClient()
+        client = CachedLLMClient(inner, self.cache)
+        client.generate("a")
+        time.sleep(0.01)
+        client.generate("b")
+        time.sleep(0.01)
+        client.generate("a")  # a を最近参照に更新
+        time.sleep(0.01)
+        client.generate("c")  # b が追い出される
+
+        self.assertEqual(inner.calls, 3)
+        client.generate("a")
+        self.assertEqual(inner.calls, 3)
+        client.generate("b")
+        self.assertEqual(inner.calls, 4)
+        self.assertGreaterEqual(self.cache.stats["evictions"], 1)
+
+    def test_batch_results_are_reused_by_single_path(self):
+        """バッチ要約の結果が記事単位でキャッシュされ、単独処理で再利用される"""
+        from src.legacy.ai_summarizer import process_article_with_ai, process_articles_batch_with_ai
+
+        texts = [
+            "米連邦準備制度理事会は政策金利を据え置くことを決定した。" * 3,
+            "トヨタ自動車の第3四半期決算は減収減益となった。" * 3,
+        ]
+        inner = MagicMock(provider="test", model_name="test-model")
+        inner.generate.return_value = LLMResult(
+            text="=== 記事 1 ===\n## 地域\nusa\n## カテゴリ\n金融政策\n## 要約\n据え置き。\n"
+            "=== 記事 2 ===\n## 地域\njapan\n## カテゴリ\n企業業績\n## 要約\n減収減益。\n"
+        )
+        client = CachedLLMClient(inner, self.cache)
+
+        process_articles_batch_with_ai(client, texts)
+        result = process_article_with_ai(client, texts[1])
+
+        inner.generate.assert_called_once()
+        self.assertEqual(result["summary"], "減収減益。")
+        self.assertEqual(result["region"], "japan")
+
+    def test_unparseable_batch_response_is_not_cached(self):
+        """解析できないバッチ応答はキャッシュされず、再実行で再度リクエストされる"""
+        from src.legacy.ai_summarizer import process_articles_batch_with_ai
+
+        texts = [
+            "米連邦準備制度理事会は政策金利を据え置くことを決定した。" * 3,
+            "トヨタ自動車の第3四半期決算は減収減益となった。" * 3,
+        ]
+        inner = MagicMock(provider="test", model_name="test-model")
+        inner.generate.side_effect = [
+            LLMResult(text="=== 記事 1 ===\n## 地域\nus"),
+            LLMResult(
+                text="=== 記事 1 ===\n## 地域\nusa\n## カテゴリ\n金融政策\n## 要約\n据え置き。\n"
+                "=== 記事 2 ===\n## 地域\njapan\n## カテゴリ\n企業業績\n## 要約\n減収減益。\n"
+            ),
+        ]
+        client = CachedLLMClient(inner, self.cache)
+
+        self.assertEqual(process_articles_batch_with_ai(client, texts), [None, None])
+        results = process_articles_batch_with_ai(client, texts)
+
+        self.assertEqual(inner.generate.call_count, 2)
+        self.assertEqual([r["summary"] for r in results], ["据え置き。", "減収減益。"])
+        self.assertEqual(self.cache.stats["stores"], 2)
+
+    def test_unparseable_response_is_not_cached(self):
+        """解析できない応答はキャッシュされず、再試行で正常な応答を取得できる"""
+        from src.legacy.ai_summarizer import process_article_with_ai
+
+        text = "米連邦準備制度理事会は政策金利を据え置くことを決定した。" * 3
+        inner = MagicMock(provider="test", model_name="test-model")
+        inner.generate.side_effect = [
+            LLMResult(text="## 地域\nusa\n## カテ"),
+            LLMResult(text="## 地域\nusa\n## カテゴリ\n金融政策\n## 要約\n据え置き。"),
+        ]
+        client = CachedLLMClient(inner, self.cache)
+
+        self.assertIsNone(process_article_with_ai(client, text))
+        retried = process_article_with_ai(client, text)
+        cached = process_article_with_ai(client, text)
+
+        self.assertEqual(inner.generate.call_count, 2)
+        self.assertEqual(retried["summary"], "据え置き。")
+        self.assertEqual(cached["summary"], "据え置き。")
+        self.assertEqual(self.cache.stats["stores"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
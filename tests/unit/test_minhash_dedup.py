@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+MinHash/LSH による重複検出のユニットテスト
+"""
+
+import unittest
+from unittest.mock import patch
+
+from src.database.content_deduplicator import ContentDeduplicator
+from src.database.minhash import LSHIndex, MinHasher
+from src.database.models import Article
+
+BASE_BODY = (
+    "日本銀行は金融政策決定会合で政策金利を0.5%に据え置くことを決めた。"
+    "植田総裁は記者会見で、物価の上振れリスクに注意が必要だと述べた。"
+    "市場では年内の追加利上げを予想する声が多く、円相場は対ドルで小幅に上昇した。"
+)
+NEAR_DUPLICATE_BODY = BASE_BODY.replace("小幅に上昇した", "わずかに上昇した")
+OTHER_BODY = (
+    "米アップルは新型iPhoneの販売が好調で、四半期売上高が過去最高を更新したと発表した。"
+    "サービス部門の伸びも寄与し、株価は時間外取引で3%上昇した。"
+)
+
+
+class TestMinHash(unittest.TestCase):
+    """MinHasher / LSHIndex のテスト"""
+
+    def test_signature_estimates_jaccard(self):
+        hasher = MinHasher()
+        sig1 = hasher.signature(BASE_BODY)
+        sig2 = hasher.signature(NEAR_DUPLICATE_BODY)
+        sig3 = hasher.signature(OTHER_BODY)
+
+        self.assertGreater(MinHasher.estimate_jaccard(sig1, sig2), 0.7)
+        self.assertLess(MinHasher.estimate_jaccard(sig1, sig3), 0.2)
+
+    def test_signature_round_trips_through_bytes(self):
+        signature = MinHasher().signature(BASE_BODY)
+        restored = MinHasher.from_bytes(MinHasher.to_bytes(signature))
+        self.assertTrue((signature == restored).all())
+        self.assertEqual(len(MinHasher.to_bytes(signature)), 128 * 4)
+
+    def test_lsh_returns_similar_candidates_only(self):
+        hasher = MinHasher()
+        index = LSHIndex()
+        index.add("base", hasher.signature(BASE_BODY))
+        index.add("other", hasher.signature(OTHER_BODY))
+
+        self.assertEqual(index.query(hasher.signature(NEAR_DUPLICATE_BODY)), {"base"})
+        index.add("near", hasher.signature(NEAR_DUPLICATE_BODY))
+        self.assertEqual(index.candidate_pairs(), {("base", "near")})
+
+
+class TestContentDeduplicatorLSH(unittest.TestCase):
+    """ContentDeduplicator の候補絞り込みのテスト"""
+
+    def setUp(self):
+        self.dedup = ContentDeduplicator()
+        self.articles = [
+            {"title": "日銀、政策金利を据え置き", "body": BASE_BODY},
+            {"title": "アップル決算、売上高が過去最高", "body": OTHER_BODY},
+            {"title": "日銀が金利据え置き 総裁会見", "body": NEAR_DUPLICATE_BODY},
+        ]
+
+    def test_remove_duplicates_uses_candidates(self):
+        """近似重複は除去され、非候補のペアは詳細比較されない"""
+        with patch.object(
+            self.dedup, "is_duplicate_article", wraps=self.dedup.is_duplicate_article
+        ) as verify:
+            unique = self.dedup.remove_duplicates(self.articles)
+
+        self.assertEqual([a["title"] for a in unique], [self.articles[0]["title"], self.articles[1]["title"]])
+        self.assertEqual(verify.call_count, 1)
+
+    def test_get_duplicate_groups(self):
+        groups = self.dedup.get_duplicate_groups(self.articles)
+        self.assertEqual(groups, [[self.articles[0], self.articles[2]]])
+
+    def test_title_only_duplicates_are_detected(self):
+        """本文がない記事でもタイトルの近似重複を検出する"""
+        articles = [
+            {"title": "FRB、政策金利を据え置き 年内利下げに含み", "body": ""},
+            {"title": "FRB、政策金利を据え置き 年内利下げに含み - ロイター", "body": ""},
+        ]
+        self.assertEqual(len(self.dedup.remove_duplicates(articles)), 1)
+
+
+def test_detect_near_duplicate_articles(test_db):
+    """保存済み署名から近似重複ペアを検出し、未保存の署名は補完される"""
+    bodies = [BASE_BODY, OTHER_BODY, NEAR_DUPLICATE_BODY]
+    ids = []
+    for i, body in enumerate(bodies):
+        article_id, _ = test_db.save_article(
+            {"url": f"https://example.com/near/{i}", "title": f"記事{i}", "body": body, "source": "Reuters"}
+        )
+        ids.append(article_id)
+
+    with test_db.get_session() as session:
+        session.query(Article).filter(Article.id == ids[2]).update({"minhash_signature": None})
+
+    pairs = test_db.detect_near_duplicate_articles(days=1)
+
+    assert [(a.id, b.id) for a, b in pairs] == [(ids[0], ids[2])]
+    with test_db.get_session() as session:
+        assert session.get(Article, ids[2]).minhash_signature is not None
+
+
+if __name__ == '__main__':
+    unittest.main()
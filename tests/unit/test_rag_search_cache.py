@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+RAGSearchEngine の検索キャッシュのユニットテスト
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.config.app_config import SupabaseConfig
+from src.database.supabase_client import SupabaseClient
+from src.rag.search_engine import RAGSearchEngine
+from src.rag.vector_index import LocalVectorIndex
+
+DIMENSION = 4
+
+
+def _rpc_rows(*chunk_ids):
+    return [
+        {"chunk_id": chunk_id, "document_id": "doc-1", "content": f"チャンク{chunk_id}", "similarity": 0.9}
+        for chunk_id in chunk_ids
+    ]
+
+
+class TestRAGSearchCache(unittest.TestCase):
+    """検索結果・クエリ埋め込みキャッシュのテスト"""
+
+    def setUp(self):
+        self.config = SupabaseConfig(enabled=True, embedding_dimension=DIMENSION, local_index_enabled=False)
+        self.supabase = MagicMock()
+        self.supabase.is_available.return_value = True
+        self.supabase.chunks_version = 0
+        self.supabase.search_chunks.return_value = _rpc_rows(1, 2)
+        self.embedder = MagicMock()
+        self.embedder.is_available.return_value = True
+        self.embedder.generate_embedding.return_value = [0.1, 0.2, 0.3, 0.4]
+
+        with patch("src.rag.search_engine.get_supabase_client", return_value=self.supabase), \
+                patch("src.rag.search_engine.get_embedding_generator", return_value=self.embedder):
+            self.engine = RAGSearchEngine(self.config)
+
+    def test_repeated_search_is_served_from_cache(self):
+        first = self.engine.search("日銀 利上げ", top_k=5)
+        second = self.engine.search("日銀 利上げ", top_k=5)
+
+        self.assertEqual(first, second)
+        self.supabase.search_chunks.assert_called_once()
+        self.embedder.generate_embedding.assert_called_once()
+        self.assertEqual(self.engine.cache_stats["result_hits"], 1)
+
+    def test_filters_are_part_of_cache_key(self):
+        self.engine.search("日銀", region_filter="japan")
+        self.engine.search("日銀", region_filter="usa")
+
+        self.assertEqual(self.supabase.search_chunks.call_count, 2)
+        # クエリ埋め込みは再利用される
+        self.embedder.generate_embedding.assert_called_once()
+
+    def test_chunk_writes_invalidate_cached_results(self):
+        self.engine.search("日銀")
+        self.supabase.chunks_version += 1
+        self.engine.search("日銀")
+
+        self.assertEqual(self.supabase.search_chunks.call_count, 2)
+        self.embedder.generate_embedding.assert_called_once()
+
+    def test_similar_to_chunk_uses_stored_embedding(self):
+        self.supabase.get_chunk_by_id.return_value = {"id": 1, "content": "本文", "embedding": "[1,0,0,0]"}
+
+        results = self.engine.search_similar_to_chunk(1, top_k=1)
+
+        self.assertEqual([r.chunk_id for r in results], [2])
+        self.embedder.generate_embedding.assert_not_called()
+        self.assertEqual(
+            self.supabase.search_chunks.call_args.kwargs["query_embedding"], [1.0, 0.0, 0.0, 0.0]
+        )
+
+    def test_similar_to_chunk_reads_vector_from_local_index(self):
+        index = LocalVectorIndex(DIMENSION)
+        index.build(
+            [{"chunk_id": 1, "content": "a"}, {"chunk_id": 2, "content": "b"}, {"chunk_id": 3, "content": "c"}],
+            [[1, 0, 0, 0], [0.9, 0.1, 0, 0], [0, 0, 1, 0]],
+        )
+        self.config.local_index_enabled = True
+        self.engine._local_index = index
+        self.engine._local_index_loaded = True
+
+        results = self.engine.search_similar_to_chunk(1, top_k=1, similarity_threshold=0.5)
+
+        self.assertEqual([r.chunk_id for r in results], [2])
+        self.supabase.get_chunk_by_id.assert_not_called()
+        self.embedder.generate_embedding.assert_not_called()
+
+
+class TestSupabaseChunksVersion(unittest.TestCase):
+    """SupabaseClient のチャンク書き込み版番号のテスト"""
+
+    def test_chunk_writes_bump_version(self):
+        client = SupabaseClient(
+            SupabaseConfig(enabled=True, url="https://example.supabase.co", anon_key="", service_role_key="key")
+        )
+        client._rest_delete_by = MagicMock(return_value=True)
+
+        client.delete_chunks_by_ids([1, 2])
+        client.delete_chunks_by_document_id("doc-1")
+
+        self.assertEqual(client.chunks_version, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
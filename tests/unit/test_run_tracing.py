@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""
+実行トレース（スパン計測）のユニットテスト
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.news_processor import NewsProcessor
+from src.tracing import RunTracer, activate_tracer, get_active_tracer, trace_span
+
+
+def test_spans_record_nesting_counts_and_errors():
+    tracer = RunTracer()
+    with tracer.span("collect_articles", category="scrape") as outer:
+        with tracer.span("reuters.body_fetch", category="scrape", drivers=3) as inner:
+            inner.add(items=2, bytes=100)
+            inner.add(items=1, bytes=50)
+        outer.add(items=3)
+    with pytest.raises(ValueError):
+        with tracer.span("db.save_articles", category="db"):
+            raise ValueError("locked")
+
+    spans = {span.name: span for span in tracer.spans}
+    fetch = spans["reuters.body_fetch"]
+    assert fetch.parent == "collect_articles"
+    assert (fetch.items, fetch.bytes) == (3, 150)
+    assert fetch.attributes == {"drivers": 3}
+    assert fetch.wall_ms >= 0 and fetch.cpu_ms >= 0
+    assert spans["collect_articles"].parent is None
+    assert spans["db.save_articles"].status == "error"
+    assert "locked" in spans["db.save_articles"].error
+
+    summary = tracer.summarize()
+    assert summary["reuters.body_fetch"]["items"] == 3
+    assert summary["db.save_articles"]["errors"] == 1
+
+
+def test_spans_from_worker_threads_do_not_nest_under_other_threads():
+    tracer = RunTracer()
+
+    def summarize():
+        with tracer.span("llm.summarize", category="llm"):
+            pass
+
+    with tracer.span("collect_articles"):
+        worker = threading.Thread(target=summarize, name="ai-worker")
+        worker.start()
+        worker.join()
+
+    spans = {span.name: span for span in tracer.spans}
+    assert spans["llm.summarize"].parent is None
+    assert spans["llm.summarize"].thread_name == "ai-worker"
+
+
+def test_chrome_trace_export(tmp_path):
+    tracer = RunTracer("test_run")
+    with tracer.span("html.generate", category="output") as span:
+        span.add(items=5)
+
+    path = tracer.export_chrome_trace(str(tmp_path / "traces" / "run.json"))
+    with open(path, encoding="utf-8") as f:
+        trace = json.load(f)
+
+    complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert len(complete) == 1
+    assert complete[0]["name"] == "html.generate"
+    assert complete[0]["cat"] == "output"
+    assert complete[0]["ts"] >= 0 and complete[0]["dur"] >= 0
+    assert complete[0]["args"]["items"] == 5
+    metadata = {event["name"] for event in trace["traceEvents"] if event["ph"] == "M"}
+    assert metadata == {"process_name", "thread_name"}
+
+
+def test_trace_span_without_active_tracer_is_noop():
+    assert get_active_tracer() is None
+    with trace_span("bloomberg.listing") as span:
+        span.add(items=1)
+    assert span.items == 1
+
+    tracer = RunTracer()
+    activate_tracer(tracer)
+    try:
+        with trace_span("bloomberg.listing"):
+            pass
+    finally:
+        activate_tracer(None)
+    assert [span.name for span in tracer.spans] == ["bloomberg.listing"]
+
+
+def test_performance_spans_saved_per_session(test_db):
+    session_id = test_db.start_scraping_session()
+    tracer = RunTracer()
+    with tracer.span("collect_articles", category="scrape") as span:
+        span.add(items=10, bytes=2048)
+        span.set(streaming=True)
+
+    assert test_db.save_performance_spans(session_id, [s.to_dict() for s in tracer.spans]) == 1
+    rows = test_db.get_performance_spans(session_id)
+    assert len(rows) == 1
+    assert rows[0]["name"] == "collect_articles"
+    assert rows[0]["items"] == 10 and rows[0]["bytes"] == 2048
+    assert rows[0]["attributes"] == {"streaming": True}
+    assert test_db.get_performance_spans(session_id + 1) == []
+
+
+def test_cleanup_removes_spans_of_old_sessions(test_db):
+    session_id = test_db.start_scraping_session()
+    test_db.save_performance_spans(session_id, [{"name": "collect_articles", "started_at": 0}])
+    test_db.update_scraping_session(session_id, started_at=datetime.utcnow() - timedelta(days=40))
+
+    test_db.cleanup_old_data(days_to_keep=30)
+
+    assert test_db.get_performance_spans(session_id) == []
+
+
+def test_finish_run_trace_saves_exports_and_updates_durations(tmp_path, monkeypatch):
+    processor = NewsProcessor()
+    processor.logger = Mock()
+    processor.db_manager = Mock()
+    monkeypatch.setattr(processor.config.logging, "trace_dir", str(tmp_path))
+    processor.tracer = RunTracer()
+    activate_tracer(processor.tracer)
+    with trace_span("collect_articles", category="scrape"):
+        pass
+    with trace_span("ai.process_recent_articles", category="llm"):
+        pass
+
+    processor._finish_run_trace(42)
+
+    assert get_active_tracer() is None
+    assert processor.tracer is None
+    saved_session, saved_spans = processor.db_manager.save_performance_spans.call_args.args
+    assert saved_session == 42
+    assert [span["name"] for span in saved_spans] == ["collect_articles", "ai.process_recent_articles"]
+    durations = processor.db_manager.update_scraping_session.call_args.kwargs
+    assert set(durations) == {"scraping_duration_ms", "ai_processing_duration_ms"}
+    assert processor.last_trace_path.startswith(str(tmp_path))
+    with open(processor.last_trace_path, encoding="utf-8") as f:
+        assert len(json.load(f)["traceEvents"]) >= 2
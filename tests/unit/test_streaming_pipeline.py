@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+"""
+記事ストリーミングパイプラインのユニットテスト
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.article_pipeline import StreamingArticlePipeline
+from src.core.news_processor import NewsProcessor
+
+
+def make_article(index):
+    return {"url": f"https://example.com/{index}", "title": f"記事{index}", "body": f"本文{index}"}
+
+
+class RecordingStages:
+    """保存・AI処理の呼び出しを記録するスタブ（IDは URL 末尾の番号、偶数のみ新規）"""
+
+    def __init__(self):
+        self.saved_batches = []
+        self.analyzed_batches = []
+        self.lock = threading.Lock()
+
+    def save(self, articles):
+        with self.lock:
+            self.saved_batches.append([article["url"] for article in articles])
+        ids = [int(article["url"].rsplit("/", 1)[1]) for article in articles]
+        return [article_id for article_id in ids if article_id % 2 == 0]
+
+    def analyze(self, article_ids):
+        with self.lock:
+            self.analyzed_batches.append(list(article_ids))
+
+
+def test_duplicates_are_dropped_and_new_articles_reach_ai():
+    stages = RecordingStages()
+    with StreamingArticlePipeline(stages.save, stages.analyze, ai_workers=2) as pipeline:
+        for index in [0, 1, 2, 2, 3, 4, 0]:
+            pipeline.submit(make_article(index))
+
+    saved_urls = [url for batch in stages.saved_batches for url in batch]
+    assert sorted(saved_urls) == [f"https://example.com/{i}" for i in range(5)]
+    assert sorted(i for batch in stages.analyzed_batches for i in batch) == [0, 2, 4]
+    assert sorted(pipeline.new_article_ids) == [0, 2, 4]
+    assert len(pipeline.articles) == 5
+    assert pipeline.stats["duplicates"] == 2
+    assert pipeline.stats["ai_analyzed"] == 3
+
+
+def test_ai_limit_defers_surplus_new_articles():
+    stages = RecordingStages()
+    with StreamingArticlePipeline(stages.save, stages.analyze, max_ai_articles=2) as pipeline:
+        for index in range(0, 10, 2):
+            pipeline.submit(make_article(index))
+
+    assert sum(len(batch) for batch in stages.analyzed_batches) == 2
+    assert pipeline.stats["ai_deferred"] == 3
+    assert len(pipeline.new_article_ids) == 5
+
+
+def test_save_only_without_ai_stage():
+    stages = RecordingStages()
+    with StreamingArticlePipeline(stages.save, None) as pipeline:
+        pipeline.submit(make_article(2))
+
+    assert pipeline.new_article_ids == [2]
+    assert pipeline.stats["ai_queued"] == 0
+
+
+def test_slow_save_stage_blocks_producer():
+    release = threading.Event()
+    saving = threading.Event()
+
+    def slow_save(articles):
+        saving.set()
+        release.wait(5)
+        return []
+
+    pipeline = StreamingArticlePipeline(slow_save, None, queue_size=1, save_batch_size=1).start()
+    pipeline.submit(make_article(0))
+    assert saving.wait(5)
+    pipeline.submit(make_article(1))  # キューの唯一の枠を埋める
+
+    producer = threading.Thread(target=pipeline.submit, args=(make_article(2),))
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()
+
+    release.set()
+    producer.join(5)
+    assert not producer.is_alive()
+    stats = pipeline.close()
+    assert stats["saved"] == 3
+    assert stats["producer_wait_seconds"] > 0
+
+
+def test_ai_starts_before_producer_finishes():
+    analyzed = threading.Event()
+
+    def analyze(article_ids):
+        analyzed.set()
+
+    pipeline = StreamingArticlePipeline(lambda articles: [1], analyze).start()
+    pipeline.submit(make_article(0))
+    assert analyzed.wait(5)
+
+    pipeline.submit(make_article(1))
+    stats = pipeline.close()
+    assert stats["first_ai_start_seconds"] is not None
+    assert stats["saved"] == 2
+
+
+def test_stage_errors_do_not_stall_pipeline():
+    def save(articles):
+        if articles[0]["url"].endswith("/0"):
+            raise RuntimeError("db locked")
+        return [1]
+
+    def analyze(article_ids):
+        raise RuntimeError("quota")
+
+    pipeline = StreamingArticlePipeline(save, analyze, save_batch_size=1).start()
+    pipeline.submit(make_article(0))
+    pipeline.submit(make_article(1))
+    stats = pipeline.close()
+
+    assert stats["save_errors"] == 1
+    assert stats["ai_errors"] == 1
+    assert stats["saved"] == 1
+    # 保存に失敗した記事も収集結果には残る
+    assert sorted(a["url"] for a in pipeline.articles) == [make_article(i)["url"] for i in (0, 1)]
+
+
+def test_failed_save_batch_is_retried_per_article():
+    """一括保存が失敗したバッチは1記事ずつ保存し直し、不正な記事だけを失う"""
+    stages = RecordingStages()
+
+    def save(articles):
+        if any(article["url"].endswith("/3") for article in articles):
+            raise RuntimeError("bad row")
+        return stages.save(articles)
+
+    pipeline = StreamingArticlePipeline(save, stages.analyze, save_batch_size=4)
+    for index in range(4):
+        pipeline.submit(make_article(index))
+    pipeline.start()
+    stats = pipeline.close()
+
+    assert stages.saved_batches == [[make_article(i)["url"]] for i in range(3)]
+    assert stats["saved"] == 3
+    assert stats["save_errors"] == 1
+    assert sorted(pipeline.new_article_ids) == [0, 2]
+    assert sorted(i for batch in stages.analyzed_batches for i in batch) == [0, 2]
+    assert len(pipeline.articles) == 4
+
+
+def test_submit_after_close_is_rejected():
+    pipeline = StreamingArticlePipeline(lambda articles: [], None).start()
+    pipeline.close()
+    with pytest.raises(RuntimeError):
+        pipeline.submit(make_article(0))
+
+
+def test_news_processor_streams_collected_articles_into_pipeline(monkeypatch):
+    monkeypatch.setenv("AI_MAX_ARTICLES_PER_RUN", "1")
+    processor = NewsProcessor()
+    processor.logger = Mock()
+    processor.db_manager = Mock()
+    processor.db_manager.upsert_articles.side_effect = lambda articles: [
+        (int(article["url"].rsplit("/", 1)[1]), True) for article in articles
+    ]
+    processor.db_manager.get_articles_by_ids.side_effect = lambda ids: [f"article-{i}" for i in ids]
+    articles = [make_article(1), make_article(2)]
+
+    def collect():
+        # スクレイパーと同様に on_article フック経由で投入する
+        for article in articles:
+            processor._article_pipeline.submit(article)
+        return articles
+
+    client = Mock()
+    with patch.object(processor, "collect_articles", side_effect=collect), \
+            patch.object(processor, "_ensure_article_client", return_value=client), \
+            patch.object(processor, "_analyze_articles_with_ai") as analyze:
+        scraped, new_ids = processor.collect_and_process_articles_streaming()
+
+    assert scraped == articles
+    assert sorted(new_ids) == [1, 2]
+    assert analyze.call_count == 1
+    assert analyze.call_args.args[0] is client
+    assert processor._article_pipeline is None
+    assert processor.last_pipeline_stats["ai_deferred"] == 1
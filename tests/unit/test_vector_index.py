@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""
+ローカルベクターインデックスのユニットテスト
+"""
+
+import json
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.config.app_config import SupabaseConfig
+from src.rag.search_engine import RAGSearchEngine
+from src.rag.vector_index import LocalVectorIndex
+
+DIMENSION = 16
+
+
+def _rows(count: int = 40, seed: int = 0):
+    rng = np.random.RandomState(seed)
+    rows = []
+    for i in range(count):
+        rows.append({
+            "id": i,
+            "document_id": f"doc-{i % 4}",
+            "content": f"チャンク{i}",
+            "region": "japan" if i % 2 == 0 else "usa",
+            "metadata": {"category": "金融" if i % 3 == 0 else "企業"},
+            "embedding": str(rng.normal(size=DIMENSION).round(6).tolist()),
+            "documents": {"doc_date": f"2026-10-{1 + i % 20:02d}"},
+        })
+    return rows
+
+
+def _brute_force(rows, query, predicate=lambda row: True):
+    scored = []
+    for row in rows:
+        if not predicate(row):
+            continue
+        vector = np.array(json.loads(row["embedding"]), dtype=np.float32)
+        scored.append((float(vector @ query / np.linalg.norm(vector) / np.linalg.norm(query)), row["id"]))
+    return [chunk_id for _, chunk_id in sorted(scored, reverse=True)]
+
+
+class TestLocalVectorIndex(unittest.TestCase):
+    """LocalVectorIndex のテスト"""
+
+    def setUp(self):
+        self.rows = _rows()
+        self.query = np.random.RandomState(42).normal(size=DIMENSION).astype(np.float32)
+
+    def test_flat_search_matches_brute_force_order(self):
+        index = LocalVectorIndex.from_chunk_rows(self.rows, DIMENSION)
+
+        results = index.search(self.query, match_count=5)
+
+        self.assertEqual([r["chunk_id"] for r in results], _brute_force(self.rows, self.query)[:5])
+        similarities = [r["similarity"] for r in results]
+        self.assertEqual(similarities, sorted(similarities, reverse=True))
+        self.assertEqual(results[0]["doc_date"][:8], "2026-10-")
+
+    def test_metadata_prefilters(self):
+        index = LocalVectorIndex.from_chunk_rows(self.rows, DIMENSION)
+
+        results = index.search(
+            self.query, match_count=3, region_filter="japan", category_filter="金融", date_since="2026-10-05"
+        )
+
+        expected = _brute_force(
+            self.rows,
+            self.query,
+            lambda row: row["region"] == "japan"
+            and row["metadata"]["category"] == "金融"
+            and row["documents"]["doc_date"] >= "2026-10-05",
+        )[:3]
+        self.assertEqual([r["chunk_id"] for r in results], expected)
+
+    def test_ivf_falls_back_to_exact_when_probes_are_too_small(self):
+        index = LocalVectorIndex.from_chunk_rows(self.rows, DIMENSION, index_type="ivf", nlist=8, nprobe=1)
+
+        results = index.search(self.query, match_count=len(self.rows))
+
+        self.assertEqual(len(results), len(self.rows))
+
+    def test_ivf_with_all_probes_matches_flat(self):
+        index = LocalVectorIndex.from_chunk_rows(self.rows, DIMENSION, index_type="ivf", nlist=4, nprobe=4)
+
+        results = index.search(self.query, match_count=5)
+
+        self.assertEqual([r["chunk_id"] for r in results], _brute_force(self.rows, self.query)[:5])
+
+    def test_save_and_load_round_trip(self):
+        index = LocalVectorIndex.from_chunk_rows(self.rows, DIMENSION, index_type="ivf", nlist=4, nprobe=2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index.save(tmpdir)
+            loaded = LocalVectorIndex.load(tmpdir)
+
+        self.assertEqual(len(loaded), len(self.rows))
+        self.assertEqual(loaded.index_type, "ivf")
+        self.assertEqual(
+            loaded.search(self.query, match_count=5, region_filter="usa"),
+            index.search(self.query, match_count=5, region_filter="usa"),
+        )
+
+    def test_rows_without_valid_embedding_are_skipped(self):
+        rows = self.rows[:2] + [{"id": 99, "content": "x", "embedding": None}]
+
+        index = LocalVectorIndex.from_chunk_rows(rows, DIMENSION)
+
+        self.assertEqual(len(index), 2)
+
+
+class TestRAGSearchEngineLocalIndex(unittest.TestCase):
+    """RAGSearchEngine のローカルインデックス検索のテスト"""
+
+    def test_search_uses_local_index_without_supabase(self):
+        rows = _rows()
+        query = np.random.RandomState(42).normal(size=DIMENSION).astype(np.float32)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            LocalVectorIndex.from_chunk_rows(rows, DIMENSION).save(tmpdir)
+            config = SupabaseConfig(
+                enabled=True, embedding_dimension=DIMENSION, local_index_enabled=True, local_index_dir=tmpdir
+            )
+            supabase = MagicMock()
+            supabase.is_available.return_value = False
+            embedder = MagicMock()
+            embedder.is_available.return_value = True
+            embedder.generate_embedding.return_value = query.tolist()
+
+            with patch("src.rag.search_engine.get_supabase_client", return_value=supabase), \
+                    patch("src.rag.search_engine.get_embedding_generator", return_value=embedder):
+                engine = RAGSearchEngine(config)
+                results = engine.search("日銀", top_k=3, similarity_threshold=-1.0)
+
+        self.assertEqual([r.chunk_id for r in results], _brute_force(rows, query)[:3])
+        supabase.search_chunks.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+
+"""
+ニュースパイプラインのオフラインベンチマーク
+
+記録済みHTMLフィクスチャ・ローカルHTTPサーバー・遅延を設定できる疑似LLMクライアント・
+合成記事コーパスを使い、ネットワークやAPIキーなしで各処理段の性能を再現可能に測定する。
+
+実行例:
+    python -m tools.performance.benchmarks --sizes 100 1000 --threshold 0.2
+"""
+
+from .corpus import generate_corpus
+from .harness import BenchmarkHistory, BenchmarkResult, BenchmarkRunner
+
+__all__ = ["generate_corpus", "BenchmarkHistory", "BenchmarkResult", "BenchmarkRunner"]
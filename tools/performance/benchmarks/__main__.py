@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+ベンチマークのコマンドラインエントリポイント
+
+    python -m tools.performance.benchmarks --sizes 100 1000 10000 --stages content_dedup db_save_bulk
+
+履歴DBの直近の測定と比較して、しきい値を超えて遅くなった処理段があれば終了コード1を返す。
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from .harness import (
+    DEFAULT_HISTORY_PATH,
+    BenchmarkContext,
+    BenchmarkHistory,
+    BenchmarkRunner,
+    format_results,
+)
+from .stages import STAGES, get_stages
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="ニュースパイプラインのオフラインベンチマーク")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000],
+                        help="コーパスサイズ（例: 100 1000 10000）")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=None,
+                        help="測定する処理段（省略時は全処理段）")
+    parser.add_argument("--repeats", type=int, default=3, help="1処理段あたりの測定回数")
+    parser.add_argument("--seed", type=int, default=42, help="コーパス生成の乱数シード")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH, help="履歴DBのパス")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="性能劣化とみなす基準値からの増加率（0.2 = 20%%）")
+    parser.add_argument("--no-record", action="store_true", help="結果を履歴DBに保存しない")
+    parser.add_argument("--no-memory", action="store_true", help="ピークメモリを測定しない")
+    parser.add_argument("--llm-latency-ms", type=float, default=20.0, help="疑似LLMの応答遅延")
+    parser.add_argument("--http-latency-ms", type=float, default=0.0, help="ローカルHTTPサーバーの応答遅延")
+    parser.add_argument("--label", default=None, help="履歴に残す測定ラベル")
+    parser.add_argument("--json", action="store_true", help="結果をJSONで出力")
+    parser.add_argument("--verbose", action="store_true", help="測定中のINFOログを表示")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if not args.verbose:
+        # 処理段ごとのINFOログは測定結果の表示を埋もれさせるため抑止する
+        logging.disable(logging.INFO)
+    try:
+        runner = BenchmarkRunner(
+            get_stages(args.stages),
+            sizes=args.sizes,
+            repeats=args.repeats,
+            context=BenchmarkContext(
+                seed=args.seed,
+                llm_latency_ms=args.llm_latency_ms,
+                http_latency_ms=args.http_latency_ms,
+            ),
+            history=BenchmarkHistory(args.history),
+            threshold=args.threshold,
+            measure_memory=not args.no_memory,
+        )
+        results = runner.run(record=not args.no_record, label=args.label)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], ensure_ascii=False, indent=2))
+    else:
+        print(format_results(results))
+
+    regressions = [r for r in results if r.regression]
+    if regressions:
+        names = ", ".join(f"{r.stage}@{r.size}" for r in regressions)
+        print(f"性能劣化を検出しました: {names}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
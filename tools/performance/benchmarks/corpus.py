@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+合成記事コーパス
+
+シード固定の乱数で、スクレイパー出力と同じ形式の記事辞書を生成する。
+一部の記事は既存記事の本文をわずかに変えた近似重複にする（重複排除の負荷を再現するため）。
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pytz
+
+SUBJECTS = [
+    "日銀", "FRB", "ECB", "トヨタ自動車", "ソニーグループ", "米財務省", "中国人民銀行",
+    "日経平均株価", "S&P500", "ドル円相場", "米10年債利回り", "原油先物", "金先物",
+    "半導体大手", "国内銀行", "欧州株式市場", "新興国通貨", "商社各社",
+]
+PREDICATES = [
+    "は政策金利を据え置くと発表した", "は市場予想を上回る決算を公表した",
+    "は前日比で大幅に上昇した", "は利上げ観測の後退を受けて下落した",
+    "はインフレ率の鈍化を背景に買い戻された", "は追加の金融緩和策を検討していると明らかにした",
+    "は通期見通しを上方修正した", "は地政学リスクの高まりで売られた",
+    "は雇用統計の発表を控えて小動きとなった", "は自社株買いの拡大を決めた",
+]
+QUALIFIERS = [
+    "市場関係者の間では慎重な見方が広がっている。",
+    "アナリストは年内の追加利下げの可能性を指摘した。",
+    "投資家はFOMCの結果を見極めたいとしている。",
+    "輸出関連株を中心に幅広い銘柄に買いが入った。",
+    "為替市場では円相場が一時1ドル=150円台をつけた。",
+    "今後は米国の消費者物価指数が焦点となる。",
+    "取引量は前週に比べて減少した。",
+]
+CATEGORIES = ["金融政策", "経済指標", "企業業績", "市場動向", "地政学", "その他"]
+REGIONS = ["japan", "usa", "europe", "china", "other"]
+SENTIMENTS = ["Positive", "Negative", "Neutral"]
+
+
+def _sentence(rng: random.Random) -> str:
+    return f"{rng.choice(SUBJECTS)}{rng.choice(PREDICATES)}。{rng.choice(QUALIFIERS)}"
+
+
+def generate_corpus(size: int, seed: int = 42, duplicate_ratio: float = 0.05) -> List[Dict[str, Any]]:
+    """
+    合成記事コーパスを生成
+
+    Args:
+        size: 記事数
+        seed: 乱数シード（同じ値なら同じコーパスになる）
+        duplicate_ratio: 近似重複記事の割合
+
+    Returns:
+        スクレイパー出力形式の記事リスト（AI分析結果の列も含む）
+    """
+    rng = random.Random(seed)
+    base_time = pytz.timezone("Asia/Tokyo").localize(datetime(2025, 1, 6, 9, 0))
+    articles: List[Dict[str, Any]] = []
+
+    for index in range(size):
+        source = "Reuters" if index % 2 == 0 else "Bloomberg"
+        if articles and rng.random() < duplicate_ratio:
+            # 既存記事の本文末尾だけを変えた近似重複
+            body = rng.choice(articles)["body"] + rng.choice(QUALIFIERS)
+        else:
+            body = "".join(_sentence(rng) for _ in range(rng.randint(6, 20)))
+
+        articles.append(
+            {
+                "title": f"{rng.choice(SUBJECTS)}{rng.choice(PREDICATES)}（{index}）",
+                "url": f"https://bench.example.com/{source.lower()}/articles/{index:06d}",
+                "body": body,
+                "source": source,
+                "category": rng.choice(CATEGORIES),
+                "published_jst": base_time - timedelta(minutes=7 * index),
+                "summary": body[:200],
+                "region": rng.choice(REGIONS),
+                "sentiment_label": rng.choice(SENTIMENTS),
+                "sentiment_score": round(rng.uniform(-1, 1), 3),
+            }
+        )
+    return articles
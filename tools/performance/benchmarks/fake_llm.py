@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+遅延を設定できる疑似LLMクライアント
+
+本番と同じ構造化マークダウン（単独要約）または記事見出し付きの応答（バッチ要約）を返し、
+要約処理・ディスパッチャー・応答解析の性能を API 呼び出しなしで測定する。
+"""
+
+import re
+import threading
+import time
+from typing import Any, Optional
+
+from src.llm.base_client import BaseLLMClient, LLMResult
+
+_BATCH_COUNT_PATTERN = re.compile(r"=== 記事 (\d+) ===")
+
+
+class FakeLLMClient(BaseLLMClient):
+    """固定の要約を返すLLMクライアント（latency_ms だけ応答を遅らせる）"""
+
+    def __init__(self, latency_ms: float = 20.0, model_name: str = "fake-llm"):
+        super().__init__(provider="fake", model_name=model_name)
+        self.latency_ms = latency_ms
+        self.call_count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _sections(number: int) -> str:
+        summary = f"ベンチマーク用の要約{number}。" + "市場は政策金利の据え置きを織り込んでいる。" * 5
+        return f"## 地域\njapan\n\n## カテゴリ\n金融政策\n\n## 要約\n{summary}"
+
+    def generate(
+        self,
+        prompt: str,
+        *,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.2,
+        max_output_tokens: Optional[int] = None,
+        timeout: Optional[int] = None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        with self._lock:
+            self.call_count += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+
+        numbers = [int(n) for n in _BATCH_COUNT_PATTERN.findall(prompt)]
+        if numbers:
+            text = "\n\n".join(f"=== 記事 {n} ===\n{self._sections(n)}" for n in numbers)
+        else:
+            text = self._sections(1)
+        return LLMResult(text=text, metadata={"model": self.model_name})
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+
+"""
+ベンチマーク実行・履歴保存・性能劣化判定
+"""
+
+import gc
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .corpus import generate_corpus
+
+DEFAULT_HISTORY_PATH = "benchmark_history.db"
+
+
+class BenchmarkSkipped(Exception):
+    """実行環境に依存ライブラリが無いなどの理由で測定できない処理段"""
+
+
+@dataclass
+class BenchmarkStage:
+    """
+    測定対象の処理段
+
+    setup(context, size) で測定対象外の準備を行い、run(state) の実行時間を測定する。
+    run は処理した件数を返す。teardown(state) は測定後の後始末（任意）。
+    """
+
+    name: str
+    setup: Callable[["BenchmarkContext", int], Any]
+    run: Callable[[Any], int]
+    teardown: Optional[Callable[[Any], None]] = None
+    description: str = ""
+
+
+@dataclass
+class BenchmarkResult:
+    """1つの処理段・コーパスサイズの測定結果"""
+
+    stage: str
+    size: int
+    items: int = 0
+    repeats: int = 0
+    wall_ms: float = 0.0  # 中央値
+    wall_ms_min: float = 0.0
+    cpu_ms: float = 0.0  # 中央値
+    peak_memory_mb: Optional[float] = None  # tracemalloc による Python ヒープのピーク
+    throughput_per_sec: float = 0.0
+    status: str = "ok"  # 'ok', 'skipped', 'error'
+    note: str = ""
+    baseline_ms: Optional[float] = None
+    regression: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class BenchmarkContext:
+    """処理段が共有する実行コンテキスト（コーパス・ローカルサーバーなど）"""
+
+    def __init__(self, seed: int = 42, llm_latency_ms: float = 20.0, http_latency_ms: float = 0.0):
+        self.seed = seed
+        self.llm_latency_ms = llm_latency_ms
+        self.http_latency_ms = http_latency_ms
+        self._corpora: Dict[int, List[Dict[str, Any]]] = {}
+        self._server = None
+
+    def corpus(self, size: int) -> List[Dict[str, Any]]:
+        """サイズごとの合成コーパス（同一実行内では使い回す）"""
+        if size not in self._corpora:
+            self._corpora[size] = generate_corpus(size, seed=self.seed)
+        return self._corpora[size]
+
+    @property
+    def server(self):
+        """記録済みHTMLを返すローカルHTTPサーバー（初回アクセス時に起動）"""
+        if self._server is None:
+            from .fixtures import LocalFixtureServer
+
+            self._server = LocalFixtureServer(latency_ms=self.http_latency_ms).start()
+        return self._server
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.stop()
+            self._server = None
+
+
+class BenchmarkHistory:
+    """測定結果の履歴（SQLite）"""
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH):
+        self.path = path
+        with sqlite3.connect(self.path) as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS benchmark_runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at TEXT NOT NULL,
+                    label TEXT,
+                    git_commit TEXT,
+                    python_version TEXT,
+                    platform TEXT
+                );
+                CREATE TABLE IF NOT EXISTS benchmark_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id INTEGER NOT NULL REFERENCES benchmark_runs(id),
+                    stage TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    items INTEGER,
+                    repeats INTEGER,
+                    wall_ms REAL,
+                    wall_ms_min REAL,
+                    cpu_ms REAL,
+                    peak_memory_mb REAL,
+                    throughput_per_sec REAL,
+                    status TEXT,
+                    note TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_benchmark_stage_size
+                    ON benchmark_results (stage, size, run_id);
+                """
+            )
+
+    def baseline(self, stage: str, size: int, window: int = 5) -> Optional[float]:
+        """直近 window 回の成功した測定の中央値（履歴が無い場合はNone）"""
+        with sqlite3.connect(self.path) as conn:
+            rows = conn.execute(
+                """
+                SELECT wall_ms FROM benchmark_results
+                WHERE stage = ? AND size = ? AND status = 'ok'
+                ORDER BY run_id DESC LIMIT ?
+                """,
+                (stage, size, window),
+            ).fetchall()
+        return statistics.median(row[0] for row in rows) if rows else None
+
+    def record(self, results: Sequence[BenchmarkResult], label: Optional[str] = None) -> int:
+        """1回分の測定結果を保存して run_id を返す"""
+        with sqlite3.connect(self.path) as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO benchmark_runs (created_at, label, git_commit, python_version, platform)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    datetime.now().isoformat(timespec="seconds"),
+                    label,
+                    _git_commit(),
+                    platform.python_version(),
+                    platform.platform(),
+                ),
+            )
+            run_id = cursor.lastrowid
+            conn.executemany(
+                """
+                INSERT INTO benchmark_results
+                (run_id, stage, size, items, repeats, wall_ms, wall_ms_min, cpu_ms,
+                 peak_memory_mb, throughput_per_sec, status, note)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        run_id, r.stage, r.size, r.items, r.repeats, r.wall_ms, r.wall_ms_min,
+                        r.cpu_ms, r.peak_memory_mb, r.throughput_per_sec, r.status, r.note,
+                    )
+                    for r in results
+                ],
+            )
+        return run_id
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+class BenchmarkRunner:
+    """処理段 × コーパスサイズの測定と、履歴に対する性能劣化判定"""
+
+    def __init__(
+        self,
+        stages: Sequence[BenchmarkStage],
+        sizes: Sequence[int] = (100, 1000),
+        repeats: int = 3,
+        context: Optional[BenchmarkContext] = None,
+        history: Optional[BenchmarkHistory] = None,
+        threshold: float = 0.2,
+        min_delta_ms: float = 5.0,
+        measure_memory: bool = True,
+    ):
+        """
+        Args:
+            stages: 測定する処理段
+            sizes: コーパスサイズ
+            repeats: 1処理段あたりの測定回数（中央値を採用）
+            context: 実行コンテキスト（省略時は既定値で生成）
+            history: 履歴（省略時は劣化判定・保存を行わない）
+            threshold: 基準値からの許容増加率（0.2 = 20%）
+            min_delta_ms: 劣化とみなす最小の増加時間（短時間処理のノイズ対策）
+            measure_memory: 追加の1回で tracemalloc によるピークメモリを測定する
+        """
+        self.stages = list(stages)
+        self.sizes = list(sizes)
+        self.repeats = max(1, repeats)
+        self.context = context or BenchmarkContext()
+        self.history = history
+        self.threshold = threshold
+        self.min_delta_ms = min_delta_ms
+        self.measure_memory = measure_memory
+
+    def _run_once(self, stage: BenchmarkStage, size: int, trace_memory: bool = False):
+        state = stage.setup(self.context, size)
+        try:
+            gc.collect()
+            if trace_memory:
+                tracemalloc.start()
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            items = stage.run(state)
+            wall_ms = (time.perf_counter() - wall_start) * 1000
+            cpu_ms = (time.process_time() - cpu_start) * 1000
+            peak_mb = None
+            if trace_memory:
+                peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+                tracemalloc.stop()
+            return items, wall_ms, cpu_ms, peak_mb
+        finally:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            if stage.teardown is not None:
+                stage.teardown(state)
+
+    def measure(self, stage: BenchmarkStage, size: int) -> BenchmarkResult:
+        """1つの処理段を測定（依存ライブラリ不足は skipped、例外は error として記録）"""
+        result = BenchmarkResult(stage=stage.name, size=size)
+        try:
+            samples = [self._run_once(stage, size) for _ in range(self.repeats)]
+            if self.measure_memory:
+                result.peak_memory_mb = round(self._run_once(stage, size, trace_memory=True)[3], 2)
+        except (BenchmarkSkipped, ImportError) as e:
+            result.status, result.note = "skipped", str(e)
+            return result
+        except Exception as e:
+            result.status, result.note = "error", f"{type(e).__name__}: {e}"
+            return result
+
+        walls = [sample[1] for sample in samples]
+        result.items = samples[0][0]
+        result.repeats = len(samples)
+        result.wall_ms = round(statistics.median(walls), 3)
+        result.wall_ms_min = round(min(walls), 3)
+        result.cpu_ms = round(statistics.median(sample[2] for sample in samples), 3)
+        result.throughput_per_sec = (
+            round(result.items / (result.wall_ms / 1000), 1) if result.wall_ms > 0 else 0.0
+        )
+        return result
+
+    def check_regression(self, result: BenchmarkResult) -> BenchmarkResult:
+        """履歴の基準値と比較し、許容範囲を超えて遅くなった場合に regression を立てる"""
+        if self.history is None or result.status != "ok":
+            return result
+        result.baseline_ms = self.history.baseline(result.stage, result.size)
+        if result.baseline_ms is not None:
+            limit = result.baseline_ms * (1 + self.threshold)
+            result.regression = (
+                result.wall_ms > limit and result.wall_ms - result.baseline_ms >= self.min_delta_ms
+            )
+        return result
+
+    def run(self, record: bool = True, label: Optional[str] = None) -> List[BenchmarkResult]:
+        """全処理段を測定し、劣化判定の後に履歴へ保存する"""
+        results = []
+        try:
+            for size in self.sizes:
+                for stage in self.stages:
+                    results.append(self.check_regression(self.measure(stage, size)))
+        finally:
+            self.context.close()
+        if record and self.history is not None:
+            self.history.record(results, label=label)
+        return results
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """測定結果を表形式の文字列にする"""
+    header = (
+        f"{'stage':<22}{'size':>7}{'items':>8}{'wall_ms':>12}{'cpu_ms':>12}"
+        f"{'mem_mb':>9}{'items/s':>11}{'baseline':>11}  status"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        memory = f"{r.peak_memory_mb:.1f}" if r.peak_memory_mb is not None else "-"
+        baseline = f"{r.baseline_ms:.1f}" if r.baseline_ms is not None else "-"
+        status = "REGRESSION" if r.regression else r.status
+        if r.note:
+            status += f" ({r.note})"
+        lines.append(
+            f"{r.stage:<22}{r.size:>7}{r.items:>8}{r.wall_ms:>12.1f}{r.cpu_ms:>12.1f}"
+            f"{memory:>9}{r.throughput_per_sec:>11.1f}{baseline:>11}  {status}"
+        )
+    lines.append(
+        f"Python {platform.python_version()} / {sys.platform} / pid {os.getpid()}"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+"""
+ベンチマーク対象の処理段
+
+各処理段は本番と同じモジュールの関数を呼び出す。外部依存（Webサイト・LLM API・
+埋め込みモデル）は記録済みHTML・疑似LLM・ハッシュ埋め込みに置き換える。
+依存ライブラリが無い処理段は skipped として記録される。
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List
+
+import numpy as np
+
+from .harness import BenchmarkContext, BenchmarkSkipped, BenchmarkStage
+
+# ページ取得・LLM呼び出しを伴う処理段は件数が多いと測定時間が長くなるため上限を設ける
+MAX_REUTERS_PAGES = 500
+MAX_BLOOMBERG_FETCHES = 200
+MAX_LLM_ARTICLES = 200
+
+
+def _quiet():
+    """スクレイパーの print 出力を抑止する"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+# --- ロイター本文抽出 -------------------------------------------------------
+
+
+def _setup_reuters_extract(context: BenchmarkContext, size: int):
+    from .fixtures import load_fixture
+    from scrapers.reuters import _extract_body_from_html
+
+    return {
+        "html": load_fixture("reuters_article"),
+        "count": min(size, MAX_REUTERS_PAGES),
+        "extract": _extract_body_from_html,
+    }
+
+
+def _run_reuters_extract(state) -> int:
+    with _quiet():
+        for index in range(state["count"]):
+            state["extract"](state["html"], f"https://jp.reuters.com/bench/{index}")
+    return state["count"]
+
+
+# --- Bloomberg 本文取得（ローカルHTTPサーバー経由） -------------------------
+
+
+def _setup_bloomberg_fetch(context: BenchmarkContext, size: int):
+    from scrapers.bloomberg import config, create_bloomberg_fetcher, scrape_bloomberg_article_body
+
+    server = context.server
+    count = min(size, MAX_BLOOMBERG_FETCHES)
+    return {
+        "urls": [server.url_for("bloomberg_article", f"{i:06d}") for i in range(count)],
+        "fetcher": create_bloomberg_fetcher(),
+        "workers": config.bloomberg.num_parallel_requests,
+        "scrape": scrape_bloomberg_article_body,
+    }
+
+
+def _run_bloomberg_fetch(state) -> int:
+    fetcher, scrape = state["fetcher"], state["scrape"]
+    with _quiet(), ThreadPoolExecutor(max_workers=state["workers"]) as executor:
+        bodies = list(executor.map(lambda url: scrape(url, fetcher=fetcher), state["urls"]))
+    if not all(bodies):
+        raise RuntimeError("フィクスチャから本文を抽出できませんでした")
+    return len(bodies)
+
+
+def _teardown_bloomberg_fetch(state) -> None:
+    state["fetcher"].close()
+
+
+# --- 重複排除・DB保存 ------------------------------------------------------
+
+
+def _setup_content_dedup(context: BenchmarkContext, size: int):
+    from src.database.content_deduplicator import ContentDeduplicator
+
+    return {"articles": context.corpus(size), "deduplicator": ContentDeduplicator()}
+
+
+def _run_content_dedup(state) -> int:
+    state["deduplicator"].remove_duplicates(state["articles"])
+    return len(state["articles"])
+
+
+def _setup_db_save(context: BenchmarkContext, size: int):
+    from src.config.app_config import DatabaseConfig
+    from src.database.database_manager import DatabaseManager
+
+    directory = tempfile.mkdtemp(prefix="bench_db_")
+    manager = DatabaseManager(DatabaseConfig(url=f"sqlite:///{os.path.join(directory, 'bench.db')}"))
+    return {"manager": manager, "directory": directory, "articles": context.corpus(size)}
+
+
+def _run_db_save(state) -> int:
+    state["manager"].save_articles_bulk(state["articles"])
+    return len(state["articles"])
+
+
+def _teardown_db_save(state) -> None:
+    state["manager"].engine.dispose()
+    shutil.rmtree(state["directory"], ignore_errors=True)
+
+
+# --- HTML生成・ワードクラウド・RAG ---------------------------------------------
+
+
+def _stats(articles: List[Dict[str, Any]], key: str) -> Dict[str, int]:
+    stats: Dict[str, int] = {}
+    for article in articles:
+        stats[article[key]] = stats.get(article[key], 0) + 1
+    return stats
+
+
+def _setup_html_generate(context: BenchmarkContext, size: int):
+    from src.html.template_engine import HTMLTemplateEngine, TemplateData
+
+    articles = [
+        dict(article, published_jst=article["published_jst"].isoformat())
+        for article in context.corpus(size)
+    ]
+    data = TemplateData(
+        title="ベンチマーク",
+        articles=articles,
+        total_articles=len(articles),
+        last_updated=datetime(2025, 1, 6, 9, 0).strftime("%Y-%m-%d %H:%M"),
+        source_stats=_stats(articles, "source"),
+        region_stats=_stats(articles, "region"),
+        category_stats=_stats(articles, "category"),
+    )
+    return {"engine": HTMLTemplateEngine(), "data": data}
+
+
+def _run_html_generate(state) -> int:
+    state["engine"].generate_html(state["data"])
+    return state["data"].total_articles
+
+
+def _setup_wordcloud(context: BenchmarkContext, size: int):
+    try:
+        from src.wordcloud import WordCloudConfig, WordCloudGenerator
+    except ImportError as e:
+        raise BenchmarkSkipped(f"wordcloud の依存ライブラリがありません: {e.name}") from e
+
+    return {"generator": WordCloudGenerator(WordCloudConfig()), "articles": context.corpus(size)}
+
+
+def _run_wordcloud(state) -> int:
+    state["generator"].generate_daily_wordcloud(state["articles"])
+    return len(state["articles"])
+
+
+def _setup_rag_chunking(context: BenchmarkContext, size: int):
+    from src.config.app_config import SupabaseConfig
+    from src.rag.chunk_processor import ChunkProcessor
+
+    return {"processor": ChunkProcessor(SupabaseConfig()), "articles": context.corpus(size)}
+
+
+def _run_rag_chunking(state) -> int:
+    return len(state["processor"].create_chunks_from_articles(state["articles"]))
+
+
+# --- 埋め込み -----------------------------------------------------------------
+
+
+class HashingEmbeddingModel:
+    """
+    sentence-transformers の代替（文字バイグラムのハッシュで固定次元のベクトルを作る）
+
+    モデル推論そのものではなく、キャッシュ・正規化・類似度行列など周辺処理の性能を測る。
+    """
+
+    def __init__(self, dimension: int = 384):
+        self.dimension = dimension
+
+    def encode(self, texts, convert_to_numpy: bool = True, **kwargs):
+        matrix = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for i in range(len(text) - 1):
+                digest = hashlib.blake2b(text[i:i + 2].encode("utf-8"), digest_size=4).digest()
+                matrix[row, int.from_bytes(digest, "little") % self.dimension] += 1.0
+        return matrix
+
+
+def _setup_embedding(context: BenchmarkContext, size: int):
+    from src.config.app_config import SupabaseConfig
+    from src.database.embedding_generator import EmbeddingGenerator
+
+    generator = EmbeddingGenerator(SupabaseConfig(enabled=True, embedding_cache_enabled=False))
+    generator._model = HashingEmbeddingModel()
+    return {"generator": generator, "texts": [a["body"] for a in context.corpus(size)]}
+
+
+def _run_embedding(state) -> int:
+    generator = state["generator"]
+    embeddings = generator.generate_embeddings_batch(state["texts"])
+    generator.similarity_matrix(embeddings)
+    return len(embeddings)
+
+
+# --- LLM要約（疑似クライアント） -----------------------------------------------
+
+
+def _setup_llm_summarize(context: BenchmarkContext, size: int):
+    from src.config.app_config import get_config
+    from src.legacy.ai_summarizer import build_article_batches, process_articles_batch_with_ai
+    from src.llm.dispatcher import DispatchedLLMClient, LLMDispatcher
+
+    from .fake_llm import FakeLLMClient
+
+    ai_config = get_config().ai
+    texts = [a["body"] for a in context.corpus(size)[:MAX_LLM_ARTICLES]]
+    dispatcher = LLMDispatcher(
+        requests_per_minute=0,
+        tokens_per_minute=0,
+        initial_concurrency=ai_config.initial_concurrency,
+        max_concurrency=ai_config.max_concurrency,
+    )
+    batches = build_article_batches(
+        texts,
+        token_budget=ai_config.batch_token_budget,
+        max_batch_size=ai_config.batch_max_articles,
+    )
+    return {
+        "client": DispatchedLLMClient(FakeLLMClient(latency_ms=context.llm_latency_ms), dispatcher),
+        "dispatcher": dispatcher,
+        "groups": [[texts[i] for i in batch] for batch in batches],
+        "summarize": process_articles_batch_with_ai,
+    }
+
+
+def _run_llm_summarize(state) -> int:
+    client, summarize = state["client"], state["summarize"]
+    summarized = 0
+    for _, results, error in state["dispatcher"].stream(
+        lambda group: summarize(client, group), state["groups"]
+    ):
+        if error is not None:
+            raise error
+        summarized += sum(1 for result in results if result is not None)
+    return summarized
+
+
+STAGES: Dict[str, BenchmarkStage] = {
+    stage.name: stage
+    for stage in [
+        BenchmarkStage("reuters_extract_body", _setup_reuters_extract, _run_reuters_extract,
+                       description="ロイター記事HTMLの解析と本文抽出"),
+        BenchmarkStage("bloomberg_body_fetch", _setup_bloomberg_fetch, _run_bloomberg_fetch,
+                       _teardown_bloomberg_fetch, description="Bloomberg本文の並列取得と抽出"),
+        BenchmarkStage("content_dedup", _setup_content_dedup, _run_content_dedup,
+                       description="MinHashによる近似重複排除"),
+        BenchmarkStage("db_save_bulk", _setup_db_save, _run_db_save, _teardown_db_save,
+                       description="SQLiteへの一括保存"),
+        BenchmarkStage("llm_summarize", _setup_llm_summarize, _run_llm_summarize,
+                       description="バッチ要約（疑似LLM・ディスパッチャー経由）"),
+        BenchmarkStage("html_generate", _setup_html_generate, _run_html_generate,
+                       description="HTMLテンプレート生成"),
+        BenchmarkStage("wordcloud", _setup_wordcloud, _run_wordcloud,
+                       description="ワードクラウド生成"),
+        BenchmarkStage("rag_chunking", _setup_rag_chunking, _run_rag_chunking,
+                       description="RAG用チャンク分割"),
+        BenchmarkStage("embedding", _setup_embedding, _run_embedding,
+                       description="埋め込み生成と類似度行列（ハッシュ埋め込み）"),
+    ]
+}
+
+
+def get_stages(names=None) -> List[BenchmarkStage]:
+    """名前を指定して処理段を取得（省略時は全処理段）"""
+    if not names:
+        return list(STAGES.values())
+    unknown = [name for name in names if name not in STAGES]
+    if unknown:
+        raise ValueError(f"未知の処理段: {', '.join(unknown)}（利用可能: {', '.join(STAGES)}）")
+    return [STAGES[name] for name in names]
@@ -12,6 +12,7 @@ import sys
 import os
 # import psutil  # Optional - fallback to manual monitoring
 import gc
+import tracemalloc
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass, asdict
@@ -66,19 +67,29 @@ class PerformanceOptimizer:
         # ガベージコレクション
         gc.collect()
         
-        # 測定開始
-        start_time = time.time()
+        # 測定開始（メモリは tracemalloc による Python ヒープのピーク）
+        tracing = not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):
+            # Python 3.8 には reset_peak が無いため、外側の計測開始以降のピークになる
+            tracemalloc.reset_peak()
+        start_time = time.perf_counter()
+        start_cpu = time.process_time()
         
         # 関数実行
-        result = func(*args, **kwargs)
-        
-        # 測定終了
-        end_time = time.time()
-        execution_time = end_time - start_time
-        
-        # 簡易リソース測定（概算）
-        memory_usage = 0.1  # 概算値
-        cpu_usage = 5.0     # 概算値
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            # 測定終了
+            execution_time = time.perf_counter() - start_time
+            cpu_time = time.process_time() - start_cpu
+            memory_usage = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            if tracing:
+                tracemalloc.stop()
+        
+        # CPU使用率 = プロセスCPU時間 / 経過時間（マルチスレッドでは100%を超えうる）
+        cpu_usage = cpu_time / execution_time * 100 if execution_time > 0 else 0.0
         
         # スループット計算
         items_processed = len(result) if hasattr(result, '__len__') else 1